@@ -7,17 +7,458 @@ GUI版（PyInstaller: console=False/runw）の `--version` は、
 
 その場合でも利用者が確実にバージョンを確認できるよう、
 最小依存のコンソール用エントリポイントを提供する。
+
+加えて、GUI（Qt / WebEngine）を起動せずに基本情報取得・各種出力を実行する
+ヘッドレス実行用のサブコマンドを提供する（サーバー上の定期実行などを想定）。
+各サブコマンドは実行時に必要なモジュールだけを読み込み、Qt は読み込まない。
+
+    arim_rde_tool_cli.py stages                      # 個別取得の段階名一覧
+    arim_rde_tool_cli.py stage データセット情報        # 段階を個別実行（名前または番号）
+    arim_rde_tool_cli.py basic-info --workers 10      # 基本情報一括取得
+    arim_rde_tool_cli.py common-info                  # 共通情報のみ取得
+    arim_rde_tool_cli.py summary-xlsx --mode per_file # まとめXLSX出力
+    arim_rde_tool_cli.py reports --pages 3            # 報告書取得
+    arim_rde_tool_cli.py equipment --start-id 1 --end-id 500
+    arim_rde_tool_cli.py search-index --full          # 検索インデックス再構築
+
+トークンは --token / --token-file / 環境変数 ARIM_RDE_BEARER_TOKEN の順に参照し、
+いずれも無ければ GUI でログインした際に保存されたトークンを使用する。
 """
 
 from __future__ import annotations
 
 import argparse
+import logging
+import os
+import signal
+import sys
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+TOKEN_ENV_VAR = "ARIM_RDE_BEARER_TOKEN"
+
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_INTERRUPTED = 130
+
+# 取得処理の戻り値（メッセージ文字列）のうち、失敗を表すもの
+_FAILURE_MARKERS = (
+    "エラーが発生しました",
+    "に失敗しました",
+    "キャンセルされました",
+    "認証トークンが無効",
+    "トークンが取得できません",
+    "不正な段階名",
+    "実行できません",
+    "が存在しません",
+)
+
+logger = logging.getLogger("arim_rde_tool_cli")
+
+
+class CliError(Exception):
+    """CLI の実行前提を満たさない（トークン無し・引数不正など）"""
+
+
+class ConsoleProgress:
+    """progress_callback(current, total, message) を標準出力に書き出す
+
+    Ctrl+C の1回目でキャンセルを要求し（以降の呼び出しで False を返す）、
+    2回目で KeyboardInterrupt を送出する。
+    """
+
+    def __init__(self, quiet: bool = False):
+        self.quiet = quiet
+        self.cancelled = threading.Event()
+        self._lock = threading.Lock()
+        self._last_line: Optional[str] = None
+
+    def __call__(self, current, total, message="") -> bool:
+        if self.cancelled.is_set():
+            return False
+        if not self.quiet:
+            line = f"[{current}/{total}] {message}" if total else f"[{current}] {message}"
+            with self._lock:
+                if line != self._last_line:
+                    self._last_line = line
+                    _emit(line)
+        return True
+
+    def log(self, message: str) -> None:
+        with self._lock:
+            _emit(message)
+
+    def install_interrupt_handler(self) -> None:
+        if threading.current_thread() is not threading.main_thread():
+            return
+
+        def _handler(signum, frame):
+            if self.cancelled.is_set():
+                raise KeyboardInterrupt
+            self.cancelled.set()
+            _emit("⚠ キャンセルを要求しました（もう一度 Ctrl+C で強制終了）")
+
+        signal.signal(signal.SIGINT, _handler)
+
+
+def _emit(line: str) -> None:
+    print(line, flush=True)
+
+
+def _is_failure_result(result) -> bool:
+    if result is None or result is False:
+        return True
+    if isinstance(result, str):
+        return any(marker in result for marker in _FAILURE_MARKERS)
+    return False
+
+
+def _report_result(progress: ConsoleProgress, result) -> int:
+    if isinstance(result, str) and result:
+        progress.log(result)
+    if progress.cancelled.is_set():
+        return EXIT_INTERRUPTED
+    return EXIT_FAILED if _is_failure_result(result) else EXIT_OK
+
+
+# ---------------------------------------------------------------------------
+# トークン
+# ---------------------------------------------------------------------------
+
+def _resolve_token(args, *, validate: bool = True) -> str:
+    """引数・環境変数・保存済みトークンの順に Bearer Token を決定する"""
+    token = (args.token or "").strip()
+    if not token and args.token_file:
+        try:
+            with open(args.token_file, encoding="utf-8") as f:
+                token = f.read().strip()
+        except OSError as e:
+            raise CliError(f"トークンファイルを読み込めません: {args.token_file} ({e})") from e
+    if not token:
+        token = (os.environ.get(TOKEN_ENV_VAR) or "").strip()
+
+    from core.bearer_token_manager import BearerTokenManager
+
+    if not token:
+        token = BearerTokenManager.get_valid_token() or ""
+        if not token:
+            raise CliError(
+                "有効な Bearer Token がありません。GUI でログインするか、"
+                f"--token / --token-file / {TOKEN_ENV_VAR} で指定してください。"
+            )
+        return token
+
+    if validate and not BearerTokenManager.validate_token(token):
+        raise CliError("指定された Bearer Token が無効または期限切れです。")
+    return token
+
+
+# ---------------------------------------------------------------------------
+# 基本情報
+# ---------------------------------------------------------------------------
+
+def _selectable_stage_names():
+    from classes.basic.core.basic_info_logic import STAGE_FUNCTIONS
+
+    return [name for name, func in STAGE_FUNCTIONS.items() if func is not None]
+
+
+def _resolve_stage_name(value: str) -> str:
+    names = _selectable_stage_names()
+    if value in names:
+        return value
+    if value.isdigit() and 1 <= int(value) <= len(names):
+        return names[int(value) - 1]
+    raise CliError(f"不正な段階名です: {value}（`stages` で一覧を確認できます）")
+
+
+def _search_kwargs(args) -> Dict[str, object]:
+    words = [w for w in (args.search or []) if w]
+    if len(words) > 1:
+        return {"searchWords": None, "searchWordsBatch": words}
+    return {"searchWords": words[0] if words else None, "searchWordsBatch": None}
+
+
+def cmd_stages(args, progress: ConsoleProgress) -> int:
+    for idx, name in enumerate(_selectable_stage_names(), start=1):
+        _emit(f"{idx:>2}. {name}")
+    return EXIT_OK
+
+
+def cmd_stage(args, progress: ConsoleProgress) -> int:
+    from classes.basic.core.basic_info_logic import execute_individual_stage
+
+    stage_names = [_resolve_stage_name(value) for value in args.names]
+    # 統合情報生成はトークンを使用しない
+    needs_token = any(name != "統合情報生成" for name in stage_names)
+    token = _resolve_token(args) if needs_token else None
+
+    exit_code = EXIT_OK
+    for stage_name in stage_names:
+        progress.log(f"▶ {stage_name}")
+        result = execute_individual_stage(
+            stage_name,
+            token,
+            webview=None,
+            onlySelf=args.only_self,
+            progress_callback=progress,
+            parent_widget=None,
+            force_download=args.force_download,
+            parallel_max_workers=args.workers,
+            **_search_kwargs(args),
+        )
+        exit_code = _report_result(progress, result)
+        if exit_code != EXIT_OK:
+            break
+    return exit_code
+
+
+def cmd_basic_info(args, progress: ConsoleProgress) -> int:
+    from classes.basic.core.basic_info_logic import fetch_basic_info_logic
+
+    result = fetch_basic_info_logic(
+        _resolve_token(args),
+        parent=None,
+        webview=None,
+        onlySelf=args.only_self,
+        skip_confirmation=True,
+        progress_callback=progress,
+        program_id=args.program_id,
+        force_download=args.force_download,
+        parallel_max_workers=args.workers,
+        **_search_kwargs(args),
+    )
+    return _report_result(progress, result)
 
 
-def main() -> int:
+def cmd_common_info(args, progress: ConsoleProgress) -> int:
+    from classes.basic.core.basic_info_logic import fetch_common_info_only_logic
+
+    result = fetch_common_info_only_logic(
+        _resolve_token(args),
+        parent=None,
+        webview=None,
+        progress_callback=progress,
+        program_id=args.program_id,
+        force_download=args.force_download,
+    )
+    return _report_result(progress, result)
+
+
+def cmd_summary_xlsx(args, progress: ConsoleProgress) -> int:
+    from classes.basic.util.xlsx_exporter import SummaryExportError, export_summary_workbooks
+
+    export_options = {
+        "mode": args.mode,
+        "selected_group_ids": list(args.group_id or []),
+        "custom_suffix": args.suffix,
+    }
+    try:
+        paths = export_summary_workbooks(export_options, progress_callback=progress)
+    except SummaryExportError as e:
+        raise CliError(str(e)) from e
+    for path in paths:
+        progress.log(f"✅ {path}")
+    return EXIT_INTERRUPTED if progress.cancelled.is_set() else EXIT_OK
+
+
+# ---------------------------------------------------------------------------
+# 報告書・設備・検索インデックス
+# ---------------------------------------------------------------------------
+
+def cmd_reports(args, progress: ConsoleProgress) -> int:
+    from classes.reports.core.parallel_fetcher import ParallelReportFetcher
+    from classes.reports.core.report_cache_manager import ReportCacheManager, ReportCacheMode
+    from classes.reports.core.report_data_processor import ReportDataProcessor
+    from classes.reports.core.report_file_exporter import ReportFileExporter
+
+    fetcher = ParallelReportFetcher(
+        max_workers=args.workers,
+        cache_manager=ReportCacheManager(),
+        cache_mode=ReportCacheMode.from_value(args.cache_mode),
+    )
+    success_data, error_data = fetcher.fetch_range(
+        start_page=args.start_page,
+        max_pages=args.pages,
+        progress_callback=progress,
+    )
+    progress.log(f"✅ 取得完了: 成功={len(success_data)}, 失敗={len(error_data)}")
+    if progress.cancelled.is_set():
+        return EXIT_INTERRUPTED
+
+    if success_data:
+        valid_data, invalid_data = ReportDataProcessor().process_batch(success_data)
+        progress.log(f"✅ 処理完了: 有効={len(valid_data)}, 無効={len(invalid_data)}")
+        file_results = ReportFileExporter().export_with_backup(valid_data, "output")
+        for key, value in (file_results or {}).items():
+            progress.log(f"💾 {key}: {value}")
+    return EXIT_FAILED if error_data and not success_data else EXIT_OK
+
+
+def cmd_equipment(args, progress: ConsoleProgress) -> int:
+    from datetime import datetime
+
+    from classes.equipment.core.data_processor import FacilityDataProcessor
+    from classes.equipment.core.file_exporter import FacilityExporter
+    from classes.equipment.core.parallel_fetcher import ParallelFacilityFetcher
+
+    if args.end_id < args.start_id:
+        raise CliError("--end-id は --start-id 以上を指定してください。")
+
+    if args.stop_after:
+        from classes.equipment.core.facility_listing import FacilityListingScraper
+        from classes.equipment.core.fetch_range_builder import collect_valid_facility_ids
+
+        facility_ids = collect_valid_facility_ids(
+            start_id=args.start_id,
+            end_id=args.end_id,
+            chunk_size=args.chunk_size,
+            stop_threshold=args.stop_after,
+            log_callback=progress.log,
+            cancel_checker=progress.cancelled.is_set,
+            listing_scraper=FacilityListingScraper(),
+        )
+    else:
+        facility_ids = list(range(args.start_id, args.end_id + 1))
+
+    if not facility_ids:
+        progress.log("⚠ 取得する設備IDがありません")
+        return EXIT_OK
+
+    fetcher = ParallelFacilityFetcher(max_workers=args.workers)
+    success_data, error_info = fetcher.fetch_facilities_with_results(
+        facility_ids=facility_ids,
+        progress_callback=progress,
+    )
+    progress.log(f"✅ 取得完了: 成功={len(success_data)}, 失敗={len(error_info)}")
+    if progress.cancelled.is_set():
+        return EXIT_INTERRUPTED
+    if not success_data:
+        progress.log("⚠ 取得されたデータがありません")
+        return EXIT_OK
+
+    processed_data, process_errors = FacilityDataProcessor().process_batch(success_data)
+    progress.log(f"✅ {len(processed_data)}件のデータを処理")
+    if process_errors:
+        progress.log(f"⚠ {len(process_errors)}件の処理エラー")
+
+    exporter = FacilityExporter()
+    base_filename = f"facilities_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    if not args.no_excel and not args.no_json:
+        file_results = exporter.export_with_backup(processed_data, base_filename)
+        for key in ("latest_excel", "latest_json", "backup_dir"):
+            progress.log(f"💾 {key}: {file_results.get(key)}")
+    else:
+        if not args.no_excel:
+            progress.log(f"💾 latest_excel: {exporter.export_excel(processed_data, f'{base_filename}.xlsx')}")
+        if not args.no_json:
+            progress.log(f"💾 latest_json: {exporter.export_json(processed_data, f'{base_filename}.json')}")
+    if not args.no_entries:
+        progress.log(f"📁 個別エントリ: {exporter.export_json_entries(processed_data)}")
+    return EXIT_OK
+
+
+def cmd_search_index(args, progress: ConsoleProgress) -> int:
+    from classes.core.rde_search_index import ensure_rde_search_index, rebuild_rde_search_index
+
+    if args.full:
+        index_payload = rebuild_rde_search_index(force_full=True)
+    else:
+        index_payload = ensure_rde_search_index()
+    meta = index_payload.get("meta") if isinstance(index_payload, dict) else None
+    meta = meta if isinstance(meta, dict) else {}
+    progress.log(
+        f"✅ 検索インデックス: データセット={meta.get('dataset_count', '-')}件, "
+        f"生成日時={meta.get('generated_at', '-')}"
+    )
+    return EXIT_OK
+
+
+# ---------------------------------------------------------------------------
+# 引数
+# ---------------------------------------------------------------------------
+
+def _add_token_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--token", help="Bearer Token（省略時は --token-file / 環境変数 / 保存済みトークン）")
+    parser.add_argument("--token-file", help="Bearer Token を記載したファイル")
+
+
+def _add_fetch_arguments(parser: argparse.ArgumentParser, *, search: bool) -> None:
+    _add_token_arguments(parser)
+    if search:
+        parser.add_argument("--workers", type=int, default=None, help="並列取得数（省略時: 10）")
+    parser.add_argument("--force-download", action="store_true", help="既存ファイルがあっても再取得する")
+    if search:
+        parser.add_argument("--only-self", action="store_true", help="自身が関与するデータセットのみ取得")
+        parser.add_argument("--search", action="append", metavar="WORD", help="データセット検索語（複数指定で一括検索）")
+
+
+def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(add_help=True)
     parser.add_argument("--version", "-v", action="store_true", help="バージョン情報を表示して終了")
-    args = parser.parse_args()
+    parser.add_argument(
+        "--log-level",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+        default="WARNING",
+        help="標準エラー出力へのログレベル (デフォルト: WARNING)",
+    )
+    parser.add_argument("--quiet", "-q", action="store_true", help="進捗表示を抑制（結果のみ表示）")
+
+    sub = parser.add_subparsers(dest="command", metavar="COMMAND")
+
+    p = sub.add_parser("stages", help="個別取得の段階名一覧を表示")
+    p.set_defaults(handler=cmd_stages)
+
+    p = sub.add_parser("stage", help="基本情報の段階を個別実行（段階名または stages の番号、複数指定で順に実行）")
+    p.add_argument("names", nargs="+", metavar="STAGE")
+    _add_fetch_arguments(p, search=True)
+    p.set_defaults(handler=cmd_stage)
+
+    p = sub.add_parser("basic-info", help="基本情報を一括取得")
+    _add_fetch_arguments(p, search=True)
+    p.add_argument("--program-id", help="対象プログラムID（プロジェクトグループ選択）")
+    p.set_defaults(handler=cmd_basic_info)
+
+    p = sub.add_parser("common-info", help="共通情報のみ取得")
+    _add_fetch_arguments(p, search=False)
+    p.add_argument("--program-id", help="対象プログラムID（プロジェクトグループ選択）")
+    p.set_defaults(handler=cmd_common_info)
+
+    p = sub.add_parser("summary-xlsx", help="取得済みJSONからまとめXLSXを出力")
+    p.add_argument("--mode", choices=["merged", "per_file", "custom_selection"], default="merged", help="出力モード")
+    p.add_argument("--group-id", action="append", metavar="ID", help="custom_selection で出力するグループID（複数可）")
+    p.add_argument("--suffix", help="出力ファイル名に付ける接尾辞")
+    p.set_defaults(handler=cmd_summary_xlsx)
+
+    p = sub.add_parser("reports", help="報告書を取得して出力")
+    p.add_argument("--start-page", type=int, default=1, help="開始ページ (デフォルト: 1)")
+    p.add_argument("--pages", type=int, default=None, help="取得ページ数（省略時: 全ページ）")
+    p.add_argument("--workers", type=int, default=5, help="並列取得数 (デフォルト: 5)")
+    p.add_argument("--cache-mode", choices=["skip", "overwrite"], default="skip", help="既存キャッシュの扱い")
+    p.set_defaults(handler=cmd_reports)
+
+    p = sub.add_parser("equipment", help="設備データを取得して出力")
+    p.add_argument("--start-id", type=int, default=1, help="開始設備ID (デフォルト: 1)")
+    p.add_argument("--end-id", type=int, required=True, help="終了設備ID")
+    p.add_argument("--workers", type=int, default=5, help="並列取得数 (デフォルト: 5)")
+    p.add_argument("--stop-after", type=int, default=None, metavar="N", help="連続N件不在で打ち切る（一覧ページで有効IDを判定）")
+    p.add_argument("--chunk-size", type=int, default=1, help="--stop-after 使用時の判定単位 (デフォルト: 1)")
+    p.add_argument("--no-excel", action="store_true", help="Excel を出力しない")
+    p.add_argument("--no-json", action="store_true", help="JSON を出力しない")
+    p.add_argument("--no-entries", action="store_true", help="個別エントリJSONを出力しない")
+    p.set_defaults(handler=cmd_equipment)
+
+    p = sub.add_parser("search-index", help="データセット検索インデックスを更新")
+    p.add_argument("--full", action="store_true", help="差分ではなく全件再構築する")
+    p.set_defaults(handler=cmd_search_index)
+
+    return parser
+
+
+def main(argv=None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
 
     if args.version:
         # config.common は VERSION.txt を SoT として REVISION を公開する。
@@ -26,8 +467,40 @@ def main() -> int:
         print(str(REVISION))
         return 0
 
-    parser.print_help()
-    return 0
+    handler: Optional[Callable[..., int]] = getattr(args, "handler", None)
+    if handler is None:
+        parser.print_help()
+        return 0
+
+    logging.basicConfig(
+        level=getattr(logging, args.log_level),
+        stream=sys.stderr,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+
+    from config.common import initialize_directories
+
+    initialize_directories()
+
+    progress = ConsoleProgress(quiet=args.quiet)
+    progress.install_interrupt_handler()
+    started = time.monotonic()
+    try:
+        exit_code = handler(args, progress)
+    except CliError as e:
+        print(f"エラー: {e}", file=sys.stderr, flush=True)
+        return EXIT_FAILED
+    except KeyboardInterrupt:
+        print("中断しました", file=sys.stderr, flush=True)
+        return EXIT_INTERRUPTED
+    except Exception as e:
+        logger.exception("CLI 実行エラー")
+        print(f"エラー: {e}", file=sys.stderr, flush=True)
+        return EXIT_FAILED
+
+    if not args.quiet and args.command != "stages":
+        progress.log(f"⏱ {time.monotonic() - started:.1f}秒")
+    return exit_code
 
 
 if __name__ == "__main__":
@@ -6,9 +6,11 @@ import logging
 import math
 import os
 import re
+import threading
 import time
 import unicodedata
-from collections import Counter
+from bisect import bisect_right
+from collections import Counter, OrderedDict
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from hashlib import sha1
@@ -133,6 +135,11 @@ _DEFAULT_ALIAS_CONFIG = {
 }
 
 _ALIAS_CONFIG_CACHE = {"mtime": None, "value": None}
+_ALIAS_INDEX_CACHE = {"mtime": None, "value": None}
+# マスター（placeholder の元データ）ごとの語→エントリ索引。元テキストのハッシュで再利用する
+_ENTRY_INDEX_CACHE: "OrderedDict[Tuple[str, str], Dict[str, Any]]" = OrderedDict()
+_ENTRY_INDEX_CACHE_MAXSIZE = 16
+_ENTRY_INDEX_CACHE_LOCK = threading.Lock()
 _PROMPT_DICTIONARY_SUMMARY_CACHE = {"mtime": None, "source_mtime": None, "value": None}
 
 _PROMPT_DICTIONARY_PII_FIELD_PATTERNS = (
@@ -750,7 +757,9 @@ def _resolve_placeholder_value(
             "elapsed_seconds": round(time.perf_counter() - started, 3),
         }
 
-    entries, formatter_name = _parse_entries_for_placeholder(placeholder, source_type, raw_value)
+    entry_index = _get_entry_index(placeholder, source_type, raw_value)
+    entries = entry_index["entries"]
+    formatter_name = entry_index["formatter_name"]
     alias_index = _get_alias_index(alias_config_override)
     query_package = _build_weighted_query_package(
         context_data,
@@ -761,13 +770,27 @@ def _resolve_placeholder_value(
     )
 
     scored_entries = []
-    for entry in entries:
+    # 語を1つも共有しないエントリはスコア 0 になるため、索引で候補を絞ってから採点する
+    candidate_positions, substring_terms = _collect_candidate_positions(
+        entry_index,
+        query_package,
+        placeholder=placeholder,
+        source_type=source_type,
+        alias_index=alias_index,
+    )
+    for position in candidate_positions:
+        entry = entries[position]
         score, breakdown, matched_tokens = _score_entry(
             entry,
             query_package,
             placeholder=placeholder,
             source_type=source_type,
             alias_index=alias_index,
+            base_terms=entry_index["base_terms"][position],
+            path_components=entry_index["path_components"][position],
+            alias_terms=_entry_alias_terms(entry_index, position, placeholder, source_type, alias_index),
+            head_terms=entry_index["head_terms"][position],
+            substring_terms=substring_terms,
         )
         if score > 0:
             scored_entries.append(
@@ -1052,10 +1075,24 @@ def _score_entry(
     placeholder: str,
     source_type: str,
     alias_index: Dict[str, Any],
+    base_terms: Optional[set] = None,
+    path_components: Optional[List[str]] = None,
+    alias_terms: Optional[set] = None,
+    head_terms: Optional[frozenset] = None,
+    substring_terms: Optional[Dict[str, set]] = None,
 ) -> Tuple[int, Dict[str, int], List[Dict[str, Any]]]:
-    base_terms, alias_terms = _build_entry_term_sets(entry, placeholder, source_type, alias_index)
+    """
+    エントリのスコアを計算する
+
+    base_terms / path_components / alias_terms / head_terms は索引（_build_entry_index）で
+    事前計算した値、substring_terms は問い合わせ語ごとの部分一致する語の集合
+    （_collect_candidate_positions の結果）。省略時はその場で計算する。
+    """
+    if alias_terms is None:
+        base_terms, alias_terms = _build_entry_term_sets(entry, placeholder, source_type, alias_index, base_terms=base_terms)
     search_text = entry.get("search_text") or ""
-    path_components = [_normalize_text(component) for component in (entry.get("path") or []) if _normalize_text(component)]
+    if path_components is None:
+        path_components = _normalize_path_components(entry)
     weighted_tokens = query_package.get("weighted_tokens") or {}
     query_norm = query_package.get("query_norm") or ""
 
@@ -1119,7 +1156,11 @@ def _score_entry(
                     "source_categories": sorted(source_categories),
                 }
             )
-        elif len(token) >= 3 and any(token in term or term in token for term in list(base_terms)[:48]):
+        elif len(token) >= 3 and (
+            not substring_terms[token].isdisjoint(head_terms)
+            if substring_terms is not None and head_terms is not None and token in substring_terms
+            else any(token in term or term in token for term in list(base_terms)[:48])
+        ):
             breakdown["substring_match"] += min(18, 3 + int(token_weight * 4))
 
         damping_penalty = float(token_info.get("damping_penalty") or 0.0)
@@ -1290,12 +1331,7 @@ def _register_weighted_token(
         current["alias_of"].add(alias_of)
 
 
-def _build_entry_term_sets(
-    entry: Dict[str, Any],
-    placeholder: str,
-    source_type: str,
-    alias_index: Dict[str, Any],
-) -> Tuple[set, set]:
+def _build_entry_base_terms(entry: Dict[str, Any]) -> set:
     base_terms = set()
     for component in list(entry.get("path") or []) + [entry.get("label") or "", entry.get("search_text") or ""]:
         normalized_component = _normalize_text(component)
@@ -1304,6 +1340,22 @@ def _build_entry_term_sets(
         base_terms.add(normalized_component)
         for token in _extract_query_tokens(normalized_component):
             base_terms.add(token)
+    return base_terms
+
+
+def _normalize_path_components(entry: Dict[str, Any]) -> List[str]:
+    return [_normalize_text(component) for component in (entry.get("path") or []) if _normalize_text(component)]
+
+
+def _build_entry_term_sets(
+    entry: Dict[str, Any],
+    placeholder: str,
+    source_type: str,
+    alias_index: Dict[str, Any],
+    base_terms: Optional[set] = None,
+) -> Tuple[set, set]:
+    if base_terms is None:
+        base_terms = _build_entry_base_terms(entry)
 
     alias_terms = set()
     for term in list(base_terms):
@@ -1312,6 +1364,164 @@ def _build_entry_term_sets(
     return base_terms, alias_terms
 
 
+def _get_entry_index(placeholder: str, source_type: str, raw_value: str) -> Dict[str, Any]:
+    """placeholder の元データをエントリに分解し、語→エントリの索引を付けて返す（元テキスト単位でキャッシュ）"""
+    parser_kind = "flat" if source_type == "dataportal_flat" else "material_index"
+    cache_key = (parser_kind, sha1(_safe_str(raw_value).encode("utf-8", "surrogatepass")).hexdigest())
+    with _ENTRY_INDEX_CACHE_LOCK:
+        cached = _ENTRY_INDEX_CACHE.get(cache_key)
+        if cached is not None:
+            _ENTRY_INDEX_CACHE.move_to_end(cache_key)
+            return cached
+
+    entries, formatter_name = _parse_entries_for_placeholder(placeholder, source_type, raw_value)
+    entry_index = _build_entry_index(entries, formatter_name)
+    with _ENTRY_INDEX_CACHE_LOCK:
+        _ENTRY_INDEX_CACHE[cache_key] = entry_index
+        while len(_ENTRY_INDEX_CACHE) > _ENTRY_INDEX_CACHE_MAXSIZE:
+            _ENTRY_INDEX_CACHE.popitem(last=False)
+    return entry_index
+
+
+def _build_entry_index(entries: List[Dict[str, Any]], formatter_name: str) -> Dict[str, Any]:
+    """
+    エントリの語集合と postings（語 → エントリ位置）を作る
+
+    別名展開は問い合わせ側で行う（別名辞書は双方向なので、問い合わせ語の別名で
+    postings を引けば、エントリ側で別名展開した場合と同じエントリが見つかる）。
+    """
+    base_terms_list: List[set] = []
+    head_terms_list: List[frozenset] = []
+    path_components_list: List[List[str]] = []
+    postings: Dict[str, List[int]] = {}
+    component_postings: Dict[str, List[int]] = {}
+    search_text_postings: Dict[str, List[int]] = {}
+    for position, entry in enumerate(entries):
+        base_terms = _build_entry_base_terms(entry)
+        path_components = _normalize_path_components(entry)
+        base_terms_list.append(base_terms)
+        # 部分一致判定の対象（_score_entry と同じく先頭48語）
+        head_terms_list.append(frozenset(list(base_terms)[:48]))
+        path_components_list.append(path_components)
+        for term in base_terms:
+            postings.setdefault(term, []).append(position)
+            # 別名解決は語を正規化してから引くため、正規化後の形でも登録しておく
+            normalized_term = _normalize_text(term)
+            if normalized_term and normalized_term != term:
+                postings.setdefault(normalized_term, []).append(position)
+        for component in set(path_components):
+            component_postings.setdefault(component, []).append(position)
+        search_text = entry.get("search_text") or ""
+        if search_text:
+            search_text_postings.setdefault(search_text, []).append(position)
+
+    # 「問い合わせ語を含む語」を探すため、全語を改行区切りで連結して str.find で走査する
+    terms = list(postings)
+    term_starts: List[int] = []
+    offset = 0
+    for term in terms:
+        term_starts.append(offset)
+        offset += len(term) + 1
+    return {
+        "entries": entries,
+        "formatter_name": formatter_name,
+        "base_terms": base_terms_list,
+        "head_terms": head_terms_list,
+        "path_components": path_components_list,
+        # 別名展開後の語集合（別名索引オブジェクトと placeholder ごとに遅延計算）
+        "alias_terms": {},
+        "postings": postings,
+        "component_postings": component_postings,
+        "search_text_postings": search_text_postings,
+        "terms": terms,
+        "term_blob": "\n".join(terms),
+        "term_starts": term_starts,
+    }
+
+
+def _collect_candidate_positions(
+    entry_index: Dict[str, Any],
+    query_package: Dict[str, Any],
+    *,
+    placeholder: str,
+    source_type: str,
+    alias_index: Dict[str, Any],
+) -> Tuple[List[int], Dict[str, set]]:
+    """
+    _score_entry が正のスコアを付け得るエントリの位置（元の順序）と、
+    問い合わせ語ごとの部分一致する語の集合を返す
+    """
+    postings: Dict[str, List[int]] = entry_index["postings"]
+    terms: List[str] = entry_index["terms"]
+    term_blob: str = entry_index["term_blob"]
+    term_starts: List[int] = entry_index["term_starts"]
+    candidates: set = set()
+    substring_terms: Dict[str, set] = {}
+
+    # 完全一致・パス要素一致（問い合わせ全文に含まれるもの）
+    query_norm = query_package.get("query_norm") or ""
+    if query_norm:
+        for search_text, positions in entry_index["search_text_postings"].items():
+            if search_text in query_norm:
+                candidates.update(positions)
+        for component, positions in entry_index["component_postings"].items():
+            if component in query_norm:
+                candidates.update(positions)
+
+    for token, token_info in (query_package.get("weighted_tokens") or {}).items():
+        if float(token_info.get("weight") or 0.0) <= 0:
+            continue
+        # 直接一致・別名一致
+        for term in _resolve_alias_terms(token, alias_index, placeholder, source_type) | {token}:
+            positions = postings.get(term)
+            if positions:
+                candidates.update(positions)
+        if len(token) < 3:
+            continue
+        related: set = set()
+        # 部分一致: 語が問い合わせ語に含まれる
+        for start in range(len(token)):
+            for end in range(start + 1, len(token) + 1):
+                piece = token[start:end]
+                if piece in postings:
+                    related.add(piece)
+        # 部分一致: 問い合わせ語を含む語
+        found = term_blob.find(token)
+        while found >= 0:
+            term_id = bisect_right(term_starts, found) - 1
+            related.add(terms[term_id])
+            if term_id + 1 >= len(term_starts):
+                break
+            found = term_blob.find(token, term_starts[term_id + 1])
+        substring_terms[token] = related
+        for term in related:
+            candidates.update(postings[term])
+
+    return sorted(candidates), substring_terms
+
+
+def _entry_alias_terms(
+    entry_index: Dict[str, Any],
+    position: int,
+    placeholder: str,
+    source_type: str,
+    alias_index: Dict[str, Any],
+) -> set:
+    cache = entry_index["alias_terms"]
+    if cache.get("alias_index") is not alias_index:
+        cache.clear()
+        cache["alias_index"] = alias_index
+    values = cache.setdefault((placeholder, source_type), {})
+    alias_terms = values.get(position)
+    if alias_terms is None:
+        entry = entry_index["entries"][position]
+        _base_terms, alias_terms = _build_entry_term_sets(
+            entry, placeholder, source_type, alias_index, base_terms=entry_index["base_terms"][position]
+        )
+        values[position] = alias_terms
+    return alias_terms
+
+
 def _summarize_weighted_tokens(query_package: Dict[str, Any], limit: int = 20) -> List[str]:
     weighted_tokens = query_package.get("weighted_tokens") or {}
     ranked = sorted(weighted_tokens.items(), key=lambda item: item[1].get("weight", 0.0), reverse=True)
@@ -1323,7 +1533,21 @@ def _extract_placeholders(text: str) -> List[str]:
 
 
 def _get_alias_index(alias_config_override: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-    alias_config = _normalize_prompt_dictionary_config(alias_config_override) if alias_config_override is not None else _load_prompt_alias_config()
+    if alias_config_override is not None:
+        return _build_alias_index(_normalize_prompt_dictionary_config(alias_config_override))
+    # 保存済み設定の索引は設定ファイルが更新されるまで使い回す（返り値は変更しないこと）
+    path = get_prompt_dictionary_config_path()
+    mtime = os.path.getmtime(path) if os.path.exists(path) else None
+    cached = _ALIAS_INDEX_CACHE.get("value")
+    if cached is not None and _ALIAS_INDEX_CACHE.get("mtime") == mtime:
+        return cached
+    alias_index = _build_alias_index(_load_prompt_alias_config())
+    _ALIAS_INDEX_CACHE["mtime"] = mtime
+    _ALIAS_INDEX_CACHE["value"] = alias_index
+    return alias_index
+
+
+def _build_alias_index(alias_config: Dict[str, Any]) -> Dict[str, Any]:
     global_index = _build_bidirectional_alias_index(alias_config.get("general_aliases") or {})
     source_indexes = {}
     for source_key, aliases in (alias_config.get("source_aliases") or {}).items():
@@ -100,6 +100,10 @@ TEMPLATE_PAGE_SIZE = 10_000
 
 INSTRUMENT_PAGE_SIZE = DEFAULT_CHUNK_PAGE_SIZE
 
+# 1ページ目で meta.totalCounts が判明した後、残りページを並列取得する際の最大ワーカー数
+# （1 にすると従来どおりの逐次取得）
+PAGINATION_MAX_WORKERS = 4
+
 # タイムアウトは旧実装相当（短縮すると read timeout を誘発しやすい）
 TEMPLATE_REQUEST_TIMEOUT = 30
 INSTRUMENT_REQUEST_TIMEOUT = 10
@@ -800,6 +804,152 @@ def _merge_dataset_search_payloads(payloads: List[Dict]) -> Dict:
     return merged
 
 
+def _fetch_remaining_pages_concurrently(
+    *,
+    fetch_page: Callable[[int], Dict],
+    offsets: List[int],
+    first_chunk_index: int,
+    max_workers: int,
+    on_chunk: Callable[[int, int, Dict], bool],
+    chunk_label: str,
+) -> Dict[int, Dict]:
+    """totalCounts 判明後の残りページを有限ワーカープールで並列取得する
+
+    on_chunk はメインスレッドから完了順に呼ばれる（チャンクファイル保存・進捗通知用）。
+    False を返した場合は未着手のページをキャンセルし GroupFetchCancelled を送出する。
+
+    Returns:
+        {chunk_index: payload} （マージ時に chunk_index 昇順へ並べ替えて使用する）
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+    from net.session_manager import reserve_connection_pool
+
+    payload_by_index: Dict[int, Dict] = {}
+    if not offsets:
+        return payload_by_index
+
+    workers = max(1, min(int(max_workers), len(offsets)))
+    logger.info("%s: 残り%dページを並列取得します (並列: %d)", chunk_label, len(offsets), workers)
+
+    with reserve_connection_pool(workers):
+        executor = ThreadPoolExecutor(max_workers=workers)
+        try:
+            future_to_page = {
+                executor.submit(fetch_page, offset): (first_chunk_index + idx, offset)
+                for idx, offset in enumerate(offsets)
+            }
+            for future in as_completed(future_to_page):
+                chunk_index, offset = future_to_page[future]
+                payload = future.result()
+                payload_by_index[chunk_index] = payload
+                if not on_chunk(chunk_index, offset, payload):
+                    raise GroupFetchCancelled("キャンセルされました")
+        except BaseException:
+            # キャンセル・失敗時は未着手のページを破棄し、実行中のリクエスト完了を待たずに抜ける
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown(wait=True)
+    return payload_by_index
+
+
+def _download_pages_in_chunks(
+    *,
+    fetch_page: Callable[[int], Dict],
+    page_size: int,
+    chunk_label: str,
+    save_chunk: Optional[Callable[[int, Dict], None]] = None,
+    progress_callback: Optional[Callable[[int, int, str], bool]] = None,
+    max_workers: int = PAGINATION_MAX_WORKERS,
+) -> Dict:
+    """offset 単位のページを取得してマージする（ページング取得の共通ドライバ）
+
+    1ページ目の meta.totalCounts が得られた場合、残りの offset は max_workers 以内の
+    並列数で取得する（max_workers<=1 または totalCounts 不明時は逐次取得）。
+    save_chunk(chunk_index, payload) は取得したチャンクごとにメインスレッドから呼ばれる。
+    チャンク番号とマージ順序は offset 順で固定される。
+    """
+    total_expected = None
+    total_processed = 0
+    payload_by_index: Dict[int, Dict] = {}
+
+    def _handle_chunk(chunk_index: int, offset: int, payload: Dict) -> bool:
+        nonlocal total_expected, total_processed
+
+        payload_by_index[chunk_index] = payload
+        if save_chunk:
+            save_chunk(chunk_index, payload)
+
+        chunk_count = len(payload.get("data", []))
+        total_processed += chunk_count
+        if total_expected is None:
+            total_expected = payload.get("meta", {}).get("totalCounts")
+
+        logger.info(
+            "%s: チャンク%04dを取得 (件数=%d, offset=%d)",
+            chunk_label,
+            chunk_index,
+            chunk_count,
+            offset,
+        )
+
+        try:
+            total_for_progress = int(total_expected) if total_expected is not None else 0
+        except Exception:
+            total_for_progress = 0
+        return _progress_ok(
+            progress_callback,
+            int(total_processed),
+            int(total_for_progress),
+            f"{chunk_label}: {total_processed}/{total_for_progress if total_for_progress else '?'} (chunk={chunk_index}, offset={offset})",
+        )
+
+    first_payload = fetch_page(0)
+    if not _handle_chunk(1, 0, first_payload):
+        raise GroupFetchCancelled("キャンセルされました")
+
+    first_count = len(first_payload.get("data", []))
+    remaining_offsets = _remaining_page_offsets(total_expected, page_size, first_count)
+
+    if remaining_offsets is not None and max_workers > 1:
+        _fetch_remaining_pages_concurrently(
+            fetch_page=fetch_page,
+            offsets=remaining_offsets,
+            first_chunk_index=2,
+            max_workers=max_workers,
+            on_chunk=_handle_chunk,
+            chunk_label=chunk_label,
+        )
+    else:
+        offset = 0
+        chunk_index = 1
+        chunk_count = first_count
+        while True:
+            if total_expected is not None and total_processed >= total_expected:
+                break
+            if chunk_count == 0:
+                break
+            if total_expected is None and chunk_count < page_size:
+                break
+
+            offset += page_size
+            chunk_index += 1
+            payload = fetch_page(offset)
+            chunk_count = len(payload.get("data", []))
+            if not _handle_chunk(chunk_index, offset, payload):
+                raise GroupFetchCancelled("キャンセルされました")
+
+    chunk_payloads = [payload_by_index[idx] for idx in sorted(payload_by_index)]
+    merged_payload = _merge_dataset_chunk_payloads(chunk_payloads)
+    logger.info(
+        "%s: チャンク分割取得完了 (chunks=%d, records=%d, expected=%s)",
+        chunk_label,
+        len(chunk_payloads),
+        total_processed,
+        total_expected if total_expected is not None else "unknown",
+    )
+    return merged_payload
+
+
 def _download_paginated_resource(
     *,
     base_url: str,
@@ -813,21 +963,21 @@ def _download_paginated_resource(
     chunk_label: str,
     chunk_dir_factory: Optional[Callable[[], Path]] = None,
     chunk_file_template: Optional[str] = None,
+    max_workers: int = PAGINATION_MAX_WORKERS,
 ) -> Dict:
-    """共通のページング取得ロジック（1000件単位の分割取得用）"""
+    """共通のページング取得ロジック（1000件単位の分割取得用）
+
+    1ページ目の meta.totalCounts が得られた場合、残りの offset は max_workers 以内の
+    並列数で取得する（max_workers<=1 または totalCounts 不明時は従来どおり逐次取得）。
+    チャンクファイルの番号とマージ順序は offset 順で固定される。
+    """
     import time
 
     chunk_dir: Optional[Path] = None
     if chunk_dir_factory:
         chunk_dir = chunk_dir_factory()
 
-    offset = 0
-    chunk_index = 1
-    total_expected = None
-    total_processed = 0
-    chunk_payloads: List[Dict] = []
-
-    while True:
+    def _fetch_page(offset: int) -> Dict:
         params = dict(base_params or {})
         params["page[limit]"] = str(page_size)
         params["page[offset]"] = str(offset)
@@ -868,66 +1018,37 @@ def _download_paginated_resource(
         if record_callback:
             record_callback(url, headers, resp.status_code, elapsed_ms, success=True)
 
-        payload = resp.json()
-        chunk_payloads.append(payload)
-
-        if chunk_dir and chunk_file_template:
-            chunk_path = chunk_dir / chunk_file_template.format(chunk_index)
-            try:
-                with open(chunk_path, "w", encoding="utf-8") as f:
-                    json.dump(payload, f, ensure_ascii=False, indent=2)
-            except Exception as write_error:
-                logger.warning("%s: チャンクファイル書き込みに失敗しました (%s): %s", chunk_label, chunk_path, write_error)
-
-        chunk_count = len(payload.get("data", []))
-        total_processed += chunk_count
-        if total_expected is None:
-            total_expected = payload.get("meta", {}).get("totalCounts")
+        return resp.json()
 
-        if progress_callback:
-            try:
-                total_for_progress = int(total_expected) if total_expected is not None else 0
-            except Exception:
-                total_for_progress = 0
-
-            if not _progress_ok(
-                progress_callback,
-                int(total_processed),
-                int(total_for_progress),
-                f"{chunk_label}: {total_processed}/{total_for_progress if total_for_progress else '?'} (chunk={chunk_index}, offset={offset})",
-            ):
-                raise GroupFetchCancelled("キャンセルされました")
-
-        logger.info(
-            "%s: チャンク%04dを取得 (件数=%d, offset=%d)",
-            chunk_label,
-            chunk_index,
-            chunk_count,
-            offset,
-        )
-
-        if total_expected is not None and total_processed >= total_expected:
-            break
-        if chunk_count == 0:
-            break
-        if total_expected is None and chunk_count < page_size:
-            break
-
-        offset += page_size
-        chunk_index += 1
+    def _save_chunk(chunk_index: int, payload: Dict) -> None:
+        if not (chunk_dir and chunk_file_template):
+            return
+        chunk_path = chunk_dir / chunk_file_template.format(chunk_index)
+        try:
+            with open(chunk_path, "w", encoding="utf-8") as f:
+                json.dump(payload, f, ensure_ascii=False, indent=2)
+        except Exception as write_error:
+            logger.warning("%s: チャンクファイル書き込みに失敗しました (%s): %s", chunk_label, chunk_path, write_error)
+
+    return _download_pages_in_chunks(
+        fetch_page=_fetch_page,
+        page_size=page_size,
+        chunk_label=chunk_label,
+        save_chunk=_save_chunk,
+        progress_callback=progress_callback,
+        max_workers=max_workers,
+    )
 
-    if not chunk_payloads:
-        return {"data": []}
 
-    merged_payload = _merge_dataset_chunk_payloads(chunk_payloads)
-    logger.info(
-        "%s: チャンク分割取得完了 (chunks=%d, records=%d, expected=%s)",
-        chunk_label,
-        len(chunk_payloads),
-        total_processed,
-        total_expected if total_expected is not None else "unknown",
-    )
-    return merged_payload
+def _remaining_page_offsets(total_expected, page_size: int, first_count: int) -> Optional[List[int]]:
+    """1ページ目取得後に残っている offset 一覧を返す（totalCounts 不明時は None）"""
+    try:
+        total = int(total_expected)
+    except (TypeError, ValueError):
+        return None
+    if first_count <= 0 or total <= first_count:
+        return []
+    return list(range(page_size, total, page_size))
 
 
 def _download_dataset_list_in_chunks(
@@ -935,17 +1056,15 @@ def _download_dataset_list_in_chunks(
     headers: Dict[str, str],
     search_words: Optional[str] = None,
     page_size: int = DATASET_LIST_PAGE_SIZE,
+    progress_callback: Optional[Callable[[int, int, str], bool]] = None,
+    max_workers: int = PAGINATION_MAX_WORKERS,
 ) -> Dict:
+    """データセット一覧をチャンク取得する（2ページ目以降は totalCounts に基づき並列取得）"""
     import time
 
     chunk_dir = _prepare_dataset_chunk_directory()
-    offset = 0
-    chunk_index = 1
-    total_expected = None
-    total_processed = 0
-    chunk_payloads: List[Dict] = []
 
-    while True:
+    def _fetch_page(offset: int) -> Dict:
         query_params = _build_dataset_list_query_params(page_size, offset, search_words)
         url = _build_dataset_list_url(query_params)
         start_time = time.time()
@@ -971,43 +1090,21 @@ def _download_dataset_list_in_chunks(
             raise
 
         _record_dataset_list_api_call(url, headers, resp.status_code, elapsed_ms, query_params, True)
+        return resp.json()
 
-        payload = resp.json()
-        chunk_payloads.append(payload)
+    def _save_chunk(chunk_index: int, payload: Dict) -> None:
         chunk_path = chunk_dir / DATASET_CHUNK_FILE_TEMPLATE.format(chunk_index)
         with open(chunk_path, "w", encoding="utf-8") as f:
             json.dump(payload, f, ensure_ascii=False, indent=2)
 
-        chunk_count = len(payload.get("data", []))
-        total_processed += chunk_count
-        if total_expected is None:
-            total_expected = payload.get("meta", {}).get("totalCounts")
-
-        logger.info(
-            "データセット一覧: チャンク%04dを取得 (件数=%d, offset=%d)",
-            chunk_index,
-            chunk_count,
-            offset,
-        )
-
-        if total_expected is not None and total_processed >= total_expected:
-            break
-        if chunk_count == 0:
-            break
-        if total_expected is None and chunk_count < page_size:
-            break
-
-        offset += page_size
-        chunk_index += 1
-
-    merged_payload = _merge_dataset_chunk_payloads(chunk_payloads)
-    logger.info(
-        "データセット一覧: チャンク分割取得完了 (chunks=%d, records=%d, expected=%s)",
-        len(chunk_payloads),
-        total_processed,
-        total_expected if total_expected is not None else "unknown",
+    return _download_pages_in_chunks(
+        fetch_page=_fetch_page,
+        page_size=page_size,
+        chunk_label="データセット一覧",
+        save_chunk=_save_chunk,
+        progress_callback=progress_callback,
+        max_workers=max_workers,
     )
-    return merged_payload
 
 def fetch_invoice_schemas(bearer_token, output_dir, progress_callback=None, max_workers: int = 10):
     """
@@ -1316,7 +1413,121 @@ def fetch_self_info_from_api(bearer_token=None, output_dir=None, parent_widget=N
         raise
 
 
-def fetch_all_data_entrys_info(bearer_token, output_dir=None, progress_callback=None, parallel_threshold: int = 50, max_workers: int = 10):
+# dataEntry 差分同期用マニフェスト（dataEntry/ 直下に置くとデータセットIDと誤認されるため親ディレクトリに保存）
+DATA_ENTRY_SYNC_MANIFEST_NAME = "dataEntry_sync_manifest.json"
+DATA_ENTRY_SYNC_MANIFEST_VERSION = 1
+
+
+def _dataset_change_marker(dataset: Dict) -> str:
+    """dataset.json の1件から差分判定用の変更マーカー文字列を生成する
+
+    dataset.json の一覧にはエントリ件数を表す項目が含まれないため、マーカーは
+    attributes.modified のみ。エントリ追加で modified が更新されない場合は検出できない
+    （マニフェスト未記録のファイルはデータセットの modified との更新時刻比較で再取得を判断する）。
+    """
+    attrs = (dataset or {}).get("attributes") or {}
+    return str(attrs.get("modified") or "")
+
+
+def _load_data_entry_sync_manifest(path: str) -> Dict[str, Dict]:
+    """差分同期マニフェストを読み込み {dataset_id: record} を返す（不正・未作成時は空）"""
+    payload = _load_json_if_exists(path)
+    if not isinstance(payload, dict) or payload.get("version") != DATA_ENTRY_SYNC_MANIFEST_VERSION:
+        return {}
+    datasets = payload.get("datasets")
+    return dict(datasets) if isinstance(datasets, dict) else {}
+
+
+def _save_data_entry_sync_manifest(path: str, records: Dict[str, Dict]) -> None:
+    """差分同期マニフェストをアトミックに保存する"""
+    payload = {
+        "version": DATA_ENTRY_SYNC_MANIFEST_VERSION,
+        "updatedAt": datetime.now(timezone.utc).isoformat(),
+        "datasets": records,
+    }
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except Exception as exc:
+        logger.warning("dataEntry差分同期マニフェストの保存に失敗しました (%s): %s", path, exc)
+
+
+def _data_entry_file_is_current(path: str, dataset: Dict) -> bool:
+    """既存の dataEntry ファイルがデータセットの最終更新（attributes.modified）以降に保存されたか"""
+    modified = ((dataset or {}).get("attributes") or {}).get("modified")
+    if not modified:
+        return False
+    try:
+        modified_at = parse_datetime(str(modified))
+        if modified_at.tzinfo is None:
+            modified_at = modified_at.replace(tzinfo=timezone.utc)
+        return os.path.getmtime(path) >= modified_at.timestamp()
+    except (ValueError, OverflowError, OSError):
+        return False
+
+
+def _plan_data_entry_delta_sync(
+    datasets: List[Dict],
+    existing_ids: set,
+    manifest: Dict[str, Dict],
+    entry_dir: str,
+) -> Dict:
+    """dataset.json とマニフェストを比較し、取得対象と added/changed/unchanged の内訳を返す
+
+    - added: dataEntry/{id}.json が存在しない
+    - changed: マニフェスト記録済みのマーカーと現在のマーカーが異なる
+    - unchanged: マーカー一致。マニフェスト未記録だがファイルが存在するもの（旧バージョンで
+      取得済み）は、ファイルの更新時刻がデータセットの modified 以降なら現在のマーカーを
+      基準値として採用し、再取得しない（ファイルの方が古い・判定できない場合は changed）
+    """
+    markers: Dict[str, str] = {}
+    added: List[str] = []
+    changed: List[str] = []
+    unchanged: List[str] = []
+    baselined: List[str] = []
+
+    for ds in datasets:
+        ds_id = ds.get("id")
+        if not ds_id:
+            continue
+        marker = _dataset_change_marker(ds)
+        markers[ds_id] = marker
+        if ds_id not in existing_ids:
+            added.append(ds_id)
+            continue
+        record = manifest.get(ds_id)
+        if record is None:
+            if _data_entry_file_is_current(os.path.join(entry_dir, f"{ds_id}.json"), ds):
+                baselined.append(ds_id)
+                unchanged.append(ds_id)
+            else:
+                changed.append(ds_id)
+        elif record.get("marker") != marker:
+            changed.append(ds_id)
+        else:
+            unchanged.append(ds_id)
+
+    removed = [ds_id for ds_id in manifest if ds_id not in markers]
+    return {
+        "markers": markers,
+        "added": added,
+        "changed": changed,
+        "unchanged": unchanged,
+        "baselined": baselined,
+        "removed": removed,
+    }
+
+
+def fetch_all_data_entrys_info(
+    bearer_token,
+    output_dir=None,
+    progress_callback=None,
+    parallel_threshold: int = 50,
+    max_workers: int = 10,
+    delta_sync: bool = True,
+):
     """
     dataset.json内の全データセットIDでfetch_data_entry_info_from_apiを呼び出す
     
@@ -1325,6 +1536,8 @@ def fetch_all_data_entrys_info(bearer_token, output_dir=None, progress_callback=
     v2.5: 事前フィルタリング + TTLCache共有化で不要なリクエスト・I/Oを削減
     v2.5.46: TTLCache依存を除去し、ファイル存在チェックのみで事前フィルタリング
              （TTLCache の30分TTL切れにより全件再取得されるバグを修正）
+    差分同期: dataset.json の変更マーカー（attributes.modified 等）を同期マニフェストと比較し、
+             新規・変更されたデータセットのみ再取得する（delta_sync=False で従来のファイル存在チェックのみ）
     
     Args:
         bearer_token: 認証トークン
@@ -1332,9 +1545,11 @@ def fetch_all_data_entrys_info(bearer_token, output_dir=None, progress_callback=
         progress_callback: プログレスコールバック関数 (current, total, message) -> bool
         parallel_threshold: 並列化閾値（デフォルト: 50件）
         max_workers: 最大並列ワーカー数（デフォルト: 10）
+        delta_sync: 変更マーカーによる差分同期を行うか（デフォルト: True）
     """
     try:
         import time as _time
+        import threading
         from net.http_helpers import parallel_download
         
         output_dir = output_dir or OUTPUT_RDE_DATA_DIR
@@ -1356,7 +1571,7 @@ def fetch_all_data_entrys_info(bearer_token, output_dir=None, progress_callback=
         total_datasets = len(datasets)
         all_ids = [ds.get("id") for ds in datasets if ds.get("id")]
 
-        # --- 事前フィルタリング: ファイル存在チェック ---
+        # --- 事前フィルタリング: ファイル存在チェック + 変更マーカー比較 ---
         # v2.5.46: TTLCache依存を除去。ディレクトリ一覧で一括チェック（per-file os.path.exists より高速）
         t_filter_start = _time.perf_counter()
         target_dir = os.path.join(output_dir, "dataEntry")
@@ -1365,31 +1580,49 @@ def fetch_all_data_entrys_info(bearer_token, output_dir=None, progress_callback=
         # ディレクトリ内の既存ファイル名を一括取得
         existing_ids = {f[:-5] for f in os.listdir(target_dir) if f.endswith(".json")}
 
-        need_fetch_ids = []
-        skipped_by_cache = 0
-        for ds_id in all_ids:
-            if ds_id in existing_ids:
-                skipped_by_cache += 1
-            else:
-                need_fetch_ids.append(ds_id)
+        manifest_path = os.path.join(output_dir, DATA_ENTRY_SYNC_MANIFEST_NAME)
+        manifest: Dict[str, Dict] = {}
+        if delta_sync:
+            manifest = _load_data_entry_sync_manifest(manifest_path)
+            plan = _plan_data_entry_delta_sync(datasets, existing_ids, manifest, target_dir)
+            need_fetch_ids = plan["added"] + plan["changed"]
+            markers = plan["markers"]
+            for ds_id in plan["baselined"]:
+                manifest[ds_id] = {"marker": markers[ds_id]}
+            for ds_id in plan["removed"]:
+                manifest.pop(ds_id, None)
+            added_count = len(plan["added"])
+            changed_count = len(plan["changed"])
+            skipped_by_cache = len(plan["unchanged"])
+        else:
+            markers = {}
+            need_fetch_ids = [ds_id for ds_id in all_ids if ds_id not in existing_ids]
+            added_count = len(need_fetch_ids)
+            changed_count = 0
+            skipped_by_cache = len(all_ids) - added_count
 
         t_filter_elapsed = _time.perf_counter() - t_filter_start
         logger.info(
-            "データエントリ事前フィルタ: 総数=%d, キャッシュ済=%d, 要取得=%d (%.2f秒)",
-            total_datasets, skipped_by_cache, len(need_fetch_ids), t_filter_elapsed,
+            "データエントリ事前フィルタ: 総数=%d, 新規=%d, 変更=%d, 変更なし=%d, 要取得=%d (差分同期=%s, %.2f秒)",
+            total_datasets, added_count, changed_count, skipped_by_cache, len(need_fetch_ids),
+            delta_sync, t_filter_elapsed,
         )
 
         if progress_callback:
             msg = (f"データエントリ取得開始: 総数={total_datasets}件, "
-                   f"キャッシュ済={skipped_by_cache}件, 要取得={len(need_fetch_ids)}件 "
+                   f"新規={added_count}件, 変更={changed_count}件, 変更なし={skipped_by_cache}件, "
+                   f"要取得={len(need_fetch_ids)}件 "
                    f"(並列: {max_workers})")
             if not progress_callback(0, len(need_fetch_ids) or 1, msg):
                 return "キャンセルされました"
 
         # 全件キャッシュ済みなら即完了
         if not need_fetch_ids:
+            if delta_sync:
+                _save_data_entry_sync_manifest(manifest_path, manifest)
             result_msg = (f"データエントリ情報取得完了: "
-                         f"成功=0, 失敗=0, スキップ={skipped_by_cache}, 総数={total_datasets}")
+                         f"成功=0, 失敗=0, 新規=0, 変更=0, "
+                         f"スキップ={skipped_by_cache}, 総数={total_datasets}")
             logger.info(result_msg)
             if progress_callback:
                 progress_callback(100, 100, result_msg)
@@ -1397,11 +1630,17 @@ def fetch_all_data_entrys_info(bearer_token, output_dir=None, progress_callback=
 
         # --- タスクリストを要取得分のみで作成 ---
         tasks = [(bearer_token, ds_id) for ds_id in need_fetch_ids]
+        manifest_lock = threading.Lock()
 
         def worker(token, ds_id):
             """ワーカー関数（呼び出し元で事前フィルタ済み）"""
             try:
-                fetch_data_entry_info_from_api(token, ds_id, output_dir=target_dir, _shared_cache=True)
+                saved = fetch_data_entry_info_from_api(token, ds_id, output_dir=target_dir, _shared_cache=True)
+                if saved is False:
+                    return "failed: empty response"
+                if delta_sync:
+                    with manifest_lock:
+                        manifest[ds_id] = {"marker": markers.get(ds_id, "")}
                 return "success"
             except Exception as e:
                 logger.error(f"データエントリ処理失敗: ds_id={ds_id}, error={e}")
@@ -1414,19 +1653,27 @@ def fetch_all_data_entrys_info(bearer_token, output_dir=None, progress_callback=
             return True
         
         t_fetch_start = _time.perf_counter()
-        result = parallel_download(
-            tasks=tasks,
-            worker_function=worker,
-            max_workers=max_workers,
-            progress_callback=adjusted_progress_callback,
-            threshold=parallel_threshold,
-            progress_mode="count",
-        )
+        try:
+            result = parallel_download(
+                tasks=tasks,
+                worker_function=worker,
+                max_workers=max_workers,
+                progress_callback=adjusted_progress_callback,
+                threshold=parallel_threshold,
+                progress_mode="count",
+            )
+        finally:
+            # キャンセル・失敗時も取得済み分のマーカーは保存し、次回は残りのみ再取得する
+            if delta_sync:
+                with manifest_lock:
+                    _save_data_entry_sync_manifest(manifest_path, dict(manifest))
         t_fetch_elapsed = _time.perf_counter() - t_fetch_start
 
         result_msg = (f"データエントリ情報取得完了: "
                      f"成功={result['success_count']}, "
                      f"失敗={result['failed_count']}, "
+                     f"新規={added_count}, "
+                     f"変更={changed_count}, "
                      f"スキップ={skipped_by_cache}, "
                      f"総数={total_datasets} "
                      f"(取得: {t_fetch_elapsed:.1f}秒)")
@@ -1457,6 +1704,9 @@ def fetch_data_entry_info_from_api(bearer_token, dataset_id, output_dir=None, fo
     v2.3: TTLCache連携 - キャッシュ有効なら再取得をスキップ
     v2.5: _shared_cache パラメータでTTLCacheインスタンスの共有に対応（I/O削減）
     v2.5.46: _shared_cache は真偽値のセンチネルとして使用（呼び出し元で事前フィルタ済みを示す）
+
+    Returns:
+        保存した場合 True、レスポンスが得られなかった場合 False（キャッシュ有効でスキップ時は None）
     """
     url = f"https://rde-api.nims.go.jp/data?filter%5Bdataset.id%5D={dataset_id}&sort=-created&page%5Boffset%5D=0&page%5Blimit%5D=100&include=owner%2Csample%2CthumbnailFile%2Cfiles"
     target_dir = output_dir or DATA_ENTRY_DIR
@@ -1486,7 +1736,7 @@ def fetch_data_entry_info_from_api(bearer_token, dataset_id, output_dir=None, fo
         resp = api_request("GET", url, bearer_token=None, headers=headers, timeout=10)
         if resp is None:
             logger.error(f"データエントリ取得失敗: dataset_id={dataset_id}")
-            return
+            return False
         resp.raise_for_status()
         data = resp.json()
         
@@ -1499,6 +1749,7 @@ def fetch_data_entry_info_from_api(bearer_token, dataset_id, output_dir=None, fo
             cache.put(f"entry:{dataset_id}", True)
             
         logger.info(f"データエントリ取得・保存完了: {dataset_id}.json -> {save_path}")
+        return True
         
     except Exception as e:
         logger.error(f"データエントリ取得・保存失敗: dataset_id={dataset_id}, error={e}")
@@ -1871,6 +2122,7 @@ def fetch_all_dataset_info(
                 bearer_token=bearer_token,
                 headers=headers,
                 search_words=target,
+                progress_callback=emit_progress,
             )
             target_payloads.append(chunk_payload)
 
@@ -1893,6 +2145,9 @@ def fetch_all_dataset_info(
 
         logger.info("データセット情報(dataset.json)取得・保存完了")
 
+    except GroupFetchCancelled:
+        logger.info("データセット一覧取得がキャンセルされました")
+        return "キャンセルされました"
     except Exception as e:
         logger.error("データセット情報取得・保存失敗: %s (searchTargets=%s)", e, search_targets)
         raise
@@ -3910,7 +4165,12 @@ def auto_refresh_dataset_json(bearer_token, progress_callback=None):
         logger.info("データセット開設成功 - dataset.json自動更新開始")
         
         # データセット一覧のみ更新（個別データセット詳細は除く）
-        fetch_dataset_list_only(bearer_token, output_dir=os.path.join(OUTPUT_DIR, "rde", "data"))
+        if fetch_dataset_list_only(
+            bearer_token,
+            output_dir=os.path.join(OUTPUT_DIR, "rde", "data"),
+            progress_callback=progress_callback,
+        ) == "キャンセルされました":
+            return "キャンセルされました"
         
         if progress_callback:
             if not progress_callback(100, 100, "データセット一覧自動更新完了"):
@@ -4054,7 +4314,6 @@ def fetch_basic_info_logic(
     import json
     from pathlib import Path
     from core.bearer_token_manager import BearerTokenManager
-    from qt_compat.widgets import QMessageBox
 
     try:
         resolved_workers = int(parallel_max_workers) if parallel_max_workers is not None else None
@@ -4099,6 +4358,8 @@ def fetch_basic_info_logic(
                             break
                 
                 # エラーメッセージを表示
+                from qt_compat.widgets import QMessageBox
+
                 QMessageBox.information(
                     parent,
                     "再ログインが必要",
@@ -5637,7 +5898,6 @@ def fetch_common_info_only_logic(
     import traceback
     from datetime import datetime
     from core.bearer_token_manager import BearerTokenManager
-    from qt_compat.widgets import QMessageBox
     
     # ===== API記録初期化（v2.1.16新規追加） =====
     try:
@@ -5681,6 +5941,8 @@ def fetch_common_info_only_logic(
                             break
                 
                 # エラーメッセージを表示
+                from qt_compat.widgets import QMessageBox
+
                 QMessageBox.information(
                     parent,
                     "再ログインが必要",
@@ -5885,7 +6147,15 @@ def fetch_common_info_only_logic(
             
         logger.debug("fetch_dataset_list_only")
         if force_download or not _exists(DATASET_JSON_PATH):
-            fetch_dataset_list_only(bearer_token, output_dir=os.path.join(OUTPUT_DIR, "rde", "data"))
+            list_result = fetch_dataset_list_only(
+                bearer_token,
+                output_dir=os.path.join(OUTPUT_DIR, "rde", "data"),
+                progress_callback=lambda current, total, message: update_stage_progress(
+                    3, int(current * 100 / total) if total else 0, message
+                ),
+            )
+            if list_result == "キャンセルされました":
+                return list_result
         else:
             logger.info("データセット一覧: 既存の dataset.json を利用するため取得をスキップします")
         
@@ -5963,8 +6233,12 @@ def fetch_common_info_only_logic(
         traceback.print_exc()
         return error_msg
 
-def fetch_dataset_list_only(bearer_token, output_dir=None):
-    """データセット一覧のみを取得し、dataset.jsonとして保存（個別JSONは取得しない）"""
+def fetch_dataset_list_only(bearer_token, output_dir=None, progress_callback=None):
+    """データセット一覧のみを取得し、dataset.jsonとして保存（個別JSONは取得しない）
+
+    progress_callback(取得件数, 総件数, メッセージ) が False を返すとページ取得を打ち切り、
+    dataset.json を更新せずに "キャンセルされました" を返す。
+    """
     # パス区切りを統一
     output_dir = os.path.normpath(output_dir or OUTPUT_RDE_DATA_DIR)
 
@@ -5975,7 +6249,11 @@ def fetch_dataset_list_only(bearer_token, output_dir=None):
             bearer_token=bearer_token,
             headers=headers,
             search_words=None,
+            progress_callback=progress_callback,
         )
+    except GroupFetchCancelled:
+        logger.info("データセット一覧取得がキャンセルされました")
+        return "キャンセルされました"
     except Exception as e:
         logger.error("データセット一覧の取得に失敗しました: %s", e)
 
@@ -621,7 +621,12 @@ def fetch_common_info_with_selection_logic(
         elif tid == CommonInfo2Keys.TARGET_DATASET_LIST:
             emit("データセット一覧取得中...")
             t0 = time.perf_counter()
-            fetch_dataset_list_only(bearer_token, output_dir=get_dynamic_file_path("output/rde/data"))
+            if fetch_dataset_list_only(
+                bearer_token,
+                output_dir=get_dynamic_file_path("output/rde/data"),
+                progress_callback=lambda _current, _total, message: emit(message),
+            ) == "キャンセルされました":
+                return "キャンセルされました"
             save_fetch_meta(tid, elapsed_seconds=(time.perf_counter() - t0))
 
         elif tid == CommonInfo2Keys.TARGET_TEMPLATE:
@@ -690,7 +695,12 @@ def fetch_common_info_with_selection_logic(
             # dataset.jsonが無ければ先に取得
             if not Path(DATASET_JSON_PATH).exists():
                 t0_list = time.perf_counter()
-                fetch_dataset_list_only(bearer_token, output_dir=get_dynamic_file_path("output/rde/data"))
+                if fetch_dataset_list_only(
+                    bearer_token,
+                    output_dir=get_dynamic_file_path("output/rde/data"),
+                    progress_callback=lambda _current, _total, message: emit(message),
+                ) == "キャンセルされました":
+                    return "キャンセルされました"
                 save_fetch_meta(CommonInfo2Keys.TARGET_DATASET_LIST, elapsed_seconds=(time.perf_counter() - t0_list))
 
             t0 = time.perf_counter()
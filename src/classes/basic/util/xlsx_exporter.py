@@ -12,6 +12,7 @@ import openpyxl
 from dateutil.parser import parse as parse_datetime
 
 from classes.basic.conf.summary_export_options import SummaryExportMode, SummaryExportOptions
+from classes.core.json_repository import load_json_cached
 from config.common import (
     get_dynamic_file_path,
     INPUT_DIR,
@@ -277,13 +278,24 @@ def _run_single_summary_job(
     while True:
         if not os.path.exists(abs_xlsx) or _is_xlsx_writable(abs_xlsx):
             try:
-                wb = openpyxl.load_workbook(abs_xlsx)
                 summary_context = {
                     "subGroup_included": job.included_items,
                     "dataset_data": dataset_data,
                     "instruments_data": instruments_data,
                     "allowed_group_ids": job.allowed_group_ids,
                 }
+                if SUMMARY_STREAMING_EXPORT:
+                    if not write_summary_workbook_streaming(
+                        abs_xlsx,
+                        parent,
+                        summary_context=summary_context,
+                        progress_callback=progress_callback if progress_callback else None,
+                    ):
+                        return False
+                    emit_progress(1, 1, "XLSX書き出し完了")
+                    return True
+
+                wb = openpyxl.load_workbook(abs_xlsx)
                 write_summary_sheet(
                     wb,
                     parent,
@@ -331,15 +343,20 @@ def _run_single_summary_job(
             QMessageBox.critical(parent, "書き込みエラー", "書き込みを中止しました。")
             return False
 
-def load_json(path):
-    import json
+def load_json(path, *, cache=True):
+    """
+    取得済みJSONを共有リポジトリ経由で読み込む（返り値は他の処理と共有のため変更しない）
+
+    cache=False はデータセットごとの dataEntry など一度しか読まないファイル用（共有リポジトリに保持しない）。
+    """
     abs_path = os.path.abspath(path)
     if not os.path.exists(abs_path):
         logger.error("%sが存在しません: %s", path, abs_path)
         return None
-    with open(abs_path, "r", encoding="utf-8") as f:
+    data = load_json_cached(abs_path, store=cache)
+    if data is not None:
         logger.info("[XLSX] JSONロード成功: %s", abs_path)
-        return json.load(f)
+    return data
 def apply_basic_info_to_Xlsx_logic(bearer_token, parent=None, webview=None, ui_callback=None):
     """
     各種JSONを読み込み、XLSXの対応シートに反映（責務分離構造）
@@ -377,6 +394,69 @@ def apply_basic_info_to_Xlsx_logic(bearer_token, parent=None, webview=None, ui_c
         raise
 
 
+SUMMARY_MISSING_DATA_MESSAGE = "必要なJSONデータが不足しています。基本情報を取得してから再実行してください。"
+SUMMARY_NO_TARGET_MESSAGE = "出力対象となるサブグループが見つかりませんでした。"
+
+
+class SummaryExportError(RuntimeError):
+    """まとめXLSXを出力できない（前提データ不足・書き込み不可など）"""
+
+
+def _prepare_summary_export(export_options):
+    """出力ジョブと、全ジョブ共通の dataset / instruments JSON を読み込む"""
+    options = SummaryExportOptions.from_payload(export_options).with_sanitized_suffix()
+
+    default_xlsx = os.path.abspath(os.path.join(OUTPUT_DIR, "summary.xlsx"))
+    group_payloads = _load_group_payloads(
+        additional_paths=options.extra_project_files,
+        selected_default_files=options.project_files or None,
+    )
+    jobs = _build_summary_jobs(options, default_xlsx, group_payloads)
+    if not jobs:
+        jobs = _build_summary_jobs(SummaryExportOptions(), default_xlsx, group_payloads)
+
+    return jobs, load_json(DATASET_JSON_PATH), load_json(INSTRUMENTS_JSON_PATH)
+
+
+def export_summary_workbooks(export_options=None, progress_callback=None) -> List[str]:
+    """
+    まとめXLSXをダイアログ無しで出力する（CLI・定期実行向け、Qtを読み込まない）
+
+    Returns:
+        出力したファイルパスのリスト（progress_callback が False を返した場合はそこまで）
+
+    Raises:
+        SummaryExportError: 前提データ不足、出力対象なし、ファイルが他で開かれている場合
+    """
+    jobs, dataset_json, instruments_json = _prepare_summary_export(export_options)
+    if not dataset_json or not instruments_json:
+        raise SummaryExportError(SUMMARY_MISSING_DATA_MESSAGE)
+    if not jobs:
+        raise SummaryExportError(SUMMARY_NO_TARGET_MESSAGE)
+
+    results: List[str] = []
+    for idx, job in enumerate(jobs, start=1):
+        abs_xlsx = job.output_path
+        _ensure_summary_workbook(abs_xlsx)
+        if not _is_xlsx_writable(abs_xlsx):
+            raise SummaryExportError(f"Excelファイルが他で開かれているため書き込みできません: {abs_xlsx}")
+        summary_context = {
+            "subGroup_included": job.included_items,
+            "dataset_data": dataset_json.get("data", []),
+            "instruments_data": instruments_json.get("data", []),
+            "allowed_group_ids": job.allowed_group_ids,
+        }
+        if not write_summary_workbook_streaming(
+            abs_xlsx,
+            None,
+            summary_context=summary_context,
+            progress_callback=_wrap_job_progress(idx, len(jobs), progress_callback),
+        ):
+            break
+        results.append(abs_xlsx)
+    return results
+
+
 def summary_basic_info_to_Xlsx_logic(
     bearer_token,
     parent=None,
@@ -389,31 +469,17 @@ def summary_basic_info_to_Xlsx_logic(
 
     from qt_compat.widgets import QMessageBox
 
-    options = SummaryExportOptions.from_payload(export_options).with_sanitized_suffix()
-
-    default_xlsx = os.path.abspath(os.path.join(OUTPUT_DIR, "summary.xlsx"))
-    group_payloads = _load_group_payloads(
-        additional_paths=options.extra_project_files,
-        selected_default_files=options.project_files or None,
-    )
-    jobs = _build_summary_jobs(options, default_xlsx, group_payloads)
+    jobs, dataset_json, instruments_json = _prepare_summary_export(export_options)
     total_jobs = len(jobs)
-    if total_jobs == 0:
-        jobs = _build_summary_jobs(SummaryExportOptions(), default_xlsx, group_payloads)
-        total_jobs = len(jobs)
-
-    dataset_json = load_json(DATASET_JSON_PATH)
-    instruments_json = load_json(INSTRUMENTS_JSON_PATH)
     if not dataset_json or not instruments_json:
-        msg = "必要なJSONデータが不足しています。基本情報を取得してから再実行してください。"
-        QMessageBox.critical(parent, "データ不足", msg)
+        QMessageBox.critical(parent, "データ不足", SUMMARY_MISSING_DATA_MESSAGE)
         return False
 
     dataset_data = dataset_json.get("data", [])
     instruments_data = instruments_json.get("data", [])
 
     if total_jobs == 0:
-        QMessageBox.information(parent, "処理対象なし", "出力対象となるサブグループが見つかりませんでした。")
+        QMessageBox.information(parent, "処理対象なし", SUMMARY_NO_TARGET_MESSAGE)
         return False
 
     results: List[str] = []
@@ -446,8 +512,512 @@ def summary_basic_info_to_Xlsx_logic(
     return True
 
 
+# --- summary シート生成（通常モード／ストリーミングモード共通） ---
+
+SUMMARY_SHEET_NAME = "summary"
+
+# summary シートの列定義（1行目: ID、2行目: ラベル、3行目以降: データ）
+SUMMARY_HEADER_DEF = [
+    {"id": "subGroupName", "label": "サブグループ名"},
+    {"id": "dataset_manager_name", "label": "管理者名"},
+    {"id": "dataset_applicant_name", "label": "申請者名"},
+    {"id": "dataset_owner_names_str", "label": "オーナー名リスト"},
+    {"id": "grantNumber", "label": "課題番号"},
+    {"id": "title", "label": "課題名"},
+    {"id": "datasetName", "label": "データセット名"},
+    {"id": "instrument_name", "label": "装置名"},
+    {"id": "instrument_local_id", "label": "装置 ID"},
+    {"id": "template_id", "label": "テンプレートID"},
+    {"id": "datasetId", "label": "データセットID"},
+    {"id": "dataEntryName", "label": "データエントリ名"},
+    {"id": "dataEntryId", "label": "データエントリID"},
+    {"id": "number_of_files", "label": "ファイル数"},
+    {"id": "number_of_image_files", "label": "画像ファイル数"},
+    {"id": "date_of_dataEntry_creation", "label": "データエントリ作成日"},
+    {"id": "total_file_size_MB", "label": "ファイル合計サイズ(MB)"},
+    {"id": "dataset_embargoDate", "label": "エンバーゴ日"},
+    {"id": "dataset_isAnonymized", "label": "匿名化"},
+    {"id": "dataset_description", "label": "データセット説明"},
+    {"id": "dataset_relatedLinks", "label": "関連リンク"},
+    {"id": "dataset_relatedDatasets", "label": "関連データセット"},
+    # --- ファイルタイプ集計ヘッダ ---
+    {"id": "filetype_MAIN_IMAGE_count", "label": "MAIN_IMAGEファイル数"},
+    {"id": "filetype_MAIN_IMAGE_size", "label": "MAIN_IMAGE合計サイズ"},
+    {"id": "filetype_STRUCTURED_count", "label": "STRUCTUREDファイル数"},
+    {"id": "filetype_STRUCTURED_size", "label": "STRUCTURED合計サイズ"},
+    {"id": "filetype_THUMBNAIL_count", "label": "THUMBNAILファイル数"},
+    {"id": "filetype_THUMBNAIL_size", "label": "THUMBNAIL合計サイズ"},
+    {"id": "filetype_META_count", "label": "METAファイル数"},
+    {"id": "filetype_META_size", "label": "META合計サイズ"},
+    {"id": "filetype_OTHER_count", "label": "OTHERファイル数"},
+    {"id": "filetype_OTHER_size", "label": "OTHER合計サイズ"},
+    {"id": "filetype_total_count", "label": "ファイル総数"},
+    {"id": "filetype_total_size", "label": "ファイル総サイズ"},
+]
+
+# 2枚目のシート（既定では「データ」）に書き込まれる互換ヘッダー
+_LEGACY_DATA_SHEET_HEADER_IDS = [coldef["id"] for coldef in SUMMARY_HEADER_DEF[:22]]
+
+_SUMMARY_PRESET_FILETYPES = ["MAIN_IMAGE", "STRUCTURED", "THUMBNAIL", "META"]
+
+# True の場合、まとめXLSXは write_only モードで1行ずつ書き出す（エントリ数に依存せずメモリ一定）
+SUMMARY_STREAMING_EXPORT = True
+
+
+class _SummaryExportCancelled(Exception):
+    """summary 行生成中に progress_callback がキャンセルを返した"""
+
+
+def _is_blank_header(id_) -> bool:
+    return id_ in (None, "") or str(id_).strip() == ""
+
+
+def _summary_header_ids(existing_id_row) -> List[str]:
+    """既存ID列の順番を優先し、不足分を SUMMARY_HEADER_DEF 順で追加（空値は除外）"""
+    header_ids = [id_ for id_ in (existing_id_row or []) if not _is_blank_header(id_)]
+    for coldef in SUMMARY_HEADER_DEF:
+        if coldef["id"] not in header_ids:
+            header_ids.append(coldef["id"])
+    return header_ids
+
+
+def _collect_summary_manual_data(header_ids: Sequence[str], rows: Iterable[Sequence]) -> dict:
+    """既存データ行から手動列（SUMMARY_HEADER_DEFにない列）の値を集める
+
+    key: ("dataEntryId", id) or ("datasetId", id) -> {manual_col: value, ...}
+    手動列が無い場合は既存行を読まずに空辞書を返す。
+    """
+    generated_ids = {coldef["id"] for coldef in SUMMARY_HEADER_DEF}
+    manual_col_ids = [id_ for id_ in header_ids if id_ not in generated_ids]
+    manual_data_map = {}
+    if not manual_col_ids:
+        return manual_data_map
+    for values in rows:
+        # header_idsとrowの長さが異なる場合も安全にペア化
+        row_dict = dict(zip(header_ids, values))
+        dataset_id = row_dict.get("datasetId", "")
+        data_entry_id = row_dict.get("dataEntryId", "")
+        if data_entry_id:
+            manual_data_map[("dataEntryId", data_entry_id)] = {col: row_dict.get(col, None) for col in manual_col_ids}
+        elif dataset_id:
+            manual_data_map[("datasetId", dataset_id)] = {col: row_dict.get(col, None) for col in manual_col_ids}
+    return manual_data_map
+
+
+def _lookup_manual_restore(manual_data_map: dict, value_dict: dict) -> dict:
+    data_entry_id = value_dict.get("dataEntryId", "")
+    dataset_id = value_dict.get("datasetId", "")
+    if data_entry_id and ("dataEntryId", data_entry_id) in manual_data_map:
+        return manual_data_map[("dataEntryId", data_entry_id)]
+    if dataset_id and ("datasetId", dataset_id) in manual_data_map:
+        return manual_data_map[("datasetId", dataset_id)]
+    return {}
+
+
+def _load_summary_sources(subGroup_included, dataset_data, instruments_data):
+    """summary 行生成に必要な入力を揃える（未指定分はJSONから読み込む）。不足時は None"""
+    import json
+
+    # groupOrgnizationsフォルダ内の全ファイルを読み込んで統合
+    if not subGroup_included:
+        project_groups_dir = Path(GROUP_ORGNIZATION_DIR)
+        subGroup_included = []
+        if project_groups_dir.exists():
+            logger.info(f"[v2.1.17] groupOrgnizationsフォルダからサブグループ情報を読み込み: {project_groups_dir}")
+            subgroup_files = list(project_groups_dir.glob("*.json"))
+            logger.info(f"[v2.1.17] 検出されたサブグループファイル数: {len(subgroup_files)}件")
+            for subgroup_file in subgroup_files:
+                try:
+                    with open(subgroup_file, "r", encoding="utf-8") as f:
+                        subgroup_data = json.load(f)
+                        # included配列を統合
+                        included_items = subgroup_data.get("included", [])
+                        subGroup_included.extend(included_items)
+                        logger.info(f"[v2.1.17] {subgroup_file.name}: {len(included_items)}件のアイテムを読み込み")
+                except Exception as e:
+                    logger.error(f"[v2.1.17] サブグループファイル読み込みエラー: {subgroup_file.name} - {e}")
+            logger.info(f"[v2.1.17] 統合後のsubGroup_included総数: {len(subGroup_included)}件")
+        else:
+            logger.warning(f"[v2.1.17] groupOrgnizationsフォルダが存在しません: {project_groups_dir}")
+
+    if not dataset_data:
+        dataset_json = load_json(DATASET_JSON_PATH)
+        if not dataset_json:
+            return None
+        dataset_data = dataset_json.get("data", [])
+
+    if not instruments_data:
+        instruments_json = load_json(INSTRUMENTS_JSON_PATH)
+        if not instruments_json:
+            return None
+        instruments_data = instruments_json.get("data", [])
+
+    return subGroup_included, dataset_data, instruments_data
+
+
+def _summary_to_ymd(date_str):
+    if not date_str:
+        return ""
+    try:
+        dt = parse_datetime(date_str)
+        return dt.strftime("%Y-%m-%d")
+    except Exception:
+        return date_str
+
+
+def _summary_dataset_info(dataset_datum):
+    attr = dataset_datum.get("attributes", {})
+    rel = dataset_datum.get("relationships", {})
+    return {
+        "id": dataset_datum.get("id", ""),
+        "manager_id": rel.get("manager", {}).get("data", {}).get("id", ""),
+        "owners": rel.get("dataOwners", {}).get("data", []),
+        "applicant_id": rel.get("applicant", {}).get("data", {}).get("id", ""),
+        "template_id": rel.get("template", {}).get("data", {}).get("id", ""),
+        "instrument_id": rel.get("instruments", {}).get("data", [{}])[0].get("id", "") if rel.get("instruments", {}).get("data") else "",
+        "embargoDate": _summary_to_ymd(attr.get("embargoDate", "")),
+        "isAnonymized": attr.get("isAnonymized", ""),
+        "description": attr.get("description", ""),
+        "relatedLinks_str": "\n".join([link.get("url", "") for link in attr.get("relatedLinks", []) if isinstance(link, dict)]),
+        "relatedDatasets_urls_str": "\n".join([f"https://rde.nims.go.jp/datasets/rde/{rd.get('id', '')}" for rd in rel.get("relatedDatasets", {}).get("data", []) if isinstance(rd, dict)]),
+        "grantNumber": attr.get("grantNumber", ""),
+        "name": attr.get("name", ""),
+        "title": attr.get("subjectTitle", ""),
+    }
+
+
+def _summary_filetype_columns(filetype_stats: dict) -> dict:
+    columns = {}
+    for ftype in _SUMMARY_PRESET_FILETYPES + ["OTHER", "total"]:
+        columns[f"filetype_{ftype}_count"] = filetype_stats[ftype]["count"]
+        columns[f"filetype_{ftype}_size"] = filetype_stats[ftype]["size"]
+    return columns
+
+
+def _summary_filetype_stats(included_files: Iterable[dict]) -> dict:
+    """ファイルタイプごとの合計サイズ・ファイル数集計"""
+    filetype_stats = {ftype: {"count": 0, "size": 0} for ftype in _SUMMARY_PRESET_FILETYPES}
+    filetype_stats["OTHER"] = {"count": 0, "size": 0}
+    total_size = 0
+    total_count = 0
+    for inc in included_files:
+        attr = inc.get("attributes", {})
+        ftype = attr.get("fileType", "OTHER")
+        fsize = attr.get("fileSize", 0)
+        if ftype not in _SUMMARY_PRESET_FILETYPES:
+            ftype = "OTHER"
+        filetype_stats[ftype]["count"] += 1
+        filetype_stats[ftype]["size"] += fsize
+        total_size += fsize
+        total_count += 1
+    filetype_stats["total"] = {"count": total_count, "size": total_size}
+    return filetype_stats
+
+
+def _iter_summary_rows(subGroup_included, dataset_data, instruments_data, progress_callback=None):
+    """summary シートのデータ行（ID→値の辞書）を1行ずつ生成する
+
+    dataEntry JSON はデータセット単位で読み込み、行を返した後は保持しない。
+    progress_callback が False を返した場合は _SummaryExportCancelled を送出する。
+    """
+    # instrument_local_id列にはinstruments.jsonのattributes.programs[].localIdを出力
+    instrument_id_to_localid = {}
+    for inst in instruments_data:
+        inst_id = inst.get("id")
+        programs = inst.get("attributes", {}).get("programs", [])
+        # 複数programsがある場合はカンマ区切りで連結
+        local_ids = [prog.get("localId", "") for prog in programs if prog.get("localId")]
+        if inst_id and local_ids:
+            instrument_id_to_localid[inst_id] = ",".join(local_ids)
+    # ユーザーID→名前辞書
+    user_id_to_name = {user.get("id"): user.get("attributes", {}).get("userName", "") for user in subGroup_included if user.get("type") == "user"}
+    instrument_id_to_name = {inst.get("id"): inst.get("attributes", {}).get("nameJa", "") for inst in instruments_data}
+
+    logger.info("サブグループとデータセットの関連情報を処理開始")
+
+    # プログレス計算用
+    total_subgroups = len([sg for sg in subGroup_included if sg.get("type") == "group"])
+    estimated_total = 0
+    for subGroup in subGroup_included:
+        if subGroup.get("type") != "group":
+            continue
+        estimated_total += len(subGroup.get("attributes", {}).get("subjects", {})) * len(dataset_data)
+    progress_total = estimated_total if estimated_total > 0 else 1
+
+    if progress_callback:
+        if not progress_callback(0, progress_total, f"データ行処理開始 (推定処理数: {estimated_total})"):
+            raise _SummaryExportCancelled()
+
+    dataset_infos = [_summary_dataset_info(dataset) for dataset in dataset_data]
+    processed_items = 0
+    rows_emitted = 0
+    subgroup_idx = 0
+    for subGroup in subGroup_included:
+        if subGroup.get("type") != "group":
+            continue
+
+        subgroup_idx += 1
+        subGroup_attr = subGroup.get("attributes", {})
+        subGroup_name = subGroup_attr.get("name", "")
+        subGroup_subjects = subGroup_attr.get("subjects", {})
+
+        subject_idx = 0
+        for subject in subGroup_subjects:
+            subject_idx += 1
+            grantNumber = subject.get("grantNumber", "") if isinstance(subject, dict) else ""
+            title = subject.get("title", "") if isinstance(subject, dict) else ""
+
+            # プログレス更新
+            if progress_callback:
+                message = f"処理中... サブグループ {subgroup_idx}/{total_subgroups}, 課題 {subject_idx}, 行 {rows_emitted + 1}"
+                if not progress_callback(processed_items, progress_total, message):
+                    raise _SummaryExportCancelled()
+
+            for ds_info in dataset_infos:
+                processed_items += 1
+                if ds_info["grantNumber"] != grantNumber:
+                    continue
+                manager_name = user_id_to_name.get(ds_info["manager_id"], "未設定" if ds_info["manager_id"] in [None, ""] else "")
+                applicant_name = user_id_to_name.get(ds_info["applicant_id"], "")
+                owner_names = [user_id_to_name.get(owner.get("id", ""), "") for owner in ds_info["owners"] if owner.get("id", "")]
+                dataset_columns = {
+                    "subGroupName": subGroup_name,
+                    "dataset_manager_name": manager_name,
+                    "dataset_applicant_name": applicant_name,
+                    "dataset_owner_names_str": "\n".join([n for n in owner_names if n]),
+                    "grantNumber": grantNumber,
+                    "title": title,
+                    "datasetName": ds_info["name"],
+                    "instrument_name": instrument_id_to_name.get(ds_info["instrument_id"], ""),
+                    "instrument_local_id": instrument_id_to_localid.get(ds_info["instrument_id"], ""),
+                    "template_id": ds_info["template_id"],
+                    "datasetId": f"https://rde.nims.go.jp/datasets/rde/{ds_info['id']}",
+                }
+                dataset_tail_columns = {
+                    "dataset_embargoDate": ds_info["embargoDate"],
+                    "dataset_isAnonymized": ds_info["isAnonymized"],
+                    "dataset_description": ds_info["description"],
+                    "dataset_relatedLinks": ds_info["relatedLinks_str"],
+                    "dataset_relatedDatasets": ds_info["relatedDatasets_urls_str"],
+                }
+
+                dataEntry_path = os.path.join(OUTPUT_RDE_DIR, "data", "dataEntry", f"{ds_info['id']}.json")
+                dataEntry_json = load_json(dataEntry_path, cache=False)
+                logger.debug("[XLSX] dataEntry JSONロード for dataset: %s", ds_info['id'])
+                if not dataEntry_json:
+                    logger.error("dataEntry JSONが存在しません: %s for dataset_id=%s", dataEntry_path, ds_info['id'])
+                    continue
+                dataEntry_data = dataEntry_json.get("data", [])
+                included_files = [inc for inc in dataEntry_json.get("included", []) if inc.get("type") == "file"]
+                del dataEntry_json
+
+                # 複数データエントリ対応
+                if dataEntry_data:
+                    for entry in dataEntry_data:
+                        entry_attr = entry.get("attributes", {})
+                        # relationships.files.data の id リストに含まれるファイルのみ集計
+                        entry_file_ids = {f.get("id", "") for f in entry.get("relationships", {}).get("files", {}).get("data", [])}
+                        entry_filetype_stats = _summary_filetype_stats(
+                            inc for inc in included_files if inc.get("id", "") in entry_file_ids
+                        )
+                        total_size = entry_filetype_stats["total"]["size"]
+                        value_dict = dict(dataset_columns)
+                        value_dict.update({
+                            "dataEntryName": entry_attr.get("name", ""),
+                            "dataEntryId": entry.get("id", ""),
+                            "number_of_files": entry_attr.get("numberOfFiles", ""),
+                            "number_of_image_files": entry_attr.get("numberOfImageFiles", ""),
+                            "date_of_dataEntry_creation": _summary_to_ymd(entry_attr.get("created", "")),
+                            "total_file_size_MB": total_size / (1024 * 1024) if total_size else 0,
+                        })
+                        value_dict.update(dataset_tail_columns)
+                        value_dict.update(_summary_filetype_columns(entry_filetype_stats))
+                        rows_emitted += 1
+                        yield value_dict
+                else:
+                    # データエントリがない場合も空で1行出す
+                    filetype_stats = _summary_filetype_stats(included_files)
+                    total_size = filetype_stats["total"]["size"]
+                    value_dict = dict(dataset_columns)
+                    value_dict.update({
+                        "dataEntryName": "",
+                        "dataEntryId": "",
+                        "number_of_files": "",
+                        "number_of_image_files": "",
+                        "date_of_dataEntry_creation": "",
+                        "total_file_size_MB": total_size / (1024 * 1024) if total_size else 0,
+                    })
+                    value_dict.update(dataset_tail_columns)
+                    value_dict.update(_summary_filetype_columns(filetype_stats))
+                    rows_emitted += 1
+                    yield value_dict
+
+
+def _summary_sheet_writers():
+    """summary 以外に毎回再生成するシートと出力関数（新規作成時はこの順で追加される）"""
+    return {
+        "member": write_members_sheet,
+        "organization": write_organization_sheet,
+        "instrumentType": write_instrumentType_sheet,
+        "datasets": write_datasets_sheet,
+        "subgroups": write_subgroups_sheet,
+        "groupDetail": write_groupDetail_sheet,
+        "templates": write_templates_sheet,
+        "instruments": write_instruments_sheet,
+        "licenses": write_licenses_sheet,
+        "entries": write_entries_sheet,
+    }
+
+
+def _copy_sheet_values(src_ws, dst_ws, header_overlay: Optional[Sequence[Sequence]] = None) -> None:
+    """read_only シートの値を write_only シートへ1行ずつ写す（header_overlay は先頭行を上書き）"""
+    overlay = list(header_overlay or [])
+    row_count = 0
+    for row_count, values in enumerate(src_ws.iter_rows(values_only=True), start=1):
+        if row_count <= len(overlay):
+            head = list(overlay[row_count - 1])
+            values = head + list(values[len(head):])
+        dst_ws.append(list(values))
+    for head in overlay[row_count:]:
+        dst_ws.append(list(head))
+
+
+def _discard_write_only_workbook(wb) -> None:
+    """保存せずに破棄する write_only ブックのシートを閉じ、一時ファイルを削除する"""
+    for ws in wb.worksheets:
+        try:
+            if not ws.closed:
+                ws.close()
+            ws._writer.cleanup()
+        except Exception:
+            logger.debug("[XLSX] write_only シート破棄失敗: %s", ws.title, exc_info=True)
+
+
+def write_summary_workbook_streaming(abs_xlsx, parent, summary_context=None, progress_callback=None):
+    """まとめXLSXを write_only モードで作り直す（ストリーミング出力）
+
+    既存ファイルは read_only で開き、summary シートの手動列と、再生成対象外のシートの値だけを
+    読み出す。summary の各行は生成と同時に追記されるため、エントリ数が増えてもメモリ使用量は
+    ほぼ一定。再生成対象外のシートは値（数式を含む）のみ引き継ぎ、書式は引き継がない。
+    一時ファイルに書き出してから置き換えるため、途中で失敗しても既存ファイルは壊れない。
+
+    Returns:
+        bool: 書き出し完了なら True、キャンセル・入力不足なら False
+    """
+    summary_context = summary_context or {}
+
+    def from_context(key):
+        value = summary_context.get(key)
+        return value if value is not None else getattr(parent, key, [])
+
+    sources = _load_summary_sources(
+        from_context("subGroup_included"),
+        from_context("dataset_data"),
+        from_context("instruments_data"),
+    )
+    if sources is None:
+        return False
+    subGroup_included, dataset_data, instruments_data = sources
+
+    src_wb = openpyxl.load_workbook(abs_xlsx, read_only=True) if os.path.exists(abs_xlsx) else None
+    out_wb = None
+    saved = False
+    root, ext = os.path.splitext(abs_xlsx)
+    tmp_path = f"{root}.writing{ext or '.xlsx'}"
+    try:
+        source_names = list(src_wb.sheetnames) if src_wb is not None else []
+
+        existing_id_row = []
+        manual_data_map = {}
+        if SUMMARY_SHEET_NAME in source_names:
+            src_summary = src_wb[SUMMARY_SHEET_NAME]
+            existing_id_row = list(next(src_summary.iter_rows(min_row=1, max_row=1, values_only=True), ()))
+            manual_data_map = _collect_summary_manual_data(
+                _summary_header_ids(existing_id_row),
+                src_summary.iter_rows(min_row=3, values_only=True),
+            )
+        header_ids = _summary_header_ids(existing_id_row)
+        id_to_label = {coldef["id"]: coldef["label"] for coldef in SUMMARY_HEADER_DEF}
+        logger.debug("[XLSX] streaming ヘッダーID: %s, 手動列復元対象: %s件", header_ids, len(manual_data_map))
+
+        # 2枚目のシート（1枚しかなければ先頭）には従来どおり互換ヘッダーを書き込む
+        legacy_data_sheet = None
+        if source_names:
+            legacy_data_sheet = source_names[1] if len(source_names) > 1 else source_names[0]
+        legacy_labels = getattr(parent, 'id_to_label', {}) or {}
+        legacy_overlay = [
+            _LEGACY_DATA_SHEET_HEADER_IDS,
+            [legacy_labels.get(id_, id_) for id_ in _LEGACY_DATA_SHEET_HEADER_IDS],
+        ]
+
+        out_wb = openpyxl.Workbook(write_only=True)
+        writers = _summary_sheet_writers()
+
+        def append_summary_sheet():
+            ws = out_wb.create_sheet(SUMMARY_SHEET_NAME)
+            ws.append(header_ids)
+            ws.append([id_to_label.get(id_, id_) for id_ in header_ids])
+            for value_dict in _iter_summary_rows(subGroup_included, dataset_data, instruments_data, progress_callback):
+                manual_restore = _lookup_manual_restore(manual_data_map, value_dict)
+                ws.append([
+                    value_dict[id_] if id_ in value_dict else manual_restore.get(id_)
+                    for id_ in header_ids
+                ])
+
+        try:
+            for name in source_names:
+                if name == SUMMARY_SHEET_NAME:
+                    append_summary_sheet()
+                    continue
+                src_ws = src_wb[name]
+                if name in writers:
+                    writers[name](out_wb, parent)
+                    if name in out_wb.sheetnames:
+                        continue
+                    # 出力関数が入力不足で何も書かなかった場合は既存シートを維持
+                if not hasattr(src_ws, "iter_rows"):
+                    logger.warning("[XLSX] ワークシート以外のシートは引き継げません: %s", name)
+                    continue
+                _copy_sheet_values(
+                    src_ws,
+                    out_wb.create_sheet(name),
+                    legacy_overlay if name == legacy_data_sheet else None,
+                )
+            if SUMMARY_SHEET_NAME not in out_wb.sheetnames:
+                append_summary_sheet()
+        except _SummaryExportCancelled:
+            logger.info("XLSX書き出し処理がキャンセルされました")
+            return False
+
+        if progress_callback and not progress_callback(0, 1, "各シートの書き出しを実行中..."):
+            return False
+        for name, writer in writers.items():
+            if name not in out_wb.sheetnames and name not in source_names:
+                writer(out_wb, parent)
+
+        if progress_callback and not progress_callback(0, 1, "ファイル保存中..."):
+            return False
+        os.makedirs(os.path.dirname(abs_xlsx) or ".", exist_ok=True)
+        out_wb.save(tmp_path)
+        saved = True
+        if src_wb is not None:
+            src_wb.close()
+            src_wb = None
+        os.replace(tmp_path, abs_xlsx)
+        return True
+    finally:
+        if out_wb is not None and not saved:
+            _discard_write_only_workbook(out_wb)
+        if src_wb is not None:
+            src_wb.close()
+        if os.path.exists(tmp_path):
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                logger.debug("[XLSX] 一時ファイル削除失敗: %s", tmp_path, exc_info=True)
+
+
 def write_summary_sheet(wb, parent, load_data_entry_json=False, progress_callback=None, summary_context=None):
-    import json, os
     logger.info("write_summary_sheet called start")
     load_data_entry_json=False
     summary_context = summary_context or {}
@@ -516,7 +1086,7 @@ def write_summary_sheet(wb, parent, load_data_entry_json=False, progress_callbac
                 ws.cell(row=row_idx, column=col, value=value_dict[id_])
                 id_to_col[id_] = col
 
-    import json, os
+    import os
     logger.debug("[XLSX] write_summary_sheet called progress")
 
     # ワークシート取得
@@ -612,7 +1182,7 @@ def write_summary_sheet(wb, parent, load_data_entry_json=False, progress_callbac
         if load_data_entry_json and os.path.exists(dataEntry_path):
             entry_json_files.append(dataEntry_path)
             try:
-                entry_json = load_json(dataEntry_path)
+                entry_json = load_json(dataEntry_path, cache=False)
                 entry_count = len(entry_json.get("data", []))
             except Exception:
                 entry_count = 0
@@ -650,7 +1220,7 @@ def write_summary_sheet(wb, parent, load_data_entry_json=False, progress_callbac
                 if load_data_entry_json == True:
                     logger.debug("[XLSX] dataEntry JSONロード for subGroup: %s", ds_info['id'])
                     dataEntry_path = os.path.join(OUTPUT_RDE_DIR, "data", "dataEntry", f"{ds_info['id']}.json")
-                    dataEntry_json = load_json(dataEntry_path)
+                    dataEntry_json = load_json(dataEntry_path, cache=False)
                     if not dataEntry_json:
                         logger.error("dataEntry JSONが存在しません: %s for dataset_id=%s", dataEntry_path, ds_info['id'])
                         continue
@@ -731,428 +1301,68 @@ def write_summary_sheet(wb, parent, load_data_entry_json=False, progress_callbac
     #return "書き出し完了"
 
 # --- 各シート出力関数 ---
-    import json, os
     logger.debug("[XLSX] write_summary_sheet called")
 
-    def load_json(path):
-        abs_path = os.path.abspath(path)
-        if not os.path.exists(abs_path):
-            logger.error("%sが存在しません: %s", path, abs_path)
-            return None
-        with open(abs_path, "r", encoding="utf-8") as f:
-            logger.info("[XLSX] JSONロード成功: %s", abs_path)
-            return json.load(f)
-
-    # groupOrgnizationsフォルダ内の全ファイルを読み込んで統合
-    if not subGroup_included:
-        project_groups_dir = Path(GROUP_ORGNIZATION_DIR)
-        subGroup_included = []
-        if project_groups_dir.exists():
-            logger.info(f"[v2.1.17] groupOrgnizationsフォルダからサブグループ情報を読み込み: {project_groups_dir}")
-            subgroup_files = list(project_groups_dir.glob("*.json"))
-            logger.info(f"[v2.1.17] 検出されたサブグループファイル数: {len(subgroup_files)}件")
-            
-            for subgroup_file in subgroup_files:
-                try:
-                    with open(subgroup_file, "r", encoding="utf-8") as f:
-                        subgroup_data = json.load(f)
-                        # included配列を統合
-                        included_items = subgroup_data.get("included", [])
-                        subGroup_included.extend(included_items)
-                        logger.info(f"[v2.1.17] {subgroup_file.name}: {len(included_items)}件のアイテムを読み込み")
-                except Exception as e:
-                    logger.error(f"[v2.1.17] サブグループファイル読み込みエラー: {subgroup_file.name} - {e}")
-            
-            logger.info(f"[v2.1.17] 統合後のsubGroup_included総数: {len(subGroup_included)}件")
-        else:
-            logger.warning(f"[v2.1.17] groupOrgnizationsフォルダが存在しません: {project_groups_dir}")
-    
-    if not dataset_data:
-        dataset_json = load_json(DATASET_JSON_PATH)
-        if not dataset_json:
-            return
-        dataset_data = dataset_json.get("data", [])
-
-    if not instruments_data:
-        instruments_json = load_json(INSTRUMENTS_JSON_PATH)
-        if not instruments_json:
-            return
-        instruments_data = instruments_json.get("data", [])
+    sources = _load_summary_sources(subGroup_included, dataset_data, instruments_data)
+    if sources is None:
+        return
+    subGroup_included, dataset_data, instruments_data = sources
 
-    # --- 3層構造ヘッダ定義 ---
-    HEADER_DEF = [
-        {"id": "subGroupName", "label": "サブグループ名"},
-        {"id": "dataset_manager_name", "label": "管理者名"},
-        {"id": "dataset_applicant_name", "label": "申請者名"},
-        {"id": "dataset_owner_names_str", "label": "オーナー名リスト"},
-        {"id": "grantNumber", "label": "課題番号"},
-        {"id": "title", "label": "課題名"},
-        {"id": "datasetName", "label": "データセット名"},
-        {"id": "instrument_name", "label": "装置名"},
-        {"id": "instrument_local_id", "label": "装置 ID"},
-        {"id": "template_id", "label": "テンプレートID"},
-        {"id": "datasetId", "label": "データセットID"},
-        {"id": "dataEntryName", "label": "データエントリ名"},
-        {"id": "dataEntryId", "label": "データエントリID"},
-        {"id": "number_of_files", "label": "ファイル数"},
-        {"id": "number_of_image_files", "label": "画像ファイル数"},
-        {"id": "date_of_dataEntry_creation", "label": "データエントリ作成日"},
-        {"id": "total_file_size_MB", "label": "ファイル合計サイズ(MB)"},
-        {"id": "dataset_embargoDate", "label": "エンバーゴ日"},
-        {"id": "dataset_isAnonymized", "label": "匿名化"},
-        {"id": "dataset_description", "label": "データセット説明"},
-        {"id": "dataset_relatedLinks", "label": "関連リンク"},
-        {"id": "dataset_relatedDatasets", "label": "関連データセット"},
-        # --- ファイルタイプ集計ヘッダ ---
-        {"id": "filetype_MAIN_IMAGE_count", "label": "MAIN_IMAGEファイル数"},
-        {"id": "filetype_MAIN_IMAGE_size", "label": "MAIN_IMAGE合計サイズ"},
-        {"id": "filetype_STRUCTURED_count", "label": "STRUCTUREDファイル数"},
-        {"id": "filetype_STRUCTURED_size", "label": "STRUCTURED合計サイズ"},
-        {"id": "filetype_THUMBNAIL_count", "label": "THUMBNAILファイル数"},
-        {"id": "filetype_THUMBNAIL_size", "label": "THUMBNAIL合計サイズ"},
-        {"id": "filetype_META_count", "label": "METAファイル数"},
-        {"id": "filetype_META_size", "label": "META合計サイズ"},
-        {"id": "filetype_OTHER_count", "label": "OTHERファイル数"},
-        {"id": "filetype_OTHER_size", "label": "OTHER合計サイズ"},
-        {"id": "filetype_total_count", "label": "ファイル総数"},
-        {"id": "filetype_total_size", "label": "ファイル総サイズ"},
-    ]
-    # instrument_local_id列にはinstruments.jsonのattributes.programs[].localIdを出力
-    logger.debug("[XLSX] instruments_dataからinstrument_id_to_localidを作成")
-    instrument_id_to_localid = {}
-    for inst in instruments_data:
-        inst_id = inst.get("id")
-        programs = inst.get("attributes", {}).get("programs", [])
-        # 複数programsがある場合はカンマ区切りで連結
-        local_ids = [prog.get("localId", "") for prog in programs if prog.get("localId")]
-        if inst_id and local_ids:
-            instrument_id_to_localid[inst_id] = ",".join(local_ids)
-    SHEET_NAME = "summary"
-    logger.debug("[XLSX] シート名: %s", SHEET_NAME)
-    
-    if SHEET_NAME in wb.sheetnames:
-        logger.debug("[XLSX] シートが既に存在: %s", SHEET_NAME)
-        ws = wb[SHEET_NAME]
+    logger.debug("[XLSX] シート名: %s", SUMMARY_SHEET_NAME)
+    if SUMMARY_SHEET_NAME in wb.sheetnames:
+        logger.debug("[XLSX] シートが既に存在: %s", SUMMARY_SHEET_NAME)
+        ws = wb[SUMMARY_SHEET_NAME]
         # 既存ヘッダー行（1行目）を取得
         existing_id_row = [cell.value for cell in ws[1]] if ws.max_row >= 1 else []
     else:
-        logger.debug("[XLSX] シートが存在しないため新規作成: %s", SHEET_NAME)
-        ws = wb.create_sheet(SHEET_NAME)
+        logger.debug("[XLSX] シートが存在しないため新規作成: %s", SUMMARY_SHEET_NAME)
+        ws = wb.create_sheet(SUMMARY_SHEET_NAME)
         existing_id_row = []
     logger.debug("[XLSX] 既存ヘッダー行: %s", existing_id_row)
-    # 既存ID列の順番を優先し、なければHEADER_DEF順で追加（空文字列やNoneは除外）
-    header_ids = []
-    id_to_label = {coldef["id"]: coldef["label"] for coldef in HEADER_DEF}
-    if existing_id_row and any(existing_id_row):
-        # 既存ヘッダーの順番（空文字列やNoneは除外）
-        header_ids = [id_ for id_ in existing_id_row if id_ not in (None, "") and str(id_).strip() != ""]
-        # HEADER_DEFにあるが既存ヘッダーにないものを追加
-        for coldef in HEADER_DEF:
-            if coldef["id"] not in header_ids:
-                header_ids.append(coldef["id"])
-    else:
-        header_ids = [coldef["id"] for coldef in HEADER_DEF]
-    # 1行目:ID（空値列は除外済みだが念のため）
-    for col_idx, id_ in enumerate(header_ids, 1):
-        if id_ not in (None, "") and str(id_).strip() != "":
-            ws.cell(row=1, column=col_idx, value=id_)
-    # 2行目:ラベル
+    header_ids = _summary_header_ids(existing_id_row)
+    id_to_label = {coldef["id"]: coldef["label"] for coldef in SUMMARY_HEADER_DEF}
+    # 1行目:ID、2行目:ラベル
     for col_idx, id_ in enumerate(header_ids, 1):
-        if id_ not in (None, "") and str(id_).strip() != "":
-            ws.cell(row=2, column=col_idx, value=id_to_label.get(id_, id_))
-    id_to_col = {id_: idx+1 for idx, id_ in enumerate(header_ids) if id_ not in (None, "") and str(id_).strip() != ""}
-    logger.debug("[XLSX] ヘッダーID: %s", header_ids)   
-    # 既存データの保存（3行目以降）
-    # datasetId, dataEntryId をキーに、手動列（HEADER_DEFにない列）の値を保存
-    manual_col_ids = [id_ for id_ in header_ids if id_ not in [coldef["id"] for coldef in HEADER_DEF] and id_ not in (None, "") and str(id_).strip() != ""]
-    manual_data_map = {}  # key: ("dataEntryId", id) or ("datasetId", id) -> {manual_col: value, ...}
-    for row in ws.iter_rows(min_row=3, max_row=ws.max_row, max_col=len(header_ids)):
-        # header_idsとrowの長さが異なる場合も安全にペア化
-        row_dict = {id_: cell.value for id_, cell in zip(header_ids, row) if id_ not in (None, "") and str(id_).strip() != ""}
-        dataset_id = row_dict.get("datasetId", "")
-        data_entry_id = row_dict.get("dataEntryId", "")
-        if data_entry_id:
-            manual_data_map[("dataEntryId", data_entry_id)] = {col: row_dict.get(col, None) for col in manual_col_ids if col not in (None, "") and str(col).strip() != ""}
-        elif dataset_id:
-            manual_data_map[("datasetId", dataset_id)] = {col: row_dict.get(col, None) for col in manual_col_ids if col not in (None, "") and str(col).strip() != ""}
+        ws.cell(row=1, column=col_idx, value=id_)
+        ws.cell(row=2, column=col_idx, value=id_to_label.get(id_, id_))
+    id_to_col = {id_: idx + 1 for idx, id_ in enumerate(header_ids)}
+    logger.debug("[XLSX] ヘッダーID: %s", header_ids)
+    # 既存データの手動列を保存（3行目以降）
+    manual_data_map = _collect_summary_manual_data(
+        header_ids,
+        ws.iter_rows(min_row=3, max_row=ws.max_row, max_col=len(header_ids), values_only=True),
+    )
     # 既存データを一旦全削除（3行目以降）
     if ws.max_row >= 3:
         ws.delete_rows(3, ws.max_row - 2)
     logger.debug("[XLSX] 既存データを削除: 3行目以降")
-    # ユーザーID→名前辞書
-    user_id_to_name = {user.get("id"): user.get("attributes", {}).get("userName", "") for user in subGroup_included if user.get("type") == "user"}
-    instrument_id_to_name = {inst.get("id"): inst.get("attributes", {}).get("nameJa", "") for inst in instruments_data}
 
-    from dateutil.parser import parse as parse_datetime
-    def to_ymd(date_str):
-        if not date_str:
-            return ""
-        try:
-            dt = parse_datetime(date_str)
-            return dt.strftime("%Y-%m-%d")
-        except Exception:
-            return date_str
+    def write_row(value_dict, row_idx):
+        # datasetId, dataEntryIdで手動列データを復元
+        manual_restore = _lookup_manual_restore(manual_data_map, value_dict)
+        for id_ in header_ids:
+            col = id_to_col[id_]
+            if id_ in value_dict:
+                ws.cell(row=row_idx, column=col, value=value_dict[id_])
+            elif id_ in manual_restore:
+                ws.cell(row=row_idx, column=col, value=manual_restore[id_])
+        # value_dictにのみ存在する新規IDは末尾に追加
+        for id_ in value_dict:
+            if id_ not in header_ids:
+                header_ids.append(id_)
+                col = len(header_ids)
+                ws.cell(row=1, column=col, value=id_)
+                ws.cell(row=2, column=col, value=id_to_label.get(id_, id_))
+                ws.cell(row=row_idx, column=col, value=value_dict[id_])
+                id_to_col[id_] = col
 
-    def get_dataset_related_info(dataset_datum):
-        attr = dataset_datum.get("attributes", {})
-        rel = dataset_datum.get("relationships", {})
-        return {
-            "id": dataset_datum.get("id", ""),
-            "manager_id": rel.get("manager", {}).get("data", {}).get("id", ""),
-            "owners": rel.get("dataOwners", {}).get("data", []),
-            "applicant_id": rel.get("applicant", {}).get("data", {}).get("id", ""),
-            "template_id": rel.get("template", {}).get("data", {}).get("id", ""),
-            "instrument_id": rel.get("instruments", {}).get("data", [{}])[0].get("id", "") if rel.get("instruments", {}).get("data") else "",
-            "embargoDate": to_ymd(attr.get("embargoDate", "")),
-            "isAnonymized": attr.get("isAnonymized", ""),
-            "description": attr.get("description", ""),
-            "relatedLinks_str": "\n".join([link.get("url", "") for link in attr.get("relatedLinks", []) if isinstance(link, dict)]),
-            "relatedDatasets_urls_str": "\n".join([f"https://rde.nims.go.jp/datasets/rde/{rd.get('id', '')}" for rd in rel.get("relatedDatasets", {}).get("data", []) if isinstance(rd, dict)]),
-            "grantNumber": attr.get("grantNumber", ""),
-            "name": attr.get("name", ""),
-            "title": attr.get("subjectTitle", ""),
-            
-        }
-    
     row_idx = 3
-    logger.info("サブグループとデータセットの関連情報を処理開始")
-    
-    # プログレス計算用
-    total_subgroups = len([sg for sg in subGroup_included if sg.get("type") == "group"])
-    total_datasets = len(dataset_data)
-    processed_items = 0
-    estimated_total = 0
-    
-    # 概算の処理件数を計算
-    for subGroup in subGroup_included:
-        if subGroup.get("type") != "group":
-            continue
-        subGroup_attr = subGroup.get("attributes", {})
-        subGroup_subjects = subGroup_attr.get("subjects", {})
-        for subject in subGroup_subjects:
-            estimated_total += len(dataset_data)
-    
-    if progress_callback:
-        if not progress_callback(0, estimated_total if estimated_total > 0 else 1, f"データ行処理開始 (推定処理数: {estimated_total})"):
-            return False
-    
-    subgroup_idx = 0
-    for subGroup in subGroup_included:
-        if subGroup.get("type") != "group":
-            continue
-            
-        subgroup_idx += 1
-        subGroup_attr = subGroup.get("attributes", {})
-        subGroup_name = subGroup_attr.get("name", "")
-        subGroup_subjects = subGroup_attr.get("subjects", {})
-        
-        subject_idx = 0
-        for subject in subGroup_subjects:
-            subject_idx += 1
-            grantNumber = subject.get("grantNumber", "") if isinstance(subject, dict) else ""
-            title = subject.get("title", "") if isinstance(subject, dict) else ""
-            
-            # プログレス更新
-            if progress_callback:
-                message = f"処理中... サブグループ {subgroup_idx}/{total_subgroups}, 課題 {subject_idx}, 行 {row_idx - 2}"
-                if not progress_callback(processed_items, estimated_total if estimated_total > 0 else 1, message):
-                    return False
-            
-            for dataset in dataset_data:
-                processed_items += 1
-                ds_info = get_dataset_related_info(dataset)
-                if ds_info["grantNumber"] != grantNumber:
-                    continue
-                manager_name = user_id_to_name.get(ds_info["manager_id"], "未設定" if ds_info["manager_id"] in [None, ""] else "")
-                applicant_name = user_id_to_name.get(ds_info["applicant_id"], "")
-                owner_names = [user_id_to_name.get(owner.get("id", ""), "") for owner in ds_info["owners"] if owner.get("id", "")]
-                owner_names_str = "\n".join([n for n in owner_names if n])
-                instrument_name = instrument_id_to_name.get(ds_info["instrument_id"], "")
-                instrument_local_id = instrument_id_to_localid.get(ds_info["instrument_id"], "")
-                dataset_url = f"https://rde.nims.go.jp/datasets/rde/{ds_info['id']}"
-
-                dataEntry_path = os.path.join(OUTPUT_RDE_DIR, "data", "dataEntry", f"{ds_info['id']}.json")
-                
-                dataEntry_json = load_json(dataEntry_path)
-                logger.debug("[XLSX] dataEntry JSONロード for dataset: %s", ds_info['id'])
-
-                if not dataEntry_json:
-                    print(f"[ERROR] dataEntry JSONが存在しません: {dataEntry_path} for dataset_id={ds_info['id']}" )
-                    continue
-                dataEntry_data = dataEntry_json.get("data", [])
-
-                dataEntry_included = dataEntry_json.get("included", [])
-                # --- ファイルタイプごとの合計サイズ・ファイル数集計 ---
-                # プリセットファイルタイプ
-                PRESET_FILETYPES = [
-                    "MAIN_IMAGE", "STRUCTURED", "THUMBNAIL", "META"
-                ]
-                filetype_stats = {ftype: {"count": 0, "size": 0} for ftype in PRESET_FILETYPES}
-                filetype_stats["OTHER"] = {"count": 0, "size": 0}
-                total_size = 0
-                total_count = 0
-                for inc in dataEntry_included:
-                    if inc.get("type") != "file":
-                        continue
-                    attr = inc.get("attributes", {})
-                    ftype = attr.get("fileType", "OTHER")
-                    fsize = attr.get("fileSize", 0)
-                    if ftype not in PRESET_FILETYPES:
-                        ftype = "OTHER"
-                    filetype_stats[ftype]["count"] += 1
-                    filetype_stats[ftype]["size"] += fsize
-                    total_size += fsize
-                    total_count += 1
-                filetype_stats["total"] = {"count": total_count, "size": total_size}
-                # 既存のtotal_file_size_MBも維持
-                total_file_size = total_size
-                total_file_size_MB = total_file_size / (1024 * 1024) if total_file_size else 0
-                # 必要ならwrite_rowのvalue_dictにfiletype_statsを追加可能
-
-                def write_row(value_dict):
-                    # 既存列にデータがなければ既存値を維持
-                    # datasetId, dataEntryIdで手動列データを復元
-                    dataset_id = value_dict.get("datasetId", "")
-                    data_entry_id = value_dict.get("dataEntryId", "")
-                    if data_entry_id and ("dataEntryId", data_entry_id) in manual_data_map:
-                        manual_restore = manual_data_map[("dataEntryId", data_entry_id)]
-                    elif dataset_id and ("datasetId", dataset_id) in manual_data_map:
-                        manual_restore = manual_data_map[("datasetId", dataset_id)]
-                    else:
-                        manual_restore = {}
-                    for id_ in header_ids:
-                        col = id_to_col[id_]
-                        if id_ in value_dict:
-                            ws.cell(row=row_idx, column=col, value=value_dict[id_])
-                        elif id_ in manual_restore:
-                            ws.cell(row=row_idx, column=col, value=manual_restore[id_])
-                        else:
-                            # 既存値維持（openpyxlは新規行はNoneなので何もしない）
-                            pass
-                    # value_dictにのみ存在する新規IDは末尾に追加
-                    for id_ in value_dict:
-                        if id_ not in header_ids:
-                            header_ids.append(id_)
-                            col = len(header_ids)
-                            ws.cell(row=1, column=col, value=id_)
-                            ws.cell(row=2, column=col, value=id_to_label.get(id_, id_))
-                            ws.cell(row=row_idx, column=col, value=value_dict[id_])
-                            id_to_col[id_] = col
-
-                # 複数データエントリ対応
-                if dataEntry_data:
-                    for entry in dataEntry_data:
-                        entry_attr = entry.get("attributes", {})
-                        dataEntry_name = entry_attr.get("name", "")
-                        dataEntry_id = entry.get("id", "")
-                        number_of_files = entry_attr.get("numberOfFiles", "")
-                        number_of_image_files = entry_attr.get("numberOfImageFiles", "")
-                        date_of_dataEntry_creation = entry_attr.get("created", "")
-                        # entry_idに紐づくファイルのみ集計
-                        PRESET_FILETYPES = ["MAIN_IMAGE", "STRUCTURED", "THUMBNAIL", "META"]
-                        entry_filetype_stats = {ftype: {"count": 0, "size": 0} for ftype in PRESET_FILETYPES}
-                        entry_filetype_stats["OTHER"] = {"count": 0, "size": 0}
-                        total_size = 0
-                        total_count = 0
-                        for inc in dataEntry_included:
-                            if inc.get("type") != "file":
-                                continue
-                            attr = inc.get("attributes", {})
-                            ftype = attr.get("fileType", "OTHER")
-                            fsize = attr.get("fileSize", 0)
-                            file_id = inc.get("id", "")
-                            # relationships.files.data の id リストに含まれるファイルのみ集計
-                            entry_file_ids = [f.get("id", "") for f in entry.get("relationships", {}).get("files", {}).get("data", [])]
-                            if file_id not in entry_file_ids:
-                                continue
-                            if ftype not in PRESET_FILETYPES:
-                                ftype = "OTHER"
-                            entry_filetype_stats[ftype]["count"] += 1
-                            entry_filetype_stats[ftype]["size"] += fsize
-                            total_size += fsize
-                            total_count += 1
-                        entry_filetype_stats["total"] = {"count": total_count, "size": total_size}
-                        value_dict = {
-                            "subGroupName": subGroup_name,
-                            "dataset_manager_name": manager_name,
-                            "dataset_applicant_name": applicant_name,
-                            "dataset_owner_names_str": owner_names_str,
-                            "grantNumber": grantNumber,
-                            "title": title,
-                            "datasetName": ds_info["name"],
-                            "instrument_name": instrument_name,
-                            "instrument_local_id": instrument_local_id,
-                            "template_id": ds_info["template_id"],
-                            "datasetId": dataset_url,
-                            "dataEntryName": dataEntry_name,
-                            "dataEntryId": dataEntry_id,
-                            "number_of_files": number_of_files,
-                            "number_of_image_files": number_of_image_files,
-                            "date_of_dataEntry_creation": to_ymd(date_of_dataEntry_creation),
-                            "total_file_size_MB": total_size / (1024 * 1024) if total_size else 0,
-                            "dataset_embargoDate": ds_info["embargoDate"],
-                            "dataset_isAnonymized": ds_info["isAnonymized"],
-                            "dataset_description": ds_info["description"],
-                            "dataset_relatedLinks": ds_info["relatedLinks_str"],
-                            "dataset_relatedDatasets": ds_info["relatedDatasets_urls_str"],
-                            # ファイルタイプごとの集計値を追加
-                            "filetype_MAIN_IMAGE_count": entry_filetype_stats["MAIN_IMAGE"]["count"],
-                            "filetype_MAIN_IMAGE_size": entry_filetype_stats["MAIN_IMAGE"]["size"],
-                            "filetype_STRUCTURED_count": entry_filetype_stats["STRUCTURED"]["count"],
-                            "filetype_STRUCTURED_size": entry_filetype_stats["STRUCTURED"]["size"],
-                            "filetype_THUMBNAIL_count": entry_filetype_stats["THUMBNAIL"]["count"],
-                            "filetype_THUMBNAIL_size": entry_filetype_stats["THUMBNAIL"]["size"],
-                            "filetype_META_count": entry_filetype_stats["META"]["count"],
-                            "filetype_META_size": entry_filetype_stats["META"]["size"],
-                            "filetype_OTHER_count": entry_filetype_stats["OTHER"]["count"],
-                            "filetype_OTHER_size": entry_filetype_stats["OTHER"]["size"],
-                            "filetype_total_count": entry_filetype_stats["total"]["count"],
-                            "filetype_total_size": entry_filetype_stats["total"]["size"],
-                        }
-                        write_row(value_dict)
-                        row_idx += 1
-                else:
-                    # データエントリがない場合も空で1行出す
-                    value_dict = {
-                        "subGroupName": subGroup_name,
-                        "dataset_manager_name": manager_name,
-                        "dataset_applicant_name": applicant_name,
-                        "dataset_owner_names_str": owner_names_str,
-                        "grantNumber": grantNumber,
-                        "title": title,
-                        "datasetName": ds_info["name"],
-                        "instrument_name": instrument_name,
-                        "instrument_local_id": instrument_local_id,
-                        "template_id": ds_info["template_id"],
-                        "datasetId": dataset_url,
-                        "dataEntryName": "",
-                        "dataEntryId": "",
-                        "number_of_files": "",
-                        "number_of_image_files": "",
-                        "date_of_dataEntry_creation": "",
-                        "total_file_size_MB": total_file_size_MB,
-                        "dataset_embargoDate": ds_info["embargoDate"],
-                        "dataset_isAnonymized": ds_info["isAnonymized"],
-                        "dataset_description": ds_info["description"],
-                        "dataset_relatedLinks": ds_info["relatedLinks_str"],
-                        "dataset_relatedDatasets": ds_info["relatedDatasets_urls_str"],
-                        # ファイルタイプごとの集計値を追加
-                        "filetype_MAIN_IMAGE_count": filetype_stats["MAIN_IMAGE"]["count"],
-                        "filetype_MAIN_IMAGE_size": filetype_stats["MAIN_IMAGE"]["size"],
-                        "filetype_STRUCTURED_count": filetype_stats["STRUCTURED"]["count"],
-                        "filetype_STRUCTURED_size": filetype_stats["STRUCTURED"]["size"],
-                        "filetype_THUMBNAIL_count": filetype_stats["THUMBNAIL"]["count"],
-                        "filetype_THUMBNAIL_size": filetype_stats["THUMBNAIL"]["size"],
-                        "filetype_META_count": filetype_stats["META"]["count"],
-                        "filetype_META_size": filetype_stats["META"]["size"],
-                        "filetype_OTHER_count": filetype_stats["OTHER"]["count"],
-                        "filetype_OTHER_size": filetype_stats["OTHER"]["size"],
-                        "filetype_total_count": filetype_stats["total"]["count"],
-                        "filetype_total_size": filetype_stats["total"]["size"],
-                    }
-                    write_row(value_dict)
-                    row_idx += 1
-
+    try:
+        for value_dict in _iter_summary_rows(subGroup_included, dataset_data, instruments_data, progress_callback):
+            write_row(value_dict, row_idx)
+            row_idx += 1
+    except _SummaryExportCancelled:
+        return False
 
 
 # --- 各シート出力関数 ---
@@ -1331,38 +1541,6 @@ def write_templates_sheet(wb, parent):
             attr.get("usesInstrument", ""),
             attr.get("created", "")
         ])
-    import json, os
-    JSON_PATH = os.path.join(OUTPUT_RDE_DIR, "data", "instruments.json")
-    abs_json = os.path.abspath(JSON_PATH)
-    if not os.path.exists(abs_json):
-        return
-    with open(abs_json, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    instruments = data.get("data", [])
-    HEADER_ROW = [
-        "id", "organizationId", "organizationNameJa", "organizationNameEn", "nameJa", "nameEn", "modelNumber", "manufacturerJa", "manufacturerEn"
-    ]
-    SHEET_NAME = "instruments"
-    if SHEET_NAME in wb.sheetnames:
-        ws = wb[SHEET_NAME]
-        ws.delete_rows(1, ws.max_row)
-        ws.append(HEADER_ROW)
-    else:
-        ws = wb.create_sheet(SHEET_NAME)
-        ws.append(HEADER_ROW)
-    for inst in instruments:
-        attr = inst.get("attributes", {})
-        ws.append([
-            inst.get("id", ""),
-            attr.get("organizationId", ""),
-            attr.get("organizationNameJa", ""),
-            attr.get("organizationNameEn", ""),
-            attr.get("nameJa", ""),
-            attr.get("nameEn", ""),
-            attr.get("modelNumber", ""),
-            attr.get("manufacturerJa", ""),
-            attr.get("manufacturerEn", "")
-        ])
 def write_group_sheet(wb, parent):
     pass
 def write_instrumentType_sheet(wb, parent):
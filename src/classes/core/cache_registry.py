@@ -267,7 +267,6 @@ def _data_fetch2_runtime_snapshot(context: CacheRuntimeContext) -> CacheSnapshot
         bulk_rde_widget = getattr(widget, "bulk_rde_widget", None)
         if bulk_rde_widget is not None:
             bulk_rde_count += len(getattr(bulk_rde_widget, "_dataset_items_cache", []) or [])
-            bulk_rde_count += len(getattr(bulk_rde_widget, "_entry_items_cache", {}) or {})
             bulk_rde_count += len(getattr(bulk_rde_widget, "_subgroup_info_cache", {}) or {})
             bulk_rde_count += len(getattr(bulk_rde_widget, "_sample_info_cache", {}) or {})
             bulk_rde_count += len(getattr(bulk_rde_widget, "_instrument_info_cache", {}) or {})
@@ -337,7 +336,6 @@ def _clear_data_fetch2_runtime(context: CacheRuntimeContext) -> CacheClearResult
         bulk_rde_widget = getattr(widget, "bulk_rde_widget", None)
         if bulk_rde_widget is not None:
             setattr(bulk_rde_widget, "_dataset_items_cache", [])
-            setattr(bulk_rde_widget, "_entry_items_cache", {})
             setattr(bulk_rde_widget, "_subgroup_info_cache", None)
             setattr(bulk_rde_widget, "_sample_info_cache", None)
             setattr(bulk_rde_widget, "_instrument_info_cache", None)
@@ -444,6 +442,33 @@ def _clear_ai_runtime(context: CacheRuntimeContext) -> CacheClearResult:
     return CacheClearResult(True, "AI分析ランタイムキャッシュをクリアしました")
 
 
+def _json_repository_snapshot(context: CacheRuntimeContext) -> CacheSnapshot:
+    from classes.core.json_repository import get_json_repository
+
+    stats = get_json_repository().stats()
+    return CacheSnapshot(
+        cache_id="json_repository",
+        name="取得済みJSON共有キャッシュ",
+        feature="基本情報",
+        cache_type="メモリ",
+        storage_path="memory://JsonRepository",
+        created_at=None,
+        updated_at=None,
+        size_bytes=int(stats["bytes"]),
+        item_count=int(stats["entries"]),
+        active=bool(stats["entries"]),
+        clearable=True,
+        notes=f"hits={stats['hits']}, misses={stats['misses']}, 上限={stats['max_bytes'] // (1024 * 1024)}MB（パース後の推定量）",
+    )
+
+
+def _clear_json_repository(context: CacheRuntimeContext) -> CacheClearResult:
+    from classes.core.json_repository import clear_json_repository
+
+    clear_json_repository()
+    return CacheClearResult(True, "取得済みJSON共有キャッシュをクリアしました")
+
+
 class CacheRegistry:
     def __init__(self, entries: list[CacheEntry]):
         self._entries = list(entries)
@@ -639,7 +664,7 @@ def _build_registry() -> CacheRegistry:
         from classes.data_entry.core import registration_status_service as regsvc
 
         _emit_progress(progress_callback, 0, 0, "登録状況一覧を再取得中...")
-        entries = regsvc.fetch_all(default_chunk=5000, use_cache=False)
+        entries = regsvc.fetch_all(default_chunk=5000, use_cache=False, full=True)
         _emit_progress(progress_callback, 1, 1, f"登録状況一覧を更新しました: {len(entries)} 件")
         return CacheRefreshResult(True, f"登録状況キャッシュを更新しました（{len(entries)} 件）")
 
@@ -1047,6 +1072,12 @@ def _build_registry() -> CacheRegistry:
             _clear_data_fetch2_runtime,
             refresh_reason="画面内状態に依存するため設定タブからは更新不可",
         ),
+        CacheEntry(
+            "json_repository",
+            _json_repository_snapshot,
+            _clear_json_repository,
+            refresh_reason="ファイル更新時に自動で読み直されるため更新不要",
+        ),
         CacheEntry(
             "ai_runtime",
             _ai_runtime_snapshot,
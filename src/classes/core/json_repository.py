@@ -0,0 +1,267 @@
+"""
+パース済みJSONの共有リポジトリ（output/rde/data 配下の読み込み用）
+
+dataset.json / dataEntry/*.json / samples/*.json / instruments.json などを、
+複数の画面・処理がそれぞれ読み込み直していたものをプロセス内で共有する。
+
+- パス単位で (mtime, size) を検証し、ファイルが更新されていれば読み直す
+- 保持量はパース後の推定メモリ量（ファイルサイズ × JSON_PARSED_SIZE_FACTOR）の合計で管理し、
+  上限を超えたら古いものから破棄する（LRU）
+- 一度しか読まない大量のファイル（エクスポートでの dataEntry/*.json 走査など）は store=False で読む
+  （保持済みなら共有し、無ければ保持せずにパースする）
+- 同じファイルを複数スレッドが同時に要求した場合は1回だけパースする
+- load_json_directory() / iter_json_files() で複数のJSONを並列に読み込む
+
+返すオブジェクトは全呼び出し元で共有されるため、呼び出し側で変更してはならない
+（変更が必要な場合は呼び出し側で複製すること）。
+"""
+
+import glob
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 保持するJSONの上限（パース後の推定メモリ量の合計）
+JSON_REPOSITORY_MAX_BYTES = 256 * 1024 * 1024
+# ファイルサイズ 1 バイトあたりのパース後メモリ量の見積もり（dict/str オブジェクトのオーバーヘッド込み）
+JSON_PARSED_SIZE_FACTOR = 6
+# load_json_directory / load_json_files の既定並列数
+JSON_REPOSITORY_LOAD_WORKERS = 8
+
+_MISSING = object()
+
+
+class _Entry:
+    __slots__ = ("signature", "payload", "size")
+
+    def __init__(self, signature: Tuple[int, int], payload: Any, size: int):
+        self.signature = signature
+        self.payload = payload
+        self.size = size
+
+
+class JsonRepository:
+    """(mtime, size) で検証する読み込み時キャッシュ（スレッドセーフ、LRU）"""
+
+    def __init__(self, max_bytes: int = JSON_REPOSITORY_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._loading: Dict[str, threading.Lock] = {}
+        self._total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    # -- 読み込み ---------------------------------------------------------
+
+    def get(self, path: str, default: Any = None, *, store: bool = True) -> Any:
+        """
+        パース済みJSONを返す（存在しない・壊れている場合は default）
+
+        store=False の場合、保持済みであればそれを返し、無ければパースした結果を保持しない。
+        """
+        if not path:
+            return default
+        key = os.path.abspath(path)
+        signature = _file_signature(key)
+        if signature is None:
+            self.invalidate(key)
+            return default
+
+        payload = self._lookup(key, signature)
+        if payload is not _MISSING:
+            return payload
+        if not store:
+            payload = _parse_file(key)
+            return default if payload is _MISSING else payload
+
+        # 同じファイルの同時読み込みは1回にまとめる
+        with self._lock:
+            load_lock = self._loading.setdefault(key, threading.Lock())
+        with load_lock:
+            signature = _file_signature(key)
+            if signature is None:
+                return default
+            payload = self._lookup(key, signature, count=False)
+            if payload is not _MISSING:
+                return payload
+            payload = _parse_file(key)
+            if payload is _MISSING:
+                return default
+            self._store(key, signature, payload)
+        with self._lock:
+            if self._loading.get(key) is load_lock and not load_lock.locked():
+                self._loading.pop(key, None)
+        return payload
+
+    def iter_many(
+        self,
+        paths: Iterable[str],
+        *,
+        max_workers: Optional[int] = None,
+        store: bool = True,
+    ) -> Iterator[Tuple[str, Any]]:
+        """
+        複数ファイルを並列に読み込み、指定順に (path, payload) を返す
+
+        先読みは並列数の2倍までに抑えるため、キャッシュ上限を超える量でも
+        読み込み済みオブジェクトが溜まり続けることはない。読めなかったファイルは
+        payload が None になる。store=False の場合は読んだ結果を保持しない。
+        """
+        paths = [p for p in paths if p]
+        workers = max(1, min(max_workers or JSON_REPOSITORY_LOAD_WORKERS, len(paths) or 1))
+        if workers == 1:
+            for path in paths:
+                yield path, self.get(path, store=store)
+            return
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="json-repo") as executor:
+            pending: "deque[Tuple[str, Future]]" = deque()
+            try:
+                for path in paths:
+                    pending.append((path, executor.submit(self.get, path, store=store)))
+                    if len(pending) >= workers * 2:
+                        head, future = pending.popleft()
+                        yield head, future.result()
+                while pending:
+                    head, future = pending.popleft()
+                    yield head, future.result()
+            finally:
+                for _, future in pending:
+                    future.cancel()
+
+    def get_many(self, paths: Iterable[str], *, max_workers: Optional[int] = None) -> Dict[str, Any]:
+        """複数ファイルを並列に読み込み {path: payload} を返す（読めなかったファイルは含めない）"""
+        unique_paths = list(dict.fromkeys(p for p in paths if p))
+        return {
+            path: payload
+            for path, payload in self.iter_many(unique_paths, max_workers=max_workers)
+            if payload is not None
+        }
+
+    def load_directory(
+        self,
+        directory: str,
+        pattern: str = "*.json",
+        *,
+        max_workers: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """ディレクトリ内のJSONを並列に読み込み {ファイル名(拡張子なし): payload} を返す"""
+        if not directory or not os.path.isdir(directory):
+            return {}
+        paths = sorted(glob.glob(os.path.join(directory, pattern)))
+        loaded = self.get_many(paths, max_workers=max_workers)
+        return {os.path.splitext(os.path.basename(path))[0]: payload for path, payload in loaded.items()}
+
+    # -- 管理 -------------------------------------------------------------
+
+    def invalidate(self, path: str) -> None:
+        key = os.path.abspath(path)
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._total_bytes -= entry.size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    # -- 内部 -------------------------------------------------------------
+
+    def _lookup(self, key: str, signature: Tuple[int, int], *, count: bool = True) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.signature == signature:
+                self._entries.move_to_end(key)
+                if count:
+                    self.hits += 1
+                return entry.payload
+            if count:
+                self.misses += 1
+        return _MISSING
+
+    def _store(self, key: str, signature: Tuple[int, int], payload: Any) -> None:
+        size = signature[1] * JSON_PARSED_SIZE_FACTOR
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._total_bytes -= previous.size
+            if size > self.max_bytes:
+                # 上限を超える単一ファイルは保持しない
+                return
+            self._entries[key] = _Entry(signature, payload, size)
+            self._total_bytes += size
+            while self._total_bytes > self.max_bytes and self._entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._total_bytes -= evicted.size
+
+
+def _file_signature(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _parse_file(path: str) -> Any:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception:
+        logger.debug("JSON読み込み失敗: %s", path, exc_info=True)
+        return _MISSING
+
+
+_repository = JsonRepository()
+
+
+def get_json_repository() -> JsonRepository:
+    return _repository
+
+
+def load_json_cached(path: str, default: Any = None, *, store: bool = True) -> Any:
+    """共有リポジトリ経由でJSONを読み込む（返り値は変更しないこと。store=False は保持しない）"""
+    return _repository.get(path, default, store=store)
+
+
+def load_json_files(paths: Iterable[str], *, max_workers: Optional[int] = None) -> Dict[str, Any]:
+    """共有リポジトリ経由で複数のJSONを並列に読み込む"""
+    return _repository.get_many(paths, max_workers=max_workers)
+
+
+def iter_json_files(
+    paths: Iterable[str],
+    *,
+    max_workers: Optional[int] = None,
+    store: bool = True,
+) -> Iterator[Tuple[str, Any]]:
+    """共有リポジトリ経由で複数のJSONを並列に読み込み、指定順に (path, payload) を返す"""
+    return _repository.iter_many(paths, max_workers=max_workers, store=store)
+
+
+def load_json_directory(directory: str, pattern: str = "*.json", *, max_workers: Optional[int] = None) -> Dict[str, Any]:
+    """共有リポジトリ経由でディレクトリ内のJSONを並列に読み込む"""
+    return _repository.load_directory(directory, pattern, max_workers=max_workers)
+
+
+def clear_json_repository() -> None:
+    _repository.clear()
@@ -1,21 +1,28 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import os
+import sqlite3
+from contextlib import closing
 from datetime import datetime
 from typing import Any
 
+from classes.core.json_repository import load_json_cached
 from config.common import get_dynamic_file_path, ensure_directory_exists
 
 
-INDEX_VERSION = 1
+INDEX_VERSION = 2
+LEGACY_JSON_INDEX_RELATIVE_PATH = "output/rde/data/search_index/rde_search_index.json"
 QUERY_CACHE_MAX_ENTRIES = 3000
+NGRAM_SIZE = 3
 
 _INDEX_MEMORY_CACHE: dict[str, Any] | None = None
 _INDEX_MEMORY_PATH: str = ""
-_INDEX_MEMORY_MTIME: float = -1.0
 _QUERY_CACHE_LOADED = False
 _QUERY_CACHE_PAYLOAD: dict[str, Any] = {"signature": "", "entries": {}}
+_NGRAM_INDEX_SIGNATURE: str = ""
+_NGRAM_INDEX_FIELDS: dict[str, "_FieldNgramIndex"] = {}
 
 
 def _now_iso() -> str:
@@ -45,7 +52,7 @@ def _load_json(path: str) -> Any:
 
 
 def _load_data_items(path: str) -> list[dict]:
-    payload = _load_json(path)
+    payload = load_json_cached(path)
     if isinstance(payload, dict):
         data = payload.get("data")
         if isinstance(data, list):
@@ -65,7 +72,7 @@ def _get_sources() -> dict[str, str]:
 
 
 def get_index_path() -> str:
-    return get_dynamic_file_path("output/rde/data/search_index/rde_search_index.json")
+    return get_dynamic_file_path("output/rde/data/search_index/rde_search_index.sqlite3")
 
 
 def get_query_cache_path() -> str:
@@ -311,159 +318,446 @@ def _build_subgroup_name_by_id(subgroup_payload: Any) -> dict[str, str]:
     return result
 
 
-def _add_reverse(reverse_map: dict[str, dict[str, list[str]]], field: str, key: str, dataset_id: str):
-    normalized = _safe_str(key)
-    if not normalized:
-        return
-    bucket = reverse_map.setdefault(field, {}).setdefault(normalized, [])
-    if dataset_id not in bucket:
-        bucket.append(dataset_id)
+def _ngrams(text: str, size: int = NGRAM_SIZE) -> set[str]:
+    if len(text) < size:
+        return set()
+    return {text[i : i + size] for i in range(len(text) - size + 1)}
 
 
-def rebuild_rde_search_index() -> dict[str, Any]:
-    sources = _get_sources()
-    mtimes = _source_mtimes(sources)
+class _FieldNgramIndex:
+    """1フィールド分の逆引きキーに対する文字 n-gram ポスティング。
 
-    dataset_items = _load_data_items(sources["dataset"])
-    template_items = _load_data_items(sources["template"])
-    instrument_items = _load_data_items(sources["instrument"])
-    subgroup_payload = _load_json(sources["subgroup"])
+    keys_cf[i] は casefold 済みキー、ids[i] はそのキーに紐づくデータセットID。
+    postings[gram] は gram を含むキー位置の昇順リスト。
+    """
+
+    __slots__ = ("keys_cf", "ids", "postings")
+
+    def __init__(self, field_map: dict[str, Any]):
+        self.keys_cf: list[str] = []
+        self.ids: list[list[str]] = []
+        self.postings: dict[str, list[int]] = {}
+        for key, ids in field_map.items():
+            pos = len(self.keys_cf)
+            key_cf = _safe_str(key).casefold()
+            self.keys_cf.append(key_cf)
+            self.ids.append([_safe_str(x) for x in ids if _safe_str(x)] if isinstance(ids, list) else [])
+            for gram in _ngrams(key_cf):
+                self.postings.setdefault(gram, []).append(pos)
+
+    def match(self, token_cf: str) -> set[str]:
+        grams = _ngrams(token_cf)
+        if grams:
+            posting_lists = []
+            for gram in grams:
+                posting = self.postings.get(gram)
+                if not posting:
+                    return set()
+                posting_lists.append(posting)
+            posting_lists.sort(key=len)
+            candidates = set(posting_lists[0])
+            for posting in posting_lists[1:]:
+                candidates.intersection_update(posting)
+                if not candidates:
+                    return set()
+            positions = [pos for pos in candidates if token_cf in self.keys_cf[pos]]
+        else:
+            # n-gram 長未満の短いクエリは casefold 済みキーを走査する
+            positions = [pos for pos, key_cf in enumerate(self.keys_cf) if token_cf in key_cf]
+
+        matched: set[str] = set()
+        for pos in positions:
+            matched.update(self.ids[pos])
+        return matched
+
+
+def _build_ngram_index(index_payload: dict[str, Any]) -> dict[str, _FieldNgramIndex]:
+    reverse = index_payload.get("reverse") if isinstance(index_payload.get("reverse"), dict) else {}
+    return {
+        field: _FieldNgramIndex(field_map)
+        for field, field_map in reverse.items()
+        if isinstance(field_map, dict)
+    }
+
+
+def _get_ngram_index(index_payload: dict[str, Any]) -> dict[str, _FieldNgramIndex]:
+    """インデックスのシグネチャ単位で n-gram ポスティングをメモリに保持して返す。"""
+    global _NGRAM_INDEX_SIGNATURE, _NGRAM_INDEX_FIELDS
+    signature = _index_signature(index_payload)
+    if _NGRAM_INDEX_SIGNATURE != signature or not _NGRAM_INDEX_FIELDS:
+        _NGRAM_INDEX_FIELDS = _build_ngram_index(index_payload)
+        _NGRAM_INDEX_SIGNATURE = signature
+    return _NGRAM_INDEX_FIELDS
+
+
+def _build_local_ids_by_name(local_id_to_name: dict[str, str]) -> dict[str, list[str]]:
+    """装置名→localId 一覧（データセットごとに全localIdを走査しないための逆引き）。"""
+    result: dict[str, list[str]] = {}
+    for local_id, name in local_id_to_name.items():
+        if name:
+            result.setdefault(name, []).append(local_id)
+    return {name: sorted(set(ids)) for name, ids in result.items()}
+
+
+def _build_source_lookup(source_key: str, path: str) -> dict[str, Any]:
+    """依存ソース1つ分を解析し、データセットレコード計算用の参照表を返す。"""
+    if source_key == "template":
+        return {"template_to_instrument_ids": _build_template_to_instrument_ids(_load_data_items(path))}
+    if source_key == "instrument":
+        instrument_name_by_id, local_id_to_name = _build_instrument_maps(_load_data_items(path))
+        return {
+            "instrument_name_by_id": instrument_name_by_id,
+            "local_ids_by_name": _build_local_ids_by_name(local_id_to_name),
+        }
+    if source_key == "subgroup":
+        return {"subgroup_name_by_id": _build_subgroup_name_by_id(load_json_cached(path))}
+    return {}
+
+
+def _extract_dataset_base(dataset: dict) -> dict[str, Any] | None:
+    """dataset.json の1件から、他ソースに依存しない項目だけを取り出す。"""
+    dataset_id = _safe_str(dataset.get("id"))
+    if not dataset_id:
+        return None
+
+    attrs = dataset.get("attributes") if isinstance(dataset.get("attributes"), dict) else {}
+    rels = dataset.get("relationships") if isinstance(dataset.get("relationships"), dict) else {}
+
+    group_data = (rels.get("group") or {}).get("data") if isinstance(rels, dict) else {}
+    subgroup_id = _safe_str((group_data or {}).get("id") if isinstance(group_data, dict) else "") or _safe_str(attrs.get("groupId"))
+
+    template_data = (rels.get("template") or {}).get("data") if isinstance(rels, dict) else {}
+    template_id = _safe_str((template_data or {}).get("id") if isinstance(template_data, dict) else "") or _safe_str(attrs.get("templateId"))
+
+    related_data = (rels.get("relatedDatasets") or {}).get("data") if isinstance(rels, dict) else []
+    related_ids: list[str] = []
+    for item in _safe_list(related_data):
+        if isinstance(item, dict):
+            rid = _safe_str(item.get("id"))
+            if rid:
+                related_ids.append(rid)
+
+    return {
+        "dataset_id": dataset_id,
+        "dataset_name": _safe_str(attrs.get("name")),
+        "grant_number": _safe_str(attrs.get("grantNumber")),
+        "subgroup_id": subgroup_id,
+        "template_id": template_id,
+        "related_dataset_ids": sorted(set(related_ids)),
+    }
+
+
+def _compute_dataset_record(base: dict[str, Any], lookups: dict[str, dict[str, Any]]) -> dict[str, Any]:
+    template_to_instrument_ids = lookups.get("template", {}).get("template_to_instrument_ids", {})
+    instrument_name_by_id = lookups.get("instrument", {}).get("instrument_name_by_id", {})
+    local_ids_by_name = lookups.get("instrument", {}).get("local_ids_by_name", {})
+    subgroup_name_by_id = lookups.get("subgroup", {}).get("subgroup_name_by_id", {})
+
+    instrument_ids = list(template_to_instrument_ids.get(base["template_id"], []))
+    equipment_names = sorted(set(
+        _safe_str(instrument_name_by_id.get(instrument_id, ""))
+        for instrument_id in instrument_ids
+        if _safe_str(instrument_name_by_id.get(instrument_id, ""))
+    ))
+    equipment_local_ids: set[str] = set()
+    for name in equipment_names:
+        equipment_local_ids.update(_safe_str(x) for x in local_ids_by_name.get(name, []) if _safe_str(x))
+
+    return {
+        "dataset_id": base["dataset_id"],
+        "dataset_name": base["dataset_name"],
+        "grant_number": base["grant_number"],
+        "subgroup_id": base["subgroup_id"],
+        "subgroup_name": subgroup_name_by_id.get(base["subgroup_id"], ""),
+        "template_id": base["template_id"],
+        "related_dataset_ids": list(base["related_dataset_ids"]),
+        "instrument_ids": instrument_ids,
+        "equipment_names": equipment_names,
+        "equipment_local_ids": sorted(equipment_local_ids),
+    }
+
+
+def _record_content_hash(record: dict[str, Any]) -> str:
+    raw = json.dumps(record, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def _record_postings(record: dict[str, Any]) -> set[tuple[str, str]]:
+    """レコードから逆引き (field, key) の組を列挙する。"""
+    postings: set[tuple[str, str]] = set()
+
+    def add(field: str, key: Any):
+        normalized = _safe_str(key)
+        if normalized:
+            postings.add((field, normalized))
+
+    add("dataset_id", record.get("dataset_id"))
+    add("dataset_name", record.get("dataset_name"))
+    add("grant_number", record.get("grant_number"))
+    add("subgroup_id", record.get("subgroup_id"))
+    add("subgroup_name", record.get("subgroup_name"))
+    add("template_id", record.get("template_id"))
+    for rid in record.get("related_dataset_ids") or []:
+        add("related_dataset_id", rid)
+    for ename in record.get("equipment_names") or []:
+        add("equipment_name", ename)
+    for local_id in record.get("equipment_local_ids") or []:
+        add("equipment_local_id", local_id)
+    return postings
+
+
+_SCHEMA_STATEMENTS = (
+    "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS lookups (source TEXT PRIMARY KEY, payload TEXT NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS datasets (dataset_id TEXT PRIMARY KEY, content_hash TEXT NOT NULL, record TEXT NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS postings (field TEXT NOT NULL, key TEXT NOT NULL, dataset_id TEXT NOT NULL,"
+    " PRIMARY KEY (field, key, dataset_id)) WITHOUT ROWID",
+    "CREATE INDEX IF NOT EXISTS idx_postings_dataset ON postings(dataset_id)",
+)
+
+
+def _connect_index(path: str) -> sqlite3.Connection:
+    ensure_directory_exists(os.path.dirname(path))
+    conn = sqlite3.connect(path, timeout=30)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    for statement in _SCHEMA_STATEMENTS:
+        conn.execute(statement)
+    return conn
+
+
+def _read_index_meta(conn: sqlite3.Connection) -> dict[str, Any]:
+    row = conn.execute("SELECT value FROM meta WHERE key = 'meta'").fetchone()
+    if not row:
+        return {}
+    try:
+        meta = json.loads(row[0])
+    except Exception:
+        return {}
+    return meta if isinstance(meta, dict) else {}
 
-    template_to_instrument_ids = _build_template_to_instrument_ids(template_items)
-    instrument_name_by_id, local_id_to_name = _build_instrument_maps(instrument_items)
-    subgroup_name_by_id = _build_subgroup_name_by_id(subgroup_payload)
 
+def _load_datasets_section(path: str) -> dict[str, dict[str, Any]]:
+    with closing(_connect_index(path)) as conn:
+        rows = conn.execute("SELECT dataset_id, record FROM datasets ORDER BY dataset_id").fetchall()
     datasets: dict[str, dict[str, Any]] = {}
+    for dataset_id, record in rows:
+        try:
+            datasets[dataset_id] = json.loads(record)
+        except Exception:
+            continue
+    return datasets
+
+
+def _load_reverse_section(path: str) -> dict[str, dict[str, list[str]]]:
+    with closing(_connect_index(path)) as conn:
+        rows = conn.execute("SELECT field, key, dataset_id FROM postings ORDER BY field, key, dataset_id").fetchall()
     reverse: dict[str, dict[str, list[str]]] = {}
+    for field, key, dataset_id in rows:
+        reverse.setdefault(field, {}).setdefault(key, []).append(dataset_id)
+    return reverse
+
+
+class _LazyIndexPayload(dict):
+    """SQLite インデックスのビュー。meta は即時、datasets/reverse は初回参照時に読み込む。"""
+
+    _SECTION_LOADERS = {
+        "datasets": _load_datasets_section,
+        "reverse": _load_reverse_section,
+    }
+
+    def __init__(self, path: str, meta: dict[str, Any]):
+        super().__init__(meta=meta)
+        self._path = path
+
+    def __missing__(self, key):
+        loader = self._SECTION_LOADERS.get(key)
+        if loader is None:
+            raise KeyError(key)
+        value = loader(self._path)
+        self[key] = value
+        return value
+
+    def __contains__(self, key) -> bool:
+        return dict.__contains__(self, key) or key in self._SECTION_LOADERS
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+
+def _remove_legacy_json_index() -> None:
+    path = get_dynamic_file_path(LEGACY_JSON_INDEX_RELATIVE_PATH)
+    try:
+        if path and os.path.exists(path):
+            os.remove(path)
+    except Exception:
+        pass
 
-    for dataset in dataset_items:
-        dataset_id = _safe_str(dataset.get("id"))
-        if not dataset_id:
-            continue
 
-        attrs = dataset.get("attributes") if isinstance(dataset.get("attributes"), dict) else {}
-        rels = dataset.get("relationships") if isinstance(dataset.get("relationships"), dict) else {}
-
-        grant = _safe_str(attrs.get("grantNumber"))
-        dataset_name = _safe_str(attrs.get("name"))
-
-        group_data = (rels.get("group") or {}).get("data") if isinstance(rels, dict) else {}
-        subgroup_id = _safe_str((group_data or {}).get("id") if isinstance(group_data, dict) else "") or _safe_str(attrs.get("groupId"))
-        subgroup_name = subgroup_name_by_id.get(subgroup_id, "")
-
-        template_data = (rels.get("template") or {}).get("data") if isinstance(rels, dict) else {}
-        template_id = _safe_str((template_data or {}).get("id") if isinstance(template_data, dict) else "") or _safe_str(attrs.get("templateId"))
-
-        related_data = (rels.get("relatedDatasets") or {}).get("data") if isinstance(rels, dict) else []
-        related_ids: list[str] = []
-        for item in _safe_list(related_data):
-            if isinstance(item, dict):
-                rid = _safe_str(item.get("id"))
-                if rid:
-                    related_ids.append(rid)
-
-        instrument_ids = template_to_instrument_ids.get(template_id, [])
-        equipment_names: list[str] = []
-        equipment_local_ids: list[str] = []
-
-        for instrument_id in instrument_ids:
-            name = instrument_name_by_id.get(instrument_id, "")
-            if name:
-                equipment_names.append(name)
-
-        for local_id, local_name in local_id_to_name.items():
-            if local_name and local_name in equipment_names:
-                equipment_local_ids.append(local_id)
-
-        equipment_names = sorted(set([_safe_str(x) for x in equipment_names if _safe_str(x)]))
-        equipment_local_ids = sorted(set([_safe_str(x) for x in equipment_local_ids if _safe_str(x)]))
-        related_ids = sorted(set([_safe_str(x) for x in related_ids if _safe_str(x)]))
-
-        datasets[dataset_id] = {
-            "dataset_id": dataset_id,
-            "dataset_name": dataset_name,
-            "grant_number": grant,
-            "subgroup_id": subgroup_id,
-            "subgroup_name": subgroup_name,
-            "template_id": template_id,
-            "related_dataset_ids": related_ids,
-            "instrument_ids": instrument_ids,
-            "equipment_names": equipment_names,
-            "equipment_local_ids": equipment_local_ids,
+def rebuild_rde_search_index(force_full: bool = False) -> dict[str, Any]:
+    """検索インデックスを更新する（既定は変更ソースに影響されたデータセットのみ差分更新）。
+
+    依存ソース（template/instrument/subgroup）の参照表は SQLite に保持し、mtime が変わった
+    ソースだけ再解析する。全データセットのレコードを参照表から再計算し、内容ハッシュが
+    変わったデータセットの行と逆引きだけを書き換える。
+    """
+    sources = _get_sources()
+    mtimes = _source_mtimes(sources)
+    index_path = get_index_path()
+
+    with closing(_connect_index(index_path)) as conn:
+        saved_meta = _read_index_meta(conn)
+        saved_mtimes = saved_meta.get("source_mtimes") if isinstance(saved_meta.get("source_mtimes"), dict) else {}
+        full = force_full or int(saved_meta.get("version") or 0) != INDEX_VERSION
+        changed_sources = {
+            key for key, current in mtimes.items()
+            if full or abs(float(saved_mtimes.get(key) or 0.0) - current) > 0.0001
         }
 
-        _add_reverse(reverse, "dataset_id", dataset_id, dataset_id)
-        _add_reverse(reverse, "dataset_name", dataset_name, dataset_id)
-        _add_reverse(reverse, "grant_number", grant, dataset_id)
-        _add_reverse(reverse, "subgroup_id", subgroup_id, dataset_id)
-        _add_reverse(reverse, "subgroup_name", subgroup_name, dataset_id)
-        _add_reverse(reverse, "template_id", template_id, dataset_id)
-        for rid in related_ids:
-            _add_reverse(reverse, "related_dataset_id", rid, dataset_id)
-        for ename in equipment_names:
-            _add_reverse(reverse, "equipment_name", ename, dataset_id)
-        for local_id in equipment_local_ids:
-            _add_reverse(reverse, "equipment_local_id", local_id, dataset_id)
-
-    for field_map in reverse.values():
-        for key, ids in list(field_map.items()):
-            field_map[key] = sorted(set(ids))
-
-    index_payload: dict[str, Any] = {
-        "meta": {
+        stored_lookups = {} if full else {
+            source: payload for source, payload in conn.execute("SELECT source, payload FROM lookups").fetchall()
+        }
+        lookups: dict[str, dict[str, Any]] = {}
+        for source_key in ("template", "instrument", "subgroup"):
+            lookup = None
+            if source_key not in changed_sources and source_key in stored_lookups:
+                try:
+                    lookup = json.loads(stored_lookups[source_key])
+                except Exception:
+                    lookup = None
+            if lookup is None:
+                lookup = _build_source_lookup(source_key, sources[source_key])
+                changed_sources.add(source_key)
+            lookups[source_key] = lookup
+
+        stored_hashes: dict[str, str] = {}
+        stored_records: dict[str, str] = {}
+        if not full:
+            for dataset_id, content_hash, record in conn.execute("SELECT dataset_id, content_hash, record FROM datasets"):
+                stored_hashes[dataset_id] = content_hash
+                stored_records[dataset_id] = record
+
+        bases: dict[str, dict[str, Any]] = {}
+        if "dataset" in changed_sources:
+            for dataset in _load_data_items(sources["dataset"]):
+                base = _extract_dataset_base(dataset)
+                if base is not None:
+                    bases[base["dataset_id"]] = base
+        else:
+            for dataset_id, record in stored_records.items():
+                try:
+                    stored = json.loads(record)
+                except Exception:
+                    continue
+                bases[dataset_id] = {
+                    "dataset_id": dataset_id,
+                    "dataset_name": _safe_str(stored.get("dataset_name")),
+                    "grant_number": _safe_str(stored.get("grant_number")),
+                    "subgroup_id": _safe_str(stored.get("subgroup_id")),
+                    "template_id": _safe_str(stored.get("template_id")),
+                    "related_dataset_ids": list(stored.get("related_dataset_ids") or []),
+                }
+
+        upserts: list[tuple[str, str, dict[str, Any]]] = []
+        for dataset_id, base in bases.items():
+            record = _compute_dataset_record(base, lookups)
+            content_hash = _record_content_hash(record)
+            if stored_hashes.get(dataset_id) != content_hash:
+                upserts.append((dataset_id, content_hash, record))
+        removed_ids = [dataset_id for dataset_id in stored_hashes if dataset_id not in bases]
+
+        meta = {
             "version": INDEX_VERSION,
             "generated_at": _now_iso(),
             "source_mtimes": mtimes,
-            "dataset_count": len(datasets),
-        },
-        "datasets": datasets,
-        "reverse": reverse,
-    }
-
-    index_path = get_index_path()
-    ensure_directory_exists(os.path.dirname(index_path))
-    with open(index_path, "w", encoding="utf-8") as f:
-        json.dump(index_payload, f, ensure_ascii=False, indent=2)
+            "dataset_count": len(bases),
+        }
 
-    global _INDEX_MEMORY_CACHE, _INDEX_MEMORY_PATH, _INDEX_MEMORY_MTIME
+        with conn:
+            if full:
+                conn.execute("DELETE FROM postings")
+                conn.execute("DELETE FROM datasets")
+                conn.execute("DELETE FROM lookups")
+            for source_key in changed_sources & set(lookups.keys()):
+                conn.execute(
+                    "INSERT OR REPLACE INTO lookups (source, payload) VALUES (?, ?)",
+                    (source_key, json.dumps(lookups[source_key], ensure_ascii=False, separators=(",", ":"))),
+                )
+            stale_ids = removed_ids + [dataset_id for dataset_id, _, _ in upserts if dataset_id in stored_hashes]
+            conn.executemany("DELETE FROM postings WHERE dataset_id = ?", [(x,) for x in stale_ids])
+            conn.executemany("DELETE FROM datasets WHERE dataset_id = ?", [(x,) for x in removed_ids])
+            conn.executemany(
+                "INSERT OR REPLACE INTO datasets (dataset_id, content_hash, record) VALUES (?, ?, ?)",
+                [
+                    (dataset_id, content_hash, json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+                    for dataset_id, content_hash, record in upserts
+                ],
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO postings (field, key, dataset_id) VALUES (?, ?, ?)",
+                [
+                    (field, key, dataset_id)
+                    for dataset_id, _, record in upserts
+                    for field, key in _record_postings(record)
+                ],
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('meta', ?)",
+                (json.dumps(meta, ensure_ascii=False),),
+            )
+
+    if full:
+        _remove_legacy_json_index()
+
+    index_payload = _LazyIndexPayload(index_path, meta)
+
+    global _INDEX_MEMORY_CACHE, _INDEX_MEMORY_PATH
     _INDEX_MEMORY_CACHE = index_payload
     _INDEX_MEMORY_PATH = index_path
-    try:
-        _INDEX_MEMORY_MTIME = os.path.getmtime(index_path)
-    except Exception:
-        _INDEX_MEMORY_MTIME = -1.0
 
     _clear_query_cache_for_index(index_payload)
 
+    global _NGRAM_INDEX_SIGNATURE, _NGRAM_INDEX_FIELDS
+    _NGRAM_INDEX_FIELDS = _build_ngram_index(index_payload)
+    _NGRAM_INDEX_SIGNATURE = _index_signature(index_payload)
+
     return index_payload
 
 
 def load_rde_search_index() -> dict[str, Any] | None:
-    global _INDEX_MEMORY_CACHE, _INDEX_MEMORY_PATH, _INDEX_MEMORY_MTIME
+    global _INDEX_MEMORY_CACHE, _INDEX_MEMORY_PATH
     index_path = get_index_path()
+    if not index_path or not os.path.exists(index_path):
+        return None
+
     try:
-        current_mtime = os.path.getmtime(index_path) if index_path and os.path.exists(index_path) else -1.0
+        with closing(_connect_index(index_path)) as conn:
+            meta = _read_index_meta(conn)
     except Exception:
-        current_mtime = -1.0
+        return None
+    if not meta:
+        return None
 
     if (
         _INDEX_MEMORY_CACHE is not None
         and _INDEX_MEMORY_PATH == index_path
-        and abs(_INDEX_MEMORY_MTIME - current_mtime) <= 0.0001
+        and _INDEX_MEMORY_CACHE.get("meta") == meta
     ):
         return _INDEX_MEMORY_CACHE
 
-    payload = _load_json(index_path)
-    if isinstance(payload, dict):
-        _INDEX_MEMORY_CACHE = payload
-        _INDEX_MEMORY_PATH = index_path
-        _INDEX_MEMORY_MTIME = current_mtime
-        return payload
-    return None
+    payload = _LazyIndexPayload(index_path, meta)
+    _INDEX_MEMORY_CACHE = payload
+    _INDEX_MEMORY_PATH = index_path
+    return payload
 
 
 def _is_index_stale(index_payload: dict[str, Any]) -> bool:
     meta = index_payload.get("meta") if isinstance(index_payload.get("meta"), dict) else {}
+    if int(meta.get("version") or 0) != INDEX_VERSION:
+        return True
     saved_mtimes = meta.get("source_mtimes") if isinstance(meta.get("source_mtimes"), dict) else {}
     current_mtimes = _source_mtimes(_get_sources())
 
@@ -476,7 +770,9 @@ def _is_index_stale(index_payload: dict[str, Any]) -> bool:
 
 def ensure_rde_search_index(force_rebuild: bool = False) -> dict[str, Any]:
     current = load_rde_search_index()
-    if force_rebuild or current is None or _is_index_stale(current):
+    if force_rebuild or current is None:
+        return rebuild_rde_search_index(force_full=True)
+    if _is_index_stale(current):
         return rebuild_rde_search_index()
     return current
 
@@ -490,23 +786,18 @@ def search_dataset_ids(index_payload: dict[str, Any], criteria: dict[str, str])
     if not isinstance(reverse, dict):
         return None
 
+    ngram_index = _get_ngram_index(index_payload)
     result: set[str] | None = None
     for field, value in criteria.items():
         token = _safe_str(value)
         if not token:
             continue
 
-        field_map = reverse.get(field)
-        if not isinstance(field_map, dict):
+        field_index = ngram_index.get(field)
+        if field_index is None:
             continue
 
-        token_cf = token.casefold()
-        matched_ids: set[str] = set()
-        for key, ids in field_map.items():
-            key_cf = _safe_str(key).casefold()
-            if token_cf and token_cf in key_cf:
-                if isinstance(ids, list):
-                    matched_ids.update([_safe_str(x) for x in ids if _safe_str(x)])
+        matched_ids = field_index.match(token.casefold())
 
         if result is None:
             result = matched_ids
@@ -1,8 +1,13 @@
 """
 期限付き永続キャッシュ (TTL Persistent Cache)
 
-JSON ファイルベースのキャッシュストア。各エントリに有効期限 (TTL) が付き、
-期限切れのエントリは自動的に無視される。部分更新にも対応。
+SQLite (WAL) ベースのキャッシュストア。各エントリに有効期限 (TTL) が付き、
+期限切れのエントリは参照時に遅延削除される。書き込みはキー単位で行うため、
+名前空間のエントリ数に関わらず put のコストは一定。
+
+ストアはプロセス内で共有され、同じ名前空間の ``TTLCache`` を何度生成しても
+ファイルの再読み込みは発生しない。旧形式 (``output/cache/<namespace>.json``) が
+残っている場合は初回アクセス時に取り込む。
 
 用途:
   - データセットエントリ一覧のキャッシュ
@@ -13,35 +18,182 @@ JSON ファイルベースのキャッシュストア。各エントリに有効
 import json
 import logging
 import os
+import sqlite3
+import threading
 import time
 from datetime import timedelta
-from typing import Any
+from typing import Any, Iterable
 
 from config.common import get_dynamic_file_path
 
 logger = logging.getLogger(__name__)
 
 
+class _SqliteTTLStore:
+    """名前空間をまたいで共有する SQLite ストア（1 DB ファイルにつき 1 インスタンス）。"""
+
+    _instances: dict[str, "_SqliteTTLStore"] = {}
+    _instances_lock = threading.Lock()
+
+    @classmethod
+    def for_path(cls, path: str) -> "_SqliteTTLStore":
+        with cls._instances_lock:
+            store = cls._instances.get(path)
+            if store is None:
+                store = cls(path)
+                cls._instances[path] = store
+            return store
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.RLock()
+        self._migrated: set[str] = set()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS entries (
+                namespace TEXT NOT NULL,
+                key       TEXT NOT NULL,
+                value     TEXT NOT NULL,
+                ts        REAL NOT NULL,
+                ttl       REAL NOT NULL DEFAULT 0,
+                PRIMARY KEY (namespace, key)
+            ) WITHOUT ROWID
+            """
+        )
+
+    # -- 読み取り ---------------------------------------------------------
+
+    def get(self, namespace: str, key: str) -> tuple[bool, Any]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, ts, ttl FROM entries WHERE namespace = ? AND key = ?",
+                (namespace, key),
+            ).fetchone()
+            if row is None:
+                return False, None
+            value, ts, ttl = row
+            if _is_expired(ts, ttl):
+                self._conn.execute("DELETE FROM entries WHERE namespace = ? AND key = ?", (namespace, key))
+                return False, None
+        return True, json.loads(value)
+
+    def keys(self, namespace: str) -> list[str]:
+        now = time.time()
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key FROM entries WHERE namespace = ? AND (ttl <= 0 OR ? - ts <= ttl) ORDER BY key",
+                (namespace, now),
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    # -- 書き込み ---------------------------------------------------------
+
+    def put_many(self, namespace: str, items: Iterable[tuple[str, Any]], ts: float, ttl: float) -> None:
+        rows = [(namespace, k, json.dumps(v, ensure_ascii=False, separators=(",", ":")), ts, ttl) for k, v in items]
+        if not rows:
+            return
+        with self._lock:
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO entries (namespace, key, value, ts, ttl) VALUES (?, ?, ?, ?, ?)",
+                    rows,
+                )
+
+    def delete(self, namespace: str, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM entries WHERE namespace = ? AND key = ?", (namespace, key))
+
+    def delete_prefix(self, namespace: str, prefix: str) -> int:
+        escaped = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        with self._lock:
+            cur = self._conn.execute(
+                "DELETE FROM entries WHERE namespace = ? AND key LIKE ? ESCAPE '\\'",
+                (namespace, escaped + "%"),
+            )
+            return int(cur.rowcount or 0)
+
+    def clear(self, namespace: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM entries WHERE namespace = ?", (namespace,))
+
+    def purge_expired(self, namespace: str | None = None) -> int:
+        """期限切れエントリを物理削除して件数を返す。"""
+        now = time.time()
+        with self._lock:
+            if namespace is None:
+                cur = self._conn.execute("DELETE FROM entries WHERE ttl > 0 AND ? - ts > ttl", (now,))
+            else:
+                cur = self._conn.execute(
+                    "DELETE FROM entries WHERE namespace = ? AND ttl > 0 AND ? - ts > ttl",
+                    (namespace, now),
+                )
+            return int(cur.rowcount or 0)
+
+    # -- 旧形式の取り込み -------------------------------------------------
+
+    def migrate_legacy_json(self, namespace: str, legacy_path: str) -> None:
+        """旧 JSON キャッシュを一度だけ取り込み、取り込み後に削除する。"""
+        with self._lock:
+            if namespace in self._migrated:
+                return
+            self._migrated.add(namespace)
+            if not os.path.exists(legacy_path):
+                return
+            try:
+                with open(legacy_path, "r", encoding="utf-8") as f:
+                    raw = json.load(f)
+                rows = []
+                if isinstance(raw, dict):
+                    for k, entry in raw.items():
+                        if not isinstance(entry, dict):
+                            continue
+                        ts = float(entry.get("ts", 0) or 0)
+                        ttl = float(entry.get("ttl", 0) or 0)
+                        if _is_expired(ts, ttl):
+                            continue
+                        rows.append((namespace, str(k), json.dumps(entry.get("v"), ensure_ascii=False), ts, ttl))
+                with self._conn:
+                    self._conn.executemany(
+                        "INSERT OR IGNORE INTO entries (namespace, key, value, ts, ttl) VALUES (?, ?, ?, ?, ?)",
+                        rows,
+                    )
+                os.remove(legacy_path)
+                logger.info("TTLCache: migrated %d entries from %s", len(rows), legacy_path)
+            except Exception:
+                logger.warning("TTLCache legacy migration failed: %s", legacy_path, exc_info=True)
+
+
+def _is_expired(ts: float, ttl: float) -> bool:
+    if ttl <= 0:
+        return False  # permanent
+    return (time.time() - ts) > ttl
+
+
 class TTLCache:
-    """JSON ファイルベースの期限付き永続キャッシュ。
+    """SQLite ベースの期限付き永続キャッシュ。
 
     Parameters
     ----------
     namespace : str
-        キャッシュの名前空間。ファイルパスの一部に使用される。
-        例: ``"dataset_entries"`` → ``output/cache/dataset_entries.json``
+        キャッシュの名前空間。共有ストア内でキーを区別するために使用される。
+        例: ``"dataset_entries"``
     default_ttl : timedelta
         デフォルトの有効期限。
     """
 
     _BASE_DIR = "output/cache"
+    _DB_NAME = "ttl_cache.sqlite3"
 
     def __init__(self, namespace: str, default_ttl: timedelta = timedelta(hours=1)) -> None:
         self._namespace = namespace
         self._default_ttl = default_ttl.total_seconds()
-        self._path = get_dynamic_file_path(f"{self._BASE_DIR}/{namespace}.json")
-        self._data: dict[str, Any] = {}
-        self._load()
+        self._path = get_dynamic_file_path(f"{self._BASE_DIR}/{self._DB_NAME}")
+        self._store = _SqliteTTLStore.for_path(self._path)
+        self._store.migrate_legacy_json(namespace, get_dynamic_file_path(f"{self._BASE_DIR}/{namespace}.json"))
 
     # ------------------------------------------------------------------
     # public API
@@ -49,59 +201,48 @@ class TTLCache:
 
     def get(self, key: str) -> Any | None:
         """キーに対応する値を返す。期限切れまたは未登録なら ``None``."""
-        entry = self._data.get(key)
-        if entry is None:
-            return None
-        if self._is_expired(entry):
+        try:
+            _found, value = self._store.get(self._namespace, key)
+        except Exception:
+            logger.debug("TTLCache get failed: %s/%s", self._namespace, key, exc_info=True)
             return None
-        return entry.get("v")
+        return value
 
     def put(self, key: str, value: Any, ttl: timedelta | None = None) -> None:
         """値をキャッシュに保存する。"""
         ttl_sec = ttl.total_seconds() if ttl else self._default_ttl
-        self._data[key] = {
-            "v": value,
-            "ts": time.time(),
-            "ttl": ttl_sec,
-        }
-        self._save()
+        self._write([(key, value)], ttl_sec)
 
     def put_many(self, items: dict[str, Any], ttl: timedelta | None = None) -> None:
         """複数の値を一括保存する。"""
         ttl_sec = ttl.total_seconds() if ttl else self._default_ttl
-        now = time.time()
-        for k, v in items.items():
-            self._data[k] = {"v": v, "ts": now, "ttl": ttl_sec}
-        self._save()
+        self._write(list(items.items()), ttl_sec)
 
     def put_permanent(self, key: str, value: Any) -> None:
         """恒久キャッシュとして保存する (TTL なし)。"""
-        self._data[key] = {
-            "v": value,
-            "ts": time.time(),
-            "ttl": 0,  # 0 = 永久
-        }
-        self._save()
+        self._write([(key, value)], 0)  # 0 = 永久
 
     def invalidate(self, key: str) -> None:
         """特定キーのキャッシュを無効化する。"""
-        if key in self._data:
-            del self._data[key]
-            self._save()
+        try:
+            self._store.delete(self._namespace, key)
+        except Exception:
+            logger.warning("TTLCache invalidate failed: %s/%s", self._namespace, key, exc_info=True)
 
     def invalidate_prefix(self, prefix: str) -> int:
         """プレフィックスに一致するキーをすべて無効化して件数を返す。"""
-        to_del = [k for k in self._data if k.startswith(prefix)]
-        for k in to_del:
-            del self._data[k]
-        if to_del:
-            self._save()
-        return len(to_del)
+        try:
+            return self._store.delete_prefix(self._namespace, prefix)
+        except Exception:
+            logger.warning("TTLCache invalidate_prefix failed: %s/%s", self._namespace, prefix, exc_info=True)
+            return 0
 
     def clear(self) -> None:
         """全キャッシュをクリアする。"""
-        self._data.clear()
-        self._save()
+        try:
+            self._store.clear(self._namespace)
+        except Exception:
+            logger.warning("TTLCache clear failed: %s", self._namespace, exc_info=True)
 
     def has(self, key: str) -> bool:
         """有効なキャッシュエントリが存在するか。"""
@@ -109,40 +250,26 @@ class TTLCache:
 
     def keys(self) -> list[str]:
         """有効なキーの一覧を返す。"""
-        return [k for k in self._data if not self._is_expired(self._data[k])]
+        try:
+            return self._store.keys(self._namespace)
+        except Exception:
+            logger.debug("TTLCache keys failed: %s", self._namespace, exc_info=True)
+            return []
+
+    def purge_expired(self) -> int:
+        """期限切れエントリを物理削除して件数を返す（通常は参照時の遅延削除で十分）。"""
+        try:
+            return self._store.purge_expired(self._namespace)
+        except Exception:
+            logger.debug("TTLCache purge failed: %s", self._namespace, exc_info=True)
+            return 0
 
     # ------------------------------------------------------------------
     # internals
     # ------------------------------------------------------------------
 
-    @staticmethod
-    def _is_expired(entry: dict) -> bool:
-        ttl = entry.get("ttl", 0)
-        if ttl <= 0:
-            return False  # permanent
-        return (time.time() - entry.get("ts", 0)) > ttl
-
-    def _load(self) -> None:
-        if not os.path.exists(self._path):
-            self._data = {}
-            return
-        try:
-            with open(self._path, "r", encoding="utf-8") as f:
-                raw = json.load(f)
-            if isinstance(raw, dict):
-                self._data = raw
-            else:
-                self._data = {}
-        except Exception:
-            logger.debug("TTLCache load failed: %s", self._path, exc_info=True)
-            self._data = {}
-
-    def _save(self) -> None:
+    def _write(self, items: list[tuple[str, Any]], ttl_sec: float) -> None:
         try:
-            os.makedirs(os.path.dirname(self._path), exist_ok=True)
-            tmp = self._path + ".tmp"
-            with open(tmp, "w", encoding="utf-8") as f:
-                json.dump(self._data, f, ensure_ascii=False, separators=(",", ":"))
-            os.replace(tmp, self._path)
+            self._store.put_many(self._namespace, items, time.time(), ttl_sec)
         except Exception:
-            logger.warning("TTLCache save failed: %s", self._path, exc_info=True)
+            logger.warning("TTLCache save failed: %s (%s)", self._path, self._namespace, exc_info=True)
@@ -11,6 +11,9 @@ ARIMデータポータルへのデータ登録、ファイルアップロード
 - データ登録UI提供
 """
 
+from importlib import import_module
+import sys
+
 from config.common import REVISION as __version__
 __all__ = [
     # Core data registration logic
@@ -23,14 +26,35 @@ __all__ = [
     "DataRegisterWidget",
 ]
 
-# データ登録ロジック関数のインポート
-from .data_register_logic import (
-    run_data_register_logic,
-    entry_data,
-    upload_file,
-    select_and_save_files_to_temp,
-)
+# Qt 依存のモジュールは参照時に読み込む（一括登録エンジンなど Qt を使わない経路で core 配下を使うため）
+_LAZY_IMPORTS = {
+    "run_data_register_logic": ".data_register_logic",
+    "entry_data": ".data_register_logic",
+    "upload_file": ".data_register_logic",
+    "select_and_save_files_to_temp": ".data_register_logic",
+    "DataRegisterWidget": ".data_register_widget",
+}
 
-# データ登録UIウィジェット
-from .data_register_widget import DataRegisterWidget
+# PyInstaller frozen builds cannot always detect lazy imports.
+try:
+    if getattr(sys, "frozen", False):
+        from .data_register_logic import (  # noqa: F401
+            run_data_register_logic,
+            entry_data,
+            upload_file,
+            select_and_save_files_to_temp,
+        )
+        from .data_register_widget import DataRegisterWidget  # noqa: F401
+except Exception:
+    pass
 # RegistrationStatusWidget は UI 層に属するため、ここではインポートしない（循環依存回避）
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if not module_name:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = import_module(module_name, __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,840 @@
+"""
+一括登録エンジン（Qt 非依存）
+
+ファイルセット群を ステージング → アップロード → エントリー登録 → 登録状況確認 の
+各段階で処理する。複数のファイルセットを並行して処理し、アップロードとエントリー登録は
+それぞれ全ファイルセット共通の上限で同時実行数を抑える。
+
+    engine = BatchRegisterEngine(file_sets, max_concurrent_filesets=3)
+    engine.subscribe(lambda event: ...)   # BatchRegisterEvent を受け取る
+    result = engine.run()                 # BatchRegisterResult
+
+イベントはワーカースレッドから通知される。UI 側はシグナル等でメインスレッドへ渡すこと。
+
+「前回と同じ」試料モードのファイルセットは、先行するファイルセットの登録完了を待って
+その試料IDを引き継ぐ（アップロードは待たずに進める）。
+"""
+
+import copy
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .entry_api import (
+    ENTRY_REQUEST_HEADERS,
+    ENTRY_URL,
+    ENTRY_VALIDATION_URL,
+    EntryPayloadError,
+    build_entry_payload,
+    extract_dataset_name,
+    extract_sample_info,
+    find_registration_status,
+    is_timeout_like_response,
+    upload_file_stream,
+)
+from .file_set_manager import FileItem, FileItemType, FileSet, FileType, PathOrganizeMethod
+
+logger = logging.getLogger(__name__)
+
+# 同時に処理するファイルセット数
+DEFAULT_MAX_CONCURRENT_FILESETS = 3
+# 全ファイルセット合計で同時に送信するアップロード数
+DEFAULT_MAX_UPLOAD_WORKERS = 5
+# 全ファイルセット合計で同時に送信する POST /entries 数
+DEFAULT_MAX_ENTRY_POSTS = 2
+ENTRY_POST_TIMEOUT = 60
+# 登録状況一覧（GET /entries）を複数ファイルセットで使い回す期間（秒）
+STATUS_LOOKUP_MAX_AGE_SECONDS = 15.0
+
+STAGE_STAGING = "staging"
+STAGE_UPLOADING = "uploading"
+STAGE_POSTING = "posting"
+STAGE_CHECKING = "checking"
+
+# ファイルセット内の進捗に占める各段階の割合（終了時点）
+_STAGE_PROGRESS_END = {
+    STAGE_STAGING: 0.05,
+    STAGE_UPLOADING: 0.80,
+    STAGE_POSTING: 0.95,
+    STAGE_CHECKING: 1.0,
+}
+
+_STAGE_LABELS = {
+    STAGE_STAGING: "準備中",
+    STAGE_UPLOADING: "アップロード中",
+    STAGE_POSTING: "エントリー登録中",
+    STAGE_CHECKING: "登録状況確認中",
+}
+
+# extended_config['sample_mode'] は表示ラベルで保持されている場合がある
+_SAME_AS_PREVIOUS_LABEL = "前回と同じ"
+_EXISTING_SAMPLE_LABEL = "既存試料使用"
+
+
+class BatchRegisterResult:
+    """一括登録結果クラス"""
+
+    def __init__(self):
+        self.total_filesets = 0
+        self.success_count = 0
+        self.error_count = 0
+        self.errors: List[Tuple[str, str]] = []  # (ファイルセット名, エラーメッセージ)
+        self.success_filesets: List[str] = []    # 成功したファイルセット名
+        self.start_time: Optional[datetime] = None
+        self.end_time: Optional[datetime] = None
+
+    @property
+    def success_rate(self) -> float:
+        """成功率を取得"""
+        if self.total_filesets == 0:
+            return 0.0
+        return (self.success_count / self.total_filesets) * 100
+
+    @property
+    def duration(self) -> Optional[float]:
+        """処理時間を取得（秒）"""
+        if self.start_time and self.end_time:
+            return (self.end_time - self.start_time).total_seconds()
+        return None
+
+    def to_dict(self) -> Dict:
+        """結果を辞書に変換"""
+        return {
+            "total_filesets": self.total_filesets,
+            "success_count": self.success_count,
+            "error_count": self.error_count,
+            "success_rate": self.success_rate,
+            "duration": self.duration,
+            "errors": self.errors,
+            "success_filesets": self.success_filesets,
+            "start_time": self.start_time.isoformat() if self.start_time else None,
+            "end_time": self.end_time.isoformat() if self.end_time else None
+        }
+
+
+@dataclass
+class BatchRegisterEvent:
+    """
+    エンジンからの進捗通知
+
+    kind:
+        fileset_started / stage / upload_progress / fileset_completed / fileset_error / progress
+    """
+
+    kind: str
+    fileset_name: str = ""
+    index: int = -1
+    stage: str = ""
+    message: str = ""
+    done: int = 0
+    total: int = 0
+    percent: int = 0
+    detail: Optional[Dict[str, Any]] = None
+
+
+class FileSetRegistrationError(Exception):
+    """ファイルセット単位の登録失敗（stage は失敗した段階）"""
+
+    def __init__(self, message: str, stage: str = "", detail: Optional[Dict[str, Any]] = None):
+        super().__init__(message)
+        self.stage = stage
+        self.detail = detail or {}
+
+
+class BatchRegisterCancelled(Exception):
+    """キャンセルによる中断"""
+
+
+@dataclass
+class UploadItem:
+    """アップロード対象（登録ファイル名・添付ファイル区分を解決済み）"""
+
+    path: str
+    register_filename: str
+    is_attachment: bool
+    size: int = 0
+    upload_id: Optional[str] = None
+    sent_bytes: int = 0
+
+
+@dataclass
+class _FileSetJob:
+    index: int
+    file_set: FileSet
+    dataset_id: Optional[str] = None
+    dataset_info: Optional[Dict[str, Any]] = None
+    items: List[UploadItem] = field(default_factory=list)
+    total_bytes: int = 0
+    stage: str = ""
+    progress: float = 0.0
+    sample_id: Optional[str] = None
+    result: Dict[str, Any] = field(default_factory=dict)
+    done: threading.Event = field(default_factory=threading.Event)
+
+    @property
+    def name(self) -> str:
+        return self.file_set.name
+
+
+# ---------------------------------------------------------------------------
+# ファイルセット → アップロード対象・フォーム値（batch_preview_dialog と同じ規則）
+# ---------------------------------------------------------------------------
+
+def resolve_dataset_id(file_set: FileSet) -> Optional[str]:
+    """dataset_id → dataset_info → extended_config の順でデータセットIDを取得"""
+    if getattr(file_set, 'dataset_id', None):
+        return file_set.dataset_id
+    dataset_info = getattr(file_set, 'dataset_info', None)
+    if isinstance(dataset_info, dict) and dataset_info.get('id'):
+        return dataset_info['id']
+    if isinstance(dataset_info, str) and dataset_info:
+        return dataset_info
+    extended_config = getattr(file_set, 'extended_config', None) or {}
+    selected_dataset = extended_config.get('selected_dataset')
+    if isinstance(selected_dataset, dict) and selected_dataset.get('id'):
+        return selected_dataset['id']
+    if isinstance(selected_dataset, str) and selected_dataset:
+        return selected_dataset
+    return extended_config.get('dataset_id') or None
+
+
+def _fileset_temp_folder(file_set: FileSet) -> Optional[str]:
+    temp_folder = getattr(file_set, 'temp_folder_path', None)
+    if not temp_folder:
+        temp_folder = (getattr(file_set, 'extended_config', None) or {}).get('temp_folder')
+    return temp_folder if temp_folder and os.path.isdir(temp_folder) else None
+
+
+def _zip_directories(file_set: FileSet) -> List[str]:
+    return [
+        item.relative_path
+        for item in file_set.get_valid_items()
+        if item.file_type == FileType.DIRECTORY and getattr(item, 'is_zip', False)
+    ]
+
+
+def _register_filename(file_set: FileSet, item: FileItem) -> str:
+    organize_method = getattr(file_set, 'organize_method', None)
+    if organize_method == PathOrganizeMethod.FLATTEN:
+        return item.relative_path.replace('/', '__').replace('\\', '__')
+    if organize_method == PathOrganizeMethod.ZIP:
+        return item.name
+    return item.relative_path
+
+
+def collect_upload_items(file_set: FileSet) -> List[UploadItem]:
+    """
+    ファイルセットのアップロード対象を列挙する
+
+    個別ファイルは一時フォルダの配置を経由せず元のパスから直接アップロードする。
+    ZIP化指定ディレクトリ配下のファイルは一時フォルダ内の ZIP 1件（添付ファイル）に置き換え、
+    一時フォルダの path_mapping.xlsx を添付ファイルとして加える。
+    """
+    temp_folder = _fileset_temp_folder(file_set)
+    zip_dirs = _zip_directories(file_set)
+    items: List[UploadItem] = []
+    zips_added = set()
+
+    for item in file_set.get_valid_items():
+        if item.file_type != FileType.FILE:
+            continue
+        zip_dir = next(
+            (
+                d for d in zip_dirs
+                if item.relative_path == d or item.relative_path.startswith(d + '/') or item.relative_path.startswith(d + '\\')
+            ),
+            None,
+        )
+        if zip_dir is not None:
+            zip_path = os.path.join(temp_folder, f"{os.path.basename(zip_dir)}.zip") if temp_folder else None
+            if zip_path and os.path.exists(zip_path) and zip_path not in zips_added:
+                zips_added.add(zip_path)
+                items.append(UploadItem(
+                    path=zip_path,
+                    register_filename=os.path.basename(zip_path),
+                    is_attachment=True,
+                    size=os.path.getsize(zip_path),
+                ))
+            continue
+        items.append(UploadItem(
+            path=item.path,
+            register_filename=_register_filename(file_set, item),
+            is_attachment=getattr(item, 'item_type', None) == FileItemType.ATTACHMENT,
+            size=os.path.getsize(item.path) if os.path.exists(item.path) else 0,
+        ))
+
+    if temp_folder:
+        mapping_path = os.path.join(temp_folder, "path_mapping.xlsx")
+        if os.path.exists(mapping_path):
+            items.append(UploadItem(
+                path=mapping_path,
+                register_filename="path_mapping.xlsx",
+                is_attachment=True,
+                size=os.path.getsize(mapping_path),
+            ))
+    return items
+
+
+def build_form_values(file_set: FileSet) -> Dict[str, Any]:
+    """ファイルセットからフォーム値を構築（通常登録と同じキー）"""
+    form_values: Dict[str, Any] = {}
+    extended_config = getattr(file_set, 'extended_config', None) or {}
+
+    form_values['dataName'] = extended_config.get('data_name') or getattr(file_set, 'data_name', '') or f"一括登録_{file_set.name}"
+    form_values['basicDescription'] = extended_config.get('description') or getattr(file_set, 'description', '') or "一括登録によるデータ"
+    form_values['experimentId'] = extended_config.get('experiment_id') or getattr(file_set, 'experiment_id', '') or ""
+
+    sample_mode = extended_config.get('sample_mode') or getattr(file_set, 'sample_mode', 'new')
+    sample_id = extended_config.get('sample_id') or getattr(file_set, 'sample_id', '')
+    form_values['sampleNames'] = extended_config.get('sample_name') or getattr(file_set, 'sample_name', '') or f"試料_{file_set.name}"
+    form_values['sampleDescription'] = extended_config.get('sample_description') or getattr(file_set, 'sample_description', '') or "一括登録試料"
+    form_values['sampleComposition'] = extended_config.get('sample_composition') or getattr(file_set, 'sample_composition', '') or ""
+    if sample_mode in ('existing', _EXISTING_SAMPLE_LABEL) and sample_id:
+        form_values['sampleId'] = sample_id
+    else:
+        form_values['sampleReferenceUrl'] = extended_config.get('reference_url') or getattr(file_set, 'reference_url', '') or ""
+        form_values['sampleTags'] = extended_config.get('tags') or getattr(file_set, 'tags', '') or ""
+
+    custom_values = getattr(file_set, 'custom_values', {}) or extended_config.get('custom_values', {})
+    if not custom_values:
+        exclude_keys = {
+            'data_name', 'description', 'experiment_id', 'reference_url', 'tags',
+            'sample_mode', 'sample_id', 'sample_name', 'sample_description',
+            'sample_composition', 'dataset_id', 'dataset_name',
+            'temp_folder', 'temp_created', 'mapping_file', 'last_sample_id',
+            'last_sample_name', 'registration_timestamp', 'selected_dataset'
+        }
+        custom_values = {
+            key: value
+            for key, value in extended_config.items()
+            if key not in exclude_keys and value is not None and value != ""
+        }
+    form_values['custom'] = custom_values
+    return form_values
+
+
+def build_files_payload(items: List[UploadItem]) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """アップロード済み項目から dataFiles / attachments を構築"""
+    data_files: Dict[str, Any] = {"data": []}
+    attachments: List[Dict[str, Any]] = []
+    for item in items:
+        if not item.upload_id:
+            continue
+        if item.is_attachment:
+            attachments.append({"uploadId": item.upload_id, "description": item.register_filename})
+        else:
+            data_files["data"].append({"type": "upload", "id": item.upload_id})
+    return data_files, attachments
+
+
+def is_same_as_previous(file_set: FileSet) -> bool:
+    extended_config = getattr(file_set, 'extended_config', None) or {}
+    return getattr(file_set, 'sample_mode', 'new') == 'same_as_previous' or extended_config.get('sample_mode') == _SAME_AS_PREVIOUS_LABEL
+
+
+# ---------------------------------------------------------------------------
+# エンジン
+# ---------------------------------------------------------------------------
+
+class _StatusLookup:
+    """登録状況一覧（最新100件）の取得を並行するファイルセット間でまとめる
+
+    取得結果は fetch_latest() が全件ストアへ反映するため、照合はストアに対して行う。
+    """
+
+    def __init__(self, max_age: float = STATUS_LOOKUP_MAX_AGE_SECONDS):
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._fetched_utc: Optional[datetime] = None
+        self._fetched_monotonic = 0.0
+
+    def refresh(self, since_utc: datetime) -> None:
+        """since_utc 以降に取得していなければ最新一覧を取得する"""
+        from classes.data_entry.core import registration_status_service as regsvc
+
+        with self._lock:
+            fresh = (
+                self._fetched_utc is not None
+                and self._fetched_utc >= since_utc
+                and time.monotonic() - self._fetched_monotonic < self.max_age
+            )
+            if not fresh:
+                fetched_utc = datetime.now(timezone.utc)
+                regsvc.fetch_latest(limit=100, use_cache=False)
+                self._fetched_utc = fetched_utc
+                self._fetched_monotonic = time.monotonic()
+
+
+class BatchRegisterEngine:
+    """
+    ファイルセット群の一括登録を並行実行する（Qt 非依存）
+
+    Args:
+        file_sets: 登録するファイルセット（この順で開始し、試料ID継承もこの順）
+        max_concurrent_filesets: 同時に処理するファイルセット数
+        max_upload_workers: 全体で同時に送信するアップロード数
+        max_entry_posts: 全体で同時に送信する POST /entries 数
+        temp_folder_manager: 一時フォルダ作成に使う TempFolderManager
+            （省略時は個別ファイルを配置しない STAGING_MODE_SOURCE。アップロードは元ファイルから直接行うため、
+            一時フォルダには ZIP と path_mapping.xlsx だけを作る）
+    """
+
+    def __init__(
+        self,
+        file_sets: List[FileSet],
+        *,
+        max_concurrent_filesets: int = DEFAULT_MAX_CONCURRENT_FILESETS,
+        max_upload_workers: int = DEFAULT_MAX_UPLOAD_WORKERS,
+        max_entry_posts: int = DEFAULT_MAX_ENTRY_POSTS,
+        temp_folder_manager=None,
+    ):
+        self.file_sets = list(file_sets)
+        self.max_concurrent_filesets = max(1, int(max_concurrent_filesets))
+        self.max_upload_workers = max(1, int(max_upload_workers))
+        self.max_entry_posts = max(1, int(max_entry_posts))
+        self._temp_folder_manager = temp_folder_manager
+        self._listeners: List[Callable[[BatchRegisterEvent], None]] = []
+        self._listeners_lock = threading.Lock()
+        self._cancel_event = threading.Event()
+        self._entry_post_slots = threading.BoundedSemaphore(self.max_entry_posts)
+        self._upload_executor: Optional[ThreadPoolExecutor] = None
+        self._status_lookup = _StatusLookup()
+        self._verified_datasets: Dict[str, Optional[Tuple[str, str]]] = {}
+        self._verify_lock = threading.Lock()
+        self._jobs: List[_FileSetJob] = []
+        self._progress_lock = threading.Lock()
+        self._last_percent = -1
+
+    # -- 購読・キャンセル ---------------------------------------------------
+
+    def subscribe(self, callback: Callable[[BatchRegisterEvent], None]) -> None:
+        with self._listeners_lock:
+            self._listeners.append(callback)
+
+    def unsubscribe(self, callback: Callable[[BatchRegisterEvent], None]) -> None:
+        with self._listeners_lock:
+            if callback in self._listeners:
+                self._listeners.remove(callback)
+
+    def cancel(self) -> None:
+        """未開始の段階を打ち切る（送信中のリクエストは完了まで待つ）"""
+        self._cancel_event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    # -- 実行 ---------------------------------------------------------------
+
+    def run(self) -> BatchRegisterResult:
+        """全ファイルセットを登録し、結果を返す（呼び出しスレッドで完了まで待つ）"""
+        from net.session_manager import reserve_connection_pool
+
+        result = BatchRegisterResult()
+        result.start_time = datetime.now()
+        result.total_filesets = len(self.file_sets)
+        self._jobs = [_FileSetJob(index=i, file_set=fs) for i, fs in enumerate(self.file_sets)]
+
+        # トークンが無ければファイルセットごとの失敗にせず、開始前に 1 件のエラーで打ち切る
+        from core.bearer_token_manager import BearerTokenManager
+        if not BearerTokenManager.get_valid_token():
+            result.errors.append(("認証エラー", "認証トークンが取得できません。ログインを確認してください。"))
+            result.end_time = datetime.now()
+            self._emit(BatchRegisterEvent(
+                kind="progress",
+                percent=100,
+                message="一括登録中止（認証トークンなし）",
+                done=0,
+                total=result.total_filesets,
+            ))
+            return result
+
+        pool_size = self.max_upload_workers + self.max_entry_posts + self.max_concurrent_filesets
+        try:
+            with reserve_connection_pool(pool_size), \
+                    ThreadPoolExecutor(max_workers=self.max_upload_workers, thread_name_prefix="batch-upload") as upload_executor, \
+                    ThreadPoolExecutor(max_workers=self.max_concurrent_filesets, thread_name_prefix="batch-fileset") as fileset_executor:
+                self._upload_executor = upload_executor
+                futures = [fileset_executor.submit(self._run_job, job) for job in self._jobs]
+                wait(futures)
+        except Exception as e:
+            logger.error("一括登録エンジンでエラー: %s", e, exc_info=True)
+            result.errors.append(("システムエラー", str(e)))
+        finally:
+            self._upload_executor = None
+
+        for job in self._jobs:
+            if job.result.get('success'):
+                result.success_count += 1
+                result.success_filesets.append(job.name)
+            elif job.result:
+                result.error_count += 1
+                result.errors.append((job.name, job.result.get('error', '不明なエラー')))
+        self._refresh_sample_info(self._jobs)
+        result.end_time = datetime.now()
+        self._emit(BatchRegisterEvent(
+            kind="progress",
+            percent=100,
+            message="一括登録キャンセル" if self.cancelled else "一括登録完了",
+            done=result.success_count + result.error_count,
+            total=result.total_filesets,
+        ))
+        return result
+
+    def _run_job(self, job: _FileSetJob) -> None:
+        try:
+            if self.cancelled:
+                job.result = {'success': False, 'cancelled': True, 'error': 'キャンセルされました'}
+                return
+            self._emit(BatchRegisterEvent(kind="fileset_started", fileset_name=job.name, index=job.index))
+            self._stage(job)
+            self._upload(job)
+            response = self._post_entry(job)
+            self._check_status(job, response)
+            job.result = {'success': True, 'sample_id': job.sample_id}
+            self._set_job_progress(job, 1.0)
+            self._emit(BatchRegisterEvent(
+                kind="fileset_completed", fileset_name=job.name, index=job.index,
+                detail={'sample_id': job.sample_id},
+            ))
+        except BatchRegisterCancelled:
+            job.result = {'success': False, 'cancelled': True, 'error': 'キャンセルされました'}
+        except Exception as e:
+            stage = getattr(e, 'stage', '') or job.stage
+            detail = getattr(e, 'detail', None) or {}
+            job.result = {'success': False, 'error': str(e), 'stage': stage, **detail}
+            logger.error("ファイルセット '%s' の登録失敗 (%s): %s", job.name, stage, e)
+            self._set_job_progress(job, 1.0)
+            self._emit(BatchRegisterEvent(
+                kind="fileset_error", fileset_name=job.name, index=job.index,
+                stage=stage, message=str(e), detail=detail or None,
+            ))
+        finally:
+            job.done.set()
+
+    # -- 段階 ---------------------------------------------------------------
+
+    def _stage(self, job: _FileSetJob) -> None:
+        """データセット解決・一時フォルダ準備・アップロード対象の列挙"""
+        self._enter_stage(job, STAGE_STAGING)
+        file_set = job.file_set
+        dataset_id = resolve_dataset_id(file_set)
+        if not dataset_id:
+            raise FileSetRegistrationError("データセットIDが設定されていません。", STAGE_STAGING)
+        job.dataset_id = dataset_id
+        job.dataset_info = self._resolve_dataset_info(file_set, dataset_id)
+        self._verify_dataset(dataset_id)
+
+        # 一時フォルダ（ZIP・path_mapping.xlsx）が無ければ作成する
+        temp_folder = _fileset_temp_folder(file_set)
+        if temp_folder is None or not os.path.exists(os.path.join(temp_folder, "path_mapping.xlsx")):
+            self._prepare_temp_folder(file_set)
+
+        job.items = collect_upload_items(file_set)
+        if not job.items:
+            raise FileSetRegistrationError("アップロード対象ファイルがありません", STAGE_STAGING)
+        missing = [item.path for item in job.items if not os.path.exists(item.path)]
+        if missing:
+            raise FileSetRegistrationError(f"ファイルが存在しません: {missing[0]}", STAGE_STAGING)
+        job.total_bytes = sum(item.size for item in job.items)
+        self._set_job_progress(job, _STAGE_PROGRESS_END[STAGE_STAGING])
+
+    def _upload(self, job: _FileSetJob) -> None:
+        """共有アップロードプールで全ファイルを送信"""
+        self._enter_stage(job, STAGE_UPLOADING)
+        self._check_cancelled()
+        total = len(job.items)
+        completed = [0]
+        lock = threading.Lock()
+
+        def upload_one(item: UploadItem) -> Dict[str, Any]:
+            if self.cancelled:
+                return {'error': 'キャンセルされました', 'cancelled': True}
+
+            def on_bytes(sent: int, _total: int) -> None:
+                item.sent_bytes = sent
+                self._on_upload_bytes(job)
+
+            upload_result = upload_file_stream(
+                job.dataset_id,
+                item.path,
+                register_filename=item.register_filename,
+                progress_callback=on_bytes,
+            )
+            if upload_result.get('upload_id'):
+                item.upload_id = upload_result['upload_id']
+                if item.register_filename == "path_mapping.xlsx":
+                    job.file_set.mapping_upload_id = item.upload_id
+            with lock:
+                completed[0] += 1
+                done = completed[0]
+            self._emit(BatchRegisterEvent(
+                kind="upload_progress", fileset_name=job.name, index=job.index, stage=STAGE_UPLOADING,
+                message=f"{item.register_filename}", done=done, total=total,
+            ))
+            return upload_result
+
+        futures = [self._upload_executor.submit(upload_one, item) for item in job.items]
+        results = [f.result() for f in futures]
+        self._check_cancelled()
+        failed = [
+            (item.register_filename, r.get('error'))
+            for item, r in zip(job.items, results)
+            if not item.upload_id
+        ]
+        if failed:
+            # 一部でも失敗したファイルセットは登録しない（欠けたエントリーを作らない）
+            name, error = failed[0]
+            raise FileSetRegistrationError(
+                f"ファイルアップロードに失敗しました ({len(failed)}/{total}件): {name}: {error}",
+                STAGE_UPLOADING,
+                {'failed_files': [n for n, _ in failed]},
+            )
+        self._set_job_progress(job, _STAGE_PROGRESS_END[STAGE_UPLOADING])
+
+    def _post_entry(self, job: _FileSetJob) -> Dict[str, Any]:
+        """POST /entries（バリデーション → 本体）。応答を返す"""
+        from classes.utils.api_request_helper import api_request
+
+        self._inherit_previous_sample(job)
+        self._check_cancelled()
+        self._enter_stage(job, STAGE_POSTING)
+        data_files, attachments = build_files_payload(job.items)
+        if not data_files.get('data') and not attachments:
+            raise FileSetRegistrationError("データファイルまたは添付ファイルが必要です", STAGE_POSTING)
+        form_values = build_form_values(job.file_set)
+        try:
+            payload = build_entry_payload(job.dataset_info, form_values, data_files, attachments)
+        except EntryPayloadError as e:
+            raise FileSetRegistrationError(str(e), STAGE_POSTING)
+
+        headers = dict(ENTRY_REQUEST_HEADERS)
+        with self._entry_post_slots:
+            self._check_cancelled()
+            resp_validation = api_request("POST", ENTRY_VALIDATION_URL, bearer_token=None, headers=headers, json_data=payload, timeout=ENTRY_POST_TIMEOUT)
+            if resp_validation is None:
+                raise FileSetRegistrationError("バリデーション通信エラー: サーバーとの通信に失敗しました。", STAGE_POSTING)
+            if resp_validation.status_code not in (200, 201, 202):
+                raise FileSetRegistrationError(
+                    f"バリデーションエラー: {resp_validation.text[:500]}", STAGE_POSTING,
+                    {'error_details': resp_validation.text},
+                )
+            post_started_at_utc = datetime.now(timezone.utc)
+            try:
+                resp = api_request("POST", ENTRY_URL, bearer_token=None, headers=headers, json_data=payload, timeout=ENTRY_POST_TIMEOUT)
+            except Exception as e:
+                logger.warning("entries POSTで例外: %s", e)
+                resp = None
+
+        self._set_job_progress(job, _STAGE_PROGRESS_END[STAGE_POSTING])
+        return {
+            'response': resp,
+            'post_started_at_utc': post_started_at_utc,
+            'data_name': str(form_values.get('dataName') or '').strip(),
+        }
+
+    def _check_status(self, job: _FileSetJob, posted: Dict[str, Any]) -> None:
+        """応答から試料IDを取り出す。タイムアウト時は登録状況一覧で照合する"""
+        self._enter_stage(job, STAGE_CHECKING)
+        resp = posted['response']
+        if resp is not None and not is_timeout_like_response(resp):
+            if not (200 <= resp.status_code < 300):
+                raise FileSetRegistrationError(
+                    f"エントリー登録失敗 HTTP {resp.status_code}: {resp.text[:500]}", STAGE_POSTING,
+                    {'error_details': resp.text},
+                )
+            sample_info = extract_sample_info(resp.json())
+            if sample_info:
+                job.sample_id = sample_info['sample_id']
+                _save_sample_info_to_fileset(job.file_set, sample_info)
+            return
+
+        # タイムアウト(応答なし)・504 等: 処理が継続している可能性があるため登録状況で判定
+        try:
+            # 最新一覧の取得（全件ストアへ反映）は並行するファイルセット間でまとめ、照合は索引で行う
+            self._status_lookup.refresh(posted['post_started_at_utc'])
+            match = find_registration_status(
+                None,
+                data_name=posted['data_name'],
+                dataset_name=extract_dataset_name(job.dataset_info),
+                near_time_utc=posted['post_started_at_utc'],
+            )
+        except Exception as e:
+            raise FileSetRegistrationError(f"レスポンス待ちスキップ（登録状況の照会に失敗: {e}）", STAGE_CHECKING)
+        entry = match.get('entry') or {}
+        status = str(entry.get('status') or '').strip().lower()
+        if not entry or status == 'failed':
+            message = "レスポンス待ちスキップ（タイムアウト/中断）"
+            if match.get('link_url'):
+                message += f"\n{match['link_url']}"
+            raise FileSetRegistrationError(
+                message, STAGE_CHECKING,
+                {'skipped': True, 'skip_reason': 'response_wait_skipped', 'registration_status': entry or None},
+            )
+        logger.info("エントリー登録はタイムアウトしたが登録状況で確認: %s status=%s", job.name, status)
+
+    # -- 補助 ---------------------------------------------------------------
+
+    def _resolve_dataset_info(self, file_set: FileSet, dataset_id: str) -> Dict[str, Any]:
+        dataset_info = getattr(file_set, 'dataset_info', None)
+        if isinstance(dataset_info, dict) and dataset_info.get('id'):
+            return dataset_info
+        from config.common import OUTPUT_RDE_DIR
+        from classes.core.json_repository import load_json_cached
+
+        dataset_file_path = os.path.join(OUTPUT_RDE_DIR, "data", "datasets", f"{dataset_id}.json")
+        dataset_data = load_json_cached(dataset_file_path)
+        if isinstance(dataset_data, dict) and isinstance(dataset_data.get('data'), dict):
+            dataset_data = dataset_data['data']
+        if not isinstance(dataset_data, dict):
+            raise FileSetRegistrationError(f"データセット情報が取得できません: {dataset_file_path}", STAGE_STAGING)
+        # 共有キャッシュのオブジェクトをファイルセットに持たせないよう複製する
+        dataset_data = copy.deepcopy(dataset_data)
+        file_set.dataset_info = dataset_data
+        return dataset_data
+
+    def _verify_dataset(self, dataset_id: str) -> None:
+        """データセットの存在確認（データセットごとに1回、401/404 は登録せずスキップ扱い）"""
+        with self._verify_lock:
+            if dataset_id not in self._verified_datasets:
+                self._verified_datasets[dataset_id] = self._fetch_dataset_problem(dataset_id)
+            problem = self._verified_datasets[dataset_id]
+        if problem:
+            message, skip_reason = problem
+            raise FileSetRegistrationError(message, STAGE_STAGING, {'skipped': True, 'skip_reason': skip_reason})
+
+    @staticmethod
+    def _fetch_dataset_problem(dataset_id: str) -> Optional[Tuple[str, str]]:
+        """(メッセージ, スキップ理由) を返す。問題が無ければ None"""
+        try:
+            from config.site_rde import URLS
+            from net.http_helpers import proxy_get
+
+            detail_url = URLS['api']['dataset_detail'].format(id=dataset_id)
+            resp = proxy_get(detail_url, headers={'Accept': 'application/vnd.api+json'}, timeout=10)
+            if resp.status_code == 404:
+                return f'データセットが存在しません (id={dataset_id})', 'not_found'
+            if resp.status_code == 401:
+                return f'未認証のためアクセスできません (id={dataset_id})', 'unauthorized'
+        except Exception as e:
+            # ネットワーク一時障害の場合は後続の段階で判定する
+            logger.warning("データセット存在確認エラー (続行): %s", e)
+        return None
+
+    def _prepare_temp_folder(self, file_set: FileSet) -> None:
+        from .file_staging import STAGING_MODE_SOURCE
+        from .temp_folder_manager import TempFolderManager
+
+        if self._temp_folder_manager is None:
+            self._temp_folder_manager = TempFolderManager(staging_mode=STAGING_MODE_SOURCE)
+        temp_folder, mapping_file = self._temp_folder_manager.create_temp_folder_for_fileset(file_set)
+        if not getattr(file_set, 'extended_config', None):
+            file_set.extended_config = {}
+        file_set.extended_config['temp_folder'] = temp_folder
+        file_set.extended_config['temp_created'] = True
+        file_set.extended_config['mapping_file'] = mapping_file
+        file_set.mapping_file = mapping_file  # 下位互換性用
+
+    def _inherit_previous_sample(self, job: _FileSetJob) -> None:
+        """「前回と同じ」: 先行ファイルセットの登録完了を待ち、最後に得た試料IDを使う"""
+        if not is_same_as_previous(job.file_set):
+            return
+        for previous in reversed(self._jobs[:job.index]):
+            while not previous.done.wait(0.5):
+                self._check_cancelled()
+            if previous.sample_id:
+                file_set = job.file_set
+                file_set.sample_mode = 'existing'
+                file_set.sample_id = previous.sample_id
+                if not getattr(file_set, 'extended_config', None):
+                    file_set.extended_config = {}
+                file_set.extended_config['sample_mode'] = _EXISTING_SAMPLE_LABEL
+                file_set.extended_config['sample_id'] = previous.sample_id
+                logger.info("前回サンプルID継承: %s -> %s", file_set.name, previous.sample_id)
+                return
+
+    @staticmethod
+    def _refresh_sample_info(jobs: List[_FileSetJob]) -> None:
+        """登録に成功したデータセットの試料情報を取得し直す（データセットごとに1回）"""
+        dataset_ids = list(dict.fromkeys(job.dataset_id for job in jobs if job.result.get('success') and job.dataset_id))
+        if not dataset_ids:
+            return
+        try:
+            from classes.basic.core.basic_info_logic import fetch_sample_info_for_dataset_only
+        except Exception as e:
+            logger.warning("サンプル情報の自動取得をスキップ: %s", e)
+            return
+        for dataset_id in dataset_ids:
+            try:
+                fetch_sample_info_for_dataset_only(None, dataset_id)
+            except Exception as e:
+                logger.warning("サンプル情報の自動取得に失敗: %s", e)
+
+    def _check_cancelled(self) -> None:
+        if self.cancelled:
+            raise BatchRegisterCancelled()
+
+    def _enter_stage(self, job: _FileSetJob, stage: str) -> None:
+        job.stage = stage
+        self._emit(BatchRegisterEvent(
+            kind="stage", fileset_name=job.name, index=job.index, stage=stage,
+            message=f"{_STAGE_LABELS.get(stage, stage)}: {job.name}",
+        ))
+
+    def _on_upload_bytes(self, job: _FileSetJob) -> None:
+        if job.total_bytes <= 0:
+            return
+        sent = sum(item.sent_bytes for item in job.items)
+        start = _STAGE_PROGRESS_END[STAGE_STAGING]
+        span = _STAGE_PROGRESS_END[STAGE_UPLOADING] - start
+        self._set_job_progress(job, start + span * min(1.0, sent / job.total_bytes))
+
+    def _set_job_progress(self, job: _FileSetJob, value: float) -> None:
+        with self._progress_lock:
+            job.progress = max(job.progress, value)
+            total = len(self._jobs) or 1
+            percent = int(sum(j.progress for j in self._jobs) / total * 100)
+            if percent == self._last_percent or percent >= 100:
+                return
+            self._last_percent = percent
+            done = sum(1 for j in self._jobs if j.done.is_set())
+        self._emit(BatchRegisterEvent(
+            kind="progress", fileset_name=job.name, index=job.index, stage=job.stage,
+            message=f"{_STAGE_LABELS.get(job.stage, job.stage)}: {job.name}",
+            percent=percent, done=done, total=total,
+        ))
+
+    def _emit(self, event: BatchRegisterEvent) -> None:
+        with self._listeners_lock:
+            listeners = list(self._listeners)
+        for listener in listeners:
+            try:
+                listener(event)
+            except Exception:
+                logger.debug("一括登録イベント通知でエラー", exc_info=True)
+
+
+def _save_sample_info_to_fileset(file_set: FileSet, sample_info: Dict[str, Any]) -> None:
+    if not getattr(file_set, 'extended_config', None):
+        file_set.extended_config = {}
+    file_set.extended_config['last_sample_id'] = sample_info['sample_id']
+    file_set.extended_config['last_sample_name'] = sample_info.get('sample_name', '')
+    file_set.extended_config['registration_timestamp'] = str(datetime.now().isoformat())
+
+
+def run_batch_register(
+    file_sets: List[FileSet],
+    *,
+    on_event: Optional[Callable[[BatchRegisterEvent], None]] = None,
+    **engine_options,
+) -> BatchRegisterResult:
+    """BatchRegisterEngine を生成して実行する簡易関数"""
+    engine = BatchRegisterEngine(file_sets, **engine_options)
+    if on_event is not None:
+        engine.subscribe(on_event)
+    return engine.run()
@@ -6,59 +6,18 @@
 
 import os
 import json
-import zipfile
 import shutil
 import tempfile
-from typing import List, Dict, Optional, Tuple, Callable
-from datetime import datetime
+from typing import List, Dict, Tuple, Callable
 from pathlib import Path
 
-from qt_compat.core import QObject, Signal, QThread
+from qt_compat.core import QEventLoop, QObject, Signal, QThread
 from qt_compat.widgets import QApplication, QProgressDialog, QMessageBox
 
 from .file_set_manager import FileSet, FileSetManager, FileItem, FileType, PathOrganizeMethod
 from .data_register_logic_wrapper import DataRegisterLogic
-
-
-class BatchRegisterResult:
-    """一括登録結果クラス"""
-    
-    def __init__(self):
-        self.total_filesets = 0
-        self.success_count = 0
-        self.error_count = 0
-        self.errors: List[Tuple[str, str]] = []  # (ファイルセット名, エラーメッセージ)
-        self.success_filesets: List[str] = []    # 成功したファイルセット名
-        self.start_time: Optional[datetime] = None
-        self.end_time: Optional[datetime] = None
-    
-    @property
-    def success_rate(self) -> float:
-        """成功率を取得"""
-        if self.total_filesets == 0:
-            return 0.0
-        return (self.success_count / self.total_filesets) * 100
-    
-    @property
-    def duration(self) -> Optional[float]:
-        """処理時間を取得（秒）"""
-        if self.start_time and self.end_time:
-            return (self.end_time - self.start_time).total_seconds()
-        return None
-    
-    def to_dict(self) -> Dict:
-        """結果を辞書に変換"""
-        return {
-            "total_filesets": self.total_filesets,
-            "success_count": self.success_count,
-            "error_count": self.error_count,
-            "success_rate": self.success_rate,
-            "duration": self.duration,
-            "errors": self.errors,
-            "success_filesets": self.success_filesets,
-            "start_time": self.start_time.isoformat() if self.start_time else None,
-            "end_time": self.end_time.isoformat() if self.end_time else None
-        }
+from .batch_register_engine import BatchRegisterEngine, BatchRegisterEvent, BatchRegisterResult
+from .file_staging import stage_file, write_zip
 
 
 class BatchRegisterWorker(QThread):
@@ -70,98 +29,41 @@ class BatchRegisterWorker(QThread):
     fileset_completed = Signal(str)      # ファイルセット完了
     fileset_error = Signal(str, str)     # (ファイルセット名, エラーメッセージ)
     finished = Signal(object)            # BatchRegisterResult
+    event_received = Signal(object)      # BatchRegisterEvent（段階・アップロード進捗など全イベント）
     
-    def __init__(self, file_sets: List[FileSet], temp_base_dir: str):
+    def __init__(self, file_sets: List[FileSet], temp_base_dir: str, **engine_options):
         super().__init__()
         self.file_sets = file_sets
         self.temp_base_dir = temp_base_dir
         self.result = BatchRegisterResult()
-        self._cancelled = False
+        # 登録処理本体は Qt 非依存のエンジンで並行実行し、イベントをシグナルに変換する
+        self.engine = BatchRegisterEngine(file_sets, **engine_options)
+        self.engine.subscribe(self._on_engine_event)
     
     def cancel(self):
         """処理をキャンセル"""
-        self._cancelled = True
+        self.engine.cancel()
     
     def run(self):
         """メイン処理"""
-        self.result.start_time = datetime.now()
-        self.result.total_filesets = len(self.file_sets)
-        
         try:
-            for i, file_set in enumerate(self.file_sets):
-                if self._cancelled:
-                    break
-                
-                # 進捗更新
-                progress = int((i / len(self.file_sets)) * 100)
-                self.progress_updated.emit(progress, f"処理中: {file_set.name}")
-                self.fileset_started.emit(file_set.name)
-                
-                try:
-                    # ファイルセット登録処理
-                    self._register_fileset(file_set)
-                    
-                    self.result.success_count += 1
-                    self.result.success_filesets.append(file_set.name)
-                    self.fileset_completed.emit(file_set.name)
-                    
-                except Exception as e:
-                    error_msg = str(e)
-                    self.result.error_count += 1
-                    self.result.errors.append((file_set.name, error_msg))
-                    self.fileset_error.emit(file_set.name, error_msg)
-            
-            # 完了
-            self.progress_updated.emit(100, "一括登録完了")
-            
+            self.result = self.engine.run()
         except Exception as e:
             self.result.errors.append(("システムエラー", str(e)))
-        
         finally:
-            self.result.end_time = datetime.now()
             self.finished.emit(self.result)
     
-    def _register_fileset(self, file_set: FileSet):
-        """個別ファイルセットの登録処理"""
-        # ベアラートークンを統一管理システムで取得
-        from ..ui.batch_preview_dialog import FileSetPreviewWidget
-        from core.bearer_token_manager import BearerTokenManager
-        bearer_token = BearerTokenManager.get_valid_token()
-        if not bearer_token:
-            raise Exception("認証トークンが取得できません。ログインを確認してください。")
-        # データセット情報の確認
-        if not file_set.dataset_id:
-            raise Exception("データセットIDが設定されていません。")
-        # ファイルセット情報をdataset_infoの形式に変換
-        dataset_info = {
-            'id': file_set.dataset_id,
-            'relationships': {},
-            'attributes': {}
-        }
-        # プレビューウィジェット作成（一時的）
-        preview_widget = FileSetPreviewWidget(file_set, bearer_token=bearer_token)
-        
-        try:
-            # フォーム値構築
-            form_values = preview_widget._build_form_values_from_fileset()
-            
-            # アップロード処理実行
-            upload_success = preview_widget._execute_batch_upload()
-            if not upload_success:
-                raise Exception("ファイルアップロードに失敗しました。")
-            
-            # データ登録処理実行
-            registration_success = preview_widget._execute_data_registration()
-            if not registration_success:
-                raise Exception("データ登録に失敗しました。")
-                
-        except Exception as e:
-            raise Exception(f"ファイルセット '{file_set.name}' の登録処理でエラーが発生: {str(e)}")
-        
-        finally:
-            # プレビューウィジェットをクリーンアップ
-            if preview_widget:
-                preview_widget.deleteLater()
+    def _on_engine_event(self, event: BatchRegisterEvent):
+        """エンジンのイベントをシグナルで通知（ワーカースレッドから呼ばれる）"""
+        self.event_received.emit(event)
+        if event.kind == "progress":
+            self.progress_updated.emit(event.percent, event.message)
+        elif event.kind == "fileset_started":
+            self.fileset_started.emit(event.fileset_name)
+        elif event.kind == "fileset_completed":
+            self.fileset_completed.emit(event.fileset_name)
+        elif event.kind == "fileset_error":
+            self.fileset_error.emit(event.fileset_name, event.message)
     
     def _organize_files(self, file_set: FileSet, temp_dir: str) -> List[str]:
         """ファイル整理処理"""
@@ -197,7 +99,7 @@ class BatchRegisterWorker(QThread):
                     new_name = item.name
                 
                 dest_path = os.path.join(temp_dir, new_name)
-                shutil.copy2(item.path, dest_path)
+                stage_file(item.path, dest_path)
                 organized_files.append(dest_path)
             
             elif item.file_type == FileType.DIRECTORY:
@@ -218,7 +120,7 @@ class BatchRegisterWorker(QThread):
                             new_name = file_name
                         
                         dest_path = os.path.join(temp_dir, new_name)
-                        shutil.copy2(file_path, dest_path)
+                        stage_file(file_path, dest_path)
                         organized_files.append(dest_path)
         
         return organized_files
@@ -226,22 +128,22 @@ class BatchRegisterWorker(QThread):
     def _zip_files(self, file_set: FileSet, items: List[FileItem], temp_dir: str) -> List[str]:
         """ZIP化処理"""
         zip_path = os.path.join(temp_dir, f"{file_set.name}.zip")
+        members = []
+        for item in items:
+            if item.file_type == FileType.FILE:
+                # ファイルをZIPに追加
+                members.append((item.path, item.relative_path))
+            
+            elif item.file_type == FileType.DIRECTORY:
+                # ディレクトリを再帰的にZIPに追加
+                for root, dirs, files in os.walk(item.path):
+                    for file_name in files:
+                        file_path = os.path.join(root, file_name)
+                        # ベースディレクトリからの相対パスを計算
+                        relative_path = os.path.relpath(file_path, file_set.base_directory)
+                        members.append((file_path, relative_path))
         
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for item in items:
-                if item.file_type == FileType.FILE:
-                    # ファイルをZIPに追加
-                    zipf.write(item.path, item.relative_path)
-                
-                elif item.file_type == FileType.DIRECTORY:
-                    # ディレクトリを再帰的にZIPに追加
-                    for root, dirs, files in os.walk(item.path):
-                        for file_name in files:
-                            file_path = os.path.join(root, file_name)
-                            # ベースディレクトリからの相対パスを計算
-                            relative_path = os.path.relpath(file_path, file_set.base_directory)
-                            zipf.write(file_path, relative_path)
-        
+        write_zip(zip_path, members)
         return [zip_path]
 
 
@@ -251,6 +153,7 @@ class BatchRegisterLogic(QObject):
     # シグナル定義
     progress_updated = Signal(int, str)
     finished = Signal(object)  # BatchRegisterResult
+    event_received = Signal(object)  # BatchRegisterEvent
     
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -258,9 +161,14 @@ class BatchRegisterLogic(QObject):
         self.progress_dialog = None
         self.temp_base_dir = None
     
+    def cancel(self):
+        """実行中の一括登録をキャンセル"""
+        if self.worker:
+            self.worker.cancel()
+    
     def run_batch_register(self, file_sets: List[FileSet], 
-                          show_progress: bool = True) -> BatchRegisterResult:
-        """一括登録実行"""
+                          show_progress: bool = True, **engine_options) -> BatchRegisterResult:
+        """一括登録実行（engine_options は BatchRegisterEngine の並列数指定）"""
         if not file_sets:
             result = BatchRegisterResult()
             result.errors.append(("入力エラー", "登録するファイルセットがありません"))
@@ -271,20 +179,22 @@ class BatchRegisterLogic(QObject):
         
         try:
             # ワーカースレッド作成
-            self.worker = BatchRegisterWorker(file_sets, self.temp_base_dir)
+            self.worker = BatchRegisterWorker(file_sets, self.temp_base_dir, **engine_options)
             
             # シグナル接続
             self.worker.progress_updated.connect(self.progress_updated)
+            self.worker.event_received.connect(self.event_received)
             self.worker.finished.connect(self._on_worker_finished)
             
             # プログレスダイアログ表示
             if show_progress:
                 self._show_progress_dialog(len(file_sets))
             
-            # 処理開始
+            # 処理完了まで待機（進捗シグナルを受け取れるようイベントループを回す）
+            loop = QEventLoop()
+            self.worker.finished.connect(loop.quit)
             self.worker.start()
-            
-            # 処理完了まで待機
+            loop.exec()
             self.worker.wait()
             
             return self.worker.result
@@ -309,11 +219,7 @@ class BatchRegisterLogic(QObject):
         self.progress_dialog.show()
         
         # キャンセルボタン処理
-        def on_cancel():
-            if self.worker:
-                self.worker.cancel()
-        
-        self.progress_dialog.canceled.connect(on_cancel)
+        self.progress_dialog.canceled.connect(self.cancel)
         
         # 進捗更新処理
         def on_progress_updated(progress, message):
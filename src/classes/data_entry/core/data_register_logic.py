@@ -2,8 +2,6 @@ import os
 import json
 import logging
 import tempfile
-import urllib.parse
-import re
 
 from classes.utils.window_sizing import center_window_on_parent
 
@@ -570,6 +568,16 @@ from config.common import OUTPUT_RDE_DIR, INPUT_DIR
 from classes.utils.api_request_helper import api_request, post_form, post_binary  # refactored to use api_request_helper
 from core.bearer_token_manager import BearerTokenManager
 from config.common import get_dynamic_file_path
+from .entry_api import (
+    ENTRY_REQUEST_HEADERS,
+    ENTRY_URL,
+    ENTRY_VALIDATION_URL,
+    EntryPayloadError,
+    build_entry_payload,
+    extract_dataset_name,
+    payload_dataset_id,
+    upload_file_stream,
+)
 # ロガー設定
 logger = logging.getLogger(__name__)
 
@@ -1024,7 +1032,6 @@ def _continue_data_register_process(
     # progress.close() は entry_data 内でのみ呼ぶ
 
 
-import re
 def entry_data(
     bearer_token,
     dataFiles,
@@ -1041,156 +1048,20 @@ def entry_data(
     # 注意: Bearer Tokenは不要（API呼び出し時に自動選択される）
     # 古いチェックを削除: if not bearer_token: return
     
-    url = "https://rde-entry-api-arim.nims.go.jp/entries"
-    url_validation="https://rde-entry-api-arim.nims.go.jp/entries?validationOnly=true"
+    url = ENTRY_URL
+    url_validation = ENTRY_VALIDATION_URL
     # attachementsはrun_data_register_logicから渡されたアップロード結果のみを使う
-    # dataset_infoから必要な値を抽出。初期値を必ず宣言
-    datasetId = "a74b58c0-9907-40e7-a261-a75519730d82"
-    dataOwnerId = "03b8fc123d0a67ba407dd2f06fe49768d9cbddca6438366632366466"
-    instrumentId = "db16a466-1245-46f8-947a-4884633471a1"
-    ownerId = dataOwnerId
-    if dataset_info and isinstance(dataset_info, dict):
-        datasetId = dataset_info.get('id', datasetId)
-        # dataOwnerId: manager, applicant, dataOwners, ownerId, userIdの順で取得
-        relationships = dataset_info.get('relationships', {})
-        attr = dataset_info.get('attributes', {})
-        ownerId_candidate = None
-        manager = relationships.get('manager', {}).get('data', {})
-        if isinstance(manager, dict) and manager.get('id'):
-            ownerId_candidate = manager.get('id')
-        if not ownerId_candidate:
-            applicant = relationships.get('applicant', {}).get('data', {})
-            if isinstance(applicant, dict) and applicant.get('id'):
-                ownerId_candidate = applicant.get('id')
-        if not ownerId_candidate:
-            data_owners = relationships.get('dataOwners', {}).get('data', [])
-            if isinstance(data_owners, list) and len(data_owners) > 0 and isinstance(data_owners[0], dict):
-                ownerId_candidate = data_owners[0].get('id')
-        if not ownerId_candidate:
-            ownerId_candidate = attr.get('ownerId') or attr.get('userId')
-        if ownerId_candidate:
-            dataOwnerId = ownerId_candidate
-            ownerId = ownerId_candidate
-        # instrumentId: relationships.instruments.data[0].id
-        instrumentId_candidate = None
-        instruments = relationships.get('instruments', {}).get('data', [])
-        if isinstance(instruments, list) and len(instruments) > 0 and isinstance(instruments[0], dict):
-            instrumentId_candidate = instruments[0].get('id')
-        if instrumentId_candidate:
-            instrumentId = instrumentId_candidate
-
-    # --- フォーム値反映 ---
-    dataName = form_values.get('dataName') if form_values else None
-    basicDescription = form_values.get('basicDescription') if form_values else None
-    experimentId = form_values.get('experimentId') if form_values else None
-    sampleDescription = form_values.get('sampleDescription') if form_values else None
-    sampleComposition = form_values.get('sampleComposition') if form_values else None
-    sampleReferenceUrl = form_values.get('sampleReferenceUrl') if form_values else None
-    sampleTags = form_values.get('sampleTags') if form_values else None
-    sampleNames = form_values.get('sampleNames') if form_values else None
-    relatedSamples = form_values.get('relatedSamples') if form_values else []
-    hideOwner = form_values.get('hideOwner') if form_values else None
-    ownerId_from_form = form_values.get('ownerId') if form_values else None
-    if ownerId_from_form:
-        ownerId = ownerId_from_form
-    
-    # データ所有者（所属）の反映
-    dataOwnerId_from_form = form_values.get('dataOwnerId') if form_values else None
-    if dataOwnerId_from_form:
-        dataOwnerId = dataOwnerId_from_form
-
-    sample_id = form_values.get('sampleId') if form_values else None
-    logger.info(f"DEBUG: sample_id from form_values = {sample_id}")  # デバッグログ追加
-
-    # experimentIdバリデーション（半角英数記号のみ）
-    if experimentId and not re.fullmatch(r'[\w\-\.\/:;#@\[\]\(\)\{\}\!\$%&\*\+=\?\^\|~<>,]*', experimentId):
+    try:
+        payload = build_entry_payload(dataset_info, form_values, dataFiles, attachements)
+    except EntryPayloadError:
+        experimentId = form_values.get('experimentId') if form_values else None
         print("[ERROR] experimentIdは半角英数記号のみです。: ", experimentId)
         QMessageBox.warning(None, "入力エラー", "experimentIdは半角英数記号のみで入力してください。")
         return
-
-    # tags, namesはカンマ区切りでリスト化
-    if isinstance(sampleTags, list):
-        tags_list = sampleTags
-    elif isinstance(sampleTags, str):
-        tags_list = [t.strip() for t in sampleTags.split(',')] if sampleTags else None
-    else:
-        tags_list = None
-
-    if isinstance(sampleNames, list):
-        names_list = sampleNames
-    elif isinstance(sampleNames, str):
-        names_list = [n.strip() for n in sampleNames.split(',')] if sampleNames else []
-    else:
-        names_list = []
-
-    # カスタム欄（スキーマフォーム）の値をpayloadに反映
-    custom_values = form_values.get('custom') if form_values and 'custom' in form_values else {}
-    
-    # custom_valuesが空の辞書の場合、null値を含むフィールドがあるか確認
-    if not custom_values:
-        # form_valuesからcustom_valuesキーを直接取得してみる
-        custom_values = form_values.get('custom_values', {}) if form_values else {}
-        logger.debug("正式登録 - customが空のためcustom_valuesを取得: %s", custom_values)
-
-    if not sample_id:
-        payload_detail_sample = {
-                            "description": sampleDescription or "",
-                            "composition": sampleComposition or "",
-                            "referenceUrl": sampleReferenceUrl or "",
-                            "hideOwner": hideOwner,
-                            "names": names_list,
-                            "relatedSamples": relatedSamples,
-                            "tags": tags_list,
-                            "generalAttributes": None,
-                            "specificAttributes": None,
-                            "ownerId": ownerId
-                        }
-    else:
-        payload_detail_sample = {"sampleId": sample_id}
-
-    payload = {
-        "data": {
-            "type": "entry",
-            "attributes": {
-                "invoice": {
-                    "datasetId": datasetId,
-                    "basic": {
-                        "dataOwnerId": dataOwnerId,
-                        "dataName": dataName or "データ名",
-                        "instrumentId": instrumentId,
-                        "description": basicDescription or "説明",
-                        "experimentId": experimentId or "basic/experimentId"
-                    },
-                    "custom": custom_values,
-                    "sample": payload_detail_sample
-                }
-            },
-            "relationships": {
-                "dataFiles": dataFiles
-            }
-        },
-        "meta": {
-            "attachments": attachements
-        }
-    }
+    datasetId = payload_dataset_id(payload)
+    dataName = form_values.get('dataName') if form_values else None
     # Authorizationヘッダーは削除（api_request内で自動選択）
-    headers = {
-        "Accept": "application/vnd.api+json",
-        "Accept-Encoding": "gzip, deflate, br, zstd",
-        "Accept-Language": "ja,en-US;q=0.9,en;q=0.8",
-        "Connection": "keep-alive",
-        "Content-Type": "application/vnd.api+json",
-        "Host": "rde-entry-api-arim.nims.go.jp",
-        "Origin": "https://rde-entry-arim.nims.go.jp",
-        "Referer": "https://rde-entry-arim.nims.go.jp/",
-        "Sec-Fetch-Dest": "empty",
-        "Sec-Fetch-Mode": "cors",
-        "Sec-Fetch-Site": "same-site",
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36",
-        "sec-ch-ua": '"Not)A;Brand";v="8", "Chromium";v="138", "Google Chrome";v="138"',
-        "sec-ch-ua-mobile": "?0",
-        "sec-ch-ua-platform": '"Windows"',
-    }
+    headers = dict(ENTRY_REQUEST_HEADERS)
 
     print (f"headers: {headers}")
     print (f"payload: {payload}")
@@ -1515,16 +1386,15 @@ def entry_data(
                     import time as _time
                     try:
                         from classes.data_entry.core import registration_status_service as regsvc
-                        from classes.data_entry.core.registration_status_matcher import find_registration_status_match
 
                         max_attempts = 5
                         for i in range(max_attempts):
                             if getattr(self, "_cancelled", False):
                                 return
                             self.attempts = i + 1
-                            latest = regsvc.fetch_latest(limit=100, use_cache=False)
-                            match_obj = find_registration_status_match(
-                                latest,
+                            # 最新一覧を取得して全件ストアへ反映し、索引で照合する
+                            regsvc.fetch_latest(limit=100, use_cache=False)
+                            match_obj = regsvc.match_registration_status(
                                 data_name=str(target_data_name or '').strip(),
                                 dataset_name=(str(target_dataset_name).strip() if target_dataset_name else None),
                                 near_time_utc=post_started_at_utc,
@@ -1826,20 +1696,7 @@ def entry_data(
             _finalize_progress_dialog(progress, title=title, text=text, require_confirmation=require_confirmation)
 
     def _extract_dataset_name_for_status_match() -> str:
-        try:
-            if isinstance(dataset_info, dict):
-                # 一括登録: dataset_info['name'] を保持しているケースがある
-                name = str(dataset_info.get('name') or '').strip()
-                if name:
-                    return name
-                attr = dataset_info.get('attributes') or {}
-                if isinstance(attr, dict):
-                    name = str(attr.get('name') or '').strip()
-                    if name:
-                        return name
-        except Exception:
-            pass
-        return ""
+        return extract_dataset_name(dataset_info)
 
     def _build_timeout_detail(*, data_name: str, dataset_name: str, match: dict | None) -> str:
         pretty_dataset = dataset_name or "(不明)"
@@ -1944,11 +1801,9 @@ def entry_data(
             # タイムアウト(60秒)の可能性が高いので、登録状況で進行中か判定して表示する
             try:
                 from classes.data_entry.core import registration_status_service as regsvc
-                from classes.data_entry.core.registration_status_matcher import find_registration_status_match
 
-                latest = regsvc.fetch_latest(limit=100, use_cache=False)
-                match_obj = find_registration_status_match(
-                    latest,
+                regsvc.fetch_latest(limit=100, use_cache=False)
+                match_obj = regsvc.match_registration_status(
                     data_name=target_data_name,
                     dataset_name=target_dataset_name or None,
                     near_time_utc=post_started_at_utc,
@@ -2013,11 +1868,9 @@ def entry_data(
         if getattr(resp, 'status_code', None) in (502, 503, 504) or ('timeout' in resp_text_lower and int(getattr(resp, 'status_code', 0) or 0) >= 500):
             try:
                 from classes.data_entry.core import registration_status_service as regsvc
-                from classes.data_entry.core.registration_status_matcher import find_registration_status_match
 
-                latest = regsvc.fetch_latest(limit=100, use_cache=False)
-                match_obj = find_registration_status_match(
-                    latest,
+                regsvc.fetch_latest(limit=100, use_cache=False)
+                match_obj = regsvc.match_registration_status(
                     data_name=target_data_name,
                     dataset_name=target_dataset_name or None,
                     near_time_utc=post_started_at_utc,
@@ -2121,69 +1974,28 @@ def entry_data(
                 pass
         return {"error": "exception", "detail": str(e)}
 
-def upload_file(bearer_token, datasetId="a74b58c0-9907-40e7-a261-a75519730d82", file_path=None):
+def upload_file(bearer_token, datasetId="a74b58c0-9907-40e7-a261-a75519730d82", file_path=None, progress_callback=None):
     """ファイルアップロード（net.http_helpers経由 / リトライ付き）
     502/503/504 などのサーバ・ゲートウェイ系エラーは指数バックオフ再試行 (最大3回)
+    本文はファイルから逐次読み出して送信する（ファイル全体をメモリに載せない）。
+    progress_callback: (送信済みバイト数, 総バイト数) を受け取るコールバック（任意）
     戻り値: uploadId もしくは None
     """
-    from net.http_helpers import proxy_post
     if not bearer_token:
         logger.error("Bearerトークン未取得のためアップロード不可。ログイン状態を確認してください。")
         return None
     output_dir = get_dynamic_file_path('output/rde/data')
     if not file_path:
         file_path = os.path.join(INPUT_DIR, "file", "test.dm4")  # フォールバックテストファイル
-    url = f"https://rde-entry-api-arim.nims.go.jp/uploads?datasetId={datasetId}"
     try:
-        filename = os.path.basename(file_path)
-        with open(file_path, 'rb') as f:
-            binary_data = f.read()
-        size_bytes = len(binary_data)
-        encoded_filename = urllib.parse.quote(filename)
-        base_headers = {
-            "Accept": "application/json",
-            "X-File-Name": encoded_filename,
-            "Content-Type": "application/octet-stream",
-            "User-Agent": "PythonUploader/1.0",
-        }
-        max_attempts = 3
-        backoff = 1.5
-        for attempt in range(1, max_attempts + 1):
-            logger.info(f"[UPLOAD] 開始 attempt={attempt}/{max_attempts} file={filename} size={size_bytes}B datasetId={datasetId}")
-            try:
-                resp = proxy_post(url, data=binary_data, headers=base_headers, timeout=90)
-                status = resp.status_code
-                if status >= 500:
-                    logger.warning(f"[UPLOAD] サーバエラー status={status} attempt={attempt} body_length={len(resp.text)}")
-                    if attempt < max_attempts:
-                        import time as _t
-                        sleep_sec = backoff ** attempt
-                        logger.info(f"[UPLOAD] リトライ待機 {sleep_sec:.1f}s")
-                        _t.sleep(sleep_sec)
-                        continue
-                resp.raise_for_status()
-                data = resp.json()
-                os.makedirs(output_dir, exist_ok=True)
-                with open(os.path.join(output_dir, "upload_file.json"), "w", encoding="utf-8") as outf:
-                    json.dump(data, outf, ensure_ascii=False, indent=2)
-                upload_id = data.get("uploadId")
-                logger.info(f"[UPLOAD] 成功 uploadId={upload_id} status={status} attempts={attempt}")
-                return upload_id
-            except Exception as ue:
-                if 'resp' in locals() and resp is not None:
-                    status = getattr(resp, 'status_code', 'N/A')
-                    text_preview = resp.text[:300] if hasattr(resp, 'text') else ''
-                    logger.error(f"[UPLOAD] 失敗 attempt={attempt} status={status} error={ue} resp_preview={text_preview}")
-                else:
-                    logger.error(f"[UPLOAD] 失敗 attempt={attempt} error={ue}")
-                if attempt < max_attempts:
-                    import time as _t
-                    sleep_sec = backoff ** attempt
-                    logger.info(f"[UPLOAD] リトライ待機 {sleep_sec:.1f}s (exception)")
-                    _t.sleep(sleep_sec)
-                    continue
-                return None
+        result = upload_file_stream(datasetId, file_path, progress_callback=progress_callback)
+        upload_id = result.get("upload_id")
+        if not upload_id:
+            return None
+        os.makedirs(output_dir, exist_ok=True)
+        with open(os.path.join(output_dir, "upload_file.json"), "w", encoding="utf-8") as outf:
+            json.dump(result.get("response_data"), outf, ensure_ascii=False, indent=2)
+        return upload_id
     except Exception as e:
         logger.error(f"[UPLOAD] 致命的エラー file={file_path} error={e}")
         return None
-    return None
\ No newline at end of file
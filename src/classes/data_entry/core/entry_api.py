@@ -0,0 +1,379 @@
+"""
+データ登録 API の Qt 非依存部分
+
+通常登録（data_register_logic）と一括登録エンジン（batch_register_engine）で共有する。
+
+- アップロード（POST /uploads、ファイルから逐次送信・再試行付き）
+- エントリー作成ペイロードの構築と送信（POST /entries）
+- タイムアウト時の登録状況照合
+"""
+
+import logging
+import os
+import re
+import time
+import urllib.parse
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+ENTRY_API_BASE = "https://rde-entry-api-arim.nims.go.jp"
+ENTRY_URL = f"{ENTRY_API_BASE}/entries"
+ENTRY_VALIDATION_URL = f"{ENTRY_URL}?validationOnly=true"
+ENTRY_LINK_BASE = "https://rde-entry-arim.nims.go.jp/data-entry/datasets/entries/"
+
+# dataset_info から取得できない場合の既定値（従来の entry_data と同じ）
+DEFAULT_DATASET_ID = "a74b58c0-9907-40e7-a261-a75519730d82"
+DEFAULT_DATA_OWNER_ID = "03b8fc123d0a67ba407dd2f06fe49768d9cbddca6438366632366466"
+DEFAULT_INSTRUMENT_ID = "db16a466-1245-46f8-947a-4884633471a1"
+
+# POST /entries のヘッダー（Authorization は api_request 内で自動選択）
+ENTRY_REQUEST_HEADERS = {
+    "Accept": "application/vnd.api+json",
+    "Accept-Encoding": "gzip, deflate, br, zstd",
+    "Accept-Language": "ja,en-US;q=0.9,en;q=0.8",
+    "Connection": "keep-alive",
+    "Content-Type": "application/vnd.api+json",
+    "Host": "rde-entry-api-arim.nims.go.jp",
+    "Origin": "https://rde-entry-arim.nims.go.jp",
+    "Referer": "https://rde-entry-arim.nims.go.jp/",
+    "Sec-Fetch-Dest": "empty",
+    "Sec-Fetch-Mode": "cors",
+    "Sec-Fetch-Site": "same-site",
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36",
+    "sec-ch-ua": '"Not)A;Brand";v="8", "Chromium";v="138", "Google Chrome";v="138"',
+    "sec-ch-ua-mobile": "?0",
+    "sec-ch-ua-platform": '"Windows"',
+}
+
+# experimentId は半角英数記号のみ
+EXPERIMENT_ID_PATTERN = re.compile(r'[\w\-\.\/:;#@\[\]\(\)\{\}\!\$%&\*\+=\?\^\|~<>,]*')
+
+UPLOAD_MAX_ATTEMPTS = 3
+UPLOAD_BACKOFF = 1.5
+
+
+class EntryPayloadError(ValueError):
+    """フォーム値が不正でエントリーペイロードを構築できない"""
+
+
+def build_upload_url(dataset_id: str) -> str:
+    return f"{ENTRY_API_BASE}/uploads?datasetId={dataset_id}"
+
+
+def build_entry_link_url(entry_id: Optional[str]) -> Optional[str]:
+    return f"{ENTRY_LINK_BASE}{entry_id}" if entry_id else None
+
+
+def upload_file_stream(
+    dataset_id: str,
+    file_path: str,
+    *,
+    register_filename: Optional[str] = None,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    max_attempts: int = UPLOAD_MAX_ATTEMPTS,
+    backoff: float = UPLOAD_BACKOFF,
+    timeout: int = 90,
+) -> Dict[str, Any]:
+    """
+    ファイルを1件アップロードする（5xx・例外時は指数バックオフで再試行）
+
+    本文はファイルから逐次読み出して送信する（net.upload_stream.FileUploadStream）。
+
+    Args:
+        dataset_id: 送信先データセットID
+        file_path: 送信するファイル
+        register_filename: 登録ファイル名（X-File-Name、省略時はファイル名）
+        progress_callback: (送信済みバイト数, 総バイト数) を受け取るコールバック
+
+    Returns:
+        成功時 {"upload_id", "response_data", "status_code", "attempts"}、
+        失敗時 {"error", "status_code"(任意), "attempts"}
+    """
+    from net.http_helpers import proxy_post
+    from net.upload_stream import FileUploadStream
+
+    filename = register_filename or os.path.basename(file_path)
+    url = build_upload_url(dataset_id)
+    headers = {
+        "Accept": "application/json",
+        "X-File-Name": urllib.parse.quote(filename),
+        "Content-Type": "application/octet-stream",
+        "User-Agent": "PythonUploader/1.0",
+    }
+    try:
+        body = FileUploadStream(file_path, progress_callback=progress_callback)
+    except OSError as e:
+        logger.error("[UPLOAD] ファイルを開けません file=%s error=%s", file_path, e)
+        return {"error": f"ファイルを開けません: {e}", "attempts": 0}
+
+    result: Dict[str, Any] = {"error": "アップロードに失敗しました", "attempts": 0}
+    with body:
+        for attempt in range(1, max_attempts + 1):
+            result = {"attempts": attempt}
+            logger.info(
+                "[UPLOAD] 開始 attempt=%s/%s file=%s size=%sB datasetId=%s",
+                attempt, max_attempts, filename, len(body), dataset_id,
+            )
+            resp = None
+            try:
+                if attempt > 1:
+                    body.rewind()
+                resp = proxy_post(url, data=body, headers=headers, timeout=timeout)
+                status = resp.status_code
+                result["status_code"] = status
+                if status >= 500:
+                    logger.warning("[UPLOAD] サーバエラー status=%s attempt=%s body_length=%s", status, attempt, len(resp.text))
+                    result["error"] = f"HTTP {status}: {resp.text[:300]}"
+                else:
+                    resp.raise_for_status()
+                    data = resp.json()
+                    upload_id = data.get("uploadId")
+                    if not upload_id:
+                        logger.error("[UPLOAD] レスポンスにuploadIdが含まれていません: %s", data)
+                        result.update({"error": "レスポンスにuploadIdが含まれていません", "response_data": data})
+                        return result
+                    logger.info("[UPLOAD] 成功 uploadId=%s status=%s attempts=%s", upload_id, status, attempt)
+                    result.update({"upload_id": upload_id, "response_data": data})
+                    return result
+            except Exception as ue:
+                if resp is not None:
+                    text_preview = resp.text[:300] if hasattr(resp, 'text') else ''
+                    logger.error("[UPLOAD] 失敗 attempt=%s status=%s error=%s resp_preview=%s", attempt, getattr(resp, 'status_code', 'N/A'), ue, text_preview)
+                else:
+                    logger.error("[UPLOAD] 失敗 attempt=%s error=%s", attempt, ue)
+                result["error"] = str(ue)
+            if attempt < max_attempts:
+                sleep_sec = backoff ** attempt
+                logger.info("[UPLOAD] リトライ待機 %.1fs", sleep_sec)
+                time.sleep(sleep_sec)
+    return result
+
+
+def build_entry_payload(
+    dataset_info: Optional[Dict[str, Any]],
+    form_values: Optional[Dict[str, Any]],
+    data_files: Dict[str, Any],
+    attachments: List[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """
+    POST /entries のペイロードを構築する
+
+    Raises:
+        EntryPayloadError: experimentId に半角英数記号以外が含まれる
+    """
+    datasetId = DEFAULT_DATASET_ID
+    dataOwnerId = DEFAULT_DATA_OWNER_ID
+    instrumentId = DEFAULT_INSTRUMENT_ID
+    ownerId = dataOwnerId
+    if dataset_info and isinstance(dataset_info, dict):
+        datasetId = dataset_info.get('id', datasetId)
+        # dataOwnerId: manager, applicant, dataOwners, ownerId, userIdの順で取得
+        relationships = dataset_info.get('relationships', {})
+        attr = dataset_info.get('attributes', {})
+        ownerId_candidate = None
+        manager = relationships.get('manager', {}).get('data', {})
+        if isinstance(manager, dict) and manager.get('id'):
+            ownerId_candidate = manager.get('id')
+        if not ownerId_candidate:
+            applicant = relationships.get('applicant', {}).get('data', {})
+            if isinstance(applicant, dict) and applicant.get('id'):
+                ownerId_candidate = applicant.get('id')
+        if not ownerId_candidate:
+            data_owners = relationships.get('dataOwners', {}).get('data', [])
+            if isinstance(data_owners, list) and len(data_owners) > 0 and isinstance(data_owners[0], dict):
+                ownerId_candidate = data_owners[0].get('id')
+        if not ownerId_candidate:
+            ownerId_candidate = attr.get('ownerId') or attr.get('userId')
+        if ownerId_candidate:
+            dataOwnerId = ownerId_candidate
+            ownerId = ownerId_candidate
+        # instrumentId: relationships.instruments.data[0].id
+        instrumentId_candidate = None
+        instruments = relationships.get('instruments', {}).get('data', [])
+        if isinstance(instruments, list) and len(instruments) > 0 and isinstance(instruments[0], dict):
+            instrumentId_candidate = instruments[0].get('id')
+        if instrumentId_candidate:
+            instrumentId = instrumentId_candidate
+
+    # --- フォーム値反映 ---
+    dataName = form_values.get('dataName') if form_values else None
+    basicDescription = form_values.get('basicDescription') if form_values else None
+    experimentId = form_values.get('experimentId') if form_values else None
+    sampleDescription = form_values.get('sampleDescription') if form_values else None
+    sampleComposition = form_values.get('sampleComposition') if form_values else None
+    sampleReferenceUrl = form_values.get('sampleReferenceUrl') if form_values else None
+    sampleTags = form_values.get('sampleTags') if form_values else None
+    sampleNames = form_values.get('sampleNames') if form_values else None
+    relatedSamples = form_values.get('relatedSamples') if form_values else []
+    hideOwner = form_values.get('hideOwner') if form_values else None
+    ownerId_from_form = form_values.get('ownerId') if form_values else None
+    if ownerId_from_form:
+        ownerId = ownerId_from_form
+
+    # データ所有者（所属）の反映
+    dataOwnerId_from_form = form_values.get('dataOwnerId') if form_values else None
+    if dataOwnerId_from_form:
+        dataOwnerId = dataOwnerId_from_form
+
+    sample_id = form_values.get('sampleId') if form_values else None
+    logger.info(f"DEBUG: sample_id from form_values = {sample_id}")  # デバッグログ追加
+
+    if experimentId and not EXPERIMENT_ID_PATTERN.fullmatch(experimentId):
+        raise EntryPayloadError(f"experimentIdは半角英数記号のみです。: {experimentId}")
+
+    # tags, namesはカンマ区切りでリスト化
+    if isinstance(sampleTags, list):
+        tags_list = sampleTags
+    elif isinstance(sampleTags, str):
+        tags_list = [t.strip() for t in sampleTags.split(',')] if sampleTags else None
+    else:
+        tags_list = None
+
+    if isinstance(sampleNames, list):
+        names_list = sampleNames
+    elif isinstance(sampleNames, str):
+        names_list = [n.strip() for n in sampleNames.split(',')] if sampleNames else []
+    else:
+        names_list = []
+
+    # カスタム欄（スキーマフォーム）の値をpayloadに反映
+    custom_values = form_values.get('custom') if form_values and 'custom' in form_values else {}
+
+    # custom_valuesが空の辞書の場合、null値を含むフィールドがあるか確認
+    if not custom_values:
+        # form_valuesからcustom_valuesキーを直接取得してみる
+        custom_values = form_values.get('custom_values', {}) if form_values else {}
+        logger.debug("正式登録 - customが空のためcustom_valuesを取得: %s", custom_values)
+
+    if not sample_id:
+        payload_detail_sample = {
+            "description": sampleDescription or "",
+            "composition": sampleComposition or "",
+            "referenceUrl": sampleReferenceUrl or "",
+            "hideOwner": hideOwner,
+            "names": names_list,
+            "relatedSamples": relatedSamples,
+            "tags": tags_list,
+            "generalAttributes": None,
+            "specificAttributes": None,
+            "ownerId": ownerId
+        }
+    else:
+        payload_detail_sample = {"sampleId": sample_id}
+
+    return {
+        "data": {
+            "type": "entry",
+            "attributes": {
+                "invoice": {
+                    "datasetId": datasetId,
+                    "basic": {
+                        "dataOwnerId": dataOwnerId,
+                        "dataName": dataName or "データ名",
+                        "instrumentId": instrumentId,
+                        "description": basicDescription or "説明",
+                        "experimentId": experimentId or "basic/experimentId"
+                    },
+                    "custom": custom_values,
+                    "sample": payload_detail_sample
+                }
+            },
+            "relationships": {
+                "dataFiles": data_files
+            }
+        },
+        "meta": {
+            "attachments": attachments
+        }
+    }
+
+
+def payload_dataset_id(payload: Dict[str, Any]) -> str:
+    return payload["data"]["attributes"]["invoice"]["datasetId"]
+
+
+def extract_dataset_name(dataset_info: Optional[Dict[str, Any]]) -> str:
+    """登録状況照合用のデータセット名"""
+    try:
+        if isinstance(dataset_info, dict):
+            # 一括登録: dataset_info['name'] を保持しているケースがある
+            name = str(dataset_info.get('name') or '').strip()
+            if name:
+                return name
+            attr = dataset_info.get('attributes') or {}
+            if isinstance(attr, dict):
+                name = str(attr.get('name') or '').strip()
+                if name:
+                    return name
+    except Exception:
+        pass
+    return ""
+
+
+def is_timeout_like_response(resp) -> bool:
+    """構造化サーバー待ちのタイムアウト等で 502/503/504 が返った場合"""
+    try:
+        resp_text_lower = (resp.text or '').lower()
+    except Exception:
+        resp_text_lower = ''
+    status = int(getattr(resp, 'status_code', 0) or 0)
+    return status in (502, 503, 504) or ('timeout' in resp_text_lower and status >= 500)
+
+
+def find_registration_status(
+    entries: Optional[List[Dict[str, Any]]],
+    *,
+    data_name: str,
+    dataset_name: str,
+    near_time_utc: datetime,
+) -> Dict[str, Any]:
+    """
+    登録状況一覧から POST /entries に対応するエントリーを探す
+
+    entries が None の場合は全件ストア（registration_status_service）を索引で照合する。
+
+    Returns:
+        {"state", "entry", "link_url"}（state は registration_status_matcher の判定）
+    """
+    if entries is None:
+        from classes.data_entry.core import registration_status_service as regsvc
+
+        match_obj = regsvc.match_registration_status(
+            data_name=data_name,
+            dataset_name=dataset_name or None,
+            near_time_utc=near_time_utc,
+        )
+    else:
+        from classes.data_entry.core.registration_status_matcher import find_registration_status_match
+
+        match_obj = find_registration_status_match(
+            entries,
+            data_name=data_name,
+            dataset_name=dataset_name or None,
+            near_time_utc=near_time_utc,
+        )
+    match_entry = match_obj.entry
+    return {
+        "state": match_obj.state,
+        "entry": match_entry,
+        "link_url": build_entry_link_url((match_entry or {}).get('id')),
+    }
+
+
+def extract_sample_info(response_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """POST /entries の応答から試料情報を抽出"""
+    try:
+        data = response_data.get('data', {})
+        relationships = data.get('relationships', {})
+        sample_data = relationships.get('sample', {}).get('data', {})
+        if sample_data and sample_data.get('id'):
+            return {
+                'sample_id': sample_data['id'],
+                'sample_name': f"Sample_{sample_data['id'][:8]}"
+            }
+        return None
+    except Exception as e:
+        logger.warning("試料情報抽出エラー: %s", e)
+        return None
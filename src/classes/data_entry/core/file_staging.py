@@ -0,0 +1,167 @@
+"""
+一時フォルダへのファイル配置（ステージング）
+
+一括登録の一時フォルダ（フラット化・ZIP化）へ元ファイルを配置する。内容を複製せずに済む方法から順に試す。
+
+1. ハードリンク（同一ボリュームのみ）
+2. reflink（FICLONE: btrfs/XFS などのコピーオンライト複製）/ copy_file_range（カーネル内コピー）
+3. shutil.copy2
+
+STAGING_MODE_SOURCE では一時フォルダにファイルを置かず、アップロード時に元ファイルを直接読む
+（batch_register_engine.collect_upload_items が元のパスを使う）。
+
+ハードリンクで配置したファイルは元ファイルと実体を共有するため、一時フォルダ内のファイルを
+書き換えてはならない（読み出し専用として扱う）。
+"""
+
+import errno
+import logging
+import os
+import shutil
+import sys
+import threading
+import zipfile
+from typing import Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# ステージング方式（TempFolderManager の staging_mode）
+STAGING_MODE_AUTO = "auto"      # ハードリンク → reflink → コピー
+STAGING_MODE_COPY = "copy"      # 常にコピー（従来動作）
+STAGING_MODE_SOURCE = "source"  # 配置しない（元ファイルから直接アップロード）
+STAGING_MODES = (STAGING_MODE_AUTO, STAGING_MODE_COPY, STAGING_MODE_SOURCE)
+
+# 実際に使われた配置方法（FileMapping.staging_method）
+STAGED_BY_HARDLINK = "hardlink"
+STAGED_BY_REFLINK = "reflink"
+STAGED_BY_KERNEL_COPY = "copy_file_range"
+STAGED_BY_COPY = "copy"
+STAGED_BY_SOURCE = "source"
+STAGED_BY_ZIP = "zip"
+
+# linux/fs.h: _IOW(0x94, 9, int)
+_FICLONE = 0x40049409
+_COPY_FILE_RANGE_CHUNK = 1024 * 1024 * 1024
+
+# 失敗した (元デバイス, 配置先デバイス, 方法) を記録し、同じ組み合わせでは再試行しない
+_unsupported_lock = threading.Lock()
+_unsupported: set = set()
+
+
+def stage_file(src: str, dst: str, mode: str = STAGING_MODE_AUTO) -> str:
+    """
+    src を dst に配置し、使った方法（STAGED_BY_*）を返す
+
+    dst が既にあれば置き換える。STAGING_MODE_SOURCE の場合は何もせず STAGED_BY_SOURCE を返す。
+
+    Raises:
+        OSError: src を読めない・dst を作成できない
+    """
+    if mode == STAGING_MODE_SOURCE:
+        return STAGED_BY_SOURCE
+    if mode not in STAGING_MODES:
+        raise ValueError(f"サポートされていないステージング方式: {mode}")
+
+    _remove_existing(dst)
+    if mode == STAGING_MODE_COPY:
+        shutil.copy2(src, dst)
+        return STAGED_BY_COPY
+
+    src_dev = os.stat(src).st_dev
+    dst_dev = os.stat(os.path.dirname(os.path.abspath(dst))).st_dev
+
+    if _supported(src_dev, dst_dev, STAGED_BY_HARDLINK):
+        try:
+            os.link(src, dst)
+            return STAGED_BY_HARDLINK
+        except OSError as e:
+            _mark_unsupported(src_dev, dst_dev, STAGED_BY_HARDLINK, e)
+            _remove_existing(dst)
+
+    if sys.platform.startswith("linux"):
+        method = _clone_or_kernel_copy(src, dst, src_dev, dst_dev)
+        if method is not None:
+            shutil.copystat(src, dst)
+            return method
+
+    shutil.copy2(src, dst)
+    return STAGED_BY_COPY
+
+
+def write_zip(zip_path: str, members: Iterable[Tuple[str, str]]) -> int:
+    """
+    (元ファイル, ZIP内パス) の組から ZIP を作成し、格納したファイル数を返す
+
+    圧縮済み形式・高エントロピーのファイルは再圧縮せず ZIP_STORED で格納する
+    （判定は contents_zip_auto.choose_compress_type と共通）。存在しないファイルは飛ばす。
+    """
+    from classes.data_portal.core.contents_zip_auto import choose_compress_type
+
+    count = 0
+    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+        for src, arcname in members:
+            try:
+                size = os.path.getsize(src)
+            except OSError:
+                logger.warning("ファイルが存在しません: %s", src)
+                continue
+            zipf.write(src, arcname, compress_type=choose_compress_type(src, size))
+            count += 1
+    return count
+
+
+def _remove_existing(path: str) -> None:
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+def _supported(src_dev: int, dst_dev: int, method: str) -> bool:
+    with _unsupported_lock:
+        return (src_dev, dst_dev, method) not in _unsupported
+
+
+def _mark_unsupported(src_dev: int, dst_dev: int, method: str, error: OSError) -> None:
+    # 個別ファイルの権限・リンク数上限などは次のファイルで再試行する
+    if error.errno in (errno.EXDEV, errno.EOPNOTSUPP, errno.ENOTSUP, errno.ENOSYS, errno.EINVAL, errno.ENOTTY):
+        with _unsupported_lock:
+            _unsupported.add((src_dev, dst_dev, method))
+    logger.debug("%s による配置不可 (dev %s -> %s): %s", method, src_dev, dst_dev, error)
+
+
+def _clone_or_kernel_copy(src: str, dst: str, src_dev: int, dst_dev: int) -> Optional[str]:
+    """FICLONE、次に copy_file_range で複製する（どちらも使えなければ None）"""
+    try:
+        import fcntl
+    except ImportError:
+        fcntl = None
+
+    for method in (STAGED_BY_REFLINK, STAGED_BY_KERNEL_COPY):
+        if method == STAGED_BY_REFLINK and fcntl is None:
+            continue
+        if method == STAGED_BY_KERNEL_COPY and not hasattr(os, "copy_file_range"):
+            continue
+        if not _supported(src_dev, dst_dev, method):
+            continue
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                if method == STAGED_BY_REFLINK:
+                    fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+                else:
+                    _copy_file_range_all(fsrc.fileno(), fdst.fileno(), os.fstat(fsrc.fileno()).st_size)
+            return method
+        except OSError as e:
+            _mark_unsupported(src_dev, dst_dev, method, e)
+            _remove_existing(dst)
+    return None
+
+
+def _copy_file_range_all(fd_in: int, fd_out: int, size: int) -> None:
+    remaining = size
+    while remaining > 0:
+        copied = os.copy_file_range(fd_in, fd_out, min(remaining, _COPY_FILE_RANGE_CHUNK))
+        if copied == 0:
+            # 途中で 0 が返った場合は切り詰められたファイルを配置済みとしない
+            raise OSError(errno.EIO, f"copy_file_range が途中で終了しました (残り {remaining} バイト)")
+        remaining -= copied
@@ -1,8 +1,22 @@
 import json
 import logging
+import threading
 from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Optional, Any
 
+from classes.data_entry.core.registration_status_matcher import (
+	RegistrationStatusMatch,
+	find_registration_status_match,
+)
+from classes.data_entry.core.registration_status_store import (
+	META_FULL_SYNCED_AT,
+	META_SYNCED_AT,
+	META_WATERMARK,
+	RegistrationStatusStore,
+	_start_ts,
+	max_start_ts,
+)
+
 # ルール遵守: パスは config.common を使用
 from config.common import OUTPUT_RDE_DIR, get_dynamic_file_path
 
@@ -15,7 +29,10 @@ logger = logging.getLogger(__name__)
 # キャッシュファイルの場所（パス管理は config.common に準拠）
 _CACHE_DIR = OUTPUT_RDE_DIR  # output/rde
 _LATEST_FILE = get_dynamic_file_path('output/rde/entries_latest.json')
+# 旧形式の全件キャッシュ（初回アクセス時にストアへ取り込んで削除する）
 _ALL_FILE = get_dynamic_file_path('output/rde/entries_all.json')
+# 全件（id キー・索引付き）のストア
+_STORE_FILE = get_dynamic_file_path('output/rde/entries_index.sqlite3')
 
 # 個別エントリーJSONの保存先: output/rde/data/entry/<entry_id>.json
 _ENTRY_DETAIL_DIR = get_dynamic_file_path('output/rde/data/entry')
@@ -24,6 +41,15 @@ _ENTRY_DETAIL_DIR = get_dynamic_file_path('output/rde/data/entry')
 _CACHE_TTL = timedelta(days=1)
 _UTC = timezone.utc
 
+# 差分同期: startTime の新しい順に取得し、既知の範囲（watermark）に達したら打ち切る（初回ページの件数）
+_INCREMENTAL_CHUNK = 200
+# watermark より前でも、この期間内の状態未確定エントリーまでは遡って取り直す
+_PENDING_LOOKBACK = timedelta(days=3)
+# startTime の揺れ・同時刻のエントリーを取りこぼさないための重なり
+_SYNC_OVERLAP = timedelta(minutes=10)
+# サーバー側で削除されたエントリーを反映するため、この間隔で全件を取り直す
+_FULL_RESYNC_INTERVAL = timedelta(days=7)
+
 
 class EntrySummary:
 	def __init__(self,
@@ -81,35 +107,71 @@ class EntrySummary:
 		}
 
 
+_store_lock = threading.Lock()
+_store: Optional[RegistrationStatusStore] = None
+
+
+def _get_store() -> RegistrationStatusStore:
+	"""全件ストアを返す（初回は旧形式の entries_all.json を取り込む）"""
+	global _store
+	with _store_lock:
+		if _store is None:
+			_store = RegistrationStatusStore.for_path(_STORE_FILE)
+			_migrate_legacy_all_file(_store)
+		return _store
+
+
+def _migrate_legacy_all_file(store: RegistrationStatusStore) -> None:
+	import os
+	if not os.path.exists(_ALL_FILE):
+		return
+	try:
+		legacy = _load_cache(_ALL_FILE)
+		if legacy and store.get_meta(META_FULL_SYNCED_AT) is None:
+			# 旧形式も全件取得の結果なので、ファイル更新時刻に全件同期したものとして扱う
+			synced_at = os.path.getmtime(_ALL_FILE)
+			store.replace_all(legacy)
+			store.set_meta(META_WATERMARK, max_start_ts(legacy))
+			store.set_meta(META_FULL_SYNCED_AT, synced_at)
+			store.set_meta(META_SYNCED_AT, synced_at)
+			logger.info("[登録状況] 旧全件キャッシュを取り込み: %s件", len(legacy))
+		os.remove(_ALL_FILE)
+	except Exception as exc:
+		logger.warning("[登録状況] 旧全件キャッシュの取り込みに失敗: %s", exc)
+
+
+def _synced_at(store: RegistrationStatusStore, key: str) -> Optional[datetime]:
+	value = store.get_meta(key)
+	if value is None:
+		return None
+	try:
+		return datetime.utcfromtimestamp(float(value))
+	except (TypeError, ValueError, OverflowError):
+		return None
+
+
 def has_all_cache(*, ignore_ttl: bool = False) -> bool:
 	"""全件キャッシュが利用可能か判定する。"""
-	import os
+	synced_at = _synced_at(_get_store(), META_FULL_SYNCED_AT)
+	if synced_at is None:
+		return False
 	if ignore_ttl:
-		return os.path.exists(_ALL_FILE)
-	return _is_cache_valid(_ALL_FILE)
+		return True
+	last_sync = _synced_at(_get_store(), META_SYNCED_AT) or synced_at
+	return (_now() - last_sync) <= _CACHE_TTL
 
 
 def load_all_cache(*, ignore_ttl: bool = False) -> List[Dict]:
 	"""全件キャッシュをネットワーク無しで読み込む。"""
 	if not has_all_cache(ignore_ttl=ignore_ttl):
 		return []
-	return _load_cache(_ALL_FILE)
-
-
-def _has_any_all_cache_file() -> bool:
-	import os
-	return os.path.exists(_ALL_FILE)
+	return _get_store().all_entries()
 
 
 def _merge_into_all_cache(entries: List[Dict]) -> None:
-	"""全件キャッシュが存在する場合、指定entriesで該当IDを上書き更新する。"""
-	if not _has_any_all_cache_file():
-		return
+	"""指定entriesで全件ストアの該当IDを上書き更新する。"""
 	try:
-		all_entries = {e.get('id'): e for e in _load_cache(_ALL_FILE)}
-		for e in entries:
-			all_entries[e.get('id')] = e
-		_save_cache(_ALL_FILE, list(all_entries.values()))
+		_get_store().upsert_many(entries)
 	except Exception as exc:
 		logger.debug("全件キャッシュへのマージに失敗: %s", exc)
 
@@ -297,6 +359,10 @@ def clear_cache() -> None:
 			if os.path.exists(p):
 				os.remove(p)
 				removed.append(p)
+		store = _get_store()
+		if store.count() or store.get_meta(META_FULL_SYNCED_AT) is not None:
+			store.clear()
+			removed.append(store.path)
 		if os.path.isdir(_ENTRY_DETAIL_DIR):
 			for name in os.listdir(_ENTRY_DETAIL_DIR):
 				path = os.path.join(_ENTRY_DETAIL_DIR, name)
@@ -315,7 +381,7 @@ def clear_cache() -> None:
 
 def has_valid_cache() -> bool:
 	"""いずれかのキャッシュがTTL内で有効か判定"""
-	return _is_cache_valid(_LATEST_FILE) or _is_cache_valid(_ALL_FILE)
+	return _is_cache_valid(_LATEST_FILE) or has_all_cache()
 
 
 def _collect_cache_metadata(cache_type: str, path: str) -> Optional[Dict[str, Any]]:
@@ -344,10 +410,22 @@ def _collect_cache_metadata(cache_type: str, path: str) -> Optional[Dict[str, An
 def get_cache_metadata() -> List[Dict[str, Any]]:
 	"""現在のキャッシュ状態を返す"""
 	metadata: List[Dict[str, Any]] = []
-	for cache_type, path in (("latest", _LATEST_FILE), ("all", _ALL_FILE)):
-		info = _collect_cache_metadata(cache_type, path)
-		if info:
-			metadata.append(info)
+	info = _collect_cache_metadata("latest", _LATEST_FILE)
+	if info:
+		metadata.append(info)
+	try:
+		store = _get_store()
+		synced_at = _synced_at(store, META_SYNCED_AT) or _synced_at(store, META_FULL_SYNCED_AT)
+		if synced_at is not None:
+			metadata.append({
+				"type": "all",
+				"path": store.path,
+				"updated_at": synced_at.replace(tzinfo=_UTC),
+				"size": store.file_size(),
+				"count": store.count(),
+			})
+	except Exception as exc:
+		logger.debug("全件ストアのメタ情報の収集に失敗: %s", exc)
 	import os
 	if os.path.isdir(_ENTRY_DETAIL_DIR):
 		try:
@@ -377,11 +455,22 @@ def get_cache_metadata() -> List[Dict[str, Any]]:
 	return metadata
 
 
+_ENTRIES_HEADERS = {
+	'Accept': 'application/vnd.api+json',
+	'Cache-Control': 'no-cache',
+	'Pragma': 'no-cache',
+	'Origin': 'https://rde-entry-arim.nims.go.jp',
+	'Referer': 'https://rde-entry-arim.nims.go.jp/',
+	# Authorization は http_helpers 側でBearer自動付与
+}
+
+
 def _build_entries_url(limit: int, offset: int) -> str:
 	base = "https://rde-entry-api-arim.nims.go.jp/entries"
 	params = (
 		f"page%5Blimit%5D={limit}"
 		f"&page%5Boffset%5D={offset}"
+		f"&sort=-startTime"
 		f"&include=instrument%2CcreatedBy%2CdataOwner%2CrestructureRequest"
 		f"&fields%5Bentry%5D=startTime%2CdataName%2CdatasetName%2Cstatus%2CerrorCode%2CerrorMessage"
 		f"&fields%5Buser%5D=userName%2CorganizationName"
@@ -471,33 +560,22 @@ def _parse_entries(resp_json: Dict) -> List[EntrySummary]:
 
 def fetch_latest(limit: int = 100, use_cache: bool = True) -> List[Dict]:
 	logger.debug(f"[登録状況] fetch_latest invoked: limit={limit}, use_cache={use_cache}")
-	# キャッシュが有効なら最新キャッシュ使用
+	# キャッシュが有効なら最新キャッシュ使用（取得時に全件ストアへ反映済み）
 	if use_cache and _is_cache_valid(_LATEST_FILE):
 		logger.debug("[登録状況] 最新キャッシュ有効 - 読み込み")
-		latest = _load_cache(_LATEST_FILE)
-		# 全件キャッシュが存在する場合はマージ（TTLに依存しない）
-		_merge_into_all_cache(latest)
-		return latest
+		return _load_cache(_LATEST_FILE)
 
 	# API 取得
 	url = _build_entries_url(limit=limit, offset=0)
-	headers = {
-		'Accept': 'application/vnd.api+json',
-		'Cache-Control': 'no-cache',
-		'Pragma': 'no-cache',
-		'Origin': 'https://rde-entry-arim.nims.go.jp',
-		'Referer': 'https://rde-entry-arim.nims.go.jp/',
-		# Authorization は http_helpers 側でBearer自動付与
-	}
 	try:
 		logger.debug(f"[登録状況] GET {url}")
-		resp = proxy_get(url, headers=headers)
+		resp = proxy_get(url, headers=_ENTRIES_HEADERS)
 		if not resp or resp.status_code != 200:
 			logger.warning(f"entries 最新取得に失敗: status={getattr(resp, 'status_code', None)}")
 			return _load_cache(_LATEST_FILE) if use_cache else []
 		items = [e.to_dict() for e in _parse_entries(resp.json())]
 		_save_cache(_LATEST_FILE, items)
-		# 全件キャッシュが存在する場合はマージ（TTLに依存しない）
+		# 全件ストアの該当IDを更新（TTLに依存しない）
 		_merge_into_all_cache(items)
 		return items
 	except Exception as e:
@@ -505,51 +583,150 @@ def fetch_latest(limit: int = 100, use_cache: bool = True) -> List[Dict]:
 		return _load_cache(_LATEST_FILE) if use_cache else []
 
 
-def fetch_all(default_chunk: int = 5000, use_cache: bool = True) -> List[Dict]:
-	logger.debug(f"[登録状況] fetch_all invoked: chunk={default_chunk}, use_cache={use_cache}")
-	# キャッシュが有効なら全件キャッシュを返す
-	if use_cache and _is_cache_valid(_ALL_FILE):
+def fetch_all(default_chunk: int = 5000, use_cache: bool = True, *, full: bool = False) -> List[Dict]:
+	"""全件を返す（startTime の新しい順）。
+
+	全件ストアがTTL内ならネットワーク無しで返す。それ以外は差分同期する
+	（startTime の新しい順に取得し、既知の範囲に達したら打ち切る）。
+	全件同期が無い・_FULL_RESYNC_INTERVAL より古い・full=True の場合は全件を取り直す。
+	"""
+	logger.debug(f"[登録状況] fetch_all invoked: chunk={default_chunk}, use_cache={use_cache}, full={full}")
+	store = _get_store()
+	# キャッシュが有効なら全件ストアを返す
+	if use_cache and has_all_cache():
 		logger.debug("[登録状況] 全件キャッシュ有効 - 読み込み")
-		return _load_cache(_ALL_FILE)
+		return store.all_entries()
 
-	# 反復ページングで全件取得
-	offset = 0
-	chunk = default_chunk
-	collected: Dict[str, Dict] = {}
-	headers = {
-		'Accept': 'application/vnd.api+json',
-		'Cache-Control': 'no-cache',
-		'Pragma': 'no-cache',
-		'Origin': 'https://rde-entry-arim.nims.go.jp',
-		'Referer': 'https://rde-entry-arim.nims.go.jp/',
-	}
 	try:
-		while True:
-			url = _build_entries_url(limit=chunk, offset=offset)
-			logger.debug(f"[登録状況] GET {url}")
-			resp = proxy_get(url, headers=headers)
-			if not resp or resp.status_code != 200:
-				logger.warning(f"entries 全件取得失敗: status={getattr(resp, 'status_code', None)} offset={offset}")
-				break
-			parsed = [e.to_dict() for e in _parse_entries(resp.json())]
-			for e in parsed:
-				collected[e.get('id')] = e
-			if len(parsed) < chunk:
-				break
-			offset += chunk
-
-		all_list = list(collected.values())
-		_save_cache(_ALL_FILE, all_list)
-		# 仕様: 全件を取った場合は最新も取得し直す
-		latest = fetch_latest(limit=100, use_cache=False)
-		_save_cache(_LATEST_FILE, latest)
-		return all_list
+		full_synced_at = _synced_at(store, META_FULL_SYNCED_AT)
+		if full or full_synced_at is None or (_now() - full_synced_at) > _FULL_RESYNC_INTERVAL:
+			synced = _sync_full(store, default_chunk)
+		else:
+			synced = _sync_incremental(store, default_chunk)
+		if synced:
+			# 仕様: 全件を取った場合は最新も取得し直す
+			fetch_latest(limit=100, use_cache=False)
+		return store.all_entries()
 	except Exception as e:
 		logger.exception(f"entries 全件取得で例外: {e}")
-		return _load_cache(_ALL_FILE) if use_cache else []
+		return store.all_entries() if use_cache else []
+
+
+def _fetch_entries_page(limit: int, offset: int) -> Optional[List[Dict]]:
+	"""一覧を1ページ取得する（失敗時は None）"""
+	url = _build_entries_url(limit=limit, offset=offset)
+	logger.debug(f"[登録状況] GET {url}")
+	resp = proxy_get(url, headers=_ENTRIES_HEADERS)
+	if not resp or resp.status_code != 200:
+		logger.warning(f"entries 一覧取得失敗: status={getattr(resp, 'status_code', None)} offset={offset}")
+		return None
+	return [e.to_dict() for e in _parse_entries(resp.json())]
+
+
+def _sync_full(store: RegistrationStatusStore, chunk: int) -> bool:
+	"""反復ページングで全件取得し、ストアを置き換える"""
+	import time
+	offset = 0
+	collected: Dict[str, Dict] = {}
+	while True:
+		page = _fetch_entries_page(chunk, offset)
+		if page is None:
+			# 取得できた分だけ反映する（削除の反映・全件同期の記録は行わない）
+			store.upsert_many(collected.values())
+			return False
+		for e in page:
+			collected[e.get('id')] = e
+		if len(page) < chunk:
+			break
+		offset += chunk
+
+	store.replace_all(collected.values())
+	store.set_meta(META_WATERMARK, max_start_ts(collected.values()))
+	now = time.time()
+	store.set_meta(META_FULL_SYNCED_AT, now)
+	store.set_meta(META_SYNCED_AT, now)
+	logger.info(f"[登録状況] 全件同期: {len(collected)}件")
+	return True
 
 
-def count_by_status(entries: List[Dict]) -> Dict[str, int]:
+def _sync_incremental(store: RegistrationStatusStore, chunk: int) -> bool:
+	"""watermark に達するまで新しい順に取得してストアへ反映する
+
+	watermark は同期完了時にだけ進める（fetch_latest() のマージでは進めない）。
+	"""
+	import time
+	floor_ts = store.sync_floor_ts(_PENDING_LOOKBACK.total_seconds())
+	if floor_ts is None:
+		return _sync_full(store, chunk)
+	floor_ts -= _SYNC_OVERLAP.total_seconds()
+
+	offset = 0
+	pages: List[List[Dict]] = []
+	limit = min(_INCREMENTAL_CHUNK, chunk)
+	previous_start: Optional[float] = None
+	while True:
+		page = _fetch_entries_page(limit, offset)
+		if page is None:
+			# 途中までの反映は watermark を進めて取りこぼしを生むため、何も反映しない
+			return False
+		starts = [ts for ts in (_start_ts(e.get('startTime')) for e in page) if ts is not None]
+		if previous_start is not None:
+			# ページ間の並びも確認する（前ページの末尾より新しいエントリーが来たら並んでいない）
+			starts.insert(0, previous_start)
+		if any(newer < older for newer, older in zip(starts, starts[1:])):
+			# 新しい順に並んでいなければ打ち切り位置を決められない
+			logger.info("[登録状況] 一覧が startTime の新しい順でないため全件取得に切り替え")
+			return _sync_full(store, chunk)
+		pages.append(page)
+		if starts:
+			previous_start = starts[-1]
+		if len(page) < limit or (starts and starts[-1] < floor_ts):
+			break
+		offset += limit
+		# 既知の範囲が遠い場合に備え、ページを倍々に大きくする（上限は全件取得の chunk）
+		limit = min(limit * 2, chunk)
+
+	fetched = [e for page in pages for e in page]
+	added = store.upsert_many(fetched)
+	watermark = max(ts for ts in (store.get_meta(META_WATERMARK), max_start_ts(fetched)) if ts is not None)
+	store.set_meta(META_WATERMARK, watermark)
+	store.set_meta(META_SYNCED_AT, time.time())
+	logger.info(f"[登録状況] 差分同期: 取得{len(fetched)}件 新規{added}件")
+	return True
+
+
+def match_registration_status(
+	*,
+	data_name: str,
+	dataset_name: Optional[str],
+	near_time_utc: datetime,
+	window: timedelta = timedelta(minutes=20),
+) -> RegistrationStatusMatch:
+	"""全件ストアから POST /entries に対応するエントリーを照合する。
+
+	dataName・startTime の索引で候補を絞り込み、判定は find_registration_status_match と同じ。
+	fetch_latest() の結果はストアへ反映されるため、直前に fetch_latest() を呼べば最新状態で照合できる。
+	"""
+	if near_time_utc.tzinfo is None:
+		near_time_utc = near_time_utc.replace(tzinfo=_UTC)
+	candidates = _get_store().find_by_data_name(
+		data_name,
+		start_from=near_time_utc - window,
+		start_to=near_time_utc + window,
+	)
+	return find_registration_status_match(
+		candidates,
+		data_name=data_name,
+		dataset_name=dataset_name,
+		near_time_utc=near_time_utc,
+		window=window,
+	)
+
+
+def count_by_status(entries: Optional[List[Dict]] = None) -> Dict[str, int]:
+	"""status 別件数（entries 省略時は全件ストアを集計）"""
+	if entries is None:
+		return _get_store().count_by_status()
 	result: Dict[str, int] = {}
 	for e in entries:
 		s = e.get('status') or 'UNKNOWN'
@@ -557,10 +734,12 @@ def count_by_status(entries: List[Dict]) -> Dict[str, int]:
 	return result
 
 
-def count_by_dataset(entries: List[Dict]) -> Dict[str, int]:
+def count_by_dataset(entries: Optional[List[Dict]] = None) -> Dict[str, int]:
+	"""datasetName 別件数（entries 省略時は全件ストアを集計）"""
+	if entries is None:
+		return _get_store().count_by_dataset()
 	result: Dict[str, int] = {}
 	for e in entries:
 		d = e.get('datasetName') or 'UNKNOWN'
 		result[d] = result.get(d, 0) + 1
 	return result
-
@@ -0,0 +1,261 @@
+"""
+登録状況（/entries 一覧）のローカルストア
+
+SQLite (WAL) に id をキーとしてエントリーを保持し、startTime・status・datasetName・dataName に
+索引を張る。一覧の差分取り込み（upsert）、件数集計、照合候補の抽出を索引付きクエリで行う。
+
+差分同期の基準（watermark）は最後に完了した同期で得た最新 startTime（meta に記録する。
+最新一覧のマージでは進めない）。ただし状態が確定していない（COMPLETED / FAILED / CANCELLED 以外の）
+エントリーは状態が変わり得るため、その startTime まで遡る。
+
+ストアはプロセス内で共有される（1 DB ファイルにつき 1 インスタンス）。
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+from classes.data_entry.core.registration_status_matcher import _parse_iso8601
+
+logger = logging.getLogger(__name__)
+
+# 状態が確定した status（大文字）
+TERMINAL_STATUSES = frozenset({"COMPLETED", "FAILED", "CANCELLED", "CANCELED"})
+
+META_FULL_SYNCED_AT = "full_synced_at"
+META_SYNCED_AT = "synced_at"
+META_WATERMARK = "watermark"
+
+
+def _start_ts(start_time: Any) -> Optional[float]:
+    parsed = _parse_iso8601(str(start_time or ""))
+    return parsed.timestamp() if parsed else None
+
+
+def max_start_ts(entries: Iterable[Dict[str, Any]]) -> Optional[float]:
+    """エントリー群の最新 startTime（epoch 秒）"""
+    starts = [ts for ts in (_start_ts(e.get("startTime")) for e in entries if isinstance(e, dict)) if ts is not None]
+    return max(starts) if starts else None
+
+
+class RegistrationStatusStore:
+    """id をキーとする登録状況エントリーのストア（スレッドセーフ）"""
+
+    _instances: Dict[str, "RegistrationStatusStore"] = {}
+    _instances_lock = threading.Lock()
+
+    @classmethod
+    def for_path(cls, path: str) -> "RegistrationStatusStore":
+        with cls._instances_lock:
+            store = cls._instances.get(path)
+            if store is None:
+                store = cls(path)
+                cls._instances[path] = store
+            return store
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.RLock()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS entries (
+                    id           TEXT PRIMARY KEY,
+                    status       TEXT NOT NULL DEFAULT '',
+                    start_time   TEXT,
+                    start_ts     REAL,
+                    data_name    TEXT NOT NULL DEFAULT '',
+                    dataset_name TEXT NOT NULL DEFAULT '',
+                    payload      TEXT NOT NULL
+                )
+                """
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_start ON entries (start_ts)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_status ON entries (status)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_dataset ON entries (dataset_name)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_name ON entries (data_name, start_ts)")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL) WITHOUT ROWID"
+            )
+
+    # -- 書き込み ---------------------------------------------------------
+
+    def upsert_many(self, entries: Iterable[Dict[str, Any]]) -> int:
+        """エントリーを id 単位で追加・上書きし、新規に追加した件数を返す"""
+        rows = _to_rows(entries)
+        if not rows:
+            return 0
+        with self._transaction():
+            before = self._count()
+            self._upsert_rows(rows)
+            return self._count() - before
+
+    def replace_all(self, entries: Iterable[Dict[str, Any]]) -> None:
+        """全件取得の結果で置き換える（一覧に無くなったエントリーは削除）"""
+        rows = _to_rows(entries)
+        with self._transaction():
+            self._conn.execute("DELETE FROM entries")
+            self._upsert_rows(rows)
+
+    def set_meta(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                (key, json.dumps(value)),
+            )
+
+    def clear(self) -> None:
+        with self._transaction():
+            self._conn.execute("DELETE FROM entries")
+            self._conn.execute("DELETE FROM meta")
+
+    # -- 読み取り ---------------------------------------------------------
+
+    def get_meta(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return default
+        try:
+            return json.loads(row[0])
+        except ValueError:
+            return default
+
+    def count(self) -> int:
+        with self._lock:
+            return self._count()
+
+    def all_entries(self) -> List[Dict[str, Any]]:
+        """全エントリーを startTime の新しい順に返す"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT payload FROM entries ORDER BY start_ts IS NULL, start_ts DESC, id"
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def count_by_status(self) -> Dict[str, int]:
+        return self._count_by("status")
+
+    def count_by_dataset(self) -> Dict[str, int]:
+        return self._count_by("dataset_name")
+
+    def find_by_data_name(
+        self,
+        data_name: str,
+        *,
+        start_from: datetime,
+        start_to: datetime,
+    ) -> List[Dict[str, Any]]:
+        """dataName が一致し startTime が範囲内のエントリー（照合候補）"""
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT payload FROM entries
+                WHERE data_name = ? AND start_ts BETWEEN ? AND ?
+                ORDER BY start_ts DESC
+                """,
+                ((data_name or "").strip(), start_from.timestamp(), start_to.timestamp()),
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def sync_floor_ts(self, pending_lookback_seconds: float) -> Optional[float]:
+        """
+        差分同期で遡る startTime（epoch 秒）を返す（同期済みでなければ None）
+
+        watermark と、そこから pending_lookback_seconds 以内にある状態未確定エントリーの
+        最古の startTime のうち古い方。
+        """
+        watermark = self.get_meta(META_WATERMARK)
+        if watermark is None:
+            return None
+        with self._lock:
+            placeholders = ",".join("?" * len(TERMINAL_STATUSES))
+            row = self._conn.execute(
+                f"""
+                SELECT MIN(start_ts) FROM entries
+                WHERE start_ts >= ? AND UPPER(TRIM(status)) NOT IN ({placeholders})
+                """,
+                (watermark - pending_lookback_seconds, *sorted(TERMINAL_STATUSES)),
+            ).fetchone()
+        pending_oldest = row[0] if row else None
+        return min(watermark, pending_oldest) if pending_oldest is not None else watermark
+
+    def file_size(self) -> int:
+        size = 0
+        for suffix in ("", "-wal"):
+            try:
+                size += os.path.getsize(self.path + suffix)
+            except OSError:
+                pass
+        return size
+
+    # -- 内部 -------------------------------------------------------------
+
+    @contextmanager
+    def _transaction(self):
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def _count(self) -> int:
+        return int(self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0])
+
+    def _count_by(self, column: str) -> Dict[str, int]:
+        # 空の値は UNKNOWN として数える（従来の一覧走査と同じ）
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {column}, COUNT(*) FROM entries GROUP BY {column}"
+            ).fetchall()
+        result: Dict[str, int] = {}
+        for value, n in rows:
+            key = value or "UNKNOWN"
+            result[key] = result.get(key, 0) + n
+        return result
+
+    def _upsert_rows(self, rows: List[tuple]) -> None:
+        self._conn.executemany(
+            """
+            INSERT INTO entries (id, status, start_time, start_ts, data_name, dataset_name, payload)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(id) DO UPDATE SET
+                status = excluded.status,
+                start_time = excluded.start_time,
+                start_ts = excluded.start_ts,
+                data_name = excluded.data_name,
+                dataset_name = excluded.dataset_name,
+                payload = excluded.payload
+            """,
+            rows,
+        )
+
+
+def _to_rows(entries: Iterable[Dict[str, Any]]) -> List[tuple]:
+    rows = []
+    for e in entries or []:
+        if not isinstance(e, dict) or not e.get("id"):
+            continue
+        rows.append((
+            str(e["id"]),
+            str(e.get("status") or ""),
+            e.get("startTime"),
+            _start_ts(e.get("startTime")),
+            # 照合は前後の空白を除いた dataName で行う（registration_status_matcher と同じ）
+            str(e.get("dataName") or "").strip(),
+            str(e.get("datasetName") or ""),
+            json.dumps(e, ensure_ascii=False, separators=(",", ":")),
+        ))
+    return rows
@@ -7,7 +7,6 @@
 import os
 import shutil
 import tempfile
-import zipfile
 import uuid
 from typing import List, Dict, Optional, Tuple
 from pathlib import Path
@@ -20,6 +19,10 @@ from openpyxl import Workbook
 logger = logging.getLogger(__name__)
 
 from classes.data_entry.core.file_set_manager import FileSet, FileItem, FileType, PathOrganizeMethod, FileItemType
+from classes.data_entry.core.file_staging import (
+    STAGING_MODE_AUTO, STAGED_BY_COPY, STAGED_BY_ZIP,
+    stage_file, write_zip,
+)
 
 
 @dataclass
@@ -31,18 +34,23 @@ class FileMapping:
     file_type: str              # データファイル/添付ファイル
     size: int                   # ファイルサイズ
     relative_path: str          # 元の相対パス
+    staging_method: str = STAGED_BY_COPY  # 一時フォルダへの配置方法（file_staging.STAGED_BY_*）
 
 
 class TempFolderManager:
     """一時フォルダ管理クラス（UUID対応版）"""
     
-    def __init__(self, base_temp_dir: Optional[str] = None):
+    def __init__(self, base_temp_dir: Optional[str] = None, staging_mode: str = STAGING_MODE_AUTO):
         """
         初期化
         
         Args:
             base_temp_dir: 一時フォルダのベースディレクトリ（Noneの場合はoutput/temp）
+            staging_mode: ファイルの配置方式（file_staging.STAGING_MODE_*）。
+                既定はハードリンク → reflink → コピーの順に試す。
+                STAGING_MODE_SOURCE では ZIP とマッピングExcelのみ作成し、個別ファイルは配置しない
         """
+        self.staging_mode = staging_mode
         if base_temp_dir is None:
             from config.common import get_output_directory
             self.base_temp_dir = os.path.join(get_output_directory(), "temp")
@@ -152,19 +160,7 @@ class TempFolderManager:
                 zip_filename = f"{Path(zip_dir).name}.zip"
                 zip_file_path = os.path.join(temp_dir, zip_filename)
                 
-                with zipfile.ZipFile(zip_file_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                    for file_item in zip_files:
-                        if not os.path.exists(file_item.path):
-                            continue
-                        
-                        # ZIP内での相対パス（ディレクトリ構造を保持）
-                        zip_internal_path = file_item.relative_path
-                        if zip_internal_path.startswith(zip_dir):
-                            # ディレクトリプレフィックスを削除
-                            zip_internal_path = zip_internal_path[len(zip_dir):].lstrip('/\\')
-                        
-                        zipf.write(file_item.path, zip_internal_path)
-                        logger.debug("フラット化ZIP内に追加: %s -> %s", file_item.path, zip_internal_path)
+                write_zip(zip_file_path, self._zip_members(zip_files, zip_dir))
                 
                 # ZIPファイルのマッピング情報を記録
                 zip_size = os.path.getsize(zip_file_path)
@@ -174,7 +170,8 @@ class TempFolderManager:
                     register_name=zip_filename,
                     file_type="データファイル",
                     size=zip_size,
-                    relative_path=zip_dir
+                    relative_path=zip_dir,
+                    staging_method=STAGED_BY_ZIP
                 )
                 mappings.append(mapping)
                 logger.info("フラット化でZIP化完了: %s (%sファイル)", zip_file_path, len(zip_files))
@@ -215,9 +212,9 @@ class TempFolderManager:
                     flatten_name = f"{original_flatten_name}_{counter}"
                 counter += 1
             
-            # ファイルをコピー
+            # ファイルを配置
             temp_file_path = os.path.join(temp_dir, flatten_name)
-            shutil.copy2(file_item.path, temp_file_path)
+            staging_method = stage_file(file_item.path, temp_file_path, self.staging_mode)
             
             # マッピング情報を記録
             mapping = FileMapping(
@@ -226,11 +223,13 @@ class TempFolderManager:
                 register_name=flatten_name,
                 file_type=self._get_file_category(file_item),
                 size=file_item.size,
-                relative_path=file_item.relative_path
+                relative_path=file_item.relative_path,
+                staging_method=staging_method
             )
             mappings.append(mapping)
         
         self.file_mappings[file_set.id] = mappings
+        self._log_staging_summary(file_set, mappings)
         
         # マッピングExcelファイルを作成
         mapping_xlsx = self._create_mapping_excel(file_set, mappings, temp_dir)
@@ -304,7 +303,7 @@ class TempFolderManager:
                 continue
                 
             temp_file_path = os.path.join(temp_dir, file_item.name)
-            shutil.copy2(file_item.path, temp_file_path)
+            staging_method = stage_file(file_item.path, temp_file_path, self.staging_mode)
             
             mapping = FileMapping(
                 original_path=file_item.path,
@@ -312,7 +311,8 @@ class TempFolderManager:
                 register_name=file_item.name,
                 file_type=self._get_file_category(file_item),
                 size=file_item.size,
-                relative_path=file_item.relative_path
+                relative_path=file_item.relative_path,
+                staging_method=staging_method
             )
             mappings.append(mapping)
         
@@ -330,24 +330,7 @@ class TempFolderManager:
                 logger.debug("ZIP作成開始: %s", zip_file_path)
                 logger.debug("ZIP対象ファイル数: %s", len(files))
                 
-                with zipfile.ZipFile(zip_file_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                    for file_item in files:
-                        if not os.path.exists(file_item.path):
-                            logger.warning("ファイルが存在しません: %s", file_item.path)
-                            continue
-                        
-                        # ZIP内での相対パス（ディレクトリ構造を保持）
-                        zip_internal_path = file_item.relative_path
-                        if zip_internal_path.startswith(dir_name):
-                            # ディレクトリプレフィックスを削除
-                            zip_internal_path = zip_internal_path[len(dir_name):].lstrip('/\\')
-                        
-                        logger.debug("ZIP内に追加:")
-                        logger.debug("元ファイル: %s", file_item.path)
-                        logger.debug("相対パス: %s", file_item.relative_path)
-                        logger.debug("ZIP内パス: %s", zip_internal_path)
-                        
-                        zipf.write(file_item.path, zip_internal_path)
+                write_zip(zip_file_path, self._zip_members(files, dir_name))
                 
                 # ZIPファイル全体のマッピング情報を記録
                 zip_size = os.path.getsize(zip_file_path)
@@ -359,7 +342,8 @@ class TempFolderManager:
                     register_name=f"{Path(dir_name).name}.zip",
                     file_type="添付ファイル",  # ZIP化されたファイルは添付ファイル
                     size=zip_size,
-                    relative_path=dir_name
+                    relative_path=dir_name,
+                    staging_method=STAGED_BY_ZIP
                 )
                 mappings.append(mapping)
                 logger.info("ZIP化完了: %s (%sファイル)", zip_file_path, len(files))
@@ -372,7 +356,7 @@ class TempFolderManager:
                     # ファイル名の重複を避けるためにディレクトリプレフィックスを付ける
                     safe_filename = file_item.relative_path.replace('/', '_').replace('\\', '_')
                     temp_file_path = os.path.join(temp_dir, safe_filename)
-                    shutil.copy2(file_item.path, temp_file_path)
+                    staging_method = stage_file(file_item.path, temp_file_path, self.staging_mode)
                     
                     mapping = FileMapping(
                         original_path=file_item.path,
@@ -380,17 +364,40 @@ class TempFolderManager:
                         register_name=safe_filename,
                         file_type=self._get_file_category(file_item),
                         size=file_item.size,
-                        relative_path=file_item.relative_path
+                        relative_path=file_item.relative_path,
+                        staging_method=staging_method
                     )
                     mappings.append(mapping)
         
         self.file_mappings[file_set.id] = mappings
+        self._log_staging_summary(file_set, mappings)
         
         # マッピングExcelファイルを作成
         mapping_xlsx = self._create_mapping_excel(file_set, mappings, temp_dir)
         
         return mapping_xlsx
     
+    @staticmethod
+    def _zip_members(files: List[FileItem], dir_name: str) -> List[Tuple[str, str]]:
+        """ZIP化対象ディレクトリ配下のファイルを (元ファイル, ZIP内パス) の組にする"""
+        members = []
+        for file_item in files:
+            # ZIP内での相対パス（ディレクトリ構造を保持）
+            zip_internal_path = file_item.relative_path
+            if zip_internal_path.startswith(dir_name):
+                # ディレクトリプレフィックスを削除
+                zip_internal_path = zip_internal_path[len(dir_name):].lstrip('/\\')
+            logger.debug("ZIP内に追加: %s -> %s", file_item.path, zip_internal_path)
+            members.append((file_item.path, zip_internal_path))
+        return members
+    
+    @staticmethod
+    def _log_staging_summary(file_set: FileSet, mappings: List[FileMapping]) -> None:
+        counts: Dict[str, int] = {}
+        for mapping in mappings:
+            counts[mapping.staging_method] = counts.get(mapping.staging_method, 0) + 1
+        logger.info("ファイルセット %s の配置方法: %s", file_set.name, counts)
+    
     def _create_mapping_excel(self, file_set: FileSet, mappings: List[FileMapping], temp_dir: str) -> str:
         """
         ファイルマッピング情報のExcelファイルを作成
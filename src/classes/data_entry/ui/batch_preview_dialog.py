@@ -1404,11 +1404,10 @@ API情報:
             logger.debug("ファイルパス: %s", file_path)
             logger.debug("データセットID: %s", dataset_id)
             
-            # ファイルを読み込み
-            with open(file_path, 'rb') as f:
-                binary_data = f.read()
+            # 本文はファイルから逐次読み出して送信する（ファイル全体をメモリに載せない）
+            from net.upload_stream import FileUploadStream
             
-            file_size = len(binary_data)
+            file_size = os.path.getsize(file_path)
             filename = os.path.basename(file_path)
             encoded_filename = urllib.parse.quote(filename)
             logger.debug("ファイルサイズ (バイナリ): %s bytes", file_size)
@@ -1425,20 +1424,21 @@ API情報:
             logger.debug("API呼び出し開始: POST %s", url)
             logger.debug("リクエストヘッダー数: %s", len(actual_headers))
             logger.debug("X-File-Name: %s", actual_headers['X-File-Name'])
-            logger.debug("バイナリデータサイズ: %s bytes", len(binary_data))
+            logger.debug("バイナリデータサイズ: %s bytes", file_size)
             logger.debug("Bearer Token: URLから自動選択されます")
             
             # v1.18.4: api_request_helper.post_binaryを使用（Bearer Token自動選択）
             from classes.utils.api_request_helper import post_binary
             
-            resp = post_binary(
-                url=url,
-                data=binary_data,
-                bearer_token=None,  # 自動選択させる
-                content_type='application/octet-stream',
-                headers=actual_headers,
-                timeout=60  # アップロードは時間がかかる可能性があるため60秒に設定
-            )
+            with FileUploadStream(file_path) as body:
+                resp = post_binary(
+                    url=url,
+                    data=body,
+                    bearer_token=None,  # 自動選択させる
+                    content_type='application/octet-stream',
+                    headers=actual_headers,
+                    timeout=60  # アップロードは時間がかかる可能性があるため60秒に設定
+                )
             
             if resp is None:
                 logger.error("API呼び出し失敗: レスポンスがNone")
@@ -2055,17 +2055,14 @@ API情報:
             logger.debug("URL: %s", url)
             logger.debug("X-File-Name: %s", encoded_filename)
             
-            # バイナリデータ読み込み
-            with open(file_item.path, 'rb') as f:
-                binary_data = f.read()
-            
-            # Bearer Token自動選択対応のpost_binaryを使用
+            # Bearer Token自動選択対応のpost_binaryを使用（本文はファイルから逐次読み出して送信）
             from classes.utils.api_request_helper import post_binary
+            from net.upload_stream import FileUploadStream
             
-            logger.debug("API呼び出し開始: POST %s", url)
-            logger.debug("バイナリデータサイズ: %s bytes", len(binary_data))
-            
-            resp = post_binary(url, data=binary_data, bearer_token=None, headers=headers)
+            with FileUploadStream(file_item.path) as body:
+                logger.debug("API呼び出し開始: POST %s", url)
+                logger.debug("バイナリデータサイズ: %s bytes", len(body))
+                resp = post_binary(url, data=body, bearer_token=None, headers=headers)
             if resp is None:
                 logger.error("API呼び出し失敗: レスポンスがNone")
                 return {"error": "API呼び出し失敗: レスポンスがありません"}
@@ -2243,10 +2240,6 @@ API情報:
             # アップロードAPI呼び出し
             url = f"https://rde-entry-api-arim.nims.go.jp/uploads?datasetId={dataset_id}"
             
-            # ファイル読み込み
-            with open(file_path, 'rb') as f:
-                file_data = f.read()
-            
             # ヘッダー設定（Authorizationは削除、post_binary内で自動選択）
             filename = os.path.basename(file_path)
             encoded_filename = urllib.parse.quote(filename)
@@ -2256,9 +2249,11 @@ API情報:
                 "User-Agent": "PythonUploader/1.0"
             }
             
-            # Bearer Token自動選択対応のpost_binaryを使用
+            # Bearer Token自動選択対応のpost_binaryを使用（本文はファイルから逐次読み出して送信）
             from classes.utils.api_request_helper import post_binary
-            resp = post_binary(url, data=file_data, bearer_token=None, headers=headers)
+            from net.upload_stream import FileUploadStream
+            with FileUploadStream(file_path) as body:
+                resp = post_binary(url, data=body, bearer_token=None, headers=headers)
             
             if resp is None:
                 return {'success': False, 'error': 'API呼び出し失敗: レスポンスがありません'}
@@ -3067,17 +3062,14 @@ class BatchRegisterPreviewDialog(QDialog):
             logger.debug("URL: %s", url)
             logger.debug("X-File-Name: %s", encoded_filename)
             
-            # バイナリデータ読み込み
-            with open(file_item.path, 'rb') as f:
-                binary_data = f.read()
-            
-            # Bearer Token自動選択対応のpost_binaryを使用
+            # Bearer Token自動選択対応のpost_binaryを使用（本文はファイルから逐次読み出して送信）
             from classes.utils.api_request_helper import post_binary
+            from net.upload_stream import FileUploadStream
             
-            logger.debug("API呼び出し開始: POST %s", url)
-            logger.debug("バイナリデータサイズ: %s bytes", len(binary_data))
-            
-            resp = post_binary(url, data=binary_data, bearer_token=None, headers=headers)
+            with FileUploadStream(file_item.path) as body:
+                logger.debug("API呼び出し開始: POST %s", url)
+                logger.debug("バイナリデータサイズ: %s bytes", len(body))
+                resp = post_binary(url, data=body, bearer_token=None, headers=headers)
             if resp is None:
                 logger.error("API呼び出し失敗: レスポンスがNone")
                 return {"error": "API呼び出し失敗: レスポンスがありません"}
@@ -4298,8 +4290,8 @@ class BatchRegisterPreviewDialog(QDialog):
                 logger.info("ユーザーが全ファイルセット一括データ登録をキャンセルしました")
                 return
             
-            # プログレスダイアログ（データ登録）
-            progress = QProgressDialog("全ファイルセット一括データ登録中...", "キャンセル", 0, len(valid_file_sets), self)
+            # プログレスダイアログ（データ登録、全体の進捗を%で表示）
+            progress = QProgressDialog("全ファイルセット一括データ登録中...", "キャンセル", 0, 100, self)
             progress.setWindowModality(Qt.WindowModal)
             progress.setValue(0)  # 初期値を明示的に設定
             progress.setLabelText(f"データ登録準備中... (0/{len(valid_file_sets)})")
@@ -4322,95 +4314,59 @@ class BatchRegisterPreviewDialog(QDialog):
                 _orig_register_set_value(val)
             progress.setValue = _instrument_register_set_value
             
-            # 結果集計
-            total_registered = 0
-            total_failed = 0
-            skip_count = 0  # レスポンス待ち停止/タイムアウト/401/404 等によりスキップされたファイルセット数
-            fileset_results = []
-            previous_sample_id = None  # 前回のサンプルIDを保存
-            
-            for i, file_set in enumerate(valid_file_sets):
-                if progress.wasCanceled():
-                    logger.info("ユーザーによりデータ登録がキャンセルされました")
-                    break
+            # 登録は BatchRegisterEngine で複数ファイルセットを並行処理する
+            # （「前回と同じ」試料IDの継承もエンジンが先行ファイルセットの完了を待って行う）
+            from ..core.batch_register_logic import BatchRegisterLogic
 
-                progress.setLabelText(f"データ登録中: {file_set.name} ({i+1}/{len(valid_file_sets)})")
-                QApplication.processEvents()
+            results_by_index = {}
 
-                try:
-                    # 前回と同じ試料IDを使用する場合の処理
-                    sample_mode = getattr(file_set, 'sample_mode', 'new')
-                    extended_config = getattr(file_set, 'extended_config', {})
-                    
-                    if (sample_mode == 'same_as_previous' or extended_config.get('sample_mode') == '前回と同じ') and previous_sample_id:
-                        # 前回のサンプルIDを設定
-                        file_set.sample_mode = 'existing'
-                        file_set.sample_id = previous_sample_id
-                        if not hasattr(file_set, 'extended_config'):
-                            file_set.extended_config = {}
-                        file_set.extended_config['sample_mode'] = '既存試料使用'
-                        file_set.extended_config['sample_id'] = previous_sample_id
-                        logger.info("前回サンプルID継承: %s -> %s", file_set.name, previous_sample_id)
-                    
-                    register_result = self._register_single_fileset(None, file_set)
+            def on_register_event(event):
+                if event.kind == "progress":
+                    progress.setValue(event.percent)
+                    if event.message:
+                        progress.setLabelText(f"{event.message} ({event.done}/{event.total})")
+                elif event.kind == "fileset_completed":
+                    sample_id = (event.detail or {}).get('sample_id')
+                    results_by_index[event.index] = {
+                        'name': event.fileset_name,
+                        'success': True,
+                        'sample_id': sample_id,
+                    }
+                    logger.info("[SUCCESS] %s: 登録完了, sample_id=%s", event.fileset_name, sample_id)
+                elif event.kind == "fileset_error":
+                    detail = event.detail or {}
+                    results_by_index[event.index] = {
+                        'name': event.fileset_name,
+                        'success': False,
+                        'skipped': bool(detail.get('skipped')),
+                        'skip_reason': detail.get('skip_reason'),
+                        'error': event.message,
+                        'error_details': detail.get('error_details'),
+                    }
+                    if detail.get('skipped'):
+                        logger.warning("[SKIP] %s: %s", event.fileset_name, event.message)
+                    else:
+                        logger.error("%s: 登録失敗 - %s", event.fileset_name, event.message)
 
-                    # スキップ判定 (404/401 等)
-                    if register_result.get('skipped'):
-                        fileset_results.append({
-                            'name': file_set.name,
-                            'success': False,
-                            'skipped': True,
-                            'skip_reason': register_result.get('skip_reason'),
-                            'error': register_result.get('error')
-                        })
-                        skip_count += 1
-                        logger.warning("[SKIP] %s: %s", file_set.name, register_result.get('error'))
-                        # 進捗更新のみで次へ
-                        progress.setValue(i + 1)
-                        QApplication.processEvents()
-                        continue
+            register_logic = BatchRegisterLogic(self)
+            register_logic.event_received.connect(on_register_event)
+            progress.canceled.connect(register_logic.cancel)
+            batch_result = register_logic.run_batch_register(valid_file_sets, show_progress=False)
+            if register_logic.worker is not None and register_logic.worker.engine.cancelled:
+                logger.info("ユーザーによりデータ登録がキャンセルされました")
 
-                    if register_result.get('success'):
-                        fileset_results.append({
-                            'name': file_set.name,
-                            'success': True,
-                            'sample_id': register_result.get('sample_id')
-                        })
-                        
-                        total_registered += 1
-                        
-                        # 次回用に試料IDを保存
-                        sample_id = register_result.get('sample_id')
-                        if sample_id:
-                            previous_sample_id = sample_id
-                        
-                        logger.info("[SUCCESS] %s: 登録完了, sample_id=%s", file_set.name, sample_id)
-                    else:
-                        error_detail = register_result.get('error', '不明なエラー')
-                        fileset_results.append({
-                            'name': file_set.name,
-                            'success': False,
-                            'error': error_detail,
-                            'error_details': register_result.get('error_details')
-                        })
-                        total_failed += 1
-                        logger.error("%s: 登録失敗 - %s", file_set.name, error_detail)
-                    
-                except Exception as e:
-                    logger.error("ファイルセット '%s' のデータ登録エラー: %s", file_set.name, e)
-                    fileset_results.append({
-                        'name': file_set.name,
-                        'success': False,
-                        'error': str(e),
-                        'error_details': str(e)
-                    })
-                    total_failed += 1
+            fileset_results = [results_by_index[i] for i in sorted(results_by_index)]
+            # 認証エラー・システムエラーなどファイルセットに紐付かないエラーも結果に含める
+            fileset_names = {result['name'] for result in fileset_results}
+            for name, error in batch_result.errors:
+                if name not in fileset_names:
+                    fileset_results.append({'name': name, 'success': False, 'error': error, 'error_details': error})
 
-                # 完了後に進捗を更新（i+1）
-                progress.setValue(i + 1)
-                QApplication.processEvents()
+            total_registered = sum(1 for result in fileset_results if result.get('success'))
+            skip_count = sum(1 for result in fileset_results if result.get('skipped'))
+            total_failed = len(fileset_results) - total_registered - skip_count
             
-            progress.setValue(len(valid_file_sets))
+            progress.setValue(100)
             progress.close()
             QApplication.processEvents()  # UI更新を確実に処理
             
@@ -4834,219 +4790,6 @@ class BatchRegisterPreviewDialog(QDialog):
             logger.error("ファイルセットアップロードエラー: %s", e)
             return {'success_count': 0, 'failed_count': 1, 'error': str(e)}
     
-    def _register_single_fileset(self, bearer_token: str, file_set: FileSet) -> dict:
-        """単一ファイルセットのデータ登録処理"""
-        try:
-            logger.info("ファイルセットデータ登録開始: %s", file_set.name)
-
-            # ファイルセット単位の進捗ダイアログ（通常登録と同等の体験に寄せる）
-            fileset_progress = None
-            try:
-                from qt_compat.core import Qt
-                from qt_compat.widgets import QApplication
-
-                fileset_progress = QProgressDialog(f"ファイルセット処理中: {file_set.name}", "キャンセル", 0, 0, self)
-                fileset_progress.setWindowTitle("一括登録")
-                fileset_progress.setWindowModality(Qt.WindowModal)
-                fileset_progress.setAutoClose(False)
-                fileset_progress.setAutoReset(False)
-                fileset_progress.setMinimumDuration(0)
-                fileset_progress.show()
-                try:
-                    from ..core.data_register_logic import _center_on_screen
-
-                    _center_on_screen(fileset_progress)
-                except Exception:
-                    pass
-                QApplication.processEvents()
-            except Exception:
-                fileset_progress = None
-
-            # アップロードが先に実行されているかチェック・実行（進捗表示あり）
-            upload_result = self._upload_single_fileset(bearer_token, file_set, progress=fileset_progress)
-            if upload_result.get('cancelled'):
-                try:
-                    if fileset_progress is not None:
-                        fileset_progress.close()
-                except Exception:
-                    pass
-                return {
-                    'success': False,
-                    'skipped': True,
-                    'skip_reason': 'cancelled',
-                    'error': upload_result.get('error', 'キャンセルされました'),
-                }
-            if upload_result.get('skipped'):
-                try:
-                    if fileset_progress is not None:
-                        fileset_progress.close()
-                except Exception:
-                    pass
-                return {
-                    'success': False,
-                    'skipped': True,
-                    'skip_reason': upload_result.get('skip_reason', 'skipped'),
-                    'error': upload_result.get('error', 'スキップされました')
-                }
-            if upload_result['success_count'] == 0:
-                try:
-                    if fileset_progress is not None:
-                        fileset_progress.close()
-                except Exception:
-                    pass
-                return {'success': False, 'error': upload_result.get('error', 'ファイルアップロードに失敗しました')}
-            
-            # データセット情報取得・復元
-            dataset_info = getattr(file_set, 'dataset_info', None)
-            extended_config = getattr(file_set, 'extended_config', {})
-            
-            if not dataset_info:
-                # dataset_infoが不足している場合、extended_configから復元
-                dataset_id = extended_config.get('dataset_id')
-                if dataset_id:
-                    try:
-                        from config.common import OUTPUT_RDE_DIR
-                        dataset_file_path = os.path.join(OUTPUT_RDE_DIR, "data", "datasets", f"{dataset_id}.json")
-                        if os.path.exists(dataset_file_path):
-                            with open(dataset_file_path, 'r', encoding='utf-8') as f:
-                                dataset_data = json.load(f)
-                            # dataset_infoとしてfile_setに設定
-                            file_set.dataset_info = dataset_data
-                            dataset_info = dataset_data
-                            logger.debug("ファイルセット用データセット情報復元: %s", dataset_data.get('attributes', {}).get('name', dataset_id))
-                        else:
-                            logger.warning("データセットファイルが見つかりません: %s", dataset_file_path)
-                            return {'success': False, 'error': 'データセット情報が取得できません'}
-                    except Exception as e:
-                        logger.error("データセット情報復元エラー: %s", e)
-                        return {'success': False, 'error': f'データセット情報復元エラー: {e}'}
-                else:
-                    return {'success': False, 'error': 'データセット情報が設定されていません'}
-            
-            # アップロード済みファイルを取得
-            valid_items = file_set.get_valid_items()
-            file_items = [item for item in valid_items if item.file_type == FileType.FILE]
-            display_items = self._get_display_file_items_for_fileset(file_set, file_items)
-            
-            # マッピングファイルも含める
-            mapping_file_path = self._get_mapping_file_path_for_fileset(file_set)
-            if mapping_file_path and os.path.exists(mapping_file_path):
-                mapping_item = FileItem(
-                    path=mapping_file_path,
-                    relative_path="path_mapping.xlsx",
-                    name="path_mapping.xlsx",
-                    file_type=FileType.FILE,
-                    item_type=FileItemType.ATTACHMENT  # 添付ファイルとして設定
-                )
-                logger.debug("path_mapping.xlsx を添付ファイルとして設定: %s", mapping_file_path)
-                for item in display_items:
-                    if item.name == "path_mapping.xlsx" and hasattr(item, 'upload_id'):
-                        mapping_item = item
-                        mapping_item.item_type = FileItemType.ATTACHMENT  # 既存アイテムも添付ファイルに設定
-                        break
-                else:
-                    display_items.append(mapping_item)
-            
-            # アップロードIDが設定されているファイルのみ
-            uploaded_files = [item for item in display_items if hasattr(item, 'upload_id') and item.upload_id]
-            
-            if not uploaded_files:
-                return {'success': False, 'error': 'アップロード済みファイルが見つかりません'}
-            
-            # フォーム値とペイロード構築
-            form_values = self._build_form_values_from_fileset(file_set)
-            dataFiles, attachments = self._build_files_payload_for_fileset(file_set, uploaded_files)
-            
-            if not dataFiles.get('data') and not attachments:
-                try:
-                    if fileset_progress is not None:
-                        fileset_progress.close()
-                except Exception:
-                    pass
-                return {'success': False, 'error': 'データファイルまたは添付ファイルが必要です'}
-            
-            # entry_dataを呼び出し（bearer_token=Noneで自動選択）
-            from ..core.data_register_logic import entry_data
-
-            # 通常登録の完了表示に upload 集計を反映させる
-            try:
-                if fileset_progress is not None:
-                    setattr(
-                        fileset_progress,
-                        "_upload_summary",
-                        {
-                            "upload_total": int(upload_result.get('total_files') or 0),
-                            "upload_success_data_files": int(len(dataFiles.get('data') or [])),
-                            "upload_success_attachments": int(len(attachments or [])),
-                            "failed_files": [],
-                        },
-                    )
-            except Exception:
-                pass
-            
-            result = entry_data(
-                bearer_token=None,
-                dataFiles=dataFiles,
-                attachements=attachments,
-                dataset_info=dataset_info,
-                form_values=form_values,
-                progress=fileset_progress,
-                require_confirmation=False,
-            )
-
-            try:
-                if fileset_progress is not None:
-                    fileset_progress.close()
-            except Exception:
-                pass
-            
-            if result and not result.get('error'):
-                # 成功処理
-                sample_info = self._extract_sample_info_from_response(result)
-                if sample_info:
-                    self._save_sample_info_to_fileset(file_set, sample_info)
-                    return {'success': True, 'sample_id': sample_info['sample_id']}
-                else:
-                    return {'success': True, 'sample_id': None}
-
-            # タイムアウト/応答待ち停止は「登録失敗」とは限らないため、登録状況で判定する
-            if isinstance(result, dict) and result.get('error') == 'timeout':
-                try:
-                    reg = result.get('registration_status')
-                    status = str((reg or {}).get('status') or '').strip().lower() if isinstance(reg, dict) else ''
-                except Exception:
-                    reg = None
-                    status = ''
-
-                # 直前に登録状況を確認できていてFAILEDでない限り成功扱い
-                if status and status != 'failed':
-                    return {'success': True, 'sample_id': None}
-
-                # status取得できない/FAILED の場合は「レスポンス待ちスキップ」として扱う
-                link_url = None
-                try:
-                    link_url = result.get('link_url')
-                except Exception:
-                    link_url = None
-                msg = "レスポンス待ちスキップ（タイムアウト/中断）"
-                if link_url:
-                    msg += f"\n{link_url}"
-                return {
-                    'success': False,
-                    'skipped': True,
-                    'skip_reason': 'response_wait_skipped',
-                    'error': msg,
-                    'error_details': result.get('detail') if isinstance(result, dict) else None,
-                }
-
-            # エラー処理
-            error_detail = result.get('detail', '不明なエラー') if result else 'レスポンスなし'
-            return {'success': False, 'error': error_detail}
-            
-        except Exception as e:
-            logger.error("ファイルセットデータ登録エラー: %s", e)
-            return {'success': False, 'error': str(e)}
-    
     def _get_display_file_items_for_fileset(self, file_set: FileSet, file_items: List[FileItem]) -> List[FileItem]:
         """ファイルセット用の表示ファイルアイテム取得"""
         display_items = []
@@ -5194,22 +4937,20 @@ class BatchRegisterPreviewDialog(QDialog):
             file_size = os.path.getsize(file_item.path)
             logger.debug("ファイルサイズ: %s bytes", file_size)
             
-            # ファイルを読み込み
-            with open(file_item.path, 'rb') as f:
-                binary_data = f.read()
-            
             logger.debug("リクエスト送信 - URL: %s", url)
             logger.debug("リクエスト送信 - ヘッダー: %s", headers)
             
-            # Bearer Token自動選択対応のpost_binaryを使用
+            # Bearer Token自動選択対応のpost_binaryを使用（本文はファイルから逐次読み出して送信）
             from classes.utils.api_request_helper import post_binary
+            from net.upload_stream import FileUploadStream
             
             logger.info("=== ファイルアップロード開始 ===")
             logger.info("URL: %s", url)
             logger.info("ファイル名: %s", register_filename)
             logger.info("ファイルサイズ: %s bytes", file_size)
             
-            resp = post_binary(url, binary_data, bearer_token=None, headers=headers)
+            with FileUploadStream(file_item.path) as body:
+                resp = post_binary(url, body, bearer_token=None, headers=headers)
             
             logger.info("=== アップロードレスポンス ===")
             logger.debug("レスポンス受信 - ステータス: %s", resp.status_code if resp else 'None')
@@ -5310,139 +5051,6 @@ class BatchRegisterPreviewDialog(QDialog):
             logger.debug("フォールバック名を使用: %s", fallback_name)
             return fallback_name
 
-    def _build_form_values_from_fileset(self, file_set: FileSet) -> dict:
-        """ファイルセット用のフォーム値構築（通常登録との互換性確保）"""
-        try:
-            form_values = {}
-            extended_config = getattr(file_set, 'extended_config', {})
-            
-            # 基本情報（extended_configを優先）
-            form_values['dataName'] = extended_config.get('data_name') or getattr(file_set, 'data_name', '') or f"一括登録_{file_set.name}"
-            form_values['basicDescription'] = extended_config.get('description') or getattr(file_set, 'description', '') or "一括登録によるデータ"
-            form_values['experimentId'] = extended_config.get('experiment_id') or getattr(file_set, 'experiment_id', '') or ""
-            
-            # 試料情報の処理
-            sample_mode = extended_config.get('sample_mode') or getattr(file_set, 'sample_mode', 'new')
-            sample_id_from_config = extended_config.get('sample_id') or getattr(file_set, 'sample_id', '')
-            
-            # 試料モードによる分岐処理（通常登録と同じ仕様）
-            if sample_mode == 'existing' and sample_id_from_config:
-                # 既存試料選択の場合：sampleIdを設定
-                form_values['sampleId'] = sample_id_from_config
-                # 参考値として試料情報も保持（通常登録と同じ構造）
-                form_values['sampleNames'] = extended_config.get('sample_name') or getattr(file_set, 'sample_name', '') or f"試料_{file_set.name}"
-                form_values['sampleDescription'] = extended_config.get('sample_description') or getattr(file_set, 'sample_description', '') or "一括登録試料"
-                form_values['sampleComposition'] = extended_config.get('sample_composition') or getattr(file_set, 'sample_composition', '') or ""
-                logger.debug("static既存試料ID設定: %s", sample_id_from_config)
-            else:
-                # 新規作成の場合：sampleNamesを設定（通常登録と同じ）
-                form_values['sampleNames'] = extended_config.get('sample_name') or getattr(file_set, 'sample_name', '') or f"試料_{file_set.name}"
-                form_values['sampleDescription'] = extended_config.get('sample_description') or getattr(file_set, 'sample_description', '') or "一括登録試料"
-                form_values['sampleComposition'] = extended_config.get('sample_composition') or getattr(file_set, 'sample_composition', '') or ""
-                # 追加の新規試料情報
-                form_values['sampleReferenceUrl'] = extended_config.get('reference_url') or getattr(file_set, 'reference_url', '') or ""
-                form_values['sampleTags'] = extended_config.get('tags') or getattr(file_set, 'tags', '') or ""
-                logger.debug("static新規試料情報設定完了: %s", form_values['sampleNames'])
-            
-            # 固有情報（カスタム値）の抽出 - ファイルセット属性とextended_configから
-            custom_values = getattr(file_set, 'custom_values', {}) or extended_config.get('custom_values', {})
-            
-            if not custom_values:
-                # custom_valuesが空の場合、extended_configから直接抽出
-                custom_values = {}
-                exclude_keys = {
-                    'data_name', 'description', 'experiment_id', 'reference_url', 'tags',
-                    'sample_mode', 'sample_id', 'sample_name', 'sample_description', 
-                    'sample_composition', 'dataset_id', 'dataset_name',
-                    'temp_folder', 'temp_created', 'mapping_file', 'last_sample_id',
-                    'last_sample_name', 'registration_timestamp', 'selected_dataset'
-                }
-                for key, value in extended_config.items():
-                    if key not in exclude_keys and value is not None and value != "":
-                        custom_values[key] = value
-            
-            form_values['custom'] = custom_values
-            
-            return form_values
-            
-        except Exception as e:
-            logger.error("フォーム値構築エラー: %s", e)
-            return {}
-    
-    def _build_files_payload_for_fileset(self, file_set: FileSet, uploaded_files: List[FileItem]) -> Tuple[dict, List[dict]]:
-        """ファイルセット用のファイルペイロード構築"""
-        try:
-            dataFiles = {"data": []}
-            attachments = []
-            mapping_upload_id = getattr(file_set, 'mapping_upload_id', None)
-            # 既存の添付ファイルupload_idを記録
-            attachment_ids = set()
-            for file_item in uploaded_files:
-                upload_id = getattr(file_item, 'upload_id', None)
-                if not upload_id:
-                    continue
-                item_type = getattr(file_item, 'item_type', None)
-                if item_type == FileItemType.ATTACHMENT:
-                    # path_mapping.xlsx 以外も含める
-                    attachments.append({
-                        "uploadId": upload_id,
-                        "description": file_item.name
-                    })
-                    attachment_ids.add(upload_id)
-                else:
-                    dataFiles["data"].append({
-                        "type": "upload",
-                        "id": upload_id
-                    })
-            # mapping_upload_id があれば必ず添付ファイルに追加（重複排除）
-            if mapping_upload_id and mapping_upload_id not in attachment_ids:
-                attachments.append({
-                    "uploadId": mapping_upload_id,
-                    "description": "path_mapping.xlsx"
-                })
-            return dataFiles, attachments
-        except Exception as e:
-            logger.error("ファイルペイロード構築エラー: %s", e)
-            return {"data": []}, []
-    
-    def _is_data_file_extension(self, file_item: FileItem) -> bool:
-        """拡張子ベースのデータファイル判定"""
-        data_extensions = {'.csv', '.xlsx', '.xls', '.txt', '.dat', '.json', '.xml'}
-        extension = getattr(file_item, 'extension', '')
-        return extension.lower() in data_extensions if extension else False
-    
-    def _save_sample_info_to_fileset(self, file_set: FileSet, sample_info: dict):
-        """ファイルセット用の試料情報保存"""
-        try:
-            if not hasattr(file_set, 'extended_config'):
-                file_set.extended_config = {}
-            
-            file_set.extended_config['last_sample_id'] = sample_info['sample_id']
-            file_set.extended_config['last_sample_name'] = sample_info.get('sample_name', '')
-            file_set.extended_config['registration_timestamp'] = str(datetime.now().isoformat())
-            
-        except Exception as e:
-            logger.warning("試料情報保存エラー: %s", e)
-    
-    def _extract_sample_info_from_response(self, response_data: dict) -> Optional[dict]:
-        """レスポンスから試料情報を抽出"""
-        try:
-            data = response_data.get('data', {})
-            relationships = data.get('relationships', {})
-            sample_data = relationships.get('sample', {}).get('data', {})
-            
-            if sample_data and sample_data.get('id'):
-                return {
-                    'sample_id': sample_data['id'],
-                    'sample_name': f"Sample_{sample_data['id'][:8]}"
-                }
-            
-            return None
-            
-        except Exception as e:
-            logger.warning("試料情報抽出エラー: %s", e)
-            return None
-    
     def _format_size(self, size_bytes: int) -> str:
         """ファイルサイズを人間が読みやすい形式に変換"""
         if size_bytes == 0:
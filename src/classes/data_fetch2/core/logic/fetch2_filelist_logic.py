@@ -259,9 +259,34 @@ def download_all_files_from_files_json(data_id, bearer_token=None, parent=None,
     if parent and parent.__class__.__name__ != 'DatasetUploadTab':
         safe_show_message(parent, "完了", f"{data_id} の全ファイルを保存しました。（{downloaded_count}/{total_images}件成功）", "information")
 
-def download_file_for_data_id(data_id, bearer_token=None, save_dir_base=None, file_name=None, grantNumber=None, dataset_name=None, tile_name=None, tile_number=None, parent=None):
+DOWNLOAD_PART_SUFFIX = ".part"
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+def _coerce_file_size(value):
+    """files API の fileSize を int に正規化（不明・不正値・0 は None）"""
+    try:
+        size = int(value)
+    except (TypeError, ValueError):
+        return None
+    return size if size > 0 else None
+
+
+def _parse_content_range_total(content_range):
+    """Content-Range: bytes start-end/total から total を取り出す（不明時は None）"""
+    if not content_range or "/" not in content_range:
+        return None
+    return _coerce_file_size(content_range.rsplit("/", 1)[1].strip())
+
+
+def download_file_for_data_id(data_id, bearer_token=None, save_dir_base=None, file_name=None, grantNumber=None, dataset_name=None, tile_name=None, tile_number=None, parent=None, expected_size=None):
     """
     指定data_idのファイル本体をAPIから取得し、output/rde/data/dataFiles/{data_id}/ に保存
+
+    ダウンロードは {file_name}.part に書き込み、完了・サイズ検証後にアトミックに本来のパスへ
+    リネームする。途中で失敗した .part が残っている場合は HTTP Range で続きから再開し、
+    サーバーが Range に対応しない（200 を返す）場合は先頭から取り直す。
+    expected_size（files API の fileSize）と既存ファイルのサイズが一致する場合は再取得しない。
     
     Args:
         data_id: データID
@@ -273,6 +298,7 @@ def download_file_for_data_id(data_id, bearer_token=None, save_dir_base=None, fi
         tile_name: タイル名
         tile_number: タイル番号
         parent: 親ウィジェット
+        expected_size: files API メタデータ上のファイルサイズ（バイト、省略可）
     """
     import os
     
@@ -313,14 +339,42 @@ def download_file_for_data_id(data_id, bearer_token=None, save_dir_base=None, fi
     }
     logger.info("Downloading file for data_id: %s from %s", data_id, url)
     try:
-        resp = download_request(url, bearer_token=None, timeout=30, headers=headers, stream=True)  # download_request returns Response object
+        save_path = os.path.join(save_dir, file_name)
+        part_path = save_path + DOWNLOAD_PART_SUFFIX
+        expected_size = _coerce_file_size(expected_size)
+
+        # 完了済みファイルのサイズがメタデータと一致すれば再ダウンロード不要
+        if expected_size is not None and os.path.isfile(save_path) and os.path.getsize(save_path) == expected_size:
+            logger.info("Skip (size matched %d bytes): %s", expected_size, save_path)
+            return save_path
+
+        resume_from = os.path.getsize(part_path) if os.path.isfile(part_path) else 0
+        if expected_size is not None and resume_from == expected_size:
+            # 前回は書き込み完了後のリネーム前に中断された
+            os.replace(part_path, save_path)
+            logger.info("Saved (completed .part): %s", save_path)
+            return save_path
+        if expected_size is not None and resume_from > expected_size:
+            resume_from = 0
+        request_headers = dict(headers)
+        if resume_from > 0:
+            request_headers["Range"] = f"bytes={resume_from}-"
+            logger.info("Resuming download from %d bytes: %s", resume_from, part_path)
+
+        resp = download_request(url, bearer_token=None, timeout=30, headers=request_headers, stream=True)  # download_request returns Response object
         logger.debug("%s -> HTTP %s ", url, resp.status_code if resp else 'No Response')
+        if resp is not None and resp.status_code == 416 and resume_from > 0:
+            # Range不成立（.part が既に完全、またはサーバー側ファイルが変わった）→ .part を捨てて先頭から取り直す
+            logger.info("Range not satisfiable, restarting download: %s", part_path)
+            resume_from = 0
+            request_headers.pop("Range", None)
+            resp = download_request(url, bearer_token=None, timeout=30, headers=request_headers, stream=True)
         if resp is None:
             logger.error("Request failed for data_id: %s", data_id)
             if parent:
                 safe_show_message(parent, "エラー", f"data_id {data_id} のダウンロードに失敗しました。", "warning")
             return False
-        if resp.status_code != 200:
+        if resp.status_code not in (200, 206):
             if parent:
                 from qt_compat.widgets import QMessageBox
                 logger.warning("data_id %s has no fileName in attributes, skipping download.", data_id)
@@ -342,11 +396,29 @@ def download_file_for_data_id(data_id, bearer_token=None, save_dir_base=None, fi
         if not fname:
             fname = os.path.basename(urlparse(url).path)
         fname = re.sub(r'[\\/:*?"<>|]', '_', fname)
-        save_path = os.path.join(save_dir, file_name)
-        with open(save_path, 'wb') as f:
-            for chunk in resp.iter_content(chunk_size=8192):
+
+        if resp.status_code == 206 and resume_from > 0:
+            mode = 'ab'
+            total_size = _parse_content_range_total(resp.headers.get('Content-Range'))
+        else:
+            # サーバーが Range を無視した場合は全体が返るので先頭から書き直す
+            mode = 'wb'
+            total_size = _coerce_file_size(resp.headers.get('Content-Length'))
+            if resp.headers.get('Content-Encoding'):
+                total_size = None
+        if expected_size is None:
+            expected_size = total_size
+
+        with open(part_path, mode) as f:
+            for chunk in resp.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
                 if chunk:
                     f.write(chunk)
+
+        written_size = os.path.getsize(part_path)
+        if expected_size is not None and written_size != expected_size:
+            # 途中切断: .part を残して次回 Range で再開できるようにする
+            raise IOError(f"incomplete download ({written_size}/{expected_size} bytes): {part_path}")
+        os.replace(part_path, save_path)
         logger.info("Saved: %s", save_path)
         return save_path
     except Exception as e:
@@ -552,7 +624,10 @@ def _process_data_entry_for_parallel(bearer_token, data_entry, save_dir_base, gr
                 continue
                 
             # ファイル本体をダウンロード
-            download_success = download_file_for_data_id(entry_data_id, bearer_token, save_dir_base_full, file_name, grantNumber, dataset_name, tile_name, tile_number, parent)
+            download_success = download_file_for_data_id(
+                entry_data_id, bearer_token, save_dir_base_full, file_name, grantNumber, dataset_name, tile_name, tile_number, parent,
+                expected_size=attributes_file.get("fileSize"),
+            )
             if download_success:
                 download_count += 1
                 if isinstance(download_success, str):
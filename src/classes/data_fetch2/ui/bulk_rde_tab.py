@@ -4,12 +4,10 @@ from __future__ import annotations
 
 import csv
 from concurrent.futures import ThreadPoolExecutor, as_completed
-import glob
 import json
 import os
 import shutil
 import time
-from threading import Lock
 import zipfile
 from typing import Any
 
@@ -46,8 +44,14 @@ from classes.utils.facility_link_helper import (
     load_equipment_name_map_from_merged_data2,
     load_instrument_local_id_map_from_instruments_json,
 )
+from classes.core.json_repository import load_json_cached, load_json_directory
 from classes.core.rde_search_index import ensure_rde_search_index, search_dataset_ids
-from classes.data_fetch2.util.parallel_search import resolve_parallel_workers, suggest_parallel_workers, parallel_filter
+from classes.data_fetch2.util.parallel_search import (
+    ColumnarFilterIndex,
+    parallel_filter,
+    resolve_parallel_workers,
+    suggest_parallel_workers,
+)
 
 
 def _to_text(value: Any) -> str:
@@ -210,13 +214,7 @@ def _build_tile_records(
 
 
 def _load_json_list_or_data(path: str) -> list[dict]:
-    if not path or not os.path.exists(path):
-        return []
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            payload = json.load(f)
-    except Exception:
-        return []
+    payload = _load_json_payload(path)
     if isinstance(payload, dict):
         data = payload.get("data")
         if isinstance(data, list):
@@ -227,13 +225,8 @@ def _load_json_list_or_data(path: str) -> list[dict]:
 
 
 def _load_json_payload(path: str) -> Any:
-    if not path or not os.path.exists(path):
-        return None
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except Exception:
-        return None
+    # 取得済みJSONは他タブと共有のリポジトリから読む（返り値は変更しない）
+    return load_json_cached(path)
 
 
 def _safe_attr(item: dict, key: str, default: str = "") -> str:
@@ -375,8 +368,7 @@ class DataFetch2BulkRdeTab(QWidget):
         self._source_dataset_count = 0
         self._last_source_signature: tuple[str, str, str, str] | None = None
         self._record_exact_indexes: dict[str, dict[str, set[int]]] = {}
-        self._entry_items_cache: dict[str, tuple[float, list[dict]]] = {}
-        self._entry_cache_lock = Lock()
+        self._record_columnar_index: ColumnarFilterIndex | None = None
         self._subgroup_info_cache: dict[str, dict[str, str]] | None = None
         self._sample_info_cache: dict[str, dict[str, str]] | None = None
         self._instrument_info_cache: dict[str, dict[str, str]] | None = None
@@ -781,11 +773,8 @@ class DataFetch2BulkRdeTab(QWidget):
         if not subgroup_path or not os.path.exists(subgroup_path):
             return result
 
-        payload: Any = None
-        try:
-            with open(subgroup_path, "r", encoding="utf-8") as f:
-                payload = json.load(f)
-        except Exception:
+        payload: Any = _load_json_payload(subgroup_path)
+        if payload is None:
             return result
 
         items: list[dict] = []
@@ -900,8 +889,7 @@ class DataFetch2BulkRdeTab(QWidget):
             self._sample_info_cache = result
             return result
 
-        for path in glob.glob(os.path.join(samples_dir, "*.json")):
-            payload = _load_json_payload(path)
+        for payload in load_json_directory(samples_dir).values():
             items: list[dict] = []
             if isinstance(payload, dict):
                 data = payload.get("data")
@@ -961,31 +949,9 @@ class DataFetch2BulkRdeTab(QWidget):
         return result
 
     def _read_entry_items(self, dataset_id: str) -> list[dict]:
-        path = self._entry_path(dataset_id)
-        if not os.path.exists(path):
-            return []
-        try:
-            mtime = float(os.path.getmtime(path))
-        except Exception:
-            mtime = -1.0
-
-        with self._entry_cache_lock:
-            cached = self._entry_items_cache.get(dataset_id)
-            if cached is not None:
-                cached_mtime, cached_items = cached
-                if cached_mtime == mtime:
-                    return list(cached_items)
-
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                payload = json.load(f)
-            items = payload.get("data") if isinstance(payload, dict) else []
-            parsed_items = list(items or [])
-            with self._entry_cache_lock:
-                self._entry_items_cache[dataset_id] = (mtime, parsed_items)
-            return list(parsed_items)
-        except Exception:
-            return []
+        payload = _load_json_payload(self._entry_path(dataset_id))
+        items = payload.get("data") if isinstance(payload, dict) else []
+        return list(items or [])
 
     def _current_filter_criteria(self) -> dict[str, str]:
         return {
@@ -1027,6 +993,44 @@ class DataFetch2BulkRdeTab(QWidget):
             and _contains(_to_text(rec.get("related_datasets")), criteria.get("related", ""))
         )
 
+    def _build_record_columnar_index(self, records: list[dict]):
+        """部分一致フィルタ用の列指向インデックスを構築する（条件キーは _current_filter_criteria と共通）。"""
+        self._record_columnar_index = ColumnarFilterIndex.from_records(
+            records,
+            {
+                "subgroup": lambda rec: _join_non_empty([
+                    _to_text(rec.get("subgroup")),
+                    _to_text(rec.get("subgroup_display")),
+                    self._resolve_subgroup_display(rec.get("subgroup", "")),
+                ]),
+                "grant": lambda rec: _to_text(rec.get("grant_number")),
+                "sample_name": lambda rec: _to_text(rec.get("sample_name")),
+                "sample_uuid": lambda rec: _to_text(rec.get("sample_uuid")),
+                "template": lambda rec: _to_text(rec.get("template")),
+                "equip_name": lambda rec: _to_text(rec.get("equipment_name")),
+                "equip_local": lambda rec: _join_non_empty([
+                    _to_text(rec.get("equipment_local_id")),
+                    _to_text(rec.get("equipment_name")),
+                ]),
+                "tags": lambda rec: _to_text(rec.get("tags")),
+                "related": lambda rec: _to_text(rec.get("related_datasets")),
+            },
+        )
+
+    def _filter_rows_with_columnar_index(self) -> list[dict]:
+        index = self._record_columnar_index
+        records = self._all_records
+        candidate_rows = self._candidate_rows_from_exact_indexes()
+        if candidate_rows is not None and not candidate_rows:
+            return []
+        rows = index.match_rows(
+            self._current_filter_criteria(),
+            rows=candidate_rows,
+            max_workers=self._effective_search_workers(),
+            cancel_checker=lambda: self._cancel_search_requested,
+        )
+        return [records[idx] for idx in rows]
+
     def _parallel_filter_records(self, candidates: list[dict]) -> list[dict]:
         criteria = self._current_filter_criteria()
         workers = self._effective_search_workers()
@@ -1095,6 +1099,16 @@ class DataFetch2BulkRdeTab(QWidget):
         if not self._all_records or not self._record_exact_indexes:
             return self._all_records
 
+        candidate_rows = self._candidate_rows_from_exact_indexes()
+        if candidate_rows is None:
+            return self._all_records
+        return [self._all_records[idx] for idx in sorted(candidate_rows)]
+
+    def _candidate_rows_from_exact_indexes(self) -> set[int] | None:
+        """完全一致インデックスで絞り込んだ候補行番号（条件なしなら None）。"""
+        if not self._record_exact_indexes:
+            return None
+
         criteria: list[tuple[str, str]] = [
             ("subgroup", self._combo_selected_user_value(self.f_subgroup)),
             ("grant", self._combo_selected_user_value(self.f_grant)),
@@ -1115,11 +1129,9 @@ class DataFetch2BulkRdeTab(QWidget):
             else:
                 candidate_rows &= current
             if not candidate_rows:
-                return []
+                return set()
 
-        if candidate_rows is None:
-            return self._all_records
-        return [self._all_records[idx] for idx in sorted(candidate_rows)]
+        return candidate_rows
 
     def _build_all_records_from_sources(self) -> list[dict]:
         self._build_cancelled = False
@@ -1258,8 +1270,11 @@ class DataFetch2BulkRdeTab(QWidget):
             self.status.setText("検索結果: 0 タイル")
             return
 
-        candidates = self._candidate_records_from_exact_indexes()
-        filtered_records = self._parallel_filter_records(candidates)
+        if self._record_columnar_index is not None and self._record_columnar_index.row_count == len(self._all_records):
+            filtered_records = self._filter_rows_with_columnar_index()
+        else:
+            candidates = self._candidate_records_from_exact_indexes()
+            filtered_records = self._parallel_filter_records(candidates)
         self._records = filtered_records
         self._current_page = 1
         current_keys = {self._record_key(rec) for rec in self._records}
@@ -1315,6 +1330,7 @@ class DataFetch2BulkRdeTab(QWidget):
                 self._suppress_filter_dirty = False
             self._all_records = records
             self._build_record_exact_indexes(self._all_records)
+            self._build_record_columnar_index(self._all_records)
             self._last_source_signature = signature
         else:
             self.rebuild_progress.setVisible(False)
@@ -1430,8 +1446,7 @@ class DataFetch2BulkRdeTab(QWidget):
         subgroup_items: list[dict] = []
         if subgroup_path and os.path.exists(subgroup_path):
             try:
-                with open(subgroup_path, "r", encoding="utf-8") as f:
-                    subgroup_payload = json.load(f)
+                subgroup_payload = _load_json_payload(subgroup_path)
                 if isinstance(subgroup_payload, dict):
                     included = subgroup_payload.get("included")
                     if isinstance(included, list):
@@ -1468,8 +1483,7 @@ class DataFetch2BulkRdeTab(QWidget):
         subgroup_items: list[dict] = []
         if subgroup_path and os.path.exists(subgroup_path):
             try:
-                with open(subgroup_path, "r", encoding="utf-8") as f:
-                    subgroup_payload = json.load(f)
+                subgroup_payload = _load_json_payload(subgroup_path)
                 if isinstance(subgroup_payload, dict):
                     included = subgroup_payload.get("included")
                     if isinstance(included, list):
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import logging
 import os
+import sys
 from concurrent.futures import as_completed
 from concurrent.futures import ThreadPoolExecutor
-from typing import Callable, TypeVar
+from typing import Callable, Iterable, TypeVar
+
+logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
@@ -64,3 +68,128 @@ def parallel_filter(
             filtered.extend(future.result())
 
     return filtered
+
+
+# --- 列指向フィルタエンジン -------------------------------------------------
+#
+# レコードをフィールドごとの列（辞書エンコード済み）として保持し、条件ごとに
+# 「列のユニーク値」に対して一括で部分一致判定してから行番号へ展開する。
+# 同じ値を持つ行が多いタイル一覧では、判定回数が行数ではなくユニーク値数に比例する。
+
+
+def _match_values_chunk(values: list[str], needle: str) -> list[int]:
+    """ユニーク値チャンクのうち needle を含む位置を返す。"""
+    return [i for i, value in enumerate(values) if needle in value]
+
+
+class _Column:
+    __slots__ = ("values", "codes")
+
+    def __init__(self, values: list[str], codes: list[int]):
+        self.values = values
+        self.codes = codes
+
+
+class ColumnarFilterIndex:
+    """タイルレコードを列指向で保持し、部分一致条件を列単位でまとめて評価する。
+
+    各列は casefold 済み・intern 済みのユニーク値配列と、行→値コードの配列で構成される。
+    `match_rows` は条件ごとに一致する値コードを求め、一致行の行番号（昇順）を返す。
+    """
+
+    def __init__(self, columns: dict[str, _Column], row_count: int):
+        self._columns = columns
+        self._row_count = int(row_count)
+
+    @classmethod
+    def from_records(
+        cls,
+        records: list[T],
+        extractors: dict[str, Callable[[T], str]],
+    ) -> "ColumnarFilterIndex":
+        columns: dict[str, _Column] = {}
+        for field, extract in extractors.items():
+            value_to_code: dict[str, int] = {}
+            values: list[str] = []
+            codes: list[int] = []
+            for rec in records:
+                key = sys.intern(str(extract(rec) or "").casefold())
+                code = value_to_code.get(key)
+                if code is None:
+                    code = len(values)
+                    value_to_code[key] = code
+                    values.append(key)
+                codes.append(code)
+            columns[field] = _Column(values, codes)
+        return cls(columns, len(records))
+
+    @property
+    def row_count(self) -> int:
+        return self._row_count
+
+    def fields(self) -> list[str]:
+        return list(self._columns.keys())
+
+    def match_rows(
+        self,
+        criteria: dict[str, str],
+        *,
+        rows: Iterable[int] | None = None,
+        max_workers: int = 1,
+        cancel_checker: Callable[[], bool] | None = None,
+    ) -> list[int]:
+        """全条件に部分一致する行番号を昇順で返す（空の条件は無視）。
+
+        Args:
+            criteria: {field: needle}。needle は casefold して部分一致判定する。
+            rows: 事前に絞り込んだ候補行（完全一致インデックス等）。None なら全行。
+            max_workers: ユニーク値判定の並列数。
+            cancel_checker: True を返した時点で評価を打ち切り、空リストを返す。
+        """
+        active: list[tuple[_Column, str]] = []
+        for field, needle in criteria.items():
+            text = str(needle or "").strip()
+            if not text:
+                continue
+            column = self._columns.get(field)
+            if column is None:
+                raise KeyError(field)
+            active.append((column, text.casefold()))
+
+        candidate = list(range(self._row_count)) if rows is None else sorted(set(rows))
+        for column, needle in active:
+            if callable(cancel_checker) and cancel_checker():
+                return []
+            hit = self._match_column_values(column.values, needle, max_workers)
+            codes = column.codes
+            candidate = [row for row in candidate if hit[codes[row]]]
+            if not candidate:
+                break
+        return candidate
+
+    @staticmethod
+    def _match_column_values(
+        values: list[str],
+        needle: str,
+        max_workers: int,
+    ) -> bytearray:
+        hit = bytearray(len(values))
+        workers = max(1, int(max_workers))
+        if workers <= 1 or len(values) < 2000:
+            for i, value in enumerate(values):
+                if needle in value:
+                    hit[i] = 1
+            return hit
+
+        chunk_size = max(1000, len(values) // (workers * 2))
+        starts = list(range(0, len(values), chunk_size))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(_match_values_chunk, values[start : start + chunk_size], needle): start
+                for start in starts
+            }
+            for future in as_completed(futures):
+                start = futures[future]
+                for offset in future.result():
+                    hit[start + offset] = 1
+        return hit
@@ -7,9 +7,9 @@
 import re
 import json
 from typing import Dict, Optional, Any, List, Tuple
-from bs4 import BeautifulSoup
 
 from classes.managers.log_manager import get_logger
+from classes.utils.html_parsing import make_soup
 from net.http_helpers import proxy_get
 from classes.reports.core.report_scraper import ReportScraper
 from classes.ai.core.ai_manager import AIManager
@@ -429,7 +429,7 @@ def extract_important_tech_areas_from_report_direct(report_url: str) -> Dict[str
         response.raise_for_status()
         
         # BeautifulSoupでパース
-        soup = BeautifulSoup(response.text, 'lxml')
+        soup = make_soup(response.text)
         
         # 技術領域のセクションを検索
         tech_area_tag = soup.find('h5', string='技術領域 / Technology Area')
@@ -1,10 +1,39 @@
 from __future__ import annotations
 
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Iterable, List, Tuple
+from typing import BinaryIO, Callable, Dict, Iterable, List, Optional, Tuple
+import math
 import os
+import shutil
+import struct
+import sys
+import tempfile
+import threading
+import time
 import zipfile
+import zlib
+
+# 圧縮済み形式（deflate しても縮まないため ZIP_STORED で格納する）
+INCOMPRESSIBLE_EXTENSIONS = frozenset(
+    {
+        ".jpg", ".jpeg", ".png", ".gif", ".webp", ".heic", ".jp2",
+        ".zip", ".gz", ".tgz", ".bz2", ".xz", ".7z", ".rar", ".zst", ".lz4",
+        ".docx", ".xlsx", ".pptx", ".odt", ".ods", ".odp",
+        ".mp4", ".mov", ".avi", ".mkv", ".mp3", ".m4a", ".aac", ".ogg", ".flac",
+    }
+)
+# 拡張子で判定できないファイル（tif など圧縮有無が混在する形式を含む）はサンプルのエントロピーで判定
+ENTROPY_SAMPLE_BYTES = 16 * 1024
+ENTROPY_STORE_THRESHOLD = 7.5  # bits/byte
+ENTROPY_MIN_FILE_BYTES = 64 * 1024
+# この大きさ以上の圧縮対象はワーカースレッドで並列に圧縮する（zlib は圧縮中に GIL を解放する）
+PARALLEL_COMPRESS_MIN_BYTES = 4 * 1024 * 1024
+ZIP_COPY_CHUNK_BYTES = 1024 * 1024
+# 1 メンバーの書き込み中に進捗を通知する間隔（秒）
+ZIP_PROGRESS_INTERVAL = 0.2
 
 
 @dataclass(frozen=True)
@@ -52,30 +81,405 @@ def format_bytes(num_bytes: int) -> str:
     return f"{int(num_bytes)} B"
 
 
+class ZipBuildCancelled(RuntimeError):
+    """Raised when the user cancels building the contents zip."""
+
+
+@dataclass(frozen=True)
+class _ZipMember:
+    src: str
+    arcname: str
+    size: int
+    compress_type: int
+
+
+def _sample_entropy(path: str, size: int) -> float:
+    """先頭・中央・末尾のサンプルから 1 バイトあたりのエントロピー（bits）を求める"""
+    offsets = {0, max(0, size // 2 - ENTROPY_SAMPLE_BYTES // 2), max(0, size - ENTROPY_SAMPLE_BYTES)}
+    counts: Counter = Counter()
+    total = 0
+    with open(path, "rb") as f:
+        for offset in sorted(offsets):
+            f.seek(offset)
+            chunk = f.read(ENTROPY_SAMPLE_BYTES)
+            counts.update(chunk)
+            total += len(chunk)
+    if total <= 0:
+        return 0.0
+    return -sum((n / total) * math.log2(n / total) for n in counts.values())
+
+
+def choose_compress_type(path: str, size: int) -> int:
+    """格納方式を決める（圧縮済み形式・高エントロピーのファイルは ZIP_STORED）"""
+    if Path(path).suffix.lower() in INCOMPRESSIBLE_EXTENSIONS:
+        return zipfile.ZIP_STORED
+    if size < ENTROPY_MIN_FILE_BYTES:
+        return zipfile.ZIP_DEFLATED
+    try:
+        if _sample_entropy(path, size) >= ENTROPY_STORE_THRESHOLD:
+            return zipfile.ZIP_STORED
+    except OSError:
+        pass
+    return zipfile.ZIP_DEFLATED
+
+
+def _copy_member_data(
+    fin: BinaryIO,
+    fout: BinaryIO,
+    compress_type: int,
+    on_chunk: Optional[Callable[[int], None]] = None,
+) -> Tuple[int, int, int]:
+    """fin を格納方式に従って fout に書き出し (CRC32, 元サイズ, 格納サイズ) を返す（deflate は raw）"""
+    compressor = None
+    if compress_type == zipfile.ZIP_DEFLATED:
+        compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+    crc = 0
+    file_size = 0
+    compress_size = 0
+    while True:
+        chunk = fin.read(ZIP_COPY_CHUNK_BYTES)
+        if not chunk:
+            break
+        file_size += len(chunk)
+        crc = zlib.crc32(chunk, crc)
+        data = compressor.compress(chunk) if compressor is not None else chunk
+        compress_size += len(data)
+        fout.write(data)
+        if on_chunk is not None:
+            on_chunk(len(chunk))
+    if compressor is not None:
+        data = compressor.flush()
+        compress_size += len(data)
+        fout.write(data)
+    return crc, file_size, compress_size
+
+
+def _deflate_to_file(src: str, dest: str, abort: threading.Event) -> Tuple[int, int, int]:
+    """src を raw deflate で dest に書き出し (CRC32, 元サイズ, 圧縮後サイズ) を返す（ワーカースレッド用）"""
+
+    def check_abort(_nbytes: int) -> None:
+        if abort.is_set():
+            raise ZipBuildCancelled("ZIP作成が中断されました")
+
+    with open(src, "rb") as fin, open(dest, "wb") as fout:
+        return _copy_member_data(fin, fout, zipfile.ZIP_DEFLATED, check_abort)
+
+
+@dataclass
+class _ZipEntry:
+    name: bytes
+    flags: int
+    compress_type: int
+    dos_time: int
+    dos_date: int
+    external_attr: int
+    header_offset: int
+    zip64_local: bool
+    crc: int = 0
+    file_size: int = 0
+    compress_size: int = 0
+
+
+class _ZipStreamWriter:
+    """ZIP を先頭から順に書き出す（APPNOTE.TXT の書式。必要に応じて ZIP64 拡張を使う）
+
+    メンバーのデータはヘッダの直後に呼び出し元が fp へ書き込み、CRC・サイズは end() で
+    ローカルヘッダに書き戻す（ワーカーで圧縮済みのデータもそのまま格納できる）。
+    """
+
+    _LOCAL_HEADER = struct.Struct("<4s5H3L2H")
+    _CENTRAL_HEADER = struct.Struct("<4s6H3L5H2L")
+    _END_RECORD = struct.Struct("<4s4H2LH")
+    _END_RECORD64 = struct.Struct("<4sQ2H2L4Q")
+    _END_LOCATOR64 = struct.Struct("<4sLQL")
+    _MAX_32 = 0xFFFFFFFF
+    _MAX_16 = 0xFFFF
+
+    def __init__(self, fp: BinaryIO):
+        self.fp = fp
+        self._entries: List[_ZipEntry] = []
+        self._create_system = 0 if sys.platform == "win32" else 3
+
+    def begin(self, member: _ZipMember, compress_type: int, size_hint: int) -> _ZipEntry:
+        """ローカルヘッダを書き出す（CRC・サイズは仮の値）"""
+        st = os.stat(member.src)
+        year, month, day, hour, minute, second = time.localtime(st.st_mtime)[:6]
+        if year < 1980:
+            year, month, day, hour, minute, second = 1980, 1, 1, 0, 0, 0
+        name = member.arcname.replace(os.sep, "/")
+        try:
+            encoded = name.encode("ascii")
+            flags = 0
+        except UnicodeEncodeError:
+            encoded = name.encode("utf-8")
+            flags = 0x800
+        # 圧縮後のサイズは事前に分からないため、zipfile と同じく余裕を見て ZIP64 の要否を決める
+        zip64 = size_hint * 1.05 > zipfile.ZIP64_LIMIT
+        entry = _ZipEntry(
+            name=encoded,
+            flags=flags,
+            compress_type=compress_type,
+            dos_time=(hour << 11) | (minute << 5) | (second // 2),
+            dos_date=((year - 1980) << 9) | (month << 5) | day,
+            external_attr=(st.st_mode & 0xFFFF) << 16,
+            header_offset=self.fp.tell(),
+            zip64_local=zip64,
+        )
+        extra = struct.pack("<2H2Q", 1, 16, 0, 0) if zip64 else b""
+        self.fp.write(
+            self._LOCAL_HEADER.pack(
+                b"PK\x03\x04", 45 if zip64 else 20, flags, compress_type, entry.dos_time, entry.dos_date,
+                0, self._MAX_32 if zip64 else 0, self._MAX_32 if zip64 else 0, len(encoded), len(extra),
+            )
+        )
+        self.fp.write(encoded)
+        self.fp.write(extra)
+        return entry
+
+    def end(self, entry: _ZipEntry, crc: int, file_size: int, compress_size: int) -> None:
+        """メンバーのデータを書き終えた後、CRC・サイズをローカルヘッダに書き戻す"""
+        if not entry.zip64_local and max(file_size, compress_size) > zipfile.ZIP64_LIMIT:
+            raise RuntimeError(f"ZIP作成中にファイルサイズが変化しました: {entry.name.decode('utf-8')}")
+        entry.crc = crc
+        entry.file_size = file_size
+        entry.compress_size = compress_size
+        end_offset = self.fp.tell()
+        self.fp.seek(entry.header_offset + 14)
+        if entry.zip64_local:
+            self.fp.write(struct.pack("<L", crc))
+            self.fp.seek(entry.header_offset + self._LOCAL_HEADER.size + len(entry.name) + 4)
+            self.fp.write(struct.pack("<2Q", file_size, compress_size))
+        else:
+            self.fp.write(struct.pack("<3L", crc, compress_size, file_size))
+        self.fp.seek(end_offset)
+        self._entries.append(entry)
+
+    def close(self) -> None:
+        """セントラルディレクトリと終端レコードを書き出す"""
+        cd_offset = self.fp.tell()
+        for entry in self._entries:
+            extra_fields = []
+            file_size, compress_size, header_offset = entry.file_size, entry.compress_size, entry.header_offset
+            if file_size > zipfile.ZIP64_LIMIT:
+                extra_fields.append(file_size)
+                file_size = self._MAX_32
+            if compress_size > zipfile.ZIP64_LIMIT:
+                extra_fields.append(compress_size)
+                compress_size = self._MAX_32
+            if header_offset > zipfile.ZIP64_LIMIT:
+                extra_fields.append(header_offset)
+                header_offset = self._MAX_32
+            extra = b""
+            if extra_fields:
+                extra = struct.pack(f"<2H{len(extra_fields)}Q", 1, 8 * len(extra_fields), *extra_fields)
+            version = 45 if extra_fields or entry.zip64_local else 20
+            self.fp.write(
+                self._CENTRAL_HEADER.pack(
+                    b"PK\x01\x02", (self._create_system << 8) | version, version, entry.flags,
+                    entry.compress_type, entry.dos_time, entry.dos_date, entry.crc, compress_size, file_size,
+                    len(entry.name), len(extra), 0, 0, 0, entry.external_attr, header_offset,
+                )
+            )
+            self.fp.write(entry.name)
+            self.fp.write(extra)
+
+        count = len(self._entries)
+        cd_end = self.fp.tell()
+        cd_size = cd_end - cd_offset
+        if count >= self._MAX_16 or cd_offset > zipfile.ZIP64_LIMIT or cd_size > zipfile.ZIP64_LIMIT:
+            self.fp.write(
+                self._END_RECORD64.pack(
+                    b"PK\x06\x06", self._END_RECORD64.size - 12, 45, 45, 0, 0, count, count, cd_size, cd_offset,
+                )
+            )
+            self.fp.write(self._END_LOCATOR64.pack(b"PK\x06\x07", 0, cd_end, 1))
+            count = min(count, self._MAX_16)
+            cd_size = min(cd_size, self._MAX_32)
+            cd_offset = min(cd_offset, self._MAX_32)
+        self.fp.write(self._END_RECORD.pack(b"PK\x05\x06", 0, 0, count, count, cd_size, cd_offset, 0))
+
+
+def _plan_members(base_dir: str, files: Iterable[SelectedFile]) -> List[_ZipMember]:
+    members: List[_ZipMember] = []
+    for f in files or []:
+        src = Path(f.local_path)
+        if not src.exists() or not src.is_file():
+            continue
+        try:
+            arcname = os.path.relpath(str(src), str(base_dir))
+        except Exception:
+            arcname = src.name
+        size = src.stat().st_size
+        members.append(_ZipMember(str(src), arcname, size, choose_compress_type(str(src), size)))
+    return members
+
+
+def _write_member_streaming(
+    writer: _ZipStreamWriter,
+    member: _ZipMember,
+    on_chunk: Callable[[int], None],
+) -> None:
+    entry = writer.begin(member, member.compress_type, member.size)
+    with open(member.src, "rb") as fsrc:
+        crc, file_size, compress_size = _copy_member_data(fsrc, writer.fp, member.compress_type, on_chunk)
+    writer.end(entry, crc, file_size, compress_size)
+
+
+def _write_member_precompressed(
+    writer: _ZipStreamWriter,
+    member: _ZipMember,
+    data_path: str,
+    crc: int,
+    file_size: int,
+    compress_size: int,
+    check_cancel: Callable[[], None],
+) -> None:
+    """ワーカーで圧縮済みのデータをそのままメンバーとして書き出す"""
+    entry = writer.begin(member, zipfile.ZIP_DEFLATED, max(file_size, compress_size))
+    with open(data_path, "rb") as fdata:
+        while True:
+            chunk = fdata.read(ZIP_COPY_CHUNK_BYTES)
+            if not chunk:
+                break
+            writer.fp.write(chunk)
+            check_cancel()
+    writer.end(entry, crc, file_size, compress_size)
+
+
+def _default_zip_workers() -> int:
+    return max(1, min(8, (os.cpu_count() or 1)))
+
+
 def build_zip(
     zip_path: str,
     base_dir: str,
     files: Iterable[SelectedFile],
+    *,
+    progress_callback: Optional[Callable[[int, int, str], None]] = None,
+    cancel_checker: Optional[Callable[[], bool]] = None,
+    max_workers: Optional[int] = None,
 ) -> str:
     """指定ファイルを zip にまとめる。
 
     - zip 内のパスは base_dir からの相対パスにする（ディレクトリ構造保持）。
+    - 圧縮済み形式（拡張子・サンプルのエントロピーで判定）は ZIP_STORED で格納する。
+    - 大きな圧縮対象はワーカースレッドで raw deflate に並列圧縮し、ZIP のヘッダはこちらで書き出す。
+      その他のメンバーはチャンク単位に順に書き込む。
+    - progress_callback(処理済みバイト数, 合計バイト数, メッセージ) で進捗を通知する
+      （大きなメンバーの書き込み中も一定間隔で通知する）。
+    - cancel_checker が True を返したら作成途中のファイルを削除して ZipBuildCancelled を送出する。
     """
 
     zip_path_p = Path(zip_path)
     zip_path_p.parent.mkdir(parents=True, exist_ok=True)
 
-    base_dir_p = Path(base_dir)
-
-    with zipfile.ZipFile(zip_path_p, "w", compression=zipfile.ZIP_DEFLATED) as zf:
-        for f in files or []:
-            src = Path(f.local_path)
-            if not src.exists() or not src.is_file():
-                continue
-            try:
-                arcname = os.path.relpath(str(src), str(base_dir_p))
-            except Exception:
-                arcname = src.name
-            zf.write(str(src), arcname=arcname)
+    members = _plan_members(base_dir, files)
+    total_bytes = sum(m.size for m in members)
+    done_bytes = 0
+    message = ""
+    last_report = 0.0
+
+    def check_cancel() -> None:
+        if callable(cancel_checker) and cancel_checker():
+            raise ZipBuildCancelled("ZIP作成がキャンセルされました")
+
+    def report(text: Optional[str] = None, *, throttle: bool = False) -> None:
+        nonlocal message, last_report
+        if text is not None:
+            message = text
+        now = time.monotonic()
+        if throttle and now - last_report < ZIP_PROGRESS_INTERVAL:
+            return
+        last_report = now
+        if callable(progress_callback):
+            progress_callback(done_bytes, total_bytes, message)
+
+    def on_chunk(nbytes: int) -> None:
+        nonlocal done_bytes
+        done_bytes += nbytes
+        check_cancel()
+        report(throttle=True)
+
+    workers = max(1, int(max_workers or _default_zip_workers()))
+    parallel_indices = [
+        i
+        for i, m in enumerate(members)
+        if m.compress_type == zipfile.ZIP_DEFLATED and m.size >= PARALLEL_COMPRESS_MIN_BYTES
+    ]
+    if workers <= 1 or len(parallel_indices) <= 1:
+        parallel_indices = []
+    parallel_set = set(parallel_indices)
+
+    part_path = zip_path_p.with_name(zip_path_p.name + ".part")
+    tmp_dir = tempfile.mkdtemp(prefix=".zip-", dir=str(zip_path_p.parent))
+    executor = None
+    completed = False
+    abort = threading.Event()
+    pending: Dict[int, Future] = {}
+    queue = list(parallel_indices)
+
+    def submit_ahead() -> None:
+        # 先行して圧縮するのは並列数の2倍まで（一時ファイルの容量を抑える）
+        while executor is not None and queue and len(pending) < workers * 2:
+            index = queue.pop(0)
+            dest = os.path.join(tmp_dir, f"{index}.deflate")
+            pending[index] = executor.submit(_deflate_to_file, members[index].src, dest, abort)
+
+    try:
+        if parallel_indices:
+            executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="zip-deflate")
+            submit_ahead()
+
+        with open(part_path, "wb") as fp:
+            writer = _ZipStreamWriter(fp)
+            for index, member in enumerate(members):
+                check_cancel()
+                report(f"{index + 1}/{len(members)}: {member.arcname}")
+                submit_ahead()
+                if index not in parallel_set:
+                    _write_member_streaming(writer, member, on_chunk)
+                    continue
+
+                dest = os.path.join(tmp_dir, f"{index}.deflate")
+                future = pending.pop(index, None)
+                result = None
+                if future is not None:
+                    while not wait([future], timeout=ZIP_PROGRESS_INTERVAL).done:
+                        check_cancel()
+                        report(throttle=True)
+                    try:
+                        result = future.result()
+                    except OSError:
+                        result = None
+                if result is None:
+                    # ワーカーで圧縮できなかったメンバーは呼び出し元で圧縮する
+                    _write_member_streaming(writer, member, on_chunk)
+                    continue
+                crc, file_size, compress_size = result
+                _write_member_precompressed(writer, member, dest, crc, file_size, compress_size, check_cancel)
+                try:
+                    os.remove(dest)
+                except OSError:
+                    pass
+                on_chunk(member.size)
+            writer.close()
+        report("ZIP作成完了")
+        os.replace(part_path, zip_path_p)
+        completed = True
+    except BaseException:
+        try:
+            part_path.unlink()
+        except OSError:
+            pass
+        raise
+    finally:
+        for future in pending.values():
+            future.cancel()
+        if executor is not None:
+            # キャンセル・エラー時は実行中の圧縮をチャンク単位で打ち切らせ、一時ファイルを閉じてから削除する
+            if not completed:
+                abort.set()
+            executor.shutdown(wait=True, cancel_futures=True)
+        shutil.rmtree(tmp_dir, ignore_errors=True)
 
     return str(zip_path_p)
@@ -18,7 +18,7 @@ from net.session_manager import create_new_proxy_session
 from classes.managers.log_manager import get_logger
 from .auth_manager import PortalCredentials
 from ..conf.config import get_data_portal_config
-from bs4 import BeautifulSoup
+from classes.utils.html_parsing import make_soup
 
 logger = get_logger("DataPortal.PortalClient")
 
@@ -349,7 +349,7 @@ class PortalClient:
             parsed_fields: Dict[str, Any] = {}
             post_target: str = "index.php"
             try:
-                soup = BeautifulSoup(response.text, 'lxml')
+                soup = make_soup(response.text)
 
                 # 候補フォームを収集
                 candidate_forms = soup.find_all('form')
@@ -551,7 +551,7 @@ class PortalClient:
         candidates: list[tuple[Optional[datetime], int, str]] = []
 
         try:
-            soup = BeautifulSoup(text, 'html.parser')
+            soup = make_soup(text)
             order = 0
             for form in soup.find_all('form'):
                 fields: Dict[str, str] = {}
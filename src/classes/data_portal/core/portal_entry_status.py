@@ -10,14 +10,17 @@ All file paths must be obtained via config.common.get_dynamic_file_path.
 
 from __future__ import annotations
 
+import atexit
 import json
 import os
 import threading
 import time
 from dataclasses import dataclass
+from datetime import datetime
 from typing import Any, Dict, Optional
 
 from classes.managers.log_manager import get_logger
+from classes.utils.html_parsing import make_soup, memoize_parse
 from config.common import get_dynamic_file_path
 
 logger = get_logger("DataPortal.PortalEntryStatus")
@@ -87,6 +90,7 @@ def _all_persisted_cache_paths() -> list[str]:
     return paths
 
 
+@memoize_parse()
 def parse_portal_entry_search_html(
     html: str,
     dataset_id: str,
@@ -126,9 +130,7 @@ def parse_portal_entry_search_html(
             can_edit = False
 
         try:
-            from bs4 import BeautifulSoup
-
-            soup = BeautifulSoup(text, "html.parser")
+            soup = make_soup(text)
 
             try:
                 dataset_row = None
@@ -285,9 +287,7 @@ def parse_portal_contents_link_search_html(html: str, dataset_id: str) -> bool:
 
     # Prefer structured parsing.
     try:
-        from bs4 import BeautifulSoup
-
-        soup = BeautifulSoup(text, "html.parser")
+        soup = make_soup(text)
         for td in soup.find_all("td", {"class": "l"}):
             if td is None:
                 continue
@@ -325,16 +325,29 @@ def parse_portal_contents_link_search_html(html: str, dataset_id: str) -> bool:
 
 
 class PortalEntryStatusCache:
+    """Dataset portal labels keyed by environment, persisted with write coalescing.
+
+    Updates only mark the cache dirty; the JSON files are rewritten once per
+    ``FLUSH_DELAY_SECONDS`` on a background timer (and at interpreter exit or on
+    ``flush()``), so a refresh over thousands of datasets writes a handful of times
+    instead of once per label.
+    """
+
+    FLUSH_DELAY_SECONDS = 2.0
+
     def __init__(self) -> None:
         self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
         self._loaded = False
-        self._items: Dict[str, Dict[str, Any]] = {}
+        # environment -> dataset_id -> {"label": str, "checked_at": float}
+        self._items_by_env: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._generation = 0
+        self._saved_generation = 0
+        self._flush_timer: Optional[threading.Timer] = None
 
     @staticmethod
-    def _key(environment: str, dataset_id: str) -> str:
-        env = str(environment or DEFAULT_ENVIRONMENT).strip() or DEFAULT_ENVIRONMENT
-        dsid = str(dataset_id or "").strip()
-        return f"{env}:{dsid}"
+    def _env(environment: Optional[str]) -> str:
+        return str(environment or DEFAULT_ENVIRONMENT).strip() or DEFAULT_ENVIRONMENT
 
     def _ensure_loaded(self) -> None:
         if self._loaded:
@@ -365,18 +378,29 @@ class PortalEntryStatusCache:
                     if saved_at >= latest_saved_at:
                         latest_saved_at = saved_at
                         latest_items = items
-                self._items = latest_items if isinstance(latest_items, dict) else {}
             except Exception:
-                self._items = {}
+                latest_items = {}
+
+            # Persisted format stays flat ("env:dataset_id"); keep it grouped in memory.
+            items_by_env: Dict[str, Dict[str, Dict[str, Any]]] = {}
+            for key, item in (latest_items if isinstance(latest_items, dict) else {}).items():
+                env, sep, dsid = str(key).partition(":")
+                if not sep or not dsid:
+                    continue
+                items_by_env.setdefault(env, {})[dsid] = item
+            self._items_by_env = items_by_env
             self._loaded = True
 
+    def _get_item(self, dataset_id: str, environment: str) -> Optional[Dict[str, Any]]:
+        item = self._items_by_env.get(self._env(environment), {}).get(str(dataset_id or "").strip())
+        return item if isinstance(item, dict) else None
+
     def get_label(self, dataset_id: str, environment: str = DEFAULT_ENVIRONMENT) -> Optional[str]:
         self._ensure_loaded()
-        k = self._key(environment, dataset_id)
         now = time.time()
         with self._lock:
-            item = self._items.get(k)
-            if not isinstance(item, dict):
+            item = self._get_item(dataset_id, environment)
+            if item is None:
                 return None
             checked_at = item.get("checked_at")
             try:
@@ -396,10 +420,9 @@ class PortalEntryStatusCache:
         """
 
         self._ensure_loaded()
-        k = self._key(environment, dataset_id)
         with self._lock:
-            item = self._items.get(k)
-            if not isinstance(item, dict):
+            item = self._get_item(dataset_id, environment)
+            if item is None:
                 return None
             label = item.get("label")
             return str(label) if isinstance(label, str) and label.strip() else None
@@ -408,10 +431,9 @@ class PortalEntryStatusCache:
         """Return cached checked_at (epoch seconds) regardless of TTL."""
 
         self._ensure_loaded()
-        k = self._key(environment, dataset_id)
         with self._lock:
-            item = self._items.get(k)
-            if not isinstance(item, dict):
+            item = self._get_item(dataset_id, environment)
+            if item is None:
                 return None
             try:
                 checked_at_f = float(item.get("checked_at") or 0.0)
@@ -419,18 +441,23 @@ class PortalEntryStatusCache:
                 checked_at_f = 0.0
             return checked_at_f if checked_at_f > 0.0 else None
 
+    def item_count(self) -> int:
+        self._ensure_loaded()
+        with self._lock:
+            return sum(len(items) for items in self._items_by_env.values())
+
     def clear(self, environment: Optional[str] = None) -> None:
-        """Clear cached items (optionally only for one environment) and persist."""
+        """Clear cached items (optionally only for one environment) and persist immediately."""
 
         self._ensure_loaded()
         env = str(environment or "").strip()
         with self._lock:
             if not env:
-                self._items = {}
+                self._items_by_env = {}
             else:
-                prefix = f"{env}:"
-                self._items = {k: v for k, v in self._items.items() if not str(k).startswith(prefix)}
-        self._save_best_effort()
+                self._items_by_env.pop(env, None)
+            self._generation += 1
+        self.flush()
 
     def clear_dataset_ids(self, dataset_ids: set[str] | list[str] | tuple[str, ...], environment: Optional[str] = None) -> None:
         """Remove cached items for specific dataset IDs and persist.
@@ -452,23 +479,30 @@ class PortalEntryStatusCache:
 
         with self._lock:
             if env:
-                prefix = f"{env}:"
-                for dsid in ids:
-                    self._items.pop(f"{env}:{dsid}", None)
+                targets = [self._items_by_env.get(env) or {}]
             else:
                 # Remove from any env.
-                suffixes = {f":{dsid}" for dsid in ids}
-                self._items = {k: v for k, v in self._items.items() if not any(str(k).endswith(sfx) for sfx in suffixes)}
+                targets = list(self._items_by_env.values())
+            removed = False
+            for items in targets:
+                for dsid in ids:
+                    if items.pop(dsid, None) is not None:
+                        removed = True
+            if removed:
+                self._generation += 1
 
-        self._save_best_effort()
+        if removed:
+            self._schedule_flush()
 
     def set_label(self, dataset_id: str, label: str, environment: str = DEFAULT_ENVIRONMENT) -> None:
         self._ensure_loaded()
-        k = self._key(environment, dataset_id)
+        env = self._env(environment)
+        dsid = str(dataset_id or "").strip()
         now = time.time()
         with self._lock:
-            self._items[k] = {"label": str(label), "checked_at": now}
-        self._save_best_effort()
+            self._items_by_env.setdefault(env, {})[dsid] = {"label": str(label), "checked_at": now}
+            self._generation += 1
+        self._schedule_flush()
 
     def set_labels_bulk(self, labels_by_dataset_id: Dict[str, str], environment: str = DEFAULT_ENVIRONMENT) -> None:
         """Set many labels at once and persist only once.
@@ -477,12 +511,13 @@ class PortalEntryStatusCache:
         """
 
         self._ensure_loaded()
-        env = str(environment or DEFAULT_ENVIRONMENT).strip() or DEFAULT_ENVIRONMENT
+        env = self._env(environment)
         now = time.time()
         if not isinstance(labels_by_dataset_id, dict) or not labels_by_dataset_id:
             return
 
         with self._lock:
+            items = self._items_by_env.setdefault(env, {})
             for dataset_id, label in labels_by_dataset_id.items():
                 dsid = str(dataset_id or "").strip()
                 if not dsid:
@@ -490,26 +525,65 @@ class PortalEntryStatusCache:
                 text = str(label).strip()
                 if not text:
                     continue
-                k = self._key(env, dsid)
-                self._items[k] = {"label": text, "checked_at": now}
+                items[dsid] = {"label": text, "checked_at": now}
+            self._generation += 1
 
-        self._save_best_effort()
+        self._schedule_flush()
 
-    def _save_best_effort(self) -> None:
+    def _schedule_flush(self) -> None:
+        """Persist pending changes after FLUSH_DELAY_SECONDS (one timer for a burst of updates)."""
+
+        with self._lock:
+            if self._flush_timer is not None:
+                return
+            timer = threading.Timer(self.FLUSH_DELAY_SECONDS, self._on_flush_timer)
+            timer.daemon = True
+            self._flush_timer = timer
+        timer.start()
+
+    def _on_flush_timer(self) -> None:
+        with self._lock:
+            self._flush_timer = None
+        self.flush()
+
+    def flush(self) -> None:
+        """Write pending changes now (no-op when nothing changed since the last save)."""
+
+        with self._lock:
+            timer = self._flush_timer
+            self._flush_timer = None
+        if timer is not None:
+            timer.cancel()
+        if not self._loaded:
+            return
+        with self._flush_lock:
+            with self._lock:
+                if self._generation == self._saved_generation:
+                    return
+                generation = self._generation
+                # Snapshot under lock so concurrent writers do not corrupt the persisted file.
+                items_snapshot = {
+                    f"{env}:{dsid}": item
+                    for env, items in self._items_by_env.items()
+                    for dsid, item in items.items()
+                }
+            if self._save_best_effort(items_snapshot):
+                with self._lock:
+                    self._saved_generation = max(self._saved_generation, generation)
+
+    def _save_best_effort(self, items_snapshot: Dict[str, Dict[str, Any]]) -> bool:
         paths = _all_persisted_cache_paths()
         if not paths:
-            return
+            return True
+        saved = False
         try:
-            # Snapshot under lock so concurrent writers do not corrupt the persisted file.
-            with self._lock:
-                items_snapshot = dict(self._items)
-
             payload = {
                 "version": _CACHE_VERSION,
                 "ttl_seconds": CACHE_TTL_SECONDS,
                 "saved_at": time.time(),
                 "items": items_snapshot,
             }
+            text = json.dumps(payload, ensure_ascii=False)
 
             for path in paths:
                 try:
@@ -518,39 +592,55 @@ class PortalEntryStatusCache:
                     # Atomic write (best-effort) to avoid truncation/corruption on crash.
                     tmp_path = f"{path}.tmp"
                     with open(tmp_path, "w", encoding="utf-8") as fh:
-                        json.dump(payload, fh, ensure_ascii=False)
+                        fh.write(text)
                     try:
                         os.replace(tmp_path, path)
                     except Exception:
                         # Fallback to direct write if atomic replace fails.
                         with open(path, "w", encoding="utf-8") as fh:
-                            json.dump(payload, fh, ensure_ascii=False)
+                            fh.write(text)
                         try:
                             if os.path.exists(tmp_path):
                                 os.remove(tmp_path)
                         except Exception:
                             pass
+                    saved = True
                 except Exception:
                     continue
         except Exception as exc:
             logger.debug(f"portal entry status cache save skipped: {exc}")
+        return saved
 
 
 _CACHE_SINGLETON: Optional[PortalEntryStatusCache] = None
+_CACHE_SINGLETON_LOCK = threading.Lock()
 
 
 def get_portal_entry_status_cache() -> PortalEntryStatusCache:
     global _CACHE_SINGLETON
     if _CACHE_SINGLETON is None:
-        _CACHE_SINGLETON = PortalEntryStatusCache()
+        with _CACHE_SINGLETON_LOCK:
+            if _CACHE_SINGLETON is None:
+                cache = PortalEntryStatusCache()
+                # Persist labels still waiting for the debounce timer at shutdown.
+                atexit.register(cache.flush)
+                _CACHE_SINGLETON = cache
     return _CACHE_SINGLETON
 
 
+def flush_portal_entry_status_cache() -> None:
+    """Write pending portal status cache changes to disk immediately."""
+
+    if _CACHE_SINGLETON is not None:
+        _CACHE_SINGLETON.flush()
+
+
 def get_portal_entry_status_cache_metadata() -> dict[str, Any]:
     """Return portal entry status cache metadata for diagnostics/UI."""
 
     cache = get_portal_entry_status_cache()
     cache._ensure_loaded()
+    cache.flush()
 
     latest_saved_at = 0.0
     latest_count = 0
@@ -581,7 +671,7 @@ def get_portal_entry_status_cache_metadata() -> dict[str, Any]:
     return {
         "paths": paths,
         "size_bytes": size_bytes,
-        "item_count": latest_count or len(getattr(cache, "_items", {}) or {}),
+        "item_count": latest_count or cache.item_count(),
         "updated_at": updated_at,
-        "active": bool(latest_count or getattr(cache, "_items", {})),
+        "active": bool(latest_count or cache.item_count()),
     }
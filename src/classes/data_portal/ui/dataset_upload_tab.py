@@ -2513,6 +2513,7 @@ class DatasetUploadTab(QWidget):
                     tile_name=c.tile_name,
                     tile_number=c.tile_number,
                     parent=self,
+                    expected_size=c.file_size,
                 )
                 if save_path:
                     downloaded.append(
@@ -2534,7 +2535,7 @@ class DatasetUploadTab(QWidget):
 
             # ZIP作成（dataFiles/{grant}/{dataset}/.ZIP 配下）
             from datetime import datetime
-            from classes.data_portal.core.contents_zip_auto import build_zip
+            from classes.data_portal.core.contents_zip_auto import ZipBuildCancelled, build_zip
 
             zip_dir = get_dynamic_file_path(
                 f"output/rde/data/dataFiles/{safe_grant_number}/{safe_dataset_name}/.ZIP"
@@ -2545,7 +2546,37 @@ class DatasetUploadTab(QWidget):
             base_dir = get_dynamic_file_path(
                 f"output/rde/data/dataFiles/{safe_grant_number}/{safe_dataset_name}"
             )
-            zip_path = build_zip(zip_path=zip_path, base_dir=base_dir, files=downloaded)
+
+            zip_progress = QProgressDialog("ZIPを作成中...", "キャンセル", 0, 1000, self)
+            zip_progress.setWindowTitle("ZIP自動作成")
+            zip_progress.setWindowModality(Qt.WindowModal)
+            zip_progress.setMinimumDuration(0)
+            zip_progress.show()
+            QApplication.processEvents()
+
+            def on_zip_progress(done_bytes: int, total_bytes: int, message: str) -> None:
+                # バイト数は int 範囲を超え得るため千分率で表示する
+                zip_progress.setValue(int(done_bytes * 1000 / total_bytes) if total_bytes > 0 else 0)
+                zip_progress.setLabelText(message)
+                QApplication.processEvents()
+
+            def is_zip_canceled() -> bool:
+                QApplication.processEvents()
+                return zip_progress.wasCanceled()
+
+            try:
+                zip_path = build_zip(
+                    zip_path=zip_path,
+                    base_dir=base_dir,
+                    files=downloaded,
+                    progress_callback=on_zip_progress,
+                    cancel_checker=is_zip_canceled,
+                )
+            except ZipBuildCancelled:
+                self._log_status("ZIP作成をキャンセルしました")
+                return
+            finally:
+                zip_progress.close()
             self._log_status(f"✅ ZIP作成完了: {Path(zip_path).name}")
 
             # そのままアップロード
@@ -2957,7 +2988,8 @@ class DatasetUploadTab(QWidget):
                             dataset_name=safe_dataset_name,
                             tile_name=replace_invalid_path_chars(tile_name),
                             tile_number=tile_number,
-                            parent=self
+                            parent=self,
+                            expected_size=attributes.get("fileSize"),
                         )
                         
                         if result:
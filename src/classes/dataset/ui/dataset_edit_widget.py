@@ -4750,25 +4750,22 @@ def create_dataset_edit_widget(parent, title, create_auto_resize_button):
     widget._entries_table = entries_table
 
     def _load_registration_entries():
-        """登録状況キャッシュ (entries_all / entries_latest) から生データリストを読み取る"""
+        """登録状況キャッシュ (全件ストア / entries_latest) から生データリストを読み取る"""
         entries = []
         try:
-            candidates = [
-                get_dynamic_file_path('output/rde/entries_all.json'),
-                get_dynamic_file_path('output/rde/entries_latest.json'),
-            ]
-            for p in candidates:
-                if p and os.path.exists(p):
-                    try:
-                        with open(p, 'r', encoding='utf-8') as f:
-                            data = json.load(f)
-                        if isinstance(data, list) and data:
-                            entries.extend(data)
-                            # entries_all があればそれを優先し終了
-                            if 'entries_all' in p:
-                                break
-                    except Exception as ie:
-                        logger.debug("登録状況キャッシュ読み込み失敗: %s", ie)
+            # 全件キャッシュがあればそれを優先する
+            from classes.data_entry.core import registration_status_service as regsvc
+            if regsvc.has_all_cache(ignore_ttl=True):
+                entries = regsvc.load_all_cache(ignore_ttl=True)
+            p = get_dynamic_file_path('output/rde/entries_latest.json')
+            if not entries and p and os.path.exists(p):
+                try:
+                    with open(p, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+                    if isinstance(data, list) and data:
+                        entries.extend(data)
+                except Exception as ie:
+                    logger.debug("登録状況キャッシュ読み込み失敗: %s", ie)
         except Exception as e:
             logger.debug("登録状況エントリー読み込み失敗: %s", e)
         return entries
@@ -7,6 +7,7 @@ import json
 import os
 import re
 import time
+from collections import OrderedDict
 from typing import Any, Dict, List, Optional
 
 from qt_compat.core import Qt, QDate, QUrl, QThread, Signal
@@ -245,14 +246,26 @@ class ToolLinkButtonsDelegate(QStyledItemDelegate):
 
 
 class DatasetListTableModel(QAbstractTableModel):
+    # 列キャッシュの種類:
+    # - text: 表示文字列（DisplayRole）
+    # - folded: 小文字化した表示文字列（大文字小文字を区別しない部分一致用）
+    # - date: UserRole の日付（date 以外は None）
+    # - int: UserRole を int() 変換した値（変換できなければ None）
+    COLUMN_VALUE_KINDS = ("text", "folded", "date", "int")
+
     def __init__(self, columns: List[DatasetListColumn], rows: List[Dict[str, Any]], parent: Optional[QObject] = None):
         super().__init__(parent)
         self._columns = columns
         self._rows = rows
+        self._data_version = 0
+        self._column_values_cache: Dict[tuple, List[Any]] = {}
+        self._row_update_listeners: List[Any] = []
 
     def set_rows(self, rows: List[Dict[str, Any]]) -> None:
         self.beginResetModel()
         self._rows = rows
+        self._data_version += 1
+        self._column_values_cache = {}
         self.endResetModel()
 
     def update_row_fields(self, row_index: int, updates: Dict[str, Any]) -> None:
@@ -275,6 +288,19 @@ class DatasetListTableModel(QAbstractTableModel):
         if not changed_cols:
             return
 
+        # 表示文字列は他列の値にも依存する（portal_status と portal_checked_at など）ため、
+        # キャッシュ済みの列はこの行だけすべて作り直す。
+        for (kind, col_index), values in self._column_values_cache.items():
+            if row_index < len(values):
+                values[row_index] = self._column_value(kind, row, self._columns[col_index])
+
+        # フィルタ側のマスクを dataChanged（= 再判定）より先に更新させる。
+        for listener in list(self._row_update_listeners):
+            try:
+                listener(row_index)
+            except Exception:
+                continue
+
         for col_index in changed_cols:
             try:
                 top_left = self.index(row_index, col_index)
@@ -288,6 +314,50 @@ class DatasetListTableModel(QAbstractTableModel):
     def get_rows(self) -> List[Dict[str, Any]]:
         return self._rows
 
+    @property
+    def data_version(self) -> int:
+        """set_rows() のたびに増える世代番号（列キャッシュ・フィルタマスクの有効期間）"""
+        return self._data_version
+
+    def add_row_update_listener(self, listener) -> None:
+        """update_row_fields() で行が変わったときに listener(row_index) を呼ぶ"""
+        if listener not in self._row_update_listeners:
+            self._row_update_listeners.append(listener)
+
+    def remove_row_update_listener(self, listener) -> None:
+        try:
+            self._row_update_listeners.remove(listener)
+        except ValueError:
+            pass
+
+    def column_values(self, column: int, kind: str = "text") -> List[Any]:
+        """列の値を行順の配列で返す（初回に作成し、set_rows() まで保持する）"""
+        if kind not in self.COLUMN_VALUE_KINDS:
+            raise ValueError(f"unknown column value kind: {kind}")
+        key = (kind, int(column))
+        values = self._column_values_cache.get(key)
+        if values is None:
+            col = self._columns[int(column)]
+            if kind == "folded":
+                values = [text.lower() for text in self.column_values(column, "text")]
+            else:
+                values = [self._column_value(kind, row, col) for row in self._rows]
+            self._column_values_cache[key] = values
+        return values
+
+    def _column_value(self, kind: str, row: Dict[str, Any], col: DatasetListColumn) -> Any:
+        if kind == "text":
+            return self._display_text(row, col)
+        if kind == "folded":
+            return self._display_text(row, col).lower()
+        value = self._user_value(row, col)
+        if kind == "date":
+            return value if isinstance(value, datetime.date) else None
+        try:
+            return int(value)
+        except Exception:
+            return None
+
     def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: N802
         if parent.isValid():
             return 0
@@ -306,6 +376,104 @@ class DatasetListTableModel(QAbstractTableModel):
                 return self._columns[section].label
         return None
 
+    @staticmethod
+    def _display_text(row: Dict[str, Any], col: DatasetListColumn) -> str:
+        value = row.get(col.key)
+        if col.key == "tool_open":
+            dataset_id = str(row.get("dataset_id") or "").strip()
+            return "RDE / DP" if dataset_id else ""
+        if col.key == "portal_status":
+            status = "" if value is None else str(value)
+            checked_at = str(row.get("portal_checked_at") or "").strip()
+            if status and checked_at:
+                return f"{status}（{checked_at}）"
+            return status
+        if col.key == "portal_checked_at":
+            txt = str(value or "").strip()
+            if txt:
+                return txt
+            status = str(row.get("portal_status") or "").strip()
+            try:
+                from classes.dataset.util.portal_status_resolver import UNCHECKED_LABEL
+            except Exception:
+                UNCHECKED_LABEL = "未確認"
+            if (not status) or status == UNCHECKED_LABEL:
+                return "確認前"
+            return ""
+        if isinstance(value, bool):
+            return "True" if value else "False"
+        if col.key == "file_size":
+            # 値は bytes(int) で保持し、表示用文字列はここで整形する。
+            try:
+                from classes.dataset.util.data_entry_summary import format_size_with_bytes
+
+                if isinstance(value, int):
+                    return format_size_with_bytes(value)
+            except Exception:
+                pass
+        return "" if value is None else str(value)
+
+    @staticmethod
+    def _user_value(row: Dict[str, Any], col: DatasetListColumn) -> Any:
+        if col.key == "embargo_date":
+            embargo_obj = row.get("_embargo_date_obj")
+            return embargo_obj
+        if col.key == "open_at_date":
+            return row.get("_open_at_date_obj")
+        if col.key == "modified_date":
+            return row.get("_modified_date_obj")
+        if col.key == "created_date":
+            return row.get("_created_date_obj")
+        if col.key == "dataset_name":
+            dataset_id = row.get("dataset_id")
+            dataset_id = str(dataset_id).strip() if dataset_id is not None else ""
+            if dataset_id:
+                return f"https://rde.nims.go.jp/rde/datasets/{dataset_id}"
+            return ""
+        if col.key == "subgroup_name":
+            subgroup_id = row.get("subgroup_id")
+            subgroup_id = str(subgroup_id).strip() if subgroup_id is not None else ""
+            if subgroup_id:
+                return f"https://rde.nims.go.jp/rde/datasets/groups/{subgroup_id}"
+            return ""
+        if col.key == "tool_open":
+            dataset_id = row.get("dataset_id")
+            dataset_id = str(dataset_id).strip() if dataset_id is not None else ""
+            return dataset_id
+        if col.key == "manager_name":
+            manager_id = str(row.get("_manager_id") or "").strip()
+            return _build_user_profile_url(manager_id)
+        if col.key == "applicant_name":
+            applicant_id = str(row.get("_applicant_id") or "").strip()
+            return _build_user_profile_url(applicant_id)
+        if col.key == "data_owner_names":
+            owner_ids = row.get("_data_owner_ids")
+            owner_labels = row.get("_data_owner_labels")
+            if not isinstance(owner_ids, list) or not owner_ids:
+                return ""
+            if not isinstance(owner_labels, list):
+                owner_labels = []
+            items: List[Dict[str, str]] = []
+            for i, oid in enumerate(owner_ids):
+                oid_str = str(oid or "").strip()
+                if not oid_str:
+                    continue
+                label = ""
+                try:
+                    if i < len(owner_labels):
+                        label = str(owner_labels[i] or "").strip()
+                except Exception:
+                    label = ""
+                if not label or label == "Unknown":
+                    label = f"Unknown ({i + 1})"
+                items.append({"label": label, "url": _build_user_profile_url(oid_str)})
+            if not items:
+                return ""
+            if len(items) == 1:
+                return items[0].get("url") or ""
+            return items
+        return row.get(col.key)
+
     def data(self, index: QModelIndex, role: int = Qt.DisplayRole):  # noqa: N802
         if not index.isValid():
             return None
@@ -314,100 +482,10 @@ class DatasetListTableModel(QAbstractTableModel):
         col = self._columns[index.column()]
 
         if role == Qt.DisplayRole:
-            value = row.get(col.key)
-            if col.key == "tool_open":
-                dataset_id = str(row.get("dataset_id") or "").strip()
-                return "RDE / DP" if dataset_id else ""
-            if col.key == "portal_status":
-                status = "" if value is None else str(value)
-                checked_at = str(row.get("portal_checked_at") or "").strip()
-                if status and checked_at:
-                    return f"{status}（{checked_at}）"
-                return status
-            if col.key == "portal_checked_at":
-                txt = str(value or "").strip()
-                if txt:
-                    return txt
-                status = str(row.get("portal_status") or "").strip()
-                try:
-                    from classes.dataset.util.portal_status_resolver import UNCHECKED_LABEL
-                except Exception:
-                    UNCHECKED_LABEL = "未確認"
-                if (not status) or status == UNCHECKED_LABEL:
-                    return "確認前"
-                return ""
-            if isinstance(value, bool):
-                return "True" if value else "False"
-            if col.key == "file_size":
-                # 値は bytes(int) で保持し、表示用文字列はここで整形する。
-                try:
-                    from classes.dataset.util.data_entry_summary import format_size_with_bytes
-
-                    if isinstance(value, int):
-                        return format_size_with_bytes(value)
-                except Exception:
-                    pass
-            return "" if value is None else str(value)
+            return self._display_text(row, col)
 
         if role == Qt.UserRole:
-            if col.key == "embargo_date":
-                embargo_obj = row.get("_embargo_date_obj")
-                return embargo_obj
-            if col.key == "open_at_date":
-                return row.get("_open_at_date_obj")
-            if col.key == "modified_date":
-                return row.get("_modified_date_obj")
-            if col.key == "created_date":
-                return row.get("_created_date_obj")
-            if col.key == "dataset_name":
-                dataset_id = row.get("dataset_id")
-                dataset_id = str(dataset_id).strip() if dataset_id is not None else ""
-                if dataset_id:
-                    return f"https://rde.nims.go.jp/rde/datasets/{dataset_id}"
-                return ""
-            if col.key == "subgroup_name":
-                subgroup_id = row.get("subgroup_id")
-                subgroup_id = str(subgroup_id).strip() if subgroup_id is not None else ""
-                if subgroup_id:
-                    return f"https://rde.nims.go.jp/rde/datasets/groups/{subgroup_id}"
-                return ""
-            if col.key == "tool_open":
-                dataset_id = row.get("dataset_id")
-                dataset_id = str(dataset_id).strip() if dataset_id is not None else ""
-                return dataset_id
-            if col.key == "manager_name":
-                manager_id = str(row.get("_manager_id") or "").strip()
-                return _build_user_profile_url(manager_id)
-            if col.key == "applicant_name":
-                applicant_id = str(row.get("_applicant_id") or "").strip()
-                return _build_user_profile_url(applicant_id)
-            if col.key == "data_owner_names":
-                owner_ids = row.get("_data_owner_ids")
-                owner_labels = row.get("_data_owner_labels")
-                if not isinstance(owner_ids, list) or not owner_ids:
-                    return ""
-                if not isinstance(owner_labels, list):
-                    owner_labels = []
-                items: List[Dict[str, str]] = []
-                for i, oid in enumerate(owner_ids):
-                    oid_str = str(oid or "").strip()
-                    if not oid_str:
-                        continue
-                    label = ""
-                    try:
-                        if i < len(owner_labels):
-                            label = str(owner_labels[i] or "").strip()
-                    except Exception:
-                        label = ""
-                    if not label or label == "Unknown":
-                        label = f"Unknown ({i + 1})"
-                    items.append({"label": label, "url": _build_user_profile_url(oid_str)})
-                if not items:
-                    return ""
-                if len(items) == 1:
-                    return items[0].get("url") or ""
-                return items
-            return row.get(col.key)
+            return self._user_value(row, col)
 
         if role == Qt.ForegroundRole:
             if col.key in {"dataset_name", "instrument_names"}:
@@ -505,11 +583,35 @@ class DatasetListTableModel(QAbstractTableModel):
         return flags
 
 
+class _RowFilterSpec:
+    """1つのフィルタ条件（列キャッシュの値 → 採否）"""
+
+    __slots__ = ("key", "column", "kind", "test", "text_column")
+
+    def __init__(self, key: tuple, column: int, kind: str, test, text_column: Optional[int] = None):
+        self.key = key
+        self.column = column
+        self.kind = kind
+        self.test = test
+        self.text_column = text_column
+
+
 class DatasetFilterProxyModel(QSortFilterProxyModel):
+    """
+    列フィルタ・範囲フィルタ付きのプロキシ
+
+    フィルタ条件ごとに全行の採否（1行1バイトのマスク）をソースモデルの列キャッシュから
+    まとめて計算し、条件が変わらないマスクは再利用する。filterAcceptsRow は
+    マスクを合成した採否配列を参照するだけにする。
+    """
+
+    # 保持するフィルタマスクの上限（条件の組み合わせ単位）
+    FILTER_MASK_CACHE_SIZE = 32
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._column_filters: Dict[int, str] = {}
-        self._column_filter_patterns: Dict[int, List[re.Pattern]] = {}
+        self._filtered_columns: set[int] = set()
         self._exact_match_column_indices: set[int] = set()
         self._embargo_from: Optional[datetime.date] = None
         self._embargo_to: Optional[datetime.date] = None
@@ -529,42 +631,33 @@ class DatasetFilterProxyModel(QSortFilterProxyModel):
         self._file_count_max: Optional[int] = None
         self._tag_count_min: Optional[int] = None
         self._tag_count_max: Optional[int] = None
+        # マスクは sourceModel の data_version 単位で有効
+        self._mask_data_version: Optional[int] = None
+        self._filter_masks: "OrderedDict[tuple, bytearray]" = OrderedDict()
+        self._filter_specs: Optional[List[_RowFilterSpec]] = None
+        self._accept_sets: Dict[frozenset, bytearray] = {}
+        self._column_by_label: Dict[str, int] = {}
         self.setFilterCaseSensitivity(Qt.CaseInsensitive)
 
+    def setSourceModel(self, source_model) -> None:  # noqa: N802
+        old = self.sourceModel()
+        if old is not None and hasattr(old, "remove_row_update_listener"):
+            old.remove_row_update_listener(self._on_source_row_updated)
+        self._reset_filter_masks()
+        if source_model is not None and hasattr(source_model, "add_row_update_listener"):
+            source_model.add_row_update_listener(self._on_source_row_updated)
+        super().setSourceModel(source_model)
+
+    def invalidateFilter(self) -> None:  # noqa: N802
+        # 条件変更時は合成結果だけ作り直す（条件ごとのマスクはキー単位で再利用する）
+        self._filter_specs = None
+        self._accept_sets = {}
+        super().invalidateFilter()
+
     def set_exact_match_columns(self, column_indices: set[int]) -> None:
         self._exact_match_column_indices = {int(i) for i in (column_indices or set())}
         self.invalidateFilter()
 
-    def _match_any_term_for_column(self, *, col_idx: int, hay: str, patterns: List[re.Pattern], raw_filter: str) -> bool:
-        """Return True if hay matches filter for the given column.
-
-        For most columns: substring match via compiled regex patterns.
-        For exact-match columns (e.g., portal_status): full-string match (still supports '*').
-        """
-
-        text = str(hay or "")
-        if int(col_idx) not in (self._exact_match_column_indices or set()):
-            return any(p.search(text) for p in (patterns or []))
-
-        # exact-match semantics: compare against the whole cell text.
-        # NOTE: portal_status はセル側に「ステータス（日時）」、フィルタ側に「ステータス（件数）」
-        # のような装飾が入るため、括弧以降は無視してステータス部分のみで一致判定する。
-        cell = text.strip()
-        cell_key = self._strip_parenthetical_suffix(cell)
-        for term in self._split_filter_terms(raw_filter or ""):
-            t = (term or "").strip()
-            if not t:
-                continue
-            t_key = self._strip_parenthetical_suffix(t)
-            if "*" in t:
-                pat = self._compile_wildcard_pattern(t_key)
-                if pat is not None and pat.fullmatch(cell_key):
-                    return True
-            else:
-                if cell_key.lower() == t_key.lower():
-                    return True
-        return False
-
     @staticmethod
     def _strip_parenthetical_suffix(text: str) -> str:
         """括弧で始まるサフィックス（例: （日時）, （件数））を除去してステータス部分だけ返す。"""
@@ -600,19 +693,9 @@ class DatasetFilterProxyModel(QSortFilterProxyModel):
         except Exception:
             return None
 
-    @classmethod
-    def _compile_terms(cls, text: str) -> List[re.Pattern]:
-        patterns: List[re.Pattern] = []
-        for term in cls._split_filter_terms(text):
-            pat = cls._compile_wildcard_pattern(term)
-            if pat is not None:
-                patterns.append(pat)
-        return patterns
-
     def set_column_filters(self, filters_by_col_index: Dict[int, str]) -> None:
         # keys: source-model column index, value: text filter
         cleaned: Dict[int, str] = {}
-        compiled: Dict[int, List[re.Pattern]] = {}
         for k, v in (filters_by_col_index or {}).items():
             try:
                 idx = int(k)
@@ -621,9 +704,8 @@ class DatasetFilterProxyModel(QSortFilterProxyModel):
             text = (v or "").strip()
             if text:
                 cleaned[idx] = text
-                compiled[idx] = self._compile_terms(text)
         self._column_filters = cleaned
-        self._column_filter_patterns = {k: v for k, v in compiled.items() if v}
+        self._filtered_columns = {k for k, v in cleaned.items() if self._split_filter_terms(v)}
         self.invalidateFilter()
 
     def set_embargo_range(self, date_from: Optional[datetime.date], date_to: Optional[datetime.date]) -> None:
@@ -676,219 +758,151 @@ class DatasetFilterProxyModel(QSortFilterProxyModel):
 
     def accepts_row_ignoring_text_filter_columns(self, source_row: int, ignore_columns: set[int]) -> bool:
         """filterAcceptsRow相当だが、指定列のテキストフィルタだけ無視して判定する。"""
-        model = self.sourceModel()
-        if model is None:
+        if self.sourceModel() is None:
             return True
+        ignored = frozenset(int(c) for c in (ignore_columns or set()))
+        return self._accepts(source_row, ignored)
 
-        source_parent = QModelIndex()
-
-        # embargo range filter
-        if self._embargo_from or self._embargo_to:
-            embargo_col = self._find_column_by_label("エンバーゴ期間終了日")
-            if embargo_col >= 0:
-                idx = model.index(source_row, embargo_col, source_parent)
-                embargo_obj = model.data(idx, Qt.UserRole)
-                if not isinstance(embargo_obj, datetime.date):
-                    return False
-                if self._embargo_from and embargo_obj < self._embargo_from:
-                    return False
-                if self._embargo_to and embargo_obj > self._embargo_to:
-                    return False
-
-        # created range filter
-        if self._created_from or self._created_to:
-            col = self._find_column_by_label("開設日")
-            if col >= 0:
-                idx = model.index(source_row, col, source_parent)
-                d = model.data(idx, Qt.UserRole)
-                if not isinstance(d, datetime.date):
-                    return False
-                if self._created_from and d < self._created_from:
-                    return False
-                if self._created_to and d > self._created_to:
-                    return False
-                
-        # modified range filter
-        if self._modified_from or self._modified_to:
-            col = self._find_column_by_label("更新日")
-            if col >= 0:
-                idx = model.index(source_row, col, source_parent)
-                d = model.data(idx, Qt.UserRole)
-                if not isinstance(d, datetime.date):
-                    return False
-                if self._modified_from and d < self._modified_from:
-                    return False
-                if self._modified_to and d > self._modified_to:
-                    return False
-
-        # openAt range filter
-        if self._open_at_from or self._open_at_to:
-            col = self._find_column_by_label("公開日")
-            if col >= 0:
-                idx = model.index(source_row, col, source_parent)
-                d = model.data(idx, Qt.UserRole)
-                if not isinstance(d, datetime.date):
-                    return False
-                if self._open_at_from and d < self._open_at_from:
-                    return False
-                if self._open_at_to and d > self._open_at_to:
-                    return False
-                                
-        if self._column_filter_patterns:
-            for col_idx, patterns in self._column_filter_patterns.items():
-                if col_idx in (ignore_columns or set()):
-                    continue
-                if col_idx < 0 or col_idx >= model.columnCount():
-                    continue
-                idx = model.index(source_row, col_idx, source_parent)
-                hay = str(model.data(idx, Qt.DisplayRole) or "")
-                raw_filter = (self._column_filters or {}).get(int(col_idx), "")
-                if not self._match_any_term_for_column(col_idx=int(col_idx), hay=hay, patterns=patterns, raw_filter=raw_filter):
-                    return False
-
-        # description length range
-        if self._description_len_min is not None or self._description_len_max is not None:
-            desc_col = self._find_column_by_label("説明文字数")
-            if desc_col >= 0:
-                idx = model.index(source_row, desc_col, source_parent)
-                val = model.data(idx, Qt.UserRole)
-                try:
-                    n = int(val)
-                except Exception:
-                    n = None
-                if n is None:
-                    return False
-                if self._description_len_min is not None and n < self._description_len_min:
-                    return False
-                if self._description_len_max is not None and n > self._description_len_max:
-                    return False
-
-        # related datasets count range
-        if self._related_count_min is not None or self._related_count_max is not None:
-            rel_col = self._find_column_by_label("関連データセット")
-            if rel_col >= 0:
-                idx = model.index(source_row, rel_col, source_parent)
-                val = model.data(idx, Qt.UserRole)
-                try:
-                    n = int(val)
-                except Exception:
-                    n = None
-                if n is None:
-                    return False
-                if self._related_count_min is not None and n < self._related_count_min:
-                    return False
-                if self._related_count_max is not None and n > self._related_count_max:
-                    return False
-
-        # tile count range
-        if self._tile_count_min is not None or self._tile_count_max is not None:
-            tile_col = self._find_column_by_label("タイル数")
-            if tile_col >= 0:
-                idx = model.index(source_row, tile_col, source_parent)
-                val = model.data(idx, Qt.UserRole)
-                try:
-                    n = int(val)
-                except Exception:
-                    n = None
-                if n is None:
-                    return False
-                if self._tile_count_min is not None and n < self._tile_count_min:
-                    return False
-                if self._tile_count_max is not None and n > self._tile_count_max:
-                    return False
-
-        # file count range
-        if self._file_count_min is not None or self._file_count_max is not None:
-            file_col = self._find_column_by_label("ファイル数")
-            if file_col >= 0:
-                idx = model.index(source_row, file_col, source_parent)
-                val = model.data(idx, Qt.UserRole)
-                try:
-                    n = int(val)
-                except Exception:
-                    n = None
-                if n is None:
-                    return False
-                if self._file_count_min is not None and n < self._file_count_min:
-                    return False
-                if self._file_count_max is not None and n > self._file_count_max:
-                    return False
-
-        # tag count range
-        if self._tag_count_min is not None or self._tag_count_max is not None:
-            tag_col = self._find_column_by_label("TAG数")
-            if tag_col >= 0:
-                idx = model.index(source_row, tag_col, source_parent)
-                val = model.data(idx, Qt.UserRole)
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:  # noqa: N802
+        if self.sourceModel() is None:
+            return True
+        return self._accepts(source_row, frozenset())
+
+    # -- フィルタマスク ---------------------------------------------------
+
+    def _accepts(self, source_row: int, ignored_text_columns: frozenset) -> bool:
+        accept = self._accept_set(ignored_text_columns)
+        if 0 <= source_row < len(accept):
+            return bool(accept[source_row])
+        return True
+
+    def _sync_mask_version(self) -> None:
+        model = self.sourceModel()
+        version = getattr(model, "data_version", None)
+        if version is None or version != self._mask_data_version:
+            self._reset_filter_masks()
+            self._mask_data_version = version
+
+    def _reset_filter_masks(self) -> None:
+        self._mask_data_version = None
+        self._filter_masks = OrderedDict()
+        self._filter_specs = None
+        self._accept_sets = {}
+        self._column_by_label = {}
+
+    def _accept_set(self, ignored_text_columns: frozenset) -> bytearray:
+        """有効な条件のマスクを AND 合成した採否配列（1行1バイト）"""
+        self._sync_mask_version()
+        accept = self._accept_sets.get(ignored_text_columns)
+        if accept is not None:
+            return accept
+
+        model = self.sourceModel()
+        row_count = int(model.rowCount()) if model is not None else 0
+        combined: Optional[int] = None
+        for spec in self._active_filter_specs():
+            if spec.text_column is not None and spec.text_column in ignored_text_columns:
+                continue
+            mask = int.from_bytes(self._filter_mask(spec), "little")
+            combined = mask if combined is None else (combined & mask)
+
+        if combined is None:
+            accept = bytearray(b"\x01" * row_count)
+        else:
+            accept = bytearray(combined.to_bytes(row_count, "little"))
+        self._accept_sets[ignored_text_columns] = accept
+        return accept
+
+    def _filter_mask(self, spec: _RowFilterSpec) -> bytearray:
+        mask = self._filter_masks.get(spec.key)
+        if mask is not None:
+            self._filter_masks.move_to_end(spec.key)
+            return mask
+        values = self._source_column_values(spec.column, spec.kind)
+        mask = bytearray(map(spec.test, values))
+        self._filter_masks[spec.key] = mask
+        while len(self._filter_masks) > self.FILTER_MASK_CACHE_SIZE:
+            self._filter_masks.popitem(last=False)
+        return mask
+
+    def _source_column_values(self, column: int, kind: str) -> List[Any]:
+        model = self.sourceModel()
+        if hasattr(model, "column_values"):
+            return model.column_values(column, kind)
+        # DatasetListTableModel 以外のモデル向け（data() から都度組み立てる）
+        values: List[Any] = []
+        role = Qt.DisplayRole if kind in {"text", "folded"} else Qt.UserRole
+        for r in range(model.rowCount()):
+            value = model.data(model.index(r, column), role)
+            if kind == "text":
+                values.append(str(value or ""))
+            elif kind == "folded":
+                values.append(str(value or "").lower())
+            elif kind == "date":
+                values.append(value if isinstance(value, datetime.date) else None)
+            else:
                 try:
-                    n = int(val)
+                    values.append(int(value))
                 except Exception:
-                    n = None
-                if n is None:
-                    return False
-                if self._tag_count_min is not None and n < self._tag_count_min:
-                    return False
-                if self._tag_count_max is not None and n > self._tag_count_max:
-                    return False
+                    values.append(None)
+        return values
 
-        return True
+    def _on_source_row_updated(self, source_row: int) -> None:
+        """1行だけ変わった場合は、保持中のマスクと採否配列の該当行だけ更新する。"""
+        model = self.sourceModel()
+        if getattr(model, "data_version", None) != self._mask_data_version:
+            return
+        specs_by_key = {spec.key: spec for spec in (self._filter_specs or [])}
+        for key in list(self._filter_masks.keys()):
+            mask = self._filter_masks[key]
+            if not (0 <= source_row < len(mask)):
+                continue
+            spec = specs_by_key.get(key)
+            if spec is None:
+                # 現在の条件で使っていないマスクは次に使うときに作り直す
+                del self._filter_masks[key]
+                continue
+            mask[source_row] = 1 if spec.test(self._source_column_values(spec.column, spec.kind)[source_row]) else 0
 
-    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:  # noqa: N802
+        for ignored, accept in self._accept_sets.items():
+            if not (0 <= source_row < len(accept)):
+                continue
+            ok = 1
+            for spec in self._filter_specs or []:
+                if spec.text_column is not None and spec.text_column in ignored:
+                    continue
+                mask = self._filter_masks.get(spec.key)
+                if mask is None:
+                    mask = self._filter_mask(spec)
+                if not mask[source_row]:
+                    ok = 0
+                    break
+            accept[source_row] = ok
+
+    def _active_filter_specs(self) -> List[_RowFilterSpec]:
+        if self._filter_specs is not None:
+            return self._filter_specs
         model = self.sourceModel()
+        specs: List[_RowFilterSpec] = []
         if model is None:
-            return True
-
-        # embargo range filter (applies to the "エンバーゴ期間終了日" column when present)
-        if self._embargo_from or self._embargo_to:
-            embargo_col = self._find_column_by_label("エンバーゴ期間終了日")
-            if embargo_col >= 0:
-                idx = model.index(source_row, embargo_col, source_parent)
-                embargo_obj = model.data(idx, Qt.UserRole)
-                if not isinstance(embargo_obj, datetime.date):
-                    return False
-                if self._embargo_from and embargo_obj < self._embargo_from:
-                    return False
-                if self._embargo_to and embargo_obj > self._embargo_to:
-                    return False
-
-        # openAt range filter
-        if self._open_at_from or self._open_at_to:
-            col = self._find_column_by_label("公開日")
-            if col >= 0:
-                idx = model.index(source_row, col, source_parent)
-                d = model.data(idx, Qt.UserRole)
-                if not isinstance(d, datetime.date):
-                    return False
-                if self._open_at_from and d < self._open_at_from:
-                    return False
-                if self._open_at_to and d > self._open_at_to:
-                    return False
-
-        # modified range filter
-        if self._modified_from or self._modified_to:
-            col = self._find_column_by_label("更新日")
-            if col >= 0:
-                idx = model.index(source_row, col, source_parent)
-                d = model.data(idx, Qt.UserRole)
-                if not isinstance(d, datetime.date):
-                    return False
-                if self._modified_from and d < self._modified_from:
-                    return False
-                if self._modified_to and d > self._modified_to:
-                    return False
-
-        # created range filter
-        if self._created_from or self._created_to:
-            col = self._find_column_by_label("開設日")
-            if col >= 0:
-                idx = model.index(source_row, col, source_parent)
-                d = model.data(idx, Qt.UserRole)
-                if not isinstance(d, datetime.date):
-                    return False
-                if self._created_from and d < self._created_from:
-                    return False
-                if self._created_to and d > self._created_to:
-                    return False
+            self._filter_specs = specs
+            return specs
+
+        # date range filters（列が無い場合は条件なし、日付でない値は不一致）
+        for label, date_from, date_to in (
+            ("エンバーゴ期間終了日", self._embargo_from, self._embargo_to),
+            ("公開日", self._open_at_from, self._open_at_to),
+            ("更新日", self._modified_from, self._modified_to),
+            ("開設日", self._created_from, self._created_to),
+        ):
+            if not (date_from or date_to):
+                continue
+            col = self._find_column_by_label(label)
+            if col < 0:
+                continue
+            specs.append(
+                _RowFilterSpec(("date", col, date_from, date_to), col, "date", self._range_test(date_from, date_to))
+            )
 
         # per-column text filters
         # - delimiters: ',', ';', ' '
@@ -896,102 +910,94 @@ class DatasetFilterProxyModel(QSortFilterProxyModel):
         # Semantics:
         # - terms within a column: OR
         # - multiple columns with filters: AND
-        if self._column_filter_patterns:
-            for col_idx, patterns in self._column_filter_patterns.items():
-                if col_idx < 0 or col_idx >= model.columnCount():
-                    continue
-                idx = model.index(source_row, col_idx, source_parent)
-                hay = str(model.data(idx, Qt.DisplayRole) or "")
-                raw_filter = (self._column_filters or {}).get(int(col_idx), "")
-                if not self._match_any_term_for_column(col_idx=int(col_idx), hay=hay, patterns=patterns, raw_filter=raw_filter):
-                    return False
-
-        # description length range
-        if self._description_len_min is not None or self._description_len_max is not None:
-            desc_col = self._find_column_by_label("説明文字数")
-            if desc_col >= 0:
-                idx = model.index(source_row, desc_col, source_parent)
-                val = model.data(idx, Qt.UserRole)
-                try:
-                    n = int(val)
-                except Exception:
-                    n = None
-                if n is None:
-                    return False
-                if self._description_len_min is not None and n < self._description_len_min:
-                    return False
-                if self._description_len_max is not None and n > self._description_len_max:
-                    return False
-
-        # related datasets count range
-        if self._related_count_min is not None or self._related_count_max is not None:
-            rel_col = self._find_column_by_label("関連データセット")
-            if rel_col >= 0:
-                idx = model.index(source_row, rel_col, source_parent)
-                val = model.data(idx, Qt.UserRole)
-                try:
-                    n = int(val)
-                except Exception:
-                    n = None
-                if n is None:
-                    return False
-                if self._related_count_min is not None and n < self._related_count_min:
-                    return False
-                if self._related_count_max is not None and n > self._related_count_max:
-                    return False
-
-        # tile count range
-        if self._tile_count_min is not None or self._tile_count_max is not None:
-            tile_col = self._find_column_by_label("タイル数")
-            if tile_col >= 0:
-                idx = model.index(source_row, tile_col, source_parent)
-                val = model.data(idx, Qt.UserRole)
-                try:
-                    n = int(val)
-                except Exception:
-                    n = None
-                if n is None:
-                    return False
-                if self._tile_count_min is not None and n < self._tile_count_min:
-                    return False
-                if self._tile_count_max is not None and n > self._tile_count_max:
-                    return False
-
-        # file count range
-        if self._file_count_min is not None or self._file_count_max is not None:
-            file_col = self._find_column_by_label("ファイル数")
-            if file_col >= 0:
-                idx = model.index(source_row, file_col, source_parent)
-                val = model.data(idx, Qt.UserRole)
-                try:
-                    n = int(val)
-                except Exception:
-                    n = None
-                if n is None:
-                    return False
-                if self._file_count_min is not None and n < self._file_count_min:
-                    return False
-                if self._file_count_max is not None and n > self._file_count_max:
-                    return False
-
-        # tag count range
-        if self._tag_count_min is not None or self._tag_count_max is not None:
-            tag_col = self._find_column_by_label("TAG数")
-            if tag_col >= 0:
-                idx = model.index(source_row, tag_col, source_parent)
-                val = model.data(idx, Qt.UserRole)
-                try:
-                    n = int(val)
-                except Exception:
-                    n = None
-                if n is None:
-                    return False
-                if self._tag_count_min is not None and n < self._tag_count_min:
-                    return False
-                if self._tag_count_max is not None and n > self._tag_count_max:
-                    return False
+        column_count = model.columnCount()
+        for col_idx in sorted(self._filtered_columns):
+            if col_idx < 0 or col_idx >= column_count:
+                continue
+            raw_filter = (self._column_filters or {}).get(int(col_idx), "")
+            if int(col_idx) in (self._exact_match_column_indices or set()):
+                key = ("exact", col_idx, raw_filter)
+                specs.append(_RowFilterSpec(key, col_idx, "text", self._exact_match_test(raw_filter), text_column=col_idx))
+            else:
+                key = ("text", col_idx, raw_filter)
+                specs.append(_RowFilterSpec(key, col_idx, "folded", self._substring_test(raw_filter), text_column=col_idx))
+
+        # int range filters（列が無い場合は条件なし、数値にできない値は不一致）
+        for label, min_value, max_value in (
+            ("説明文字数", self._description_len_min, self._description_len_max),
+            ("関連データセット", self._related_count_min, self._related_count_max),
+            ("タイル数", self._tile_count_min, self._tile_count_max),
+            ("ファイル数", self._file_count_min, self._file_count_max),
+            ("TAG数", self._tag_count_min, self._tag_count_max),
+        ):
+            if min_value is None and max_value is None:
+                continue
+            col = self._find_column_by_label(label)
+            if col < 0:
+                continue
+            specs.append(
+                _RowFilterSpec(("int", col, min_value, max_value), col, "int", self._range_test(min_value, max_value))
+            )
 
-        return True
+        self._filter_specs = specs
+        return specs
+
+    @staticmethod
+    def _range_test(lower, upper):
+        def test(value) -> bool:
+            if value is None:
+                return False
+            if lower is not None and value < lower:
+                return False
+            if upper is not None and value > upper:
+                return False
+            return True
+
+        return test
+
+    @classmethod
+    def _substring_test(cls, raw_filter: str):
+        """部分一致（小文字化済みの列値に対して判定、'*' を含む語のみ正規表現）"""
+        literals: List[str] = []
+        wildcard_parts: List[str] = []
+        for term in cls._split_filter_terms(raw_filter):
+            if "*" in term:
+                pat = cls._compile_wildcard_pattern(term)
+                if pat is not None:
+                    wildcard_parts.append(pat.pattern)
+            else:
+                literals.append(term.lower())
+        wildcard = re.compile("|".join(wildcard_parts), re.IGNORECASE) if wildcard_parts else None
+
+        def test(folded: str) -> bool:
+            for literal in literals:
+                if literal in folded:
+                    return True
+            return bool(wildcard is not None and wildcard.search(folded))
+
+        return test
+
+    @classmethod
+    def _exact_match_test(cls, raw_filter: str):
+        """完全一致（括弧以降のサフィックスは無視、'*' はワイルドカード）"""
+        literals = set()
+        patterns: List[re.Pattern] = []
+        for term in cls._split_filter_terms(raw_filter):
+            t_key = cls._strip_parenthetical_suffix(term)
+            if "*" in term:
+                pat = cls._compile_wildcard_pattern(t_key)
+                if pat is not None:
+                    patterns.append(pat)
+            else:
+                literals.add(t_key.lower())
+
+        def test(text: str) -> bool:
+            cell_key = cls._strip_parenthetical_suffix(text)
+            if cell_key.lower() in literals:
+                return True
+            return any(p.fullmatch(cell_key) for p in patterns)
+
+        return test
 
     def lessThan(self, left: QModelIndex, right: QModelIndex) -> bool:  # noqa: N802
         model = self.sourceModel()
@@ -1029,10 +1035,17 @@ class DatasetFilterProxyModel(QSortFilterProxyModel):
         model = self.sourceModel()
         if model is None:
             return -1
+        self._sync_mask_version()
+        cached = self._column_by_label.get(label)
+        if cached is not None:
+            return cached
+        found = -1
         for i in range(model.columnCount()):
             if model.headerData(i, Qt.Horizontal, Qt.DisplayRole) == label:
-                return i
-        return -1
+                found = i
+                break
+        self._column_by_label[label] = found
+        return found
 
 
 class PaginationProxyModel(QAbstractProxyModel):
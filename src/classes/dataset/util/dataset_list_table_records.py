@@ -20,6 +20,7 @@ import os
 import time
 from pathlib import Path
 
+from classes.core.json_repository import load_json_cached
 from classes.dataset.util.data_entry_summary import compute_summary_from_payload
 
 from config.common import get_dynamic_file_path
@@ -412,7 +413,8 @@ def get_dataset_list_cache_metadata() -> Dict[str, Any]:
             candidate_updated = datetime.datetime.fromtimestamp(stat.st_mtime, tz=datetime.timezone.utc)
             if updated_at is None or candidate_updated > updated_at:
                 updated_at = candidate_updated
-            payload = _load_json_file(path)
+            with open(path, "r", encoding="utf-8") as handle:
+                payload = json.load(handle)
             if isinstance(payload, dict):
                 created_raw = payload.get("created_at")
                 try:
@@ -488,13 +490,8 @@ class DatasetListColumn:
 
 
 def _load_json_file(path: str) -> Any:
-    if not path:
-        return None
-    try:
-        with open(path, "r", encoding="utf-8") as handle:
-            return json.load(handle)
-    except Exception:
-        return None
+    # 取得済みJSONは他の一覧・タブと共有のリポジトリから読む（返り値は変更しない）
+    return load_json_cached(path)
 
 
 def _coerce_data_list(payload: Any) -> List[Dict[str, Any]]:
@@ -1045,18 +1042,9 @@ def build_dataset_list_rows_from_files() -> Tuple[List[DatasetListColumn], List[
             return None
         if dsid in data_entry_payload_cache:
             return data_entry_payload_cache[dsid]
-        try:
-            path = get_dynamic_file_path(f"output/rde/data/dataEntry/{dsid}.json")
-            if not path or not os.path.exists(path):
-                data_entry_payload_cache[dsid] = None
-                return None
-            with open(path, "r", encoding="utf-8") as fh:
-                payload = json.load(fh)
-            data_entry_payload_cache[dsid] = payload
-            return payload
-        except Exception:
-            data_entry_payload_cache[dsid] = None
-            return None
+        payload = _load_json_file(get_dynamic_file_path(f"output/rde/data/dataEntry/{dsid}.json"))
+        data_entry_payload_cache[dsid] = payload
+        return payload
 
     def _compute_tile_file_stats(dsid: str) -> Tuple[Optional[int], Optional[int], Optional[int]]:
         """Return (tile_count, shared2_file_count, shared2_bytes) best-effort."""
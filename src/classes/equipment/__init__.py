@@ -13,10 +13,13 @@ ARIM設備情報サイトからデータを取得し、Excel/JSON形式で出力
 from config.common import REVISION as __version__
 __author__ = "ARIM RDE Tool"
 
-# UIコンポーネント（Qt環境が利用可能な場合のみインポート）
-try:
+__all__ = ['EquipmentWidget']
+
+
+def __getattr__(name: str):
+    # UIコンポーネントは参照時に読み込む（core/util だけを使う CLI 等で Qt を読み込まないため）
+    if name != 'EquipmentWidget':
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
     from classes.equipment.ui import EquipmentWidget
-    __all__ = ['EquipmentWidget']
-except ImportError:
-    # Qt環境がない場合はスキップ（テスト環境など）
-    __all__ = []
+    globals()[name] = EquipmentWidget
+    return EquipmentWidget
@@ -12,7 +12,9 @@ from dataclasses import dataclass
 from typing import Callable, Optional, Sequence
 from urllib.parse import urlencode
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+
+from classes.utils.html_parsing import make_soup
 
 from net.http_helpers import proxy_get
 
@@ -52,7 +54,7 @@ class FacilityListingScraper:
         """総件数と最終ページを取得"""
         try:
             html = self._fetch_page_html(1)
-            soup = BeautifulSoup(html, "html.parser")
+            soup = make_soup(html)
             total = self._extract_total_count(soup)
             final_page = self._extract_final_page(soup)
 
@@ -162,7 +164,7 @@ class FacilityListingScraper:
         return max_page or None
 
     def _extract_ids_from_page(self, html: str) -> list[int]:
-        soup = BeautifulSoup(html, "html.parser")
+        soup = make_soup(html, parse_only=SoupStrainer("a", href=True))
         ids: list[int] = []
         for link in soup.find_all("a", href=True):
             href = str(link["href"])
@@ -6,12 +6,15 @@ ARIM設備情報サイトから設備データを取得する機能を提供し
 
 import logging
 from typing import Optional, Dict
-from net.http_helpers import proxy_get
+from net.http_cache import conditional_get_parsed
 from classes.equipment.util.field_parser import extract_facility_detail, validate_facility_data
 
 
 logger = logging.getLogger(__name__)
 
+# 条件付きGETで再利用するパース結果のキー（extract_facility_detail を変更したら更新する）
+FACILITY_PARSER_KEY = "equipment.facility_detail:v1"
+
 
 class FacilityScraper:
     """設備データ取得クラス
@@ -45,8 +48,17 @@ class FacilityScraper:
         try:
             logger.debug(f"設備データ取得開始: ID={facility_id}, URL={url}")
             
+            def _parse(resp) -> Optional[Dict[str, str]]:
+                if not resp or resp.status_code != 200:
+                    return None
+                # 文字コード設定
+                resp.encoding = 'utf-8'
+                # HTMLからデータ抽出
+                return extract_facility_detail(resp.text, facility_id)
+
             # http_helpers経由でリクエスト実行（プロキシ・SSL設定自動適用）
-            response = proxy_get(url, timeout=60)
+            # 前回取得時の ETag / Last-Modified で再検証し、未変更なら保存済みの結果を使う
+            facility_data, response = conditional_get_parsed(url, FACILITY_PARSER_KEY, _parse, timeout=60)
             
             if not response:
                 logger.warning(f"設備データ取得失敗: ID={facility_id} - レスポンスなし")
@@ -59,13 +71,6 @@ class FacilityScraper:
                 )
                 return None
             
-            # 文字コード設定
-            response.encoding = 'utf-8'
-            html = response.text
-            
-            # HTMLからデータ抽出
-            facility_data = extract_facility_detail(html, facility_id)
-            
             # データ検証
             if not validate_facility_data(facility_data):
                 logger.debug(f"設備データが空: ID={facility_id}")
@@ -8,8 +8,41 @@ import re
 from typing import Dict, Optional
 from classes.equipment.conf.field_definitions import FACILITY_FIELDS
 from classes.equipment.util.name_parser import split_device_name_from_facility_name
+from classes.utils.html_parsing import memoize_parse
 
 
+_ROW_HEADER_OPEN = '<th scope="row">'
+_ROW_HEADER_CLOSE = '</th>'
+_CELL_CLOSE = '</td>'
+
+
+def _index_row_headers(html: str) -> Dict[str, int]:
+    """<th scope="row">見出し</th> の見出し → 最初に現れた位置 の索引を1回の走査で作る"""
+    index: Dict[str, int] = {}
+    pos = html.find(_ROW_HEADER_OPEN)
+    while pos != -1:
+        name_start = pos + len(_ROW_HEADER_OPEN)
+        name_end = html.find(_ROW_HEADER_CLOSE, name_start)
+        if name_end == -1:
+            break
+        index.setdefault(html[name_start:name_end], pos)
+        pos = html.find(_ROW_HEADER_OPEN, name_start)
+    return index
+
+
+def _slice_field(html: str, header_index: Dict[str, int], field_name: str) -> Optional[str]:
+    """見出しから直後の </td> までを切り出す（正規表現 <th scope="row">名前</th>.*?</td> と同じ範囲）"""
+    start = header_index.get(field_name)
+    if start is None:
+        return None
+    header_end = start + len(_ROW_HEADER_OPEN) + len(field_name) + len(_ROW_HEADER_CLOSE)
+    cell_end = html.find(_CELL_CLOSE, header_end)
+    if cell_end == -1:
+        return None
+    return html[start:cell_end + len(_CELL_CLOSE)]
+
+
+@memoize_parse()
 def extract_facility_detail(html: str, facility_id: int) -> Dict[str, str]:
     """設備詳細情報をHTMLから抽出
     
@@ -22,20 +55,15 @@ def extract_facility_detail(html: str, facility_id: int) -> Dict[str, str]:
     """
     result = {"code": str(facility_id)}
     
-    # <div id="facilityDetail"> セクションを抽出
-    facility_detail_match = re.findall(
-        r'<div id="facilityDetail">.*?</div>', 
-        html, 
-        flags=re.DOTALL
-    )
-    
-    if not facility_detail_match:
+    # <div id="facilityDetail"> セクションの有無を確認
+    if not re.search(r'<div id="facilityDetail">.*?</div>', html, flags=re.DOTALL):
         return result
     
-    # 各フィールドを抽出
+    # 各フィールドを抽出（見出し位置は1回の走査で索引化）
+    header_index = _index_row_headers(html)
     for field_name in FACILITY_FIELDS:
-        value = extract_field_value(html, field_name)
-        result[field_name] = value
+        raw = _slice_field(html, header_index, field_name)
+        result[field_name] = clean_html_value(raw, field_name) if raw is not None else ""
     
     # 追加フィールドの生成
     if "設備名称" in result:
@@ -63,20 +91,14 @@ def extract_field_value(html: str, field_name: str) -> str:
     Returns:
         str: 抽出された値（見つからない場合は空文字列）
     """
-    # <th>フィールド名</th>...<td>値</td> のパターンを検索
-    pattern = r'<th scope="row">{}</th>.*?</td>'.format(re.escape(field_name))
-    matches = re.findall(pattern, html, flags=re.DOTALL)
+    # <th>フィールド名</th>...<td>値</td> の範囲を検索
+    value = _slice_field(html, _index_row_headers(html), field_name)
     
-    if not matches:
+    if value is None:
         return ""
     
-    # 最初のマッチから値を抽出
-    value = matches[0]
-    
     # HTMLをクリーニング
-    value = clean_html_value(value, field_name)
-    
-    return value
+    return clean_html_value(value, field_name)
 
 
 def clean_html_value(value: str, field_name: str = "") -> str:
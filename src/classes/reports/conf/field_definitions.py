@@ -66,9 +66,15 @@ REPORT_DETAIL_URL = f"{BASE_URL}/user_report.php?mode=detail&code={{code}}&key={
 # 並列実行数（デフォルト）
 DEFAULT_MAX_WORKERS = 5
 
+# 一覧ページの同時取得数（ホスト単位の送出上限は net.host_governor が別途適用）
+LISTING_MAX_WORKERS = 4
+
 # チャンクサイズ（Excel保存の頻度）
 SAVE_CHUNK_SIZE = 10
 
+# 条件付きGETで再利用するパース結果のキー（extract_report_fields を変更したら更新する）
+REPORT_PARSER_KEY = "reports.detail:v1"
+
 # ページネーションのCSSセレクタ
 PAGINATION_SELECTOR = ".pageNavBox .pageNav a[href*='page=']"
 
@@ -6,10 +6,12 @@
 """
 
 import logging
-from typing import List, Dict, Tuple, Callable, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+from typing import List, Dict, Tuple, Callable, Optional, Iterable, Iterator
 import time
 
+from net.parallel_executor import iter_parallel
+
 from .report_scraper import ReportScraper
 from .report_cache_manager import ReportCacheManager, ReportCacheMode
 
@@ -17,6 +19,36 @@ from .report_cache_manager import ReportCacheManager, ReportCacheMode
 logger = logging.getLogger(__name__)
 
 
+class _AdaptivePacer:
+    """
+    詳細取得の送出間隔を応答状況から調整する（固定スリープの置き換え）
+
+    成功が続く間は待たずに送出し、失敗や低速応答が続くと間隔を倍々で広げ、
+    成功するたびに少しずつ縮める。429 / Retry-After によるホスト単位の停止は
+    net.host_governor 側で行うため、ここでは扱わない。
+    """
+
+    def __init__(self, step: float = 0.1, max_delay: float = 2.0, slow_threshold: float = 5.0):
+        self._lock = threading.Lock()
+        self._step = step
+        self._max_delay = max_delay
+        self._slow_threshold = slow_threshold
+        self._delay = 0.0
+
+    def wait(self) -> None:
+        with self._lock:
+            delay = self._delay
+        if delay > 0:
+            time.sleep(delay)
+
+    def record(self, ok: bool, elapsed: float) -> None:
+        with self._lock:
+            if not ok or elapsed > self._slow_threshold:
+                self._delay = min(self._max_delay, max(self._step, self._delay * 2))
+            else:
+                self._delay = max(0.0, self._delay - self._step)
+
+
 class ParallelReportFetcher:
     """
     報告書並列取得クラス
@@ -41,6 +73,7 @@ class ParallelReportFetcher:
         self.scraper = ReportScraper()
         self.cache_manager = cache_manager or ReportCacheManager()
         self.cache_mode = cache_mode
+        self._pacer = _AdaptivePacer()
         logger.info(
             "ParallelReportFetcher初期化: max_workers=%s, cache_mode=%s",
             max_workers,
@@ -73,89 +106,7 @@ class ParallelReportFetcher:
             >>> print(f"成功: {len(success)}, 失敗: {len(errors)}")
         """
         logger.info(f"並列取得開始: {len(report_links)} 件")
-
-        success_data: List[Dict] = []
-        error_data: List[Dict] = []
-        total = len(report_links)
-
-        self._safe_progress(progress_callback, 0, total, "並列取得を開始します...")
-
-        pending_links, cache_hits = self._apply_cache_hits(
-            report_links,
-            success_data,
-            total,
-            progress_callback,
-        )
-        completed = len(success_data)
-
-        if pending_links:
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                futures = {
-                    executor.submit(self._fetch_single, link): link
-                    for link in pending_links
-                }
-
-                for future in as_completed(futures):
-                    link = futures[future]
-                    completed += 1
-
-                    try:
-                        result = future.result()
-
-                        if result:
-                            success_data.append(result)
-                            self._save_to_cache(result)
-                            code = link.get('code', 'unknown')
-                            self._safe_progress(
-                                progress_callback,
-                                completed,
-                                total,
-                                f"✓ 取得成功: code={code} ({completed}/{total})",
-                            )
-                        else:
-                            error_data.append({
-                                "link": link,
-                                "error": "Failed to fetch report",
-                            })
-                            code = link.get('code', 'unknown')
-                            self._safe_progress(
-                                progress_callback,
-                                completed,
-                                total,
-                                f"✗ 取得失敗: code={code} ({completed}/{total})",
-                            )
-
-                    except Exception as e:
-                        logger.error(f"タスク実行エラー ({link}): {e}")
-                        error_data.append({
-                            "link": link,
-                            "error": str(e),
-                        })
-                        code = link.get('code', 'unknown')
-                        self._safe_progress(
-                            progress_callback,
-                            completed,
-                            total,
-                            f"⚠ エラー: code={code} - {str(e)[:50]}",
-                        )
-        else:
-            logger.info("取得対象は全件キャッシュ再利用されました")
-
-        logger.info(
-            "並列取得完了: 成功=%s, 失敗=%s, キャッシュ再利用=%s",
-            len(success_data),
-            len(error_data),
-            cache_hits,
-        )
-
-        self._safe_progress(
-            progress_callback,
-            total,
-            total,
-            f"完了: 成功={len(success_data)}, 失敗={len(error_data)}",
-        )
-
-        return success_data, error_data
+        return self._fetch_link_batches([list(report_links)], progress_callback, total=len(report_links))
     
     def fetch_range(
         self,
@@ -175,8 +126,8 @@ class ParallelReportFetcher:
             (success_data, error_data) のタプル
         
         Note:
-            1. 報告書一覧を取得
-            2. 並列ダウンロード実行
+            一覧ページを並列取得し、届いたページの報告書から順に詳細取得を開始します
+            （一覧の取得完了を待たない）。進捗の total は一覧の取得に合わせて増えます。
         """
         logger.info(f"範囲指定取得開始: start_page={start_page}, max_pages={max_pages}")
         
@@ -184,38 +135,126 @@ class ParallelReportFetcher:
         if progress_callback:
             progress_callback(0, 0, "報告書一覧を取得中...")
         
-        # 報告書一覧取得
-        try:
-            report_links = self.scraper.get_report_list(
-                max_pages=max_pages,
-                start_page=start_page
-            )
-            
-            logger.info(f"報告書一覧取得完了: {len(report_links)} 件")
-            
-            # プログレス通知（一覧取得完了）
-            if progress_callback:
-                progress_callback(0, len(report_links), f"報告書一覧取得完了: {len(report_links)} 件")
-            
-        except Exception as e:
-            logger.error(f"報告書一覧取得エラー: {e}")
-            if progress_callback:
-                progress_callback(0, 0, f"エラー: 報告書一覧取得失敗 - {str(e)}")
-            return [], []
-        
-        # 並列取得実行
-        return self.fetch_reports(report_links, progress_callback)
+        pages = self.scraper.iter_report_list_pages(max_pages=max_pages, start_page=start_page)
+        return self._fetch_link_batches((links for _page_num, links in pages), progress_callback)
     
     # ========================================
     # プライベートメソッド
     # ========================================
 
+    def _fetch_link_batches(
+        self,
+        link_batches: Iterable[List[Dict[str, str]]],
+        progress_callback: Optional[Callable[[int, int, str], None]],
+        total: Optional[int] = None,
+    ) -> Tuple[List[Dict], List[Dict]]:
+        """
+        リンクのバッチ（一覧ページ単位など）を受け取り次第、詳細取得を投入する
+
+        バッチは詳細取得の空きに合わせて読み進める（iter_parallel の max_pending による）。
+        total が None の場合はバッチの受信に合わせて総件数を加算する（一覧取得と並行する場合）。
+        """
+        success_data: List[Dict] = []
+        error_data: List[Dict] = []
+        streaming = total is None
+        total = total or 0
+        completed = 0
+        cache_hits = 0
+        submitted = 0
+
+        self._safe_progress(progress_callback, 0, total, "並列取得を開始します...")
+
+        def pending_links() -> Iterator[Tuple[Dict[str, str]]]:
+            # 詳細取得に空きができた分だけ一覧（バッチ）を読み進める
+            nonlocal total, completed, cache_hits, submitted
+            try:
+                for links in link_batches:
+                    if streaming:
+                        total += len(links)
+                    pending, hits = self._apply_cache_hits(
+                        links,
+                        success_data,
+                        total,
+                        progress_callback,
+                        completed=completed,
+                    )
+                    cache_hits += hits
+                    completed += hits
+                    submitted += len(pending)
+                    for link in pending:
+                        yield (link,)
+            except Exception as e:
+                logger.error(f"報告書一覧取得エラー: {e}")
+                self._safe_progress(progress_callback, completed, total, f"エラー: 報告書一覧取得失敗 - {str(e)}")
+
+            if streaming:
+                logger.info(f"報告書一覧取得完了: {total} 件")
+                self._safe_progress(progress_callback, completed, total, f"報告書一覧取得完了: {total} 件")
+
+        for result in iter_parallel(pending_links(), self._fetch_single, max_workers=self.max_workers):
+            link = result.task[0]
+            completed += 1
+            code = link.get('code', 'unknown')
+
+            if result.exception is not None:
+                logger.error(f"タスク実行エラー ({link}): {result.error}")
+                error_data.append({
+                    "link": link,
+                    "error": result.error,
+                })
+                self._safe_progress(
+                    progress_callback,
+                    completed,
+                    total,
+                    f"⚠ エラー: code={code} - {result.error[:50]}",
+                )
+            elif result.value:
+                success_data.append(result.value)
+                self._save_to_cache(result.value)
+                self._safe_progress(
+                    progress_callback,
+                    completed,
+                    total,
+                    f"✓ 取得成功: code={code} ({completed}/{total})",
+                )
+            else:
+                error_data.append({
+                    "link": link,
+                    "error": "Failed to fetch report",
+                })
+                self._safe_progress(
+                    progress_callback,
+                    completed,
+                    total,
+                    f"✗ 取得失敗: code={code} ({completed}/{total})",
+                )
+
+        if not submitted:
+            logger.info("取得対象は全件キャッシュ再利用されました")
+
+        logger.info(
+            "並列取得完了: 成功=%s, 失敗=%s, キャッシュ再利用=%s",
+            len(success_data),
+            len(error_data),
+            cache_hits,
+        )
+
+        self._safe_progress(
+            progress_callback,
+            total,
+            total,
+            f"完了: 成功={len(success_data)}, 失敗={len(error_data)}",
+        )
+
+        return success_data, error_data
+
     def _apply_cache_hits(
         self,
         report_links: List[Dict[str, str]],
         success_data: List[Dict],
         total: int,
         progress_callback: Optional[Callable[[int, int, str], None]],
+        completed: int = 0,
     ) -> Tuple[List[Dict[str, str]], int]:
         if not self.cache_manager or self.cache_mode != ReportCacheMode.SKIP:
             return list(report_links), 0
@@ -229,11 +268,12 @@ class ParallelReportFetcher:
                 success_data.append(cached)
                 cache_hits += 1
                 code = link.get('code', 'unknown')
+                current = completed + cache_hits
                 self._safe_progress(
                     progress_callback,
-                    len(success_data),
+                    current,
                     total,
-                    f"↺ キャッシュ再利用: code={code} ({len(success_data)}/{total})",
+                    f"↺ キャッシュ再利用: code={code} ({current}/{total})",
                 )
             else:
                 pending_links.append(link)
@@ -287,13 +327,16 @@ class ParallelReportFetcher:
             return None
         
         try:
-            # 少し待機（サーバー負荷軽減）
-            time.sleep(0.1)
+            # 失敗・低速応答が続く間だけ送出間隔を空ける（サーバー負荷軽減）
+            self._pacer.wait()
             
             # 報告書取得
+            started = time.monotonic()
             report_data = self.scraper.fetch_report(url)
+            self._pacer.record(report_data is not None, time.monotonic() - started)
             return report_data
             
         except Exception as e:
+            self._pacer.record(False, 0.0)
             logger.error(f"報告書取得エラー ({url}): {e}")
             return None
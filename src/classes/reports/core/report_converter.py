@@ -3,22 +3,31 @@
 
 ARIM-extracted2フォーマットから標準フォーマットへのExcel変換を実施。
 カラムマッピング、設備列の変換、チャンク処理、レジューム対応を含む。
+チャンクは行ログ(JSONL)へ追記し、Excelは最後に write_only モードで1回だけ生成する。
 """
 
 import ast
 import json
 import os
 import re
-from typing import Optional, Dict, Any, List, Callable, cast
+from datetime import date, datetime
+from typing import Optional, Dict, Any, List, Callable
 
 from dataclasses import dataclass
-from openpyxl import Workbook, load_workbook
-from openpyxl.worksheet._read_only import ReadOnlyWorksheet
-from openpyxl.worksheet.worksheet import Worksheet
+from openpyxl import Workbook
 
 from classes.utils.excel_records import load_excel_records
 
 
+# 変換途中の行ログ（JSONL、1行=1レコード）と進捗ファイルの形式
+ROW_LOG_SUFFIX = '.rows.jsonl'
+PROGRESS_VERSION = 2
+ROW_LOG_DATETIME_KEY = '$datetime'
+ROW_LOG_DATE_KEY = '$date'
+# 旧形式（チャンクごとに一時Excelを再保存）で残る一時ファイル
+LEGACY_TMP_OUTPUT_SUFFIX = '.tmp.xlsx'
+
+
 @dataclass
 class ConversionResult:
     """変換結果"""
@@ -201,52 +210,71 @@ class ReportConverter:
                 except OSError:
                     pass
 
-    def _write_chunk(self, output_path: str, records: List[Dict[str, Any]], *, append: bool) -> None:
-        if append and os.path.exists(output_path):
-            workbook = load_workbook(output_path)
-            worksheet = cast(Worksheet, workbook.active)
-        else:
-            workbook = Workbook()
-            worksheet = cast(Worksheet, workbook.active)
-            worksheet.append(self.OUTPUT_COLUMNS)
+    @staticmethod
+    def _encode_cell(value: Any) -> Any:
+        """行ログ(JSONL)用にセル値をJSON化する（日時は型を保持して復元できる形にする）"""
+        if value is None or isinstance(value, (str, int, float, bool)):
+            return value
+        if isinstance(value, datetime):
+            return {ROW_LOG_DATETIME_KEY: value.isoformat()}
+        if isinstance(value, date):
+            return {ROW_LOG_DATE_KEY: value.isoformat()}
+        return str(value)
 
-        try:
+    @staticmethod
+    def _decode_cell(value: Any) -> Any:
+        if isinstance(value, dict):
+            if ROW_LOG_DATETIME_KEY in value:
+                return datetime.fromisoformat(value[ROW_LOG_DATETIME_KEY])
+            if ROW_LOG_DATE_KEY in value:
+                return date.fromisoformat(value[ROW_LOG_DATE_KEY])
+        return value
+
+    def _write_chunk(self, rows_file: str, records: List[Dict[str, Any]], *, append: bool) -> int:
+        """変換済み行を行ログ(JSONL)へ追記し、書き込み後のファイルサイズを返す。
+
+        ワークブックは最後に1回だけ生成するため、チャンクごとのコストは行数に比例するだけで済む。
+        """
+        with open(rows_file, 'ab' if append else 'wb') as f:
             for record in records:
-                worksheet.append([record.get(column) for column in self.OUTPUT_COLUMNS])
+                row = [self._encode_cell(record.get(column)) for column in self.OUTPUT_COLUMNS]
+                f.write(json.dumps(row, ensure_ascii=False).encode('utf-8'))
+                f.write(b"\n")
+            f.flush()
+            os.fsync(f.fileno())
+            return f.tell()
 
-            self._save_workbook_atomically(workbook, output_path)
-        finally:
-            close = getattr(workbook, "close", None)
-            if callable(close):
-                close()
+    def _materialize_workbook(self, rows_file: str, output_path: str) -> int:
+        """行ログを write_only ワークブックへ1行ずつ書き出し、出力先へ原子的に配置する。"""
+        workbook = Workbook(write_only=True)
+        worksheet = workbook.create_sheet()
+        worksheet.append(self.OUTPUT_COLUMNS)
+        row_count = 0
+        with open(rows_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                worksheet.append([self._decode_cell(value) for value in json.loads(line)])
+                row_count += 1
+        self._save_workbook_atomically(workbook, output_path)
+        return row_count
 
-    def _inspect_resume_workbook(self, tmp_output_file: str) -> Optional[int]:
-        """レジューム用ワークブックを検証し、保持済みデータ行数を返す。"""
-        try:
-            workbook = load_workbook(tmp_output_file, read_only=True, data_only=True)
-        except Exception:
-            return None
+    @staticmethod
+    def _input_signature(input_path: str) -> Dict[str, Any]:
+        stat = os.stat(input_path)
+        return {'size': stat.st_size, 'mtime': stat.st_mtime}
 
-        try:
-            worksheet = cast(ReadOnlyWorksheet, workbook.active)
-            header_row = next(worksheet.iter_rows(min_row=1, max_row=1, values_only=True), None)
-            if header_row is None:
-                return None
-            normalized_headers = ["" if value is None else str(value) for value in header_row]
-            if normalized_headers[:len(self.OUTPUT_COLUMNS)] != self.OUTPUT_COLUMNS:
-                return None
-            max_row = worksheet.max_row or 1
-            return max(max_row - 1, 0)
-        except Exception:
-            return None
-        finally:
-            close = getattr(workbook, "close", None)
-            if callable(close):
-                close()
+    @staticmethod
+    def _save_progress(progress_file: str, progress: Dict[str, Any]) -> None:
+        staging_path = progress_file + ".writing"
+        with open(staging_path, 'w', encoding='utf-8') as f:
+            json.dump(progress, f)
+        os.replace(staging_path, progress_file)
 
-    def _clear_resume_state(self, progress_file: str, tmp_output_file: str, reason: str) -> None:
+    def _clear_resume_state(self, progress_file: str, rows_file: str, reason: str) -> None:
         """破損・不整合なレジューム状態を削除する。"""
-        for stale_path in (progress_file, tmp_output_file):
+        legacy_tmp_output = rows_file[:-len(ROW_LOG_SUFFIX)] + LEGACY_TMP_OUTPUT_SUFFIX
+        for stale_path in (progress_file, rows_file, legacy_tmp_output):
             if not os.path.exists(stale_path):
                 continue
             try:
@@ -260,9 +288,14 @@ class ReportConverter:
         *,
         resume: bool,
         progress_file: str,
-        tmp_output_file: str,
+        rows_file: str,
+        input_signature: Dict[str, Any],
     ) -> int:
-        """レジューム可能なら開始インデックスを返し、不整合なら安全にリセットする。"""
+        """レジューム可能なら開始インデックスを返し、不整合なら安全にリセットする。
+
+        convert_progress.json に記録した行ログのバイト位置まで行ログを切り詰めて再開する
+        （最後のチェックポイント以降に途中まで書かれた行は破棄される）。
+        """
         if not resume or not os.path.exists(progress_file):
             return 0
 
@@ -270,21 +303,25 @@ class ReportConverter:
             with open(progress_file, 'r', encoding='utf-8') as f:
                 progress = json.load(f)
             progress_index = int(progress.get('last_index', 0) or 0)
+            rows_bytes = int(progress.get('rows_bytes', -1))
         except Exception as exc:
-            self._clear_resume_state(progress_file, tmp_output_file, f"進捗ファイルを読めません ({exc})")
+            self._clear_resume_state(progress_file, rows_file, f"進捗ファイルを読めません ({exc})")
             return 0
 
-        resume_rows = self._inspect_resume_workbook(tmp_output_file)
-        if resume_rows is None:
-            self._clear_resume_state(progress_file, tmp_output_file, "一時Excelが破損または不正です")
+        if progress.get('version') != PROGRESS_VERSION:
+            self._clear_resume_state(progress_file, rows_file, "旧形式の進捗ファイルです")
+            return 0
+        if progress.get('input') != input_signature:
+            self._clear_resume_state(progress_file, rows_file, "入力ファイルが前回から変更されています")
+            return 0
+        if rows_bytes < 0 or not os.path.exists(rows_file) or os.path.getsize(rows_file) < rows_bytes:
+            self._clear_resume_state(progress_file, rows_file, "行ログが見つからないか不完全です")
             return 0
 
-        if resume_rows != progress_index:
-            self._log(
-                f"レジューム情報を補正: progress={progress_index}行, tmp={resume_rows}行"
-            )
+        with open(rows_file, 'r+b') as f:
+            f.truncate(rows_bytes)
 
-        start_idx = resume_rows
+        start_idx = progress_index
         self._log(f"レジューム: {start_idx}行目から再開")
         return start_idx
     
@@ -326,23 +363,27 @@ class ReportConverter:
             # 進捗管理用ファイル
             output_dir = os.path.dirname(output_path)
             progress_file = os.path.join(output_dir, 'convert_progress.json')
-            tmp_output_file = output_path + '.tmp.xlsx'
+            rows_file = output_path + ROW_LOG_SUFFIX
+            input_signature = self._input_signature(input_path)
             
             # レジューム対応
             start_idx = self._resolve_resume_start_index(
                 resume=resume,
                 progress_file=progress_file,
-                tmp_output_file=tmp_output_file,
+                rows_file=rows_file,
+                input_signature=input_signature,
             )
             
             # チャンク処理
             num_rows = len(output_records)
             if start_idx > num_rows:
-                self._log(
-                    f"レジューム位置を補正: {start_idx}行 -> {num_rows}行 (入力総行数を超過)"
+                self._clear_resume_state(
+                    progress_file, rows_file, f"レジューム位置 {start_idx}行 が入力総行数 {num_rows}行 を超過"
                 )
-                start_idx = num_rows
+                start_idx = 0
             self._log(f"変換開始: {num_rows}行 ({start_idx}行目から)")
+            if start_idx == 0:
+                self._write_chunk(rows_file, [], append=False)
             
             for chunk_start in range(start_idx, num_rows, self.CHUNK_SIZE):
                 chunk_end = min(chunk_start + self.CHUNK_SIZE, num_rows)
@@ -351,20 +392,26 @@ class ReportConverter:
                 # チャンク変換
                 chunk_transformed = self._transform_chunk(chunk_records)
                 
-                # 保存
-                self._write_chunk(tmp_output_file, chunk_transformed, append=(chunk_start != 0))
+                # 行ログへ追記
+                rows_bytes = self._write_chunk(rows_file, chunk_transformed, append=True)
                 
                 # 進捗保存
-                with open(progress_file, 'w', encoding='utf-8') as f:
-                    json.dump({'last_index': chunk_end}, f)
+                self._save_progress(progress_file, {
+                    'version': PROGRESS_VERSION,
+                    'last_index': chunk_end,
+                    'rows_bytes': rows_bytes,
+                    'input': input_signature,
+                })
                 
                 progress_pct = (chunk_end / num_rows) * 100
                 self._log(f"変換中: {chunk_end}/{num_rows}行 ({progress_pct:.1f}%)")
             
-            # 完了時にリネーム&進捗ファイル削除
-            os.replace(tmp_output_file, output_path)
-            if os.path.exists(progress_file):
-                os.remove(progress_file)
+            # 完了時にExcelを一括生成&行ログ・進捗ファイル削除
+            self._log("Excel書き出し中...")
+            self._materialize_workbook(rows_file, output_path)
+            for finished_path in (rows_file, progress_file):
+                if os.path.exists(finished_path):
+                    os.remove(finished_path)
             
             self._log(f"変換完了: {output_path}")
             
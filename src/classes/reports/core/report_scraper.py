@@ -8,13 +8,17 @@
 import re
 import math
 import logging
+from contextlib import closing
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 from urllib.parse import urlparse, parse_qs, urlencode
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 # HTTPヘルパー（本アプリの統一されたrequests機能）
 from net.http_helpers import proxy_get, proxy_post
+from classes.utils.html_parsing import HTML_PARSER_BACKEND, make_soup, memoize_parse
+from net.http_cache import conditional_get_parsed
+from net.parallel_executor import iter_parallel
 
 # 報告書機能の設定とユーティリティ
 from ..conf.field_definitions import (
@@ -25,8 +29,11 @@ from ..conf.field_definitions import (
     PAGINATION_SELECTOR,
     REPORT_LIST_DEFAULT_QUERY,
     REPORTS_PER_PAGE,
+    LISTING_MAX_WORKERS,
+    REPORT_PARSER_KEY,
 )
 from ..util.html_parser import (
+    HeadingIndex,
     safe_extract_text,
     safe_find_tag,
     extract_links_from_next_p,
@@ -58,6 +65,7 @@ class ReportScraper:
         self.detail_url_template = REPORT_DETAIL_URL
         self.list_query = REPORT_LIST_DEFAULT_QUERY.copy()
         self.per_page = REPORTS_PER_PAGE
+        self.listing_max_workers = LISTING_MAX_WORKERS
     
     def get_report_list(
         self,
@@ -80,6 +88,53 @@ class ReportScraper:
         """
         self.logger.info(f"報告書一覧取得開始: start_page={start_page}, max_pages={max_pages}")
         
+        # ページ順に並べ直して返す（取得自体は並列）
+        pages = dict(self.iter_report_list_pages(max_pages=max_pages, start_page=start_page))
+        all_links = [link for page_num in sorted(pages) for link in pages[page_num]]
+        
+        self.logger.info(f"報告書一覧取得完了: 合計 {len(all_links)} 件")
+        return all_links
+
+    def iter_report_list_pages(
+        self,
+        max_pages: Optional[int] = None,
+        start_page: int = 1,
+        max_workers: Optional[int] = None,
+    ) -> Iterator[Tuple[int, List[Dict[str, str]]]]:
+        """
+        報告書一覧の各ページを並列取得し、取得できたページから順に返す
+        
+        Args:
+            max_pages: 取得する最大ページ数（Noneの場合は全ページ）
+            start_page: 開始ページ番号
+            max_workers: 一覧ページの同時取得数（Noneの場合は LISTING_MAX_WORKERS）
+        
+        Yields:
+            (ページ番号, 報告書リンク情報のリスト)。順序はページ番号順とは限らない。
+        
+        Note:
+            取得に失敗したページはログに記録してスキップします。
+        """
+        end_page = self._resolve_end_page(max_pages, start_page)
+        pages = list(range(start_page, end_page + 1))
+        if not pages:
+            return
+
+        workers = max(1, min(max_workers or self.listing_max_workers, len(pages)))
+        # 呼び出し側が途中で打ち切った場合、未着手のページは取得しない
+        results = iter_parallel(((page_num,) for page_num in pages), self._get_links_from_page, max_workers=workers)
+        with closing(results):
+            for result in results:
+                page_num = result.task[0]
+                if result.exception is not None:
+                    self.logger.error(f"ページ {page_num} の取得失敗: {result.error}")
+                    continue
+                links = result.value
+                self.logger.info(f"ページ {page_num}: {len(links)} 件取得")
+                yield page_num, links
+
+    def _resolve_end_page(self, max_pages: Optional[int], start_page: int) -> int:
+        """一覧サマリから取得対象の最終ページ番号を決める"""
         summary = self._get_listing_summary()
         if summary:
             final_page = summary.final_page
@@ -103,20 +158,7 @@ class ReportScraper:
             self.logger.info(
                 f"ページ範囲: {start_page} - {end_page} (最終: {final_page})"
             )
-        
-        # 各ページから報告書リンクを取得
-        all_links = []
-        for page_num in range(start_page, end_page + 1):
-            try:
-                links = self._get_links_from_page(page_num)
-                all_links.extend(links)
-                self.logger.info(f"ページ {page_num}: {len(links)} 件取得")
-            except Exception as e:
-                self.logger.error(f"ページ {page_num} の取得失敗: {e}")
-                continue
-        
-        self.logger.info(f"報告書一覧取得完了: 合計 {len(all_links)} 件")
-        return all_links
+        return end_page
 
     def get_listing_summary(self) -> Optional[ReportListingSummary]:
         """外部向けの一覧サマリAPI"""
@@ -156,55 +198,8 @@ class ReportScraper:
                 self.logger.warning(f"検索失敗: HTTPステータス {response.status_code}")
                 return []
             
-            # レスポンスHTMLをパース
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
             # 報告書リンクを抽出（_get_links_from_page と同じロジック）
-            links = []
-            
-            for a_tag in soup.find_all('a', href=True):
-                href = a_tag.get('href', '')
-                
-                # hrefを文字列に変換
-                if not isinstance(href, str):
-                    continue
-                
-                # 報告書詳細ページのリンクをフィルタ
-                if 'user_report.php' in href and 'mode=detail' in href and 'code=' in href and 'key=' in href:
-                    # 絶対URLに変換
-                    if not href.startswith('http'):
-                        if href.startswith('/'):
-                            full_url = f"{self.base_url}{href}"
-                        else:
-                            full_url = f"{self.base_url}/{href}"
-                    else:
-                        full_url = href
-                    
-                    # URLからcode/keyを抽出
-                    try:
-                        parsed_url = urlparse(full_url)
-                        params = parse_qs(parsed_url.query)
-                        code = params.get('code', [None])[0]
-                        key = params.get('key', [None])[0]
-                        
-                        if code and key:
-                            # タイトルを取得
-                            title = a_tag.get_text(strip=True) or f"Report {code}"
-                            
-                            link_info = {
-                                'code': code,
-                                'key': key,
-                                'url': full_url,
-                                'title': title
-                            }
-                            
-                            # 重複チェック
-                            if not any(l['code'] == code and l['key'] == key for l in links):
-                                links.append(link_info)
-                    
-                    except Exception as e:
-                        self.logger.warning(f"リンク解析エラー ({href}): {e}")
-                        continue
+            links = self._extract_report_links(response.text)
             
             self.logger.info(f"キーワード検索完了: {len(links)} 件の報告書を発見")
             return links
@@ -237,17 +232,22 @@ class ReportScraper:
             code = params.get('code', [None])[0]
             key = params.get('key', [None])[0]
             
-            # HTMLを取得（http_helpers経由）
-            response = proxy_get(report_url)
-            response.encoding = 'utf-8'
+            def _parse(resp) -> Optional[Dict]:
+                if resp.status_code != 200:
+                    return None
+                resp.encoding = 'utf-8'
+                # HTMLからフィールドを抽出
+                return self.extract_report_fields(resp.text)
             
-            if response.status_code != 200:
+            # HTMLを取得（http_helpers経由、ETag / Last-Modified で再検証）
+            report_data, response = conditional_get_parsed(
+                report_url, f"{REPORT_PARSER_KEY}/{HTML_PARSER_BACKEND}", _parse
+            )
+            
+            if response.status_code != 200 or report_data is None:
                 self.logger.warning(f"HTTPエラー: {response.status_code}")
                 return None
             
-            # HTMLからフィールドを抽出
-            report_data = self.extract_report_fields(response.text)
-            
             # code/keyを追加
             report_data['code'] = code if code else ''
             report_data['key'] = key if key else ''
@@ -259,6 +259,7 @@ class ReportScraper:
             self.logger.error(f"報告書取得エラー ({report_url}): {e}", exc_info=True)
             return None
     
+    @memoize_parse(skip_self=True)
     def extract_report_fields(self, html_content: str) -> Dict:
         """
         HTMLから報告書フィールドを抽出
@@ -273,7 +274,9 @@ class ReportScraper:
             EXCEL_COLUMNSに定義された全フィールドを抽出します。
             見つからないフィールドは空文字列になります。
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
+        # 見出しは1回の走査で索引化し、フィールドごとの全体走査を避ける
+        headings = HeadingIndex(soup)
         extracted_data = {}
         
         # 基本フィールドの抽出
@@ -285,14 +288,14 @@ class ReportScraper:
         ]
         
         for field_name in basic_fields:
-            tag = safe_find_tag(soup, 'h5', field_name)
+            tag = safe_find_tag(headings, 'h5', field_name)
             extracted_data[field_name] = safe_extract_text(tag)
         
         # 技術領域の抽出（横断技術領域・重要技術領域）
-        self._extract_technology_areas(soup, extracted_data)
+        self._extract_technology_areas(headings, extracted_data)
         
         # キーワードの抽出
-        extracted_data['キーワード / Keywords'] = self._extract_keywords(soup, html_content)
+        extracted_data['キーワード / Keywords'] = self._extract_keywords(headings, html_content)
         
         # 利用者情報の抽出
         user_fields = [
@@ -301,23 +304,23 @@ class ReportScraper:
         ]
         
         for field_name in user_fields:
-            tag = safe_find_tag(soup, 'h5', field_name)
+            tag = safe_find_tag(headings, 'h5', field_name)
             extracted_data[field_name] = safe_extract_text(tag)
         
         # 共同利用者（特殊処理が必要）
-        self._extract_collaborators(soup, extracted_data)
+        self._extract_collaborators(headings, extracted_data)
         
         # ARIM支援担当者
         field_name = "ARIM実施機関支援担当者 / Names of Collaborators in The Hub and Spoke Institutes"
-        tag = safe_find_tag(soup, 'h5', field_name)
+        tag = safe_find_tag(headings, 'h5', field_name)
         extracted_data[field_name] = safe_extract_text(tag)
         
         # 利用形態の抽出
-        self._extract_support_types(soup, extracted_data)
+        self._extract_support_types(headings, extracted_data)
         
         # 利用した主な設備（リンクリスト）
         field_name = "利用した主な設備 / Equipment Used in This Project"
-        tag = safe_find_tag(soup, 'h2', field_name)
+        tag = safe_find_tag(headings, 'h2', field_name)
         equipment_links = extract_links_from_next_p(tag)
         extracted_data[field_name] = equipment_links if equipment_links else []
         
@@ -330,18 +333,18 @@ class ReportScraper:
         ]
         
         for field_name in large_text_fields:
-            tag = safe_find_tag(soup, 'h5', field_name)
+            tag = safe_find_tag(headings, 'h5', field_name)
             extracted_data[field_name] = safe_extract_text(tag)
         
         # 論文・発表のリスト
         extracted_data['論文・プロシーディング（DOIのあるもの） / DOI (Publication and Proceedings)'] = \
-            extract_list_items(soup, '論文・プロシーディング（DOIのあるもの） / DOI (Publication and Proceedings)')
+            extract_list_items(headings, '論文・プロシーディング（DOIのあるもの） / DOI (Publication and Proceedings)')
         
         extracted_data['口頭発表、ポスター発表および、その他の論文 / Oral Presentations etc.'] = \
-            extract_list_items(soup, '口頭発表、ポスター発表および、その他の論文 / Oral Presentations etc.')
+            extract_list_items(headings, '口頭発表、ポスター発表および、その他の論文 / Oral Presentations etc.')
         
         # 特許件数
-        self._extract_patent_counts(soup, extracted_data)
+        self._extract_patent_counts(headings, extracted_data)
         
         return extracted_data
     
@@ -361,7 +364,7 @@ class ReportScraper:
                 return None
 
             response.encoding = 'utf-8'
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = make_soup(response.text)
 
             total_count = self._extract_total_count(soup)
             final_page = self._extract_final_page(soup)
@@ -447,56 +450,7 @@ class ReportScraper:
             if response.status_code != 200:
                 raise Exception(f"HTTPエラー: {response.status_code}")
             
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # 報告書リンクを抽出
-            # 報告書一覧は通常<a>タグで、href="report.php?mode=detail&code=XXX&key=YYY"の形式
-            links = []
-            
-            # 詳細ページへのリンクを全て取得
-            for a_tag in soup.find_all('a', href=True):
-                href = a_tag.get('href', '')
-                
-                # hrefを文字列に変換
-                if not isinstance(href, str):
-                    continue
-                
-                # 報告書詳細ページのリンクをフィルタ（user_report.php に修正）
-                if 'user_report.php' in href and 'mode=detail' in href and 'code=' in href and 'key=' in href:
-                    # 絶対URLに変換
-                    if not href.startswith('http'):
-                        if href.startswith('/'):
-                            full_url = f"{self.base_url}{href}"
-                        else:
-                            full_url = f"{self.base_url}/{href}"
-                    else:
-                        full_url = href
-                    
-                    # URLからcode/keyを抽出
-                    try:
-                        parsed_url = urlparse(full_url)
-                        params = parse_qs(parsed_url.query)
-                        code = params.get('code', [None])[0]
-                        key = params.get('key', [None])[0]
-                        
-                        if code and key:
-                            # タイトルを取得（リンクテキストまたは近隣要素）
-                            title = a_tag.get_text(strip=True) or f"Report {code}"
-                            
-                            link_info = {
-                                'code': code,
-                                'key': key,
-                                'url': full_url,
-                                'title': title
-                            }
-                            
-                            # 重複チェック
-                            if not any(l['code'] == code and l['key'] == key for l in links):
-                                links.append(link_info)
-                    
-                    except Exception as e:
-                        self.logger.warning(f"リンク解析エラー ({href}): {e}")
-                        continue
+            links = self._extract_report_links(response.text)
             
             self.logger.debug(f"ページ {page_num}: {len(links)} 件のリンクを抽出")
             return links
@@ -505,10 +459,71 @@ class ReportScraper:
             self.logger.error(f"ページ {page_num} 取得エラー: {e}")
             raise
     
-    def _extract_technology_areas(self, soup: BeautifulSoup, data: Dict) -> None:
+    def _extract_report_links(self, html: str) -> List[Dict[str, str]]:
+        """
+        一覧・検索結果HTMLから報告書詳細ページへのリンクを抽出
+        
+        <a href> だけを対象に木を構築し（SoupStrainer）、文書全体の木は作らない。
+        
+        Returns:
+            報告書リンク情報のリスト（code/key の重複は除外、出現順）
+            [{"code": "...", "key": "...", "url": "...", "title": "..."}, ...]
+        """
+        # 報告書一覧は通常<a>タグで、href="user_report.php?mode=detail&code=XXX&key=YYY"の形式
+        soup = make_soup(html, parse_only=SoupStrainer('a', href=True))
+        links: List[Dict[str, str]] = []
+        seen = set()
+        
+        for a_tag in soup.find_all('a', href=True):
+            href = a_tag.get('href', '')
+            
+            # hrefを文字列に変換
+            if not isinstance(href, str):
+                continue
+            
+            # 報告書詳細ページのリンクをフィルタ
+            if not ('user_report.php' in href and 'mode=detail' in href and 'code=' in href and 'key=' in href):
+                continue
+            
+            # 絶対URLに変換
+            if not href.startswith('http'):
+                if href.startswith('/'):
+                    full_url = f"{self.base_url}{href}"
+                else:
+                    full_url = f"{self.base_url}/{href}"
+            else:
+                full_url = href
+            
+            # URLからcode/keyを抽出
+            try:
+                parsed_url = urlparse(full_url)
+                params = parse_qs(parsed_url.query)
+                code = params.get('code', [None])[0]
+                key = params.get('key', [None])[0]
+            except Exception as e:
+                self.logger.warning(f"リンク解析エラー ({href}): {e}")
+                continue
+            
+            # 重複チェック
+            if not code or not key or (code, key) in seen:
+                continue
+            seen.add((code, key))
+            
+            # タイトルを取得（リンクテキスト）
+            title = a_tag.get_text(strip=True) or f"Report {code}"
+            links.append({
+                'code': code,
+                'key': key,
+                'url': full_url,
+                'title': title
+            })
+        
+        return links
+    
+    def _extract_technology_areas(self, headings: HeadingIndex, data: Dict) -> None:
         """技術領域（横断・重要）を抽出"""
         tag_name = '技術領域 / Technology Area'
-        tag = safe_find_tag(soup, 'h5', tag_name)
+        tag = safe_find_tag(headings, 'h5', tag_name)
         
         if tag is not None:
             # 横断技術領域の処理
@@ -575,16 +590,16 @@ class ReportScraper:
         
         return main, sub
     
-    def _extract_keywords(self, soup: BeautifulSoup, html_content: str) -> str:
+    def _extract_keywords(self, headings: HeadingIndex, html_content: str) -> str:
         """キーワードを抽出"""
         field_name = 'キーワード / Keywords'
-        tag = safe_find_tag(soup, 'h5', field_name)
+        tag = safe_find_tag(headings, 'h5', field_name)
         return safe_extract_text(tag)
     
-    def _extract_collaborators(self, soup: BeautifulSoup, data: Dict) -> None:
+    def _extract_collaborators(self, headings: HeadingIndex, data: Dict) -> None:
         """共同利用者を抽出"""
         field_name = '共同利用者氏名 / Names of Collaborators in Other Institutes Than Hub and Spoke Institutes'
-        tag = soup.find('h5', string=field_name)
+        tag = safe_find_tag(headings, 'h5', field_name)
         
         if tag is None:
             data[field_name] = ''
@@ -595,10 +610,10 @@ class ReportScraper:
             else:
                 data[field_name] = ''
     
-    def _extract_support_types(self, soup: BeautifulSoup, data: Dict) -> None:
+    def _extract_support_types(self, headings: HeadingIndex, data: Dict) -> None:
         """利用形態を抽出"""
         field_name = '利用形態 / Support Type'
-        tag = safe_find_tag(soup, 'h5', field_name)
+        tag = safe_find_tag(headings, 'h5', field_name)
         
         if tag is not None:
             support_element = tag.find_next('p')
@@ -617,12 +632,12 @@ class ReportScraper:
             data["利用形態・主"] = ""
             data["利用形態・副"] = ""
     
-    def _extract_patent_counts(self, soup: BeautifulSoup, data: Dict) -> None:
+    def _extract_patent_counts(self, headings: HeadingIndex, data: Dict) -> None:
         """特許件数を抽出"""
         # 特許出願件数
-        tag = safe_find_tag(soup, 'h5', '特許出願件数')
+        tag = safe_find_tag(headings, 'h5', '特許出願件数')
         data['特許出願件数'] = safe_extract_text(tag, default='0')
         
         # 特許登録件数
-        tag = safe_find_tag(soup, 'h5', '特許登録件数')
+        tag = safe_find_tag(headings, 'h5', '特許登録件数')
         data['特許登録件数'] = safe_extract_text(tag, default='0')
@@ -4,9 +4,10 @@
 HTML解析やデータ変換などの補助機能を提供します。
 """
 
-from .html_parser import safe_extract_text, safe_find_tag
+from .html_parser import HeadingIndex, safe_extract_text, safe_find_tag
 
 __all__ = [
+    "HeadingIndex",
     "safe_extract_text",
     "safe_find_tag",
 ]
@@ -5,10 +5,33 @@ BeautifulSoupを使用したHTML解析の補助関数を提供します。
 
 """
 
-from typing import Optional
+from typing import Dict, Iterable, Optional, Tuple, Union
 from bs4 import BeautifulSoup, Tag
 
 
+class HeadingIndex:
+    """
+    見出しタグの索引（タグ名・テキスト完全一致 → 最初に現れたタグ）
+    
+    soup.find(tag_name, string=...) をフィールドごとに繰り返すと毎回文書全体を走査するため、
+    見出しを1回の走査で索引化する。find() は soup.find(tag_name, string=...) と同じ結果を返す。
+    """
+    
+    def __init__(self, soup: BeautifulSoup, tag_names: Iterable[str] = ('h2', 'h5')):
+        self.soup = soup
+        self._tag_names = frozenset(tag_names)
+        self._index: Dict[Tuple[str, str], Tag] = {}
+        for tag in soup.find_all(list(self._tag_names)):
+            text = tag.string
+            if text is not None:
+                self._index.setdefault((tag.name, str(text)), tag)
+    
+    def find(self, tag_name: str, string: str) -> Optional[Tag]:
+        if tag_name not in self._tag_names:
+            return self.soup.find(tag_name, string=string)
+        return self._index.get((tag_name, string))
+
+
 def safe_extract_text(tag: Optional[Tag], default: str = '') -> str:
     """
     安全にタグからテキストを抽出するヘルパー関数
@@ -34,12 +57,12 @@ def safe_extract_text(tag: Optional[Tag], default: str = '') -> str:
     return next_element.text.strip()
 
 
-def safe_find_tag(soup: BeautifulSoup, tag_name: str, string_value: str) -> Optional[Tag]:
+def safe_find_tag(soup: Union[BeautifulSoup, HeadingIndex], tag_name: str, string_value: str) -> Optional[Tag]:
     """
     安全にタグを検索するヘルパー関数
     
     Args:
-        soup: BeautifulSoupオブジェクト
+        soup: BeautifulSoupオブジェクト（または HeadingIndex）
         tag_name: 検索するタグ名（例: 'h5', 'h2', 'p'）
         string_value: タグ内のテキスト値（完全一致）
     
@@ -94,14 +117,14 @@ def extract_links_from_next_p(tag: Optional[Tag]) -> list:
     return link_texts
 
 
-def extract_list_items(soup: BeautifulSoup, heading_text: str) -> list:
+def extract_list_items(soup: Union[BeautifulSoup, HeadingIndex], heading_text: str) -> list:
     """
     見出しの後にある<ul>または<ol>内の<li>要素を抽出
     
     プレーンテキストのみを返す（HTMLタグは付与しない）
     
     Args:
-        soup: BeautifulSoupオブジェクト
+        soup: BeautifulSoupオブジェクト（または HeadingIndex）
         heading_text: 見出しテキスト
     
     Returns:
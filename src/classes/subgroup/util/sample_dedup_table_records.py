@@ -14,6 +14,7 @@ import time
 from dataclasses import dataclass
 from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
+from classes.core.json_repository import iter_json_files, load_json_cached
 from config.common import get_dynamic_file_path
 from config.site_rde import URLS
 from net.http_helpers import proxy_get
@@ -328,6 +329,23 @@ def _load_json(path: str) -> Any:
         return None
 
 
+def _load_source_json(path: str) -> Any:
+    """output/rde/data 配下の取得済みJSONを共有リポジトリ経由で読む（返り値は変更しない）"""
+    return load_json_cached(path)
+
+
+def _data_entry_path(dataset_id: str) -> str:
+    return get_dynamic_file_path(f"output/rde/data/dataEntry/{dataset_id}.json")
+
+
+def _iter_data_entry_payloads(dataset_ids: Iterable[str]) -> Iterable[Tuple[str, Any]]:
+    """dataEntry JSON を並列に読み込み、(dataset_id, payload) を順に返す（全件走査のため共有リポジトリに保持しない）"""
+    dsids = [dsid for dsid in (_safe_str(x).strip() for x in dataset_ids) if dsid]
+    paths = [_data_entry_path(dsid) for dsid in dsids]
+    for dsid, (_path, payload) in zip(dsids, iter_json_files(paths, store=False)):
+        yield dsid, payload
+
+
 def _extract_group_id_from_dataset_item(item: Dict[str, Any]) -> str:
     rels = item.get("relationships") if isinstance(item.get("relationships"), dict) else {}
     group = rels.get("group") if isinstance(rels.get("group"), dict) else {}
@@ -340,7 +358,7 @@ def _extract_group_id_from_dataset_detail(dataset_id: str) -> str:
     if not dsid:
         return ""
     detail_path = get_dynamic_file_path(f"output/rde/data/datasets/{dsid}.json")
-    payload = _load_json(detail_path)
+    payload = _load_source_json(detail_path)
     if not isinstance(payload, dict):
         return ""
     data = payload.get("data") if isinstance(payload.get("data"), dict) else {}
@@ -355,7 +373,7 @@ def _extract_grants_from_dataset_detail(dataset_id: str) -> List[str]:
     if not dsid:
         return []
     detail_path = get_dynamic_file_path(f"output/rde/data/datasets/{dsid}.json")
-    payload = _load_json(detail_path)
+    payload = _load_source_json(detail_path)
     if not isinstance(payload, dict):
         return []
     data = payload.get("data") if isinstance(payload.get("data"), dict) else {}
@@ -432,7 +450,7 @@ def get_default_columns_list2() -> List[SampleDedupColumn]:
 
 def _build_subgroup_maps() -> tuple[Dict[str, str], Dict[str, str], Dict[str, str]]:
     subgroup_json_path = get_dynamic_file_path("output/rde/data/subGroup.json")
-    payload = _load_json(subgroup_json_path)
+    payload = _load_source_json(subgroup_json_path)
     if not isinstance(payload, dict):
         return {}, {}
     included = payload.get("included")
@@ -468,7 +486,7 @@ def _build_subgroup_maps() -> tuple[Dict[str, str], Dict[str, str], Dict[str, st
 
 def _build_dataset_maps() -> Tuple[Dict[str, str], Dict[str, List[str]]]:
     dataset_json_path = get_dynamic_file_path("output/rde/data/dataset.json")
-    payload = _load_json(dataset_json_path)
+    payload = _load_source_json(dataset_json_path)
     dataset_items = payload.get("data") if isinstance(payload, dict) else []
     if not isinstance(dataset_items, list):
         dataset_items = []
@@ -640,7 +658,7 @@ def _build_dataset_grants_map(dataset_ids: Optional[Iterable[str]] = None) -> Di
         wanted_dataset_ids = {str(x).strip() for x in dataset_ids if str(x).strip()}
 
     dataset_json_path = get_dynamic_file_path("output/rde/data/dataset.json")
-    payload = _load_json(dataset_json_path)
+    payload = _load_source_json(dataset_json_path)
     dataset_items = payload.get("data") if isinstance(payload, dict) else []
     if not isinstance(dataset_items, list):
         dataset_items = []
@@ -685,12 +703,7 @@ def _build_sample_usage_details(
     """Build a sample-centric list of (tile/dataset) references."""
 
     usage: Dict[str, List[Dict[str, str]]] = {}
-    for dataset_id in dataset_ids:
-        dsid = _safe_str(dataset_id).strip()
-        if not dsid:
-            continue
-        data_entry_path = get_dynamic_file_path(f"output/rde/data/dataEntry/{dsid}.json")
-        payload = _load_json(data_entry_path)
+    for dsid, payload in _iter_data_entry_payloads(dataset_ids):
         if not isinstance(payload, dict):
             continue
         entries = payload.get("data") if isinstance(payload.get("data"), list) else []
@@ -737,12 +750,7 @@ def _extract_sample_ids_from_entry(entry: Dict[str, Any]) -> List[str]:
 
 def _build_sample_usage(dataset_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
     usage: Dict[str, Dict[str, Any]] = {}
-    for dataset_id in dataset_ids:
-        dsid = _safe_str(dataset_id).strip()
-        if not dsid:
-            continue
-        data_entry_path = get_dynamic_file_path(f"output/rde/data/dataEntry/{dsid}.json")
-        payload = _load_json(data_entry_path)
+    for dsid, payload in _iter_data_entry_payloads(dataset_ids):
         if not isinstance(payload, dict):
             continue
         entries = payload.get("data") if isinstance(payload.get("data"), list) else []
@@ -776,9 +784,12 @@ def _build_sample_usage(dataset_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]
     return usage
 
 
+def _sample_payload_path(subgroup_id: str) -> str:
+    return get_dynamic_file_path(f"output/rde/data/samples/{subgroup_id}.json")
+
+
 def _load_sample_payload(subgroup_id: str) -> Optional[Dict[str, Any]]:
-    path = get_dynamic_file_path(f"output/rde/data/samples/{subgroup_id}.json")
-    payload = _load_json(path)
+    payload = _load_source_json(_sample_payload_path(subgroup_id))
     return payload if isinstance(payload, dict) else None
 
 
@@ -125,9 +125,25 @@ class ExternalAccessMonitorBar(QWidget):
                 f"{time_part}  {record.method} {record.host} — "
                 f"{record.status_code}  {record.duration_ms:.0f}ms  {short_url}"
             )
+        text += self._queue_suffix(record.host)
         self._text_label.setText(text)
         self._text_label.setStyleSheet(f"color: {color}; font-size: 11px;")
 
+    @staticmethod
+    def _queue_suffix(host: str) -> str:
+        """ホスト単位ガバナーの実行中・待機数（待機や送出停止がある場合のみ表示）"""
+        try:
+            from net.host_governor import get_host_governor_stats
+            stats = get_host_governor_stats().get((host or "").lower())
+        except Exception:
+            return ""
+        if not stats or (not stats["waiting"] and not stats["throttled_for"]):
+            return ""
+        suffix = f"  [実行中 {stats['in_flight']}/{stats['max_concurrency']}  待機 {stats['waiting']}"
+        if stats["throttled_for"]:
+            suffix += f"  停止 {stats['throttled_for']:.0f}s"
+        return suffix + "]"
+
     # -- クリック → 最近10件ダイアログ ----------------------------------------
 
     def mousePressEvent(self, event) -> None:  # noqa: N802
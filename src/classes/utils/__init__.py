@@ -1,9 +1,36 @@
 """Utility classes and helper functions package"""
 
-from .html_logger import HtmlLogger
-from .dataset_filter_fetcher import DatasetFilterFetcher
+from __future__ import annotations
+
+from importlib import import_module
+import sys
 
 __all__ = [
     "HtmlLogger",
     "DatasetFilterFetcher",
 ]
+
+# Qt 依存のクラスは参照時に読み込む（CLI などQtを使わない経路で utils 配下を使うため）
+_LAZY_IMPORTS = {
+    "HtmlLogger": ".html_logger",
+    "DatasetFilterFetcher": ".dataset_filter_fetcher",
+}
+
+# PyInstaller frozen builds cannot always detect lazy imports.
+# Import explicitly in frozen mode to ensure modules are bundled.
+try:
+    if getattr(sys, "frozen", False):
+        from .html_logger import HtmlLogger  # noqa: F401
+        from .dataset_filter_fetcher import DatasetFilterFetcher  # noqa: F401
+except Exception:
+    pass
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if not module_name:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = import_module(module_name, __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
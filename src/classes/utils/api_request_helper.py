@@ -395,7 +395,7 @@ def post_form(url: str, data: Dict[str, Any], bearer_token: Optional[str] = None
     )
 
 
-def post_binary(url: str, data: bytes, bearer_token: Optional[str] = None,
+def post_binary(url: str, data: Union[bytes, Any], bearer_token: Optional[str] = None,
                content_type: str = 'application/octet-stream',
                headers: Optional[Dict[str, str]] = None,
                timeout: int = 30) -> Optional[_requests_types.Response]:
@@ -404,7 +404,7 @@ def post_binary(url: str, data: bytes, bearer_token: Optional[str] = None,
     
     Args:
         url: リクエストURL
-        data: バイナリデータ
+        data: バイナリデータ、または net.upload_stream.FileUploadStream（ファイルから逐次送信）
         bearer_token: Bearerトークン（未指定時はURLから自動選択）
         content_type: Content-Type ヘッダー
         headers: カスタムヘッダー
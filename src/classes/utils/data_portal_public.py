@@ -12,14 +12,19 @@ from pathlib import Path
 from typing import Callable, List, Optional
 from urllib.parse import parse_qs, urlencode, urljoin, urlparse, urlunparse
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 from classes.data_portal.conf.config import get_data_portal_config
 from classes.data_portal.util.public_output_paths import get_public_data_portal_cache_dir, get_public_data_portal_root_dir
 from classes.managers.app_config_manager import get_config_manager
+from classes.utils.html_parsing import HTML_PARSER_BACKEND, make_soup, memoize_parse
+from net.http_cache import conditional_get_parsed
 from net.http_helpers import proxy_get, proxy_post
+from net.session_manager import reserve_connection_pool
 
 PROD_BASE = "https://nanonet.go.jp/data_service/arim_data.php"
+# 条件付きGETで再利用する詳細パース結果のキー（parse_public_arim_data_detail を変更したら更新する）
+PUBLIC_DETAIL_PARSER_KEY = "data_portal_public.detail:v1"
 
 logger = logging.getLogger(__name__)
 
@@ -562,12 +567,13 @@ def _build_page_url(search_url: str, page: int) -> str:
     return urlunparse(parsed._replace(query=new_query))
 
 
+@memoize_parse()
 def parse_public_arim_data_links(html: str, base_url: str = "https://nanonet.go.jp/data_service/arim_data.php") -> List[PublicArimDataLink]:
     """公開データポータルのHTMLから、詳細ページ（mode=detail）のリンク一覧を抽出。
 
     base_url は「そのHTMLの元になったページURL」を渡す想定（相対URL解決のため）。
     """
-    soup = BeautifulSoup(html, "html.parser")
+    soup = make_soup(html, parse_only=SoupStrainer("a", href=True))
     links: List[PublicArimDataLink] = []
     seen: set[tuple[str, str]] = set()
 
@@ -885,8 +891,9 @@ def _extract_summary(soup: BeautifulSoup) -> str:
     return "\n".join(chunks).strip()
 
 
+@memoize_parse()
 def parse_public_arim_data_detail(html: str, *, page_url: str) -> PublicArimDataDetail:
-    soup = BeautifulSoup(html, "html.parser")
+    soup = make_soup(html)
     title = _extract_dataset_title(soup)
     project_title = _extract_project_title(soup)
     dataset_registrant = _extract_dataset_registrant(soup)
@@ -1036,9 +1043,28 @@ def fetch_public_arim_data_detail(
     cache_enabled: bool = True,
 ) -> PublicArimDataDetail:
     url = build_public_detail_url(environment, code, key)
-    resp = proxy_get(url, headers=headers, timeout=timeout, auth=basic_auth, skip_bearer_token=True)
-    resp.encoding = "utf-8"
-    return parse_public_arim_data_detail(resp.text, page_url=url)
+    if not cache_enabled:
+        resp = proxy_get(url, headers=headers, timeout=timeout, auth=basic_auth, skip_bearer_token=True)
+        resp.encoding = "utf-8"
+        return parse_public_arim_data_detail(resp.text, page_url=url)
+
+    def _parse(resp) -> PublicArimDataDetail:
+        resp.encoding = "utf-8"
+        return parse_public_arim_data_detail(resp.text, page_url=url)
+
+    # ETag / Last-Modified で再検証し、未変更(304)なら保存済みのパース結果を使う
+    detail, _resp = conditional_get_parsed(
+        url,
+        f"{PUBLIC_DETAIL_PARSER_KEY}/{HTML_PARSER_BACKEND}",
+        _parse,
+        encode=lambda d: dict(d.__dict__),
+        decode=lambda payload: PublicArimDataDetail(**payload),
+        headers=headers,
+        timeout=timeout,
+        auth=basic_auth,
+        skip_bearer_token=True,
+    )
+    return detail
 
 
 def fetch_public_arim_data_details(
@@ -1188,7 +1214,7 @@ def fetch_public_arim_data_details(
         return out
 
     results: list[Optional[PublicArimDataDetail]] = [None] * len(selected)
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+    with reserve_connection_pool(max_workers), ThreadPoolExecutor(max_workers=max_workers) as executor:
         future_map = {executor.submit(_fetch_one, link.code, link.key): idx for idx, link in enumerate(selected)}
         for future in as_completed(future_map):
             idx = future_map[future]
@@ -1331,7 +1357,7 @@ def search_public_arim_data(
                 fetched: dict[int, List[PublicArimDataLink]] = {}
                 done = 0
                 total = len(pages)
-                with ThreadPoolExecutor(max_workers=workers) as executor:
+                with reserve_connection_pool(workers), ThreadPoolExecutor(max_workers=workers) as executor:
                     futures = {executor.submit(_fetch_page, p): p for p in pages}
                     for future in as_completed(futures):
                         page = futures[future]
@@ -0,0 +1,109 @@
+"""
+HTML解析の共通ヘルパー（パーサーバックエンド選択・パース結果のメモ化）
+
+BeautifulSoup のバックエンドは lxml が利用可能なら lxml、無ければ標準の html.parser を使う。
+スクレイパーの抽出結果は HTML 本文のハッシュをキーにプロセス内でメモ化し、
+同じページ（キャッシュ済みHTMLの再解析など）を繰り返しパースしない。
+"""
+
+import copy
+import functools
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple, TypeVar
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import lxml  # noqa: F401  # バックエンド判定のみ
+    HTML_PARSER_BACKEND = "lxml"
+except ImportError:
+    HTML_PARSER_BACKEND = "html.parser"
+
+# メモ化するパース結果の最大件数（関数ごと）
+PARSE_MEMO_MAXSIZE = 1024
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def make_soup(markup: str, *, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    """選択済みバックエンドで BeautifulSoup を生成（parse_only で対象タグのみ木を構築可能）"""
+    return BeautifulSoup(markup, HTML_PARSER_BACKEND, parse_only=parse_only)
+
+
+def content_digest(text: str) -> str:
+    """HTML本文のハッシュ（メモ化キー用）"""
+    return hashlib.blake2b((text or "").encode("utf-8", "surrogatepass"), digest_size=16).hexdigest()
+
+
+class _ParseMemo:
+    """スレッドセーフな LRU（パース結果を保持し、取り出し時は複製を返す）"""
+
+    def __init__(self, maxsize: int):
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            value = self._entries[key]
+        return True, copy.deepcopy(value)
+
+    def put(self, key: Hashable, value: Any) -> None:
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def memoize_parse(*, skip_self: bool = False, maxsize: int = PARSE_MEMO_MAXSIZE) -> Callable[[F], F]:
+    """
+    HTML（第1引数）を構造化する関数の結果を本文ハッシュ単位でメモ化するデコレータ
+
+    残りの引数もキーに含める（ハッシュ可能であること）。呼び出し側が結果を変更しても
+    メモが汚れないよう、保存時・取り出し時に複製する。
+
+    Args:
+        skip_self: メソッドに付ける場合 True（self をキーに含めない）
+        maxsize: 保持件数の上限
+    """
+
+    def decorator(func: F) -> F:
+        memo = _ParseMemo(maxsize)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            offset = 1 if skip_self else 0
+            html = args[offset] if len(args) > offset else None
+            if not isinstance(html, str):
+                return func(*args, **kwargs)
+            try:
+                key = (content_digest(html), args[offset + 1:], tuple(sorted(kwargs.items())))
+                hash(key)
+            except TypeError:
+                return func(*args, **kwargs)
+            found, value = memo.get(key)
+            if found:
+                return value
+            result = func(*args, **kwargs)
+            memo.put(key, result)
+            return result
+
+        wrapper.parse_memo = memo  # type: ignore[attr-defined]
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
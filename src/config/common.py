@@ -921,6 +921,25 @@ def create_default_config_files():
                 "total": 3,
                 "backoff_factor": 0.5,
                 "status_forcelist": [429, 500, 502, 503, 504]
+            },
+            "pool": {
+                "maxsize": 20,
+                "connections": 10,
+                "headroom": 4,
+                "prewarm": {
+                    "hosts": [],
+                    "connections": 0
+                }
+            },
+            "rate_limit": {
+                "enabled": True,
+                "default": {
+                    "rate": 20,
+                    "burst": 20,
+                    "max_concurrency": 10
+                },
+                "hosts": {},
+                "max_retries_on_429": 3
             }
         },
         "webview": {
@@ -975,6 +994,23 @@ def create_default_config_files():
     - 502
     - 503
     - 504
+  # ホスト単位コネクションプール（並列ワーカー数に応じて maxsize から自動拡張）
+  pool:
+    maxsize: 20
+    connections: 10
+    headroom: 4
+    prewarm:
+      hosts: []
+      connections: 0
+  # ホスト単位のレート制限（429 / Retry-After で自動的に引き下げ、成功が続くと回復）
+  rate_limit:
+    enabled: true
+    default:
+      rate: 20
+      burst: 20
+      max_concurrency: 10
+    hosts: {}
+    max_retries_on_429: 3
 webview:
   auto_proxy_from_network: true
   additional_args: []
@@ -169,13 +169,13 @@ class BearerTokenManager:
             bool: ユーザーが再ログインを選択した場合True
         """
         try:
-            from qt_compat.widgets import QMessageBox
-            
             if parent_widget is None:
                 # フォールバック: コンソールメッセージのみ
                 logger.error("Bearer Tokenが無効です。アプリを再起動してログインしてください。")
                 return False
             
+            from qt_compat.widgets import QMessageBox
+            
             # ユーザーへの再ログイン促進ダイアログ
             msg_box = QMessageBox(parent_widget)
             msg_box.setWindowTitle("認証エラー")
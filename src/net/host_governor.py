@@ -0,0 +1,336 @@
+"""
+ホスト単位のレート制限・同時実行数ガバナー
+
+_log_and_execute() を経由する全てのHTTPリクエストで共有されるプロセス全体のガバナー。
+ホストごとにトークンバケット（毎秒リクエスト数）と同時実行スロットを持ち、
+各ステージが個別に max_workers を決めていても、ホストへの実際の送出はここで頭打ちになる。
+
+429 / Retry-After を受けると、そのホストへの送出を指定秒数停止し、レートと同時実行数を
+半減させる（AIMD）。成功が続くと設定値まで段階的に戻す。
+
+設定（network.yaml の network.rate_limit）:
+    rate_limit:
+      enabled: true
+      default: {rate: 20, burst: 20, max_concurrency: 10}
+      hosts:
+        rde-api.nims.go.jp: {rate: 10, max_concurrency: 8}
+      max_retries_on_429: 3
+"""
+
+import email.utils
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+from urllib.parse import urlparse
+
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+# ホスト既定値（毎秒リクエスト数・バースト・同時実行数）
+DEFAULT_RATE = 20.0
+DEFAULT_BURST = 20
+DEFAULT_MAX_CONCURRENCY = 10
+# 429 を受けた際、ガバナー経由で再送する最大回数
+DEFAULT_MAX_RETRIES_ON_429 = 3
+
+# Retry-After が無い 429 の待機秒（連続するたびに倍増、上限あり）
+_BASE_BACKOFF_SECONDS = 1.0
+_MAX_BACKOFF_SECONDS = 60.0
+# Retry-After の上限（異常値でワーカーが長時間止まるのを防ぐ）
+_MAX_RETRY_AFTER_SECONDS = 300.0
+# 引き下げ後のレート下限
+_MIN_RATE = 0.5
+# 成功ごとのレート回復量（設定レートに対する割合）と、同時実行数を1戻すまでの連続成功数
+_RATE_RECOVERY_RATIO = 0.05
+_CONCURRENCY_RECOVERY_STREAK = 10
+# 待機時の最大スリープ単位（スロット解放や設定変更を取りこぼさないため）
+_WAIT_SLICE_SECONDS = 1.0
+
+
+@dataclass(frozen=True)
+class HostLimits:
+    rate: float = DEFAULT_RATE
+    burst: int = DEFAULT_BURST
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+
+
+class _HostState:
+    """ホスト1件分のバケット・スロット状態（cond のロック下で操作する）"""
+
+    def __init__(self, host: str, limits: HostLimits):
+        self.host = host
+        self.cond = threading.Condition()
+        self.apply_limits(limits)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self.in_flight = 0
+        self.waiting = 0
+        self.throttled_until = 0.0
+        self.throttle_events = 0
+        self.completed = 0
+        self._penalty = 0
+        self._success_streak = 0
+
+    def apply_limits(self, limits: HostLimits) -> None:
+        self.base_rate = max(_MIN_RATE, float(limits.rate))
+        self.rate = self.base_rate
+        self.burst = max(1, int(limits.burst))
+        self.base_concurrency = max(1, int(limits.max_concurrency))
+        self.max_concurrency = self.base_concurrency
+
+    def refill(self, now: float) -> None:
+        elapsed = now - self.updated
+        if elapsed > 0:
+            self.tokens = min(float(self.burst), self.tokens + elapsed * self.rate)
+            self.updated = now
+
+    def on_throttled(self, now: float, retry_after: Optional[float]) -> float:
+        already_paused = now < self.throttled_until
+        if retry_after is None:
+            retry_after = min(_MAX_BACKOFF_SECONDS, _BASE_BACKOFF_SECONDS * (2 ** min(self._penalty, 6)))
+        self.throttled_until = max(self.throttled_until, now + retry_after)
+        self.tokens = min(self.tokens, 0.0)
+        self._success_streak = 0
+        if not already_paused:
+            # 停止中に届いた 429 は同じ送出波によるものとみなし、引き下げは1回だけ行う
+            self.rate = max(_MIN_RATE, self.rate * 0.5)
+            self.max_concurrency = max(1, self.max_concurrency // 2)
+            self.throttle_events += 1
+            self._penalty += 1
+        return retry_after
+
+    def on_success(self) -> None:
+        self._penalty = 0
+        self._success_streak += 1
+        if self.rate < self.base_rate:
+            self.rate = min(self.base_rate, self.rate + self.base_rate * _RATE_RECOVERY_RATIO)
+        if self.max_concurrency < self.base_concurrency and self._success_streak % _CONCURRENCY_RECOVERY_STREAK == 0:
+            self.max_concurrency += 1
+
+    def snapshot(self, now: float) -> Dict[str, Any]:
+        return {
+            'in_flight': self.in_flight,
+            'waiting': self.waiting,
+            'max_concurrency': self.max_concurrency,
+            'rate': round(self.rate, 2),
+            'throttled_for': round(max(0.0, self.throttled_until - now), 1),
+            'throttle_events': self.throttle_events,
+            'completed': self.completed,
+        }
+
+
+class RequestTicket:
+    """ガバナー経由リクエスト1件の結果（release 時の調整に使用）"""
+
+    __slots__ = ('host', 'status_code', 'retry_after')
+
+    def __init__(self, host: Optional[str]):
+        self.host = host
+        self.status_code: Optional[int] = None
+        self.retry_after: Optional[float] = None
+
+    def observe(self, response) -> None:
+        self.status_code = getattr(response, 'status_code', None)
+        headers = getattr(response, 'headers', None) or {}
+        self.retry_after = parse_retry_after(headers.get('Retry-After'))
+
+
+class HostGovernor:
+    """ホスト単位のトークンバケット＋同時実行スロット（プロセス全体で共有）"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._hosts: Dict[str, _HostState] = {}
+        self._default = HostLimits()
+        self._overrides: Dict[str, HostLimits] = {}
+        self.enabled = True
+        self.max_retries_on_429 = DEFAULT_MAX_RETRIES_ON_429
+
+    def configure(self, settings: Optional[Dict[str, Any]]) -> None:
+        """network.rate_limit セクションを適用（既存ホストの状態は上限のみ更新）"""
+        settings = settings if isinstance(settings, dict) else {}
+        default = _parse_limits(settings.get('default'), HostLimits())
+        overrides = {}
+        hosts = settings.get('hosts')
+        if isinstance(hosts, dict):
+            for host, raw in hosts.items():
+                overrides[str(host).lower()] = _parse_limits(raw, default)
+        with self._lock:
+            self.enabled = bool(settings.get('enabled', True))
+            self.max_retries_on_429 = _as_int(settings.get('max_retries_on_429'), DEFAULT_MAX_RETRIES_ON_429, 0)
+            self._default = default
+            self._overrides = overrides
+            states = list(self._hosts.values())
+        for state in states:
+            with state.cond:
+                state.apply_limits(self._limits_for(state.host))
+                state.cond.notify_all()
+
+    def _limits_for(self, host: str) -> HostLimits:
+        return self._overrides.get(host, self._default)
+
+    def _state(self, host: str) -> _HostState:
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is None:
+                state = _HostState(host, self._limits_for(host))
+                self._hosts[host] = state
+            return state
+
+    def acquire(self, host: str) -> None:
+        """送出可能になるまで待機し、トークンとスロットを1つ確保する"""
+        state = self._state(host)
+        with state.cond:
+            state.waiting += 1
+            try:
+                while True:
+                    now = time.monotonic()
+                    state.refill(now)
+                    if now < state.throttled_until:
+                        delay = state.throttled_until - now
+                    elif state.in_flight >= state.max_concurrency:
+                        delay = _WAIT_SLICE_SECONDS
+                    elif state.tokens < 1.0:
+                        delay = (1.0 - state.tokens) / state.rate
+                    else:
+                        state.tokens -= 1.0
+                        state.in_flight += 1
+                        return
+                    state.cond.wait(min(delay, _WAIT_SLICE_SECONDS))
+            finally:
+                state.waiting -= 1
+
+    def release(self, host: str, status_code: Optional[int] = None, retry_after: Optional[float] = None) -> None:
+        """スロットを返却し、応答ステータスに応じてレート・同時実行数を調整する"""
+        state = self._state(host)
+        with state.cond:
+            state.in_flight = max(0, state.in_flight - 1)
+            state.completed += 1
+            now = time.monotonic()
+            if status_code == 429 or (status_code == 503 and retry_after is not None):
+                paused = state.on_throttled(now, retry_after)
+                logger.warning(
+                    "レート制限応答(%s): %s への送出を%.1f秒停止 (rate=%.2f/s, 同時実行=%d, 待機=%d)",
+                    status_code, host, paused, state.rate, state.max_concurrency, state.waiting,
+                )
+            elif status_code is not None and status_code < 500:
+                state.on_success()
+            state.cond.notify_all()
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """ホストごとの実行中・待機数（キュー深さ）と現在の上限"""
+        with self._lock:
+            states = list(self._hosts.values())
+        now = time.monotonic()
+        result = {}
+        for state in states:
+            with state.cond:
+                result[state.host] = state.snapshot(now)
+        return result
+
+
+def _as_int(value, default: int, minimum: int) -> int:
+    try:
+        return max(minimum, int(value))
+    except (TypeError, ValueError):
+        return default
+
+
+def _parse_limits(raw: Any, fallback: HostLimits) -> HostLimits:
+    if not isinstance(raw, dict):
+        return fallback
+    try:
+        rate = float(raw.get('rate', fallback.rate))
+    except (TypeError, ValueError):
+        rate = fallback.rate
+    return HostLimits(
+        rate=max(_MIN_RATE, rate),
+        burst=_as_int(raw.get('burst'), fallback.burst, 1),
+        max_concurrency=_as_int(raw.get('max_concurrency'), fallback.max_concurrency, 1),
+    )
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After ヘッダー（秒数 または HTTP-date）を秒数に変換"""
+    if value is None:
+        return None
+    value = str(value).strip()
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            when = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if when is None:
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        seconds = (when - datetime.now(timezone.utc)).total_seconds()
+    return min(_MAX_RETRY_AFTER_SECONDS, max(0.0, seconds))
+
+
+_governor = HostGovernor()
+_tls = threading.local()
+
+
+def get_host_governor() -> HostGovernor:
+    return _governor
+
+
+def configure_host_governor(settings: Optional[Dict[str, Any]]) -> None:
+    _governor.configure(settings)
+
+
+def get_host_governor_stats() -> Dict[str, Dict[str, Any]]:
+    """ホストごとのキュー深さ（waiting）・実行中数・現在のレート等を取得"""
+    return _governor.snapshot()
+
+
+def is_governed_thread() -> bool:
+    """現在のスレッドがガバナー管理下のリクエストを実行中か"""
+    return getattr(_tls, 'depth', 0) > 0
+
+
+@contextmanager
+def governed_request(url: str):
+    """
+    ホスト単位のトークンとスロットを確保してリクエストを実行する
+
+    with ブロック内でレスポンスを ticket.observe(response) に渡すと、
+    429 / Retry-After に応じてホストの上限が調整される。
+    """
+    host = (urlparse(url).hostname or '').lower()
+    ticket = RequestTicket(host or None)
+    if not host or not _governor.enabled:
+        yield ticket
+        return
+    _governor.acquire(host)
+    _tls.depth = getattr(_tls, 'depth', 0) + 1
+    try:
+        yield ticket
+    finally:
+        _tls.depth -= 1
+        _governor.release(host, ticket.status_code, ticket.retry_after)
+
+
+class GovernedRetry(Retry):
+    """
+    ガバナー管理下のリクエストでは 429 を urllib3 側で再送しない Retry
+
+    429 はガバナーがホスト全体の送出を止めた上で再送するため、
+    個々のスレッドが独自にバックオフして再送を重ねることを避ける。
+    ガバナーを経由しない直接のセッション利用では従来どおり再送する。
+    """
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if status_code == 429 and is_governed_thread():
+            return False
+        return super().is_retry(method, status_code, has_retry_after)
@@ -0,0 +1,325 @@
+"""
+条件付きGET（ETag / Last-Modified）によるHTTPレスポンスキャッシュ
+
+proxy_get の応答本文と検証子（ETag / Last-Modified）をディスク（SQLite）に保存し、
+次回は If-None-Match / If-Modified-Since を付けて再検証する。
+304 Not Modified の場合は保存済みの本文から 200 応答を組み立てて返すため、
+変更のないページは本文を転送せずに済み、変更があれば通常どおり取得・更新される。
+
+conditional_get_parsed() はパース結果も検証子と紐付けて保存し、304 のときは
+HTMLの再パースも省略する。parser_key にはパーサーのバージョンを含めること
+（パース処理を変更した場合に古い結果を使わないため）。
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from config.common import get_dynamic_file_path
+from .http_helpers import proxy_get
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+HTTP_CACHE_DB_PATH = "output/cache/http_cache.sqlite3"
+# 最後に取得・再検証されてから一定期間経過したエントリは破棄する
+HTTP_CACHE_MAX_AGE_SECONDS = 30 * 24 * 3600
+
+
+class _HttpCacheStore:
+    """検証子付きレスポンス本文とパース結果を保持する SQLite ストア"""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.RLock()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                cache_key     TEXT PRIMARY KEY,
+                url           TEXT NOT NULL,
+                etag          TEXT,
+                last_modified TEXT,
+                headers       TEXT NOT NULL,
+                encoding      TEXT,
+                body          BLOB NOT NULL,
+                stored_at     REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS parsed (
+                cache_key  TEXT NOT NULL,
+                parser_key TEXT NOT NULL,
+                validator  TEXT NOT NULL,
+                payload    TEXT NOT NULL,
+                PRIMARY KEY (cache_key, parser_key)
+            ) WITHOUT ROWID
+            """
+        )
+        self.purge_stale()
+
+    def lookup(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, etag, last_modified, headers, encoding, body FROM responses WHERE cache_key = ?",
+                (cache_key,),
+            ).fetchone()
+        if row is None:
+            return None
+        url, etag, last_modified, headers, encoding, body = row
+        return {
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'headers': json.loads(headers),
+            'encoding': encoding,
+            'body': bytes(body),
+        }
+
+    def store(self, cache_key: str, response: requests.Response) -> None:
+        headers = json.dumps(dict(response.headers), ensure_ascii=False)
+        with self._lock:
+            with self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses "
+                    "(cache_key, url, etag, last_modified, headers, encoding, body, stored_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        cache_key,
+                        response.url or '',
+                        response.headers.get('ETag'),
+                        response.headers.get('Last-Modified'),
+                        headers,
+                        response.encoding,
+                        sqlite3.Binary(response.content),
+                        time.time(),
+                    ),
+                )
+                # 本文が更新されたため、以前のパース結果は破棄
+                self._conn.execute("DELETE FROM parsed WHERE cache_key = ?", (cache_key,))
+
+    def revalidated(self, cache_key: str, entry: Dict[str, Any], previous_validator: Optional[str]) -> None:
+        """
+        304 応答を反映する（検証子・ヘッダーを更新し、保存時刻を進める）
+
+        本文は変わらないため、パース結果は新しい検証子へ引き継ぐ。
+        """
+        validator = _validator(CaseInsensitiveDict(entry['headers']))
+        with self._lock:
+            self._conn.execute(
+                "UPDATE responses SET etag = ?, last_modified = ?, headers = ?, stored_at = ? WHERE cache_key = ?",
+                (
+                    entry['etag'],
+                    entry['last_modified'],
+                    json.dumps(entry['headers'], ensure_ascii=False),
+                    time.time(),
+                    cache_key,
+                ),
+            )
+            if previous_validator and validator and validator != previous_validator:
+                self._conn.execute(
+                    "UPDATE parsed SET validator = ? WHERE cache_key = ? AND validator = ?",
+                    (validator, cache_key, previous_validator),
+                )
+
+    def load_parsed(self, cache_key: str, parser_key: str, validator: str) -> Tuple[bool, Any]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload FROM parsed WHERE cache_key = ? AND parser_key = ? AND validator = ?",
+                (cache_key, parser_key, validator),
+            ).fetchone()
+        if row is None:
+            return False, None
+        return True, json.loads(row[0])
+
+    def store_parsed(self, cache_key: str, parser_key: str, validator: str, payload: Any) -> None:
+        text = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO parsed (cache_key, parser_key, validator, payload) VALUES (?, ?, ?, ?)",
+                (cache_key, parser_key, validator, text),
+            )
+
+    def purge_stale(self) -> int:
+        threshold = time.time() - HTTP_CACHE_MAX_AGE_SECONDS
+        with self._lock:
+            with self._conn:
+                cur = self._conn.execute("DELETE FROM responses WHERE stored_at < ?", (threshold,))
+                self._conn.execute(
+                    "DELETE FROM parsed WHERE cache_key NOT IN (SELECT cache_key FROM responses)"
+                )
+            return int(cur.rowcount or 0)
+
+    def clear(self) -> None:
+        with self._lock:
+            with self._conn:
+                self._conn.execute("DELETE FROM responses")
+                self._conn.execute("DELETE FROM parsed")
+
+
+_store: Optional[_HttpCacheStore] = None
+_store_lock = threading.Lock()
+
+
+def _get_store() -> _HttpCacheStore:
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = _HttpCacheStore(get_dynamic_file_path(HTTP_CACHE_DB_PATH))
+        return _store
+
+
+def clear_http_cache() -> None:
+    """保存済みのレスポンスとパース結果をすべて削除"""
+    _get_store().clear()
+
+
+def _cache_key(url: str, kwargs: Dict[str, Any]) -> str:
+    # Basic認証のユーザーが異なる場合は別エントリとして扱う
+    auth = kwargs.get('auth')
+    if isinstance(auth, (tuple, list)) and auth:
+        return f"{url}|auth={auth[0]}"
+    return url
+
+
+def _validator(headers) -> Optional[str]:
+    etag = headers.get('ETag') if headers else None
+    if etag:
+        return f"etag:{etag}"
+    last_modified = headers.get('Last-Modified') if headers else None
+    if last_modified:
+        return f"lm:{last_modified}"
+    return None
+
+
+def _merge_revalidation(entry: Dict[str, Any], revalidation: requests.Response) -> Dict[str, Any]:
+    """304 に含まれる更新後のヘッダー（ETag / Last-Modified / Date / Cache-Control 等）を保存済みエントリーへ反映"""
+    headers = CaseInsensitiveDict(entry['headers'])
+    for name, value in revalidation.headers.items():
+        if name.lower() not in ('content-length', 'content-encoding', 'transfer-encoding'):
+            headers[name] = value
+    merged = dict(entry)
+    merged['headers'] = dict(headers)
+    merged['etag'] = headers.get('ETag')
+    merged['last_modified'] = headers.get('Last-Modified')
+    return merged
+
+
+def _response_from_entry(entry: Dict[str, Any], revalidation: requests.Response) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response.reason = 'OK'
+    response._content = entry['body']
+    response.headers = CaseInsensitiveDict(entry['headers'])
+    response.encoding = entry['encoding']
+    response.url = revalidation.url or entry['url']
+    response.request = revalidation.request
+    response.elapsed = revalidation.elapsed
+    response.from_http_cache = True
+    return response
+
+
+def conditional_get(url: str, **kwargs) -> requests.Response:
+    """
+    検証子による再検証付きの proxy_get
+
+    保存済みの検証子があれば If-None-Match / If-Modified-Since を付けて送出し、
+    304 の場合は保存済み本文から組み立てた 200 応答（from_http_cache=True）を返す。
+    200 応答に ETag / Last-Modified があれば本文を保存する。
+
+    Args:
+        url: リクエストURL
+        **kwargs: proxy_get() と同じパラメータ（stream=True の場合はキャッシュしない）
+    """
+    if kwargs.get('stream'):
+        return proxy_get(url, **kwargs)
+
+    cache_key = _cache_key(url, kwargs)
+    try:
+        store = _get_store()
+        entry = store.lookup(cache_key)
+    except Exception:
+        logger.debug("HTTPキャッシュ参照失敗: %s", url, exc_info=True)
+        return proxy_get(url, **kwargs)
+
+    headers = dict(kwargs.pop('headers', None) or {})
+    if entry is not None:
+        if entry['etag'] and 'If-None-Match' not in headers:
+            headers['If-None-Match'] = entry['etag']
+        if entry['last_modified'] and 'If-Modified-Since' not in headers:
+            headers['If-Modified-Since'] = entry['last_modified']
+
+    response = proxy_get(url, headers=headers, **kwargs)
+
+    try:
+        if response.status_code == 304 and entry is not None:
+            previous_validator = _validator(CaseInsensitiveDict(entry['headers']))
+            entry = _merge_revalidation(entry, response)
+            store.revalidated(cache_key, entry, previous_validator)
+            logger.debug("HTTPキャッシュ再利用(304): %s", url)
+            return _response_from_entry(entry, response)
+        response.from_http_cache = False
+        if response.status_code == 200 and _validator(response.headers):
+            store.store(cache_key, response)
+    except Exception:
+        logger.debug("HTTPキャッシュ保存失敗: %s", url, exc_info=True)
+    return response
+
+
+def conditional_get_parsed(
+    url: str,
+    parser_key: str,
+    parse: Callable[[requests.Response], Optional[T]],
+    *,
+    encode: Optional[Callable[[T], Any]] = None,
+    decode: Optional[Callable[[Any], T]] = None,
+    **kwargs,
+) -> Tuple[Optional[T], requests.Response]:
+    """
+    conditional_get() で取得し、パース結果も検証子単位で再利用する
+
+    Args:
+        url: リクエストURL
+        parser_key: パース結果の保存キー（パーサー名とバージョンを含める）
+        parse: レスポンスからパース結果を作る関数（None を返した結果は保存しない）
+        encode: パース結果をJSON化可能な値に変換する関数（省略時はそのまま）
+        decode: encode の逆変換（省略時はそのまま）
+        **kwargs: proxy_get() と同じパラメータ
+
+    Returns:
+        (パース結果, レスポンス) のタプル
+    """
+    response = conditional_get(url, **kwargs)
+    validator = _validator(response.headers) if response.status_code == 200 else None
+    if validator is None:
+        return parse(response), response
+
+    cache_key = _cache_key(url, kwargs)
+    if getattr(response, 'from_http_cache', False):
+        try:
+            found, payload = _get_store().load_parsed(cache_key, parser_key, validator)
+            if found:
+                return (decode(payload) if decode else payload), response
+        except Exception:
+            logger.debug("パース結果キャッシュ参照失敗: %s", url, exc_info=True)
+
+    result = parse(response)
+    if result is not None:
+        try:
+            _get_store().store_parsed(cache_key, parser_key, validator, encode(result) if encode else result)
+        except Exception:
+            logger.debug("パース結果キャッシュ保存失敗: %s", url, exc_info=True)
+    return result, response
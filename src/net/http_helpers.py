@@ -7,6 +7,9 @@ HTTP ヘルパー関数
 """
 
 from .session_manager import get_proxy_session, create_new_proxy_session, _session_manager
+from .host_governor import get_host_governor, governed_request
+from .parallel_executor import iter_parallel, classify_legacy_result, classify_upload_result, STATUS_FAILED, STATUS_SKIPPED
+from contextlib import closing
 from typing import Dict, Optional, Any, Union
 import requests  # 型ヒント用のみ
 import time
@@ -15,9 +18,20 @@ from . import api_logger
 
 logger = logging.getLogger(__name__)
 
+def _is_replayable_request(kwargs: Dict[str, Any]) -> bool:
+    """429 再送時に同じ内容を再送できるか（ストリーム/ファイル本文は rewind() を持つもののみ可）"""
+    if kwargs.get('files'):
+        return False
+    data = kwargs.get('data')
+    return data is None or isinstance(data, (bytes, str, dict, list, tuple)) or callable(getattr(data, 'rewind', None))
+
+
 def _log_and_execute(method: str, url: str, session: requests.Session, **kwargs) -> requests.Response:
     """
     APIリクエストをログ記録して実行
+
+    送出はホスト単位のガバナー（net.host_governor）でレート・同時実行数を制御する。
+    429 を受けた場合はガバナーがホスト全体の送出を止め、停止明けに再送する。
     
     Args:
         method: HTTPメソッド
@@ -52,7 +66,28 @@ def _log_and_execute(method: str, url: str, session: requests.Session, **kwargs)
         from classes.core.offline_mode import validate_online_access_or_raise
         validate_online_access_or_raise(url)
 
-        response = session.request(method, url, **kwargs)
+        governor = get_host_governor()
+        retries_on_429 = 0
+        while True:
+            with governed_request(url) as ticket:
+                # キュー待ち時間を応答時間に含めない
+                start_time = time.time()
+                response = session.request(method, url, **kwargs)
+                ticket.observe(response)
+            if (
+                response.status_code == 429
+                and governor.enabled
+                and retries_on_429 < governor.max_retries_on_429
+                and _is_replayable_request(kwargs)
+            ):
+                retries_on_429 += 1
+                logger.info("429受信のため再送します (%d/%d): %s %s", retries_on_429, governor.max_retries_on_429, method.upper(), url)
+                response.close()
+                rewind = getattr(kwargs.get('data'), 'rewind', None)
+                if callable(rewind):
+                    rewind()
+                continue
+            break
         success = True
         
         # レスポンスログ記録
@@ -406,6 +441,8 @@ def parallel_download(
     """
     並列ダウンロードを実行
     
+    各タスクの戻り値が必要な場合は net.parallel_executor.iter_parallel を直接使う。
+    
     Args:
         tasks: タスクリスト（各タスクはworker_functionに渡される引数のタプル）
         worker_function: 各タスクを処理する関数
@@ -425,119 +462,18 @@ def parallel_download(
             - cancelled: キャンセルされたかどうか
             - errors: エラーリスト
     """
-    from concurrent.futures import ThreadPoolExecutor, as_completed
-    import threading
-    
-    total_tasks = len(tasks)
-    
-    normalized_mode = str(progress_mode or "percent").strip().lower()
-    if normalized_mode not in {"percent", "count"}:
-        normalized_mode = "percent"
-
     # タスク数が閾値未満の場合は同期実行
-    if total_tasks < threshold:
-        return _sequential_download(tasks, worker_function, progress_callback, progress_mode=normalized_mode)
-    
-    # 並列ダウンロード実行
-    success_count = 0
-    failed_count = 0
-    skipped_count = 0
-    completed_count = 0
-    cancelled = False
-    errors = []
-    
-    # スレッドセーフなカウンタ
-    lock = threading.Lock()
-    
-    def update_progress():
-        """プログレス更新"""
-        nonlocal completed_count
-        with lock:
-            completed_count += 1
-            if progress_callback:
-                message = f"並列ダウンロード中... ({completed_count}/{total_tasks})"
-                if normalized_mode == "count":
-                    if not progress_callback(completed_count, total_tasks, message):
-                        return False
-                else:
-                    # 0-100%に正規化
-                    progress_percent = int((completed_count / total_tasks) * 100)
-                    if not progress_callback(progress_percent, 100, message):
-                        return False
-        return True
-    
-    try:
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # 全タスクを投入
-            future_to_task = {
-                executor.submit(worker_function, *task): task 
-                for task in tasks
-            }
-            
-            # 完了したタスクから処理
-            for future in as_completed(future_to_task):
-                task = future_to_task[future]
-                
-                try:
-                    result = future.result()
-                    
-                    # 結果の解釈
-                    if isinstance(result, str):
-                        if "skipped" in result.lower():
-                            with lock:
-                                skipped_count += 1
-                        elif "success" in result.lower():
-                            with lock:
-                                success_count += 1
-                        elif "failed" in result.lower() or "error" in result.lower():
-                            with lock:
-                                failed_count += 1
-                            errors.append({"task": task, "error": result})
-                        else:
-                            with lock:
-                                success_count += 1
-                    elif isinstance(result, dict):
-                        # 辞書形式の結果を解釈
-                        status = result.get("status", "unknown")
-                        if status == "success":
-                            with lock:
-                                success_count += 1
-                        elif status == "skipped":
-                            with lock:
-                                skipped_count += 1
-                        elif status == "failed":
-                            with lock:
-                                failed_count += 1
-                            errors.append({"task": task, "error": result.get("error")})
-                    else:
-                        # その他の結果は成功とみなす
-                        with lock:
-                            success_count += 1
-                    
-                except Exception as e:
-                    with lock:
-                        failed_count += 1
-                    errors.append({"task": task, "error": str(e)})
-                
-                # プログレス更新
-                if not update_progress():
-                    cancelled = True
-                    # 残りのタスクをキャンセル
-                    for f in future_to_task:
-                        f.cancel()
-                    break
-        
-    except Exception as e:
-        errors.append({"error": f"並列実行エラー: {e}"})
-    
-    return {
-        "success_count": success_count,
-        "failed_count": failed_count,
-        "skipped_count": skipped_count,
-        "total": total_tasks,
-        "cancelled": cancelled,
-        "errors": errors
-    }
+    sequential = len(tasks) < threshold
+    return _run_tasks(
+        tasks,
+        worker_function,
+        max_workers=1 if sequential else max_workers,
+        progress_callback=progress_callback,
+        progress_mode=progress_mode,
+        label="同期ダウンロード中..." if sequential else "並列ダウンロード中...",
+        classify=classify_legacy_result,
+        collect_results=False,
+    )
 
 
 def parallel_upload(
@@ -551,7 +487,6 @@ def parallel_upload(
     """並列アップロードを実行（結果収集対応）。
 
     NOTE:
-        並列ダウンロード(parallel_download)の実装を参考にしています。
         アップロードは後段処理で uploadId 等の結果が必要になるため、
         デフォルトで各タスクの戻り値を results に収集します。
 
@@ -574,199 +509,36 @@ def parallel_upload(
             - errors: エラーリスト
             - results: （collect_results=True の場合）完了タスク結果リスト
     """
-
-    from concurrent.futures import ThreadPoolExecutor, as_completed
-    import threading
-
-    total_tasks = len(tasks)
-
     # タスク数が閾値未満の場合は同期実行
-    if total_tasks < threshold or max_workers <= 1:
-        return _sequential_upload(tasks, worker_function, progress_callback, collect_results=collect_results)
-
-    success_count = 0
-    failed_count = 0
-    skipped_count = 0
-    completed_count = 0
-    cancelled = False
-    errors = []
-    results = []
-
-    lock = threading.Lock()
-
-    def update_progress() -> bool:
-        nonlocal completed_count
-        with lock:
-            completed_count += 1
-            if progress_callback:
-                progress_percent = int((completed_count / total_tasks) * 100)
-                message = f"並列アップロード中... ({completed_count}/{total_tasks})"
-                if not progress_callback(progress_percent, 100, message):
-                    return False
-        return True
-
-    try:
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_task = {executor.submit(worker_function, *task): task for task in tasks}
-
-            for future in as_completed(future_to_task):
-                task = future_to_task[future]
-                try:
-                    result = future.result()
-
-                    if collect_results:
-                        results.append({"task": task, "result": result})
-
-                    if isinstance(result, dict):
-                        status = result.get("status", "unknown")
-                        if status == "success":
-                            with lock:
-                                success_count += 1
-                        elif status == "skipped":
-                            with lock:
-                                skipped_count += 1
-                        elif status == "failed":
-                            with lock:
-                                failed_count += 1
-                            errors.append({"task": task, "error": result.get("error")})
-                        else:
-                            with lock:
-                                success_count += 1
-                    elif isinstance(result, str):
-                        if "skipped" in result.lower():
-                            with lock:
-                                skipped_count += 1
-                        elif "failed" in result.lower() or "error" in result.lower():
-                            with lock:
-                                failed_count += 1
-                            errors.append({"task": task, "error": result})
-                        else:
-                            with lock:
-                                success_count += 1
-                    else:
-                        with lock:
-                            success_count += 1
-
-                except Exception as e:
-                    with lock:
-                        failed_count += 1
-                    errors.append({"task": task, "error": str(e)})
-                    if collect_results:
-                        results.append({"task": task, "result": {"status": "failed", "error": str(e)}})
-
-                if not update_progress():
-                    cancelled = True
-                    for f in future_to_task:
-                        f.cancel()
-                    break
-
-    except Exception as e:
-        errors.append({"error": f"並列実行エラー: {e}"})
+    sequential = len(tasks) < threshold or max_workers <= 1
+    return _run_tasks(
+        tasks,
+        worker_function,
+        max_workers=1 if sequential else max_workers,
+        progress_callback=progress_callback,
+        progress_mode="percent",
+        label="アップロード中..." if sequential else "並列アップロード中...",
+        classify=classify_upload_result,
+        collect_results=collect_results,
+    )
 
-    payload = {
-        "success_count": success_count,
-        "failed_count": failed_count,
-        "skipped_count": skipped_count,
-        "total": total_tasks,
-        "cancelled": cancelled,
-        "errors": errors,
-    }
-    if collect_results:
-        payload["results"] = results
-    return payload
 
-def _sequential_download(
+def _run_tasks(
     tasks: list,
     worker_function: callable,
-    progress_callback: Optional[callable] = None,
     *,
-    progress_mode: str = "percent",
+    max_workers: int,
+    progress_callback: Optional[callable],
+    progress_mode: str,
+    label: str,
+    classify: callable,
+    collect_results: bool,
 ) -> Dict[str, Any]:
-    """
-    同期ダウンロードを実行（並列化の閾値未満の場合）
-    
-    Args:
-        tasks: タスクリスト
-        worker_function: 各タスクを処理する関数
-        progress_callback: プログレスコールバック
-        
-    Returns:
-        Dict[str, Any]: 実行結果
-    """
-    success_count = 0
-    failed_count = 0
-    skipped_count = 0
-    completed_count = 0
-    cancelled = False
-    errors = []
+    """parallel_download / parallel_upload 共通: iter_parallel の結果を件数・エラーに集計する"""
     total_tasks = len(tasks)
     normalized_mode = str(progress_mode or "percent").strip().lower()
     if normalized_mode not in {"percent", "count"}:
         normalized_mode = "percent"
-    
-    for idx, task in enumerate(tasks):
-        try:
-            result = worker_function(*task)
-            
-            # 結果の解釈
-            if isinstance(result, str):
-                if "skipped" in result.lower():
-                    skipped_count += 1
-                elif "success" in result.lower():
-                    success_count += 1
-                elif "failed" in result.lower() or "error" in result.lower():
-                    failed_count += 1
-                    errors.append({"task": task, "error": result})
-                else:
-                    success_count += 1
-            elif isinstance(result, dict):
-                status = result.get("status", "unknown")
-                if status == "success":
-                    success_count += 1
-                elif status == "skipped":
-                    skipped_count += 1
-                elif status == "failed":
-                    failed_count += 1
-                    errors.append({"task": task, "error": result.get("error")})
-            else:
-                success_count += 1
-            
-        except Exception as e:
-            failed_count += 1
-            errors.append({"task": task, "error": str(e)})
-        
-        # プログレス更新
-        completed_count = idx + 1
-        if progress_callback:
-            message = f"同期ダウンロード中... ({completed_count}/{total_tasks})"
-            if normalized_mode == "count":
-                if not progress_callback(completed_count, total_tasks, message):
-                    cancelled = True
-                    break
-            else:
-                progress_percent = int((completed_count / total_tasks) * 100)
-                if not progress_callback(progress_percent, 100, message):
-                    cancelled = True
-                    break
-    
-    return {
-        "success_count": success_count,
-        "failed_count": failed_count,
-        "skipped_count": skipped_count,
-        "total": total_tasks,
-        "cancelled": cancelled,
-        "errors": errors
-    }
-
-
-def _sequential_upload(
-    tasks: list,
-    worker_function: callable,
-    progress_callback: Optional[callable] = None,
-    *,
-    collect_results: bool = True,
-) -> Dict[str, Any]:
-    """同期アップロードを実行（並列化の閾値未満の場合）。"""
 
     success_count = 0
     failed_count = 0
@@ -775,51 +547,38 @@ def _sequential_upload(
     cancelled = False
     errors = []
     results = []
-    total_tasks = len(tasks)
-
-    for task in tasks:
-        try:
-            result = worker_function(*task)
-            completed_count += 1
-
-            if collect_results:
-                results.append({"task": task, "result": result})
 
-            if isinstance(result, dict):
-                status = result.get("status", "unknown")
-                if status == "success":
-                    success_count += 1
-                elif status == "skipped":
-                    skipped_count += 1
-                elif status == "failed":
+    try:
+        stream = iter_parallel(tasks, worker_function, max_workers=max_workers, classify=classify)
+        with closing(stream):
+            for item in stream:
+                if item.status == STATUS_FAILED:
                     failed_count += 1
-                    errors.append({"task": task, "error": result.get("error")})
-                else:
-                    success_count += 1
-            elif isinstance(result, str):
-                if "skipped" in result.lower():
+                    errors.append({"task": item.task, "error": item.error})
+                elif item.status == STATUS_SKIPPED:
                     skipped_count += 1
-                elif "failed" in result.lower() or "error" in result.lower():
-                    failed_count += 1
-                    errors.append({"task": task, "error": result})
                 else:
                     success_count += 1
-            else:
-                success_count += 1
-
-        except Exception as e:
-            completed_count += 1
-            failed_count += 1
-            errors.append({"task": task, "error": str(e)})
-            if collect_results:
-                results.append({"task": task, "result": {"status": "failed", "error": str(e)}})
-
-        if progress_callback:
-            progress_percent = int((completed_count / total_tasks) * 100) if total_tasks else 100
-            message = f"アップロード中... ({completed_count}/{total_tasks})"
-            if not progress_callback(progress_percent, 100, message):
-                cancelled = True
-                break
+
+                if collect_results:
+                    value = item.value if item.exception is None else {"status": "failed", "error": item.error}
+                    results.append({"task": item.task, "result": value})
+
+                # プログレス更新（False が返ればキャンセル。未開始のタスクは取り消される）
+                completed_count += 1
+                if progress_callback:
+                    message = f"{label} ({completed_count}/{total_tasks})"
+                    if normalized_mode == "count":
+                        keep_going = progress_callback(completed_count, total_tasks, message)
+                    else:
+                        # 0-100%に正規化
+                        progress_percent = int((completed_count / total_tasks) * 100) if total_tasks else 100
+                        keep_going = progress_callback(progress_percent, 100, message)
+                    if not keep_going:
+                        cancelled = True
+                        break
+    except Exception as e:
+        errors.append({"error": f"並列実行エラー: {e}"})
 
     payload = {
         "success_count": success_count,
@@ -0,0 +1,279 @@
+"""
+並列実行エグゼキューター
+
+タスク（worker に渡す引数のタプル）をスレッドプールで実行し、完了したものから
+TaskResult を 1 件ずつ返す（iter_parallel）。件数の集計だけでなく、各タスクの戻り値・
+エラー・試行回数を呼び出し元で扱える。
+
+- ordered=True の場合は入力順に返す（先行タスクの完了を待つ間、後続の結果は保持する）
+- worker が例外を送出したタスクは retries 回まで指数バックオフで再実行する
+- 実行中・再実行待ち・返却待ちのタスク数を max_pending 件までに抑え、tasks からはその分だけ
+  取り出す（ジェネレーターを渡せば、生産側は消費に合わせて進む）
+- max_workers <= 1 の場合はスレッドを使わず、呼び出し元スレッドで順に実行する
+
+反復を途中で打ち切る（break / close()）と、未開始のタスクは取り消し、実行中のタスクの終了を待って戻る。
+"""
+
+import heapq
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import ExitStack
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .session_manager import reserve_connection_pool
+
+logger = logging.getLogger(__name__)
+
+STATUS_SUCCESS = "success"
+STATUS_FAILED = "failed"
+STATUS_SKIPPED = "skipped"
+
+# 戻り値から (status, error) を決める関数
+Classifier = Callable[[Any], Tuple[str, Optional[str]]]
+
+# キャンセル確認の間隔（秒）
+_CANCEL_POLL_INTERVAL = 0.2
+
+
+@dataclass
+class TaskResult:
+    """1 タスクの実行結果"""
+
+    index: int                      # tasks 内の位置（0 始まり）
+    task: Tuple                     # worker に渡した引数
+    status: str                     # STATUS_SUCCESS / STATUS_FAILED / STATUS_SKIPPED
+    value: Any = None               # worker の戻り値（例外で終わった場合は None）
+    error: Optional[str] = None
+    exception: Optional[BaseException] = None
+    attempts: int = 1
+
+    @property
+    def ok(self) -> bool:
+        return self.status == STATUS_SUCCESS
+
+
+def classify_value(value: Any) -> Tuple[str, Optional[str]]:
+    """既定の解釈: 例外で終わらなければ成功"""
+    return STATUS_SUCCESS, None
+
+
+def classify_legacy_result(value: Any) -> Tuple[str, Optional[str]]:
+    """
+    parallel_download の worker 戻り値の解釈
+
+    - dict: "status" キー（success / skipped / failed。それ以外は成功）、エラーは "error" キー
+    - str: "skipped" / "success" / "failed"・"error" の順に含むかで判定（いずれも無ければ成功）
+    - その他: 成功
+    """
+    return _classify_legacy(value, success_first=True)
+
+
+def classify_upload_result(value: Any) -> Tuple[str, Optional[str]]:
+    """
+    parallel_upload の worker 戻り値の解釈
+
+    classify_legacy_result と同じだが、str は "failed"・"error" を "success" より先に判定する
+    （"success=false error ..." のような戻り値を失敗とする）。
+    """
+    return _classify_legacy(value, success_first=False)
+
+
+def _classify_legacy(value: Any, *, success_first: bool) -> Tuple[str, Optional[str]]:
+    if isinstance(value, dict):
+        status = value.get("status")
+        if status == STATUS_FAILED:
+            return STATUS_FAILED, value.get("error")
+        if status == STATUS_SKIPPED:
+            return STATUS_SKIPPED, None
+        return STATUS_SUCCESS, None
+    if isinstance(value, str):
+        lowered = value.lower()
+        if "skipped" in lowered:
+            return STATUS_SKIPPED, None
+        if success_first and "success" in lowered:
+            return STATUS_SUCCESS, None
+        if "failed" in lowered or "error" in lowered:
+            return STATUS_FAILED, value
+    return STATUS_SUCCESS, None
+
+
+def backoff_delay(attempt: int, backoff: float, max_backoff: float) -> float:
+    """attempt 回目の失敗後に待つ秒数（backoff, 2*backoff, 4*backoff, ... を max_backoff で頭打ち）"""
+    return min(max_backoff, backoff * (2 ** max(0, attempt - 1)))
+
+
+def iter_parallel(
+    tasks: Iterable[Tuple],
+    worker: Callable[..., Any],
+    *,
+    max_workers: int = 5,
+    ordered: bool = False,
+    retries: int = 0,
+    backoff: float = 1.0,
+    max_backoff: float = 30.0,
+    retry_on: Optional[Callable[[BaseException], bool]] = None,
+    classify: Optional[Classifier] = None,
+    max_pending: Optional[int] = None,
+    cancel_event: Optional[threading.Event] = None,
+    reserve_pool: bool = True,
+) -> Iterator[TaskResult]:
+    """
+    tasks を並列実行し、TaskResult を完了順（ordered=True なら入力順）に返す
+
+    Args:
+        tasks: worker に渡す引数のタプルのイテラブル（必要になった分だけ取り出す）
+        worker: 各タスクを処理する関数
+        max_workers: 並列数（1 以下なら呼び出し元スレッドで順に実行）
+        ordered: True の場合、入力順に返す
+        retries: 例外で失敗したタスクを再実行する最大回数
+        backoff: 再実行までの待ち時間の初期値（秒。失敗のたびに倍にする）
+        max_backoff: 再実行までの待ち時間の上限（秒）
+        retry_on: 再実行する例外かを判定する関数（既定: すべての Exception）
+        classify: 戻り値から (status, error) を決める関数（既定: classify_value）
+        max_pending: 同時に抱えるタスク数の上限（既定: max_workers * 2）
+        cancel_event: セットされたら新たな投入・返却をやめて終了する
+        reserve_pool: 並列実行の間、ワーカー数分の HTTP コネクションを確保する
+    """
+    classify = classify or classify_value
+    retry_on = retry_on or (lambda exc: isinstance(exc, Exception))
+    run = _Runner(worker, classify, retries, backoff, max_backoff, retry_on)
+
+    if max_workers <= 1:
+        yield from _iter_inline(tasks, run, cancel_event)
+        return
+
+    max_pending = max(max_workers, max_pending or max_workers * 2)
+    source = enumerate(tasks)
+    exhausted = False
+    running: Dict[Future, Tuple[int, Tuple, int]] = {}
+    waiting: List[Tuple[float, int, Tuple, int]] = []  # (再実行時刻, index, task, attempt) のヒープ
+    buffered: Dict[int, TaskResult] = {}
+    next_index = 0
+
+    def cancelled() -> bool:
+        return cancel_event is not None and cancel_event.is_set()
+
+    with ExitStack() as stack:
+        if reserve_pool:
+            stack.enter_context(reserve_connection_pool(max_workers))
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="parallel")
+        try:
+            while not cancelled():
+                while not exhausted and len(running) + len(waiting) + len(buffered) < max_pending:
+                    try:
+                        index, task = next(source)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    task = tuple(task)
+                    running[executor.submit(run.call, task)] = (index, task, 1)
+
+                now = time.monotonic()
+                while waiting and waiting[0][0] <= now:
+                    _due, index, task, attempt = heapq.heappop(waiting)
+                    running[executor.submit(run.call, task)] = (index, task, attempt)
+
+                if not running and not waiting:
+                    if exhausted:
+                        break
+                    continue
+
+                timeout = max(0.0, waiting[0][0] - now) if waiting else None
+                if cancel_event is not None:
+                    timeout = _CANCEL_POLL_INTERVAL if timeout is None else min(timeout, _CANCEL_POLL_INTERVAL)
+                if not running:
+                    time.sleep(timeout)
+                    continue
+                done, _ = wait(list(running), timeout=timeout, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    if cancelled():
+                        break
+                    index, task, attempt = running.pop(future)
+                    result, delay = run.settle(index, task, attempt, future)
+                    if result is None:
+                        heapq.heappush(waiting, (time.monotonic() + delay, index, task, attempt + 1))
+                        continue
+                    if not ordered:
+                        yield result
+                        continue
+                    buffered[index] = result
+                    while next_index in buffered and not cancelled():
+                        yield buffered.pop(next_index)
+                        next_index += 1
+        finally:
+            for future in running:
+                future.cancel()
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+class _Runner:
+    """worker の呼び出しと、結果の判定・再実行の要否判断"""
+
+    def __init__(self, worker, classify, retries, backoff, max_backoff, retry_on):
+        self.worker = worker
+        self.classify = classify
+        self.retries = max(0, retries)
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.retry_on = retry_on
+
+    def call(self, task: Tuple) -> Any:
+        return self.worker(*task)
+
+    def settle(
+        self, index: int, task: Tuple, attempt: int, future: Future
+    ) -> Tuple[Optional[TaskResult], float]:
+        """完了した Future を TaskResult にする（再実行する場合は (None, 待ち秒数)）"""
+        try:
+            value = future.result()
+        except Exception as exc:
+            return self._failed(index, task, attempt, exc)
+        return self._succeeded(index, task, attempt, value), 0.0
+
+    def run_inline(self, index: int, task: Tuple, attempt: int) -> Tuple[Optional[TaskResult], float]:
+        try:
+            value = self.call(task)
+        except Exception as exc:
+            return self._failed(index, task, attempt, exc)
+        return self._succeeded(index, task, attempt, value), 0.0
+
+    def _succeeded(self, index: int, task: Tuple, attempt: int, value: Any) -> TaskResult:
+        status, error = self.classify(value)
+        return TaskResult(index, task, status, value=value, error=error, attempts=attempt)
+
+    def _failed(
+        self, index: int, task: Tuple, attempt: int, exc: Exception
+    ) -> Tuple[Optional[TaskResult], float]:
+        if attempt <= self.retries and self.retry_on(exc):
+            delay = backoff_delay(attempt, self.backoff, self.max_backoff)
+            logger.debug("タスク %s 失敗（%s 回目）、%.1f 秒後に再実行: %s", index, attempt, delay, exc)
+            return None, delay
+        result = TaskResult(index, task, STATUS_FAILED, error=str(exc), exception=exc, attempts=attempt)
+        return result, 0.0
+
+
+def _iter_inline(
+    tasks: Iterable[Tuple],
+    run: _Runner,
+    cancel_event: Optional[threading.Event],
+) -> Iterator[TaskResult]:
+    for index, task in enumerate(tasks):
+        if cancel_event is not None and cancel_event.is_set():
+            return
+        task = tuple(task)
+        attempt = 1
+        while True:
+            result, delay = run.run_inline(index, task, attempt)
+            if result is not None:
+                break
+            if cancel_event is not None:
+                if cancel_event.wait(delay):
+                    return
+            else:
+                time.sleep(delay)
+            attempt += 1
+        yield result
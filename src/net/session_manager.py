@@ -12,10 +12,16 @@ import requests
 import logging
 import os
 import json
+import queue
+import threading
+import weakref
+from contextlib import contextmanager
 from typing import Dict, Optional, Any, Union
-from urllib3.util.retry import Retry
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
 from requests.adapters import HTTPAdapter
 
+from .host_governor import GovernedRetry, configure_host_governor
+
 # YAML サポートの確認
 try:
     import yaml
@@ -48,6 +54,163 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+
+# ============================================================================
+# コネクションプール（ホスト単位のサイズ調整・再利用メトリクス）
+# ============================================================================
+
+# ホスト単位プールの最小サイズ（network.pool.maxsize で変更可）
+DEFAULT_POOL_MAXSIZE = 20
+# 保持するホスト別プール数（network.pool.connections で変更可）
+DEFAULT_POOL_CONNECTIONS = 10
+# 並列ワーカー数の合計に上乗せする余裕分（リトライやUIからの単発リクエスト用）
+DEFAULT_POOL_HEADROOM = 4
+# 事前接続（プリウォーム）のタイムアウト秒
+DEFAULT_PREWARM_TIMEOUT = 10
+
+
+class _PoolMetrics:
+    """ホスト単位のコネクション再利用メトリクス（スレッドセーフ）"""
+
+    FIELDS = ("reused", "new_connections", "discarded")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._by_host: Dict[str, Dict[str, int]] = {}
+
+    def record(self, host: str, field: str) -> None:
+        with self._lock:
+            counters = self._by_host.get(host)
+            if counters is None:
+                counters = dict.fromkeys(self.FIELDS, 0)
+                self._by_host[host] = counters
+            counters[field] += 1
+
+    def snapshot(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {host: dict(counters) for host, counters in self._by_host.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._by_host.clear()
+
+
+_pool_metrics = _PoolMetrics()
+_pool_tls = threading.local()
+
+
+class _MeteredPoolMixin:
+    """urllib3 のプールに再利用・新規接続・破棄の計測を追加する"""
+
+    def _get_conn(self, timeout=None):
+        _pool_tls.created = False
+        conn = super()._get_conn(timeout)
+        _pool_metrics.record(self.host, "new_connections" if _pool_tls.created else "reused")
+        return conn
+
+    def _new_conn(self):
+        _pool_tls.created = True
+        return super()._new_conn()
+
+    def _put_conn(self, conn):
+        if conn is not None and self.pool is not None:
+            try:
+                self.pool.put(conn, block=False)
+                return
+            except queue.Full:
+                # プール満杯 → 接続が破棄され、次回は TLS ハンドシェイクからやり直しになる
+                _pool_metrics.record(self.host, "discarded")
+        super()._put_conn(conn)
+
+
+class _MeteredHTTPConnectionPool(_MeteredPoolMixin, HTTPConnectionPool):
+    pass
+
+
+class _MeteredHTTPSConnectionPool(_MeteredPoolMixin, HTTPSConnectionPool):
+    pass
+
+
+_METERED_POOL_CLASSES = {"http": _MeteredHTTPConnectionPool, "https": _MeteredHTTPSConnectionPool}
+
+
+class _AdaptivePoolAdapter(HTTPAdapter):
+    """
+    ホスト単位プールを並列度に合わせて拡張できるHTTPAdapter
+
+    プロキシ経由（ProxyManager）を含む全プールで計測付きプールクラスを使用し、
+    ensure_pool_maxsize() で既存プールも含めて上限を引き上げる（縮小はしない）。
+    """
+
+    def __init__(self, *args, ssl_context=None, **kwargs):
+        self._ssl_context = ssl_context
+        self._resize_lock = threading.Lock()
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        ssl_context = getattr(self, '_ssl_context', None)
+        if ssl_context is not None:
+            # urllib3のHTTPSConnectionPoolにtruststoreのSSLコンテキストを渡す
+            pool_kwargs['ssl_context'] = ssl_context
+        super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+        self.poolmanager.pool_classes_by_scheme = _METERED_POOL_CLASSES
+
+    def proxy_manager_for(self, proxy, **proxy_kwargs):
+        created = proxy not in self.proxy_manager
+        manager = super().proxy_manager_for(proxy, **proxy_kwargs)
+        if created:
+            manager.pool_classes_by_scheme = _METERED_POOL_CLASSES
+        return manager
+
+    @property
+    def pool_maxsize(self) -> int:
+        return self._pool_maxsize
+
+    def ensure_pool_maxsize(self, maxsize: int) -> bool:
+        """ホスト単位プールの上限を maxsize 以上にする。拡張した場合 True"""
+        with self._resize_lock:
+            if maxsize <= self._pool_maxsize:
+                return False
+            self._pool_maxsize = maxsize
+            managers = [self.poolmanager, *self.proxy_manager.values()]
+            for manager in managers:
+                manager.connection_pool_kw['maxsize'] = maxsize
+                for key in manager.pools.keys():
+                    pool = manager.pools.get(key)
+                    lifo = getattr(pool, 'pool', None)
+                    if lifo is None:
+                        continue
+                    # 空きスロットは追加しない（不足時は非ブロッキングで新規接続が作られ、返却時に保持される）
+                    with lifo.mutex:
+                        lifo.maxsize = maxsize
+            return True
+
+
+def _resolve_pool_settings(config: Dict[str, Any]) -> Dict[str, Any]:
+    """network.pool セクションを解釈して既定値で補完する"""
+    raw = config.get('pool') if isinstance(config, dict) else None
+    raw = raw if isinstance(raw, dict) else {}
+
+    def as_int(value, default, minimum):
+        try:
+            return max(minimum, int(value))
+        except (TypeError, ValueError):
+            return default
+
+    prewarm = raw.get('prewarm') if isinstance(raw.get('prewarm'), dict) else {}
+    hosts = prewarm.get('hosts') or []
+    if isinstance(hosts, str):
+        hosts = [h.strip() for h in hosts.split(',')]
+    return {
+        'maxsize': as_int(raw.get('maxsize'), DEFAULT_POOL_MAXSIZE, 1),
+        'connections': as_int(raw.get('connections'), DEFAULT_POOL_CONNECTIONS, 1),
+        'headroom': as_int(raw.get('headroom'), DEFAULT_POOL_HEADROOM, 0),
+        'prewarm_hosts': [str(h) for h in hosts if h],
+        'prewarm_connections': as_int(prewarm.get('connections'), 0, 0),
+        'prewarm_timeout': as_int(prewarm.get('timeout'), DEFAULT_PREWARM_TIMEOUT, 1),
+    }
+
+
 class ProxySessionManager:
     """
     プロキシ対応HTTPセッション管理クラス
@@ -60,6 +223,10 @@ class ProxySessionManager:
         self._proxy_config: Dict[str, Any] = {}
         self._configured: bool = False
         self._config_file_path = "config/network.yaml"
+        self._pool_settings: Dict[str, Any] = _resolve_pool_settings({})
+        self._pool_demand: int = 0
+        self._pool_lock = threading.Lock()
+        self._adapters: "weakref.WeakSet[_AdaptivePoolAdapter]" = weakref.WeakSet()
     
     def configure(self, proxy_config: Optional[Dict[str, Any]] = None):
         """
@@ -83,10 +250,13 @@ class ProxySessionManager:
             self._apply_certificate_config(self._proxy_config)
             
             # セッションアダプターの設定
+            self._pool_settings = _resolve_pool_settings(self._proxy_config)
+            configure_host_governor(self._proxy_config.get('rate_limit'))
             self._configure_session_adapters()
             
             self._configured = True
             logger.info("プロキシセッション設定完了")
+            self._start_pool_prewarm()
             
         except Exception as e:
             logger.warning(f"プロキシセッション設定失敗、デフォルト設定使用: {e}")
@@ -1113,42 +1283,29 @@ class ProxySessionManager:
     def _configure_session_adapters(self):
         """セッションアダプターとリトライ戦略を設定"""
         # リトライ戦略
-        retry_strategy = Retry(
+        # 429 はガバナー経由のリクエストではガバナー側で再送する（GovernedRetry）
+        retry_strategy = GovernedRetry(
             total=3,
             status_forcelist=[429, 500, 502, 503, 504],
             allowed_methods=["HEAD", "GET", "OPTIONS"],  # 新しいパラメータ名
             backoff_factor=1
         )
         
-        # HTTPアダプター設定
-        if hasattr(self, '_truststore_ssl_context') and self._truststore_ssl_context:
-            # truststoreを使用する場合、カスタムSSLコンテキストを持つHTTPAdapterを作成
-            from urllib3.util.ssl_ import create_urllib3_context
-            
-            adapter = HTTPAdapter(
-                max_retries=retry_strategy,
-                pool_connections=10,
-                pool_maxsize=20
-            )
-            
-            # urllib3のHTTPSConnectionPoolにSSLコンテキストを渡すため、
-            # アダプターのinit_poolmanager()をオーバーライド
-            original_init_poolmanager = adapter.init_poolmanager
-            
-            def init_poolmanager_with_truststore(*args, **kwargs):
-                kwargs['ssl_context'] = self._truststore_ssl_context
-                return original_init_poolmanager(*args, **kwargs)
-            
-            adapter.init_poolmanager = init_poolmanager_with_truststore
-            
+        # HTTPアダプター設定（ホスト単位プールは並列ワーカー数に応じて拡張される）
+        settings = self._pool_settings
+        with self._pool_lock:
+            maxsize = max(settings['maxsize'], self._pool_demand + settings['headroom'])
+        truststore_context = getattr(self, '_truststore_ssl_context', None)
+        adapter = _AdaptivePoolAdapter(
+            max_retries=retry_strategy,
+            pool_connections=settings['connections'],
+            pool_maxsize=maxsize,
+            ssl_context=truststore_context,
+        )
+        self._adapters.add(adapter)
+        if truststore_context:
             logger.info("✅ truststore用HTTPAdapter設定完了")
-        else:
-            # 通常のHTTPAdapter
-            adapter = HTTPAdapter(
-                max_retries=retry_strategy,
-                pool_connections=10,
-                pool_maxsize=20
-            )
+        logger.debug("HTTPAdapter設定: pool_connections=%s, pool_maxsize=%s", settings['connections'], maxsize)
         
         self._session.mount("http://", adapter)
         self._session.mount("https://", adapter)
@@ -1158,6 +1315,86 @@ class ProxySessionManager:
         
         # SSL設定は_apply_certificate_config()で既に設定済みのため、ここでは上書きしない
     
+    @contextmanager
+    def reserve_pool_capacity(self, workers: int):
+        """
+        並列ワーカー数分のコネクションをホスト単位プールに確保する
+
+        with ブロックの間、同時に実行中の並列処理の合計ワーカー数＋余裕分まで
+        プール上限を引き上げる。プールが満杯で接続が破棄され、TLSハンドシェイクを
+        繰り返すことを防ぐ（上限は縮小しない）。
+        """
+        workers = max(0, int(workers or 0))
+        with self._pool_lock:
+            self._pool_demand += workers
+            target = max(self._pool_settings['maxsize'], self._pool_demand + self._pool_settings['headroom'])
+            adapters = list(self._adapters)
+        for adapter in adapters:
+            if adapter.ensure_pool_maxsize(target):
+                logger.debug("コネクションプール拡張: pool_maxsize=%s (並列ワーカー合計=%s)", target, target - self._pool_settings['headroom'])
+        try:
+            yield
+        finally:
+            with self._pool_lock:
+                self._pool_demand -= workers
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """
+        コネクションプールの状態と再利用メトリクスを取得
+
+        Returns:
+            Dict[str, Any]:
+                - pool_maxsize: 現在のホスト単位プール上限（グローバルセッション）
+                - demand: 実行中の並列ワーカー数の合計
+                - hosts: {host: {reused, new_connections, discarded}}
+        """
+        adapter = None
+        if self._session is not None:
+            candidate = self._session.get_adapter("https://")
+            if isinstance(candidate, _AdaptivePoolAdapter):
+                adapter = candidate
+        with self._pool_lock:
+            demand = self._pool_demand
+        return {
+            'pool_maxsize': adapter.pool_maxsize if adapter else None,
+            'demand': demand,
+            'hosts': _pool_metrics.snapshot(),
+        }
+
+    def _start_pool_prewarm(self):
+        """network.pool.prewarm で指定されたホストへの接続をバックグラウンドで事前確立"""
+        settings = self._pool_settings
+        hosts = settings['prewarm_hosts']
+        count = settings['prewarm_connections']
+        if not hosts or count <= 0 or self._session is None:
+            return
+        session = self._session
+        for adapter in list(self._adapters):
+            adapter.ensure_pool_maxsize(count)
+
+        def _prewarm():
+            from concurrent.futures import ThreadPoolExecutor
+
+            def _open(url):
+                try:
+                    session.head(url, timeout=settings['prewarm_timeout'], allow_redirects=False)
+                except Exception as e:
+                    logger.debug("プリウォーム接続失敗: %s (%s)", url, e)
+
+            for url in hosts:
+                try:
+                    from classes.core.offline_mode import validate_online_access_or_raise
+                    validate_online_access_or_raise(url)
+                except Exception as e:
+                    logger.debug("プリウォームをスキップ: %s (%s)", url, e)
+                    continue
+                # 同時に発行して別々のコネクションを確立させ、プールに保持させる
+                with ThreadPoolExecutor(max_workers=count) as executor:
+                    list(executor.map(_open, [url] * count))
+                logger.info("プリウォーム完了: %s (%s接続)", url, count)
+
+        threading.Thread(target=_prewarm, name="pool-prewarm", daemon=True).start()
+
     def get_proxy_config(self) -> Dict[str, Any]:
         """現在のプロキシ設定を取得"""
         return self._proxy_config.copy()
@@ -1309,6 +1546,28 @@ def get_current_proxy_config() -> Dict[str, Any]:
     """現在のプロキシ設定を取得"""
     return _session_manager.get_proxy_config()
 
+@contextmanager
+def reserve_connection_pool(workers: int):
+    """
+    並列処理の間、ワーカー数分のコネクションをホスト単位プールに確保する
+
+    Args:
+        workers: 同時にリクエストを発行するワーカー数
+    """
+    with _session_manager.reserve_pool_capacity(workers):
+        yield
+
+
+def get_connection_pool_stats() -> Dict[str, Any]:
+    """コネクションプール上限とホスト単位の再利用メトリクスを取得"""
+    return _session_manager.get_pool_stats()
+
+
+def reset_connection_pool_stats():
+    """コネクション再利用メトリクスをリセット"""
+    _pool_metrics.reset()
+
+
 def get_active_proxy_status() -> Dict[str, Any]:
     """
     現在アクティブなプロキシ設定の状態を取得
@@ -0,0 +1,118 @@
+"""
+ストリーミングアップロード用のリクエスト本文
+
+ファイル全体をメモリに読み込まず、送信側（http.client / urllib3）が要求する分だけ
+ファイルハンドルから読み出して送る。長さが既知のため Content-Length 付きで送信され
+（chunked 転送にはならない）、メモリ使用量はファイルサイズによらず読み出し単位に収まる。
+
+    with FileUploadStream(path, progress_callback=cb) as body:
+        proxy_post(url, data=body, headers=headers)
+
+再送する場合は rewind() で先頭に戻す。net.http_helpers の 429 再送は rewind() を
+持つ本文を再送可能として扱う。
+"""
+
+import logging
+import os
+import threading
+from typing import Callable, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+# 1回の read() で返す最大バイト数（送信側の読み出し単位がこれより大きくても頭打ちにする）
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+# 進捗コールバックを呼ぶ間隔（バイト、最後は必ず呼ぶ）
+UPLOAD_PROGRESS_INTERVAL = 1024 * 1024
+
+ProgressCallback = Callable[[int, int], None]
+
+
+class FileUploadStream:
+    """
+    ファイルを先頭から順に読み出すリクエスト本文（長さ既知・再送可能）
+
+    Args:
+        path: 送信するファイル
+        progress_callback: (送信済みバイト数, 総バイト数) を受け取るコールバック
+        chunk_size: 1回の read() で返す最大バイト数
+        progress_interval: 進捗コールバックを呼ぶ間隔（バイト）
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        progress_callback: Optional[ProgressCallback] = None,
+        chunk_size: int = UPLOAD_CHUNK_SIZE,
+        progress_interval: int = UPLOAD_PROGRESS_INTERVAL,
+    ):
+        self.path = path
+        self.chunk_size = max(1, int(chunk_size))
+        self.progress_interval = max(1, int(progress_interval))
+        self._progress_callback = progress_callback
+        self._lock = threading.Lock()
+        self._file = open(path, "rb")
+        self._length = os.fstat(self._file.fileno()).st_size
+        self._sent = 0
+        self._next_report = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __enter__(self) -> "FileUploadStream":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def __iter__(self) -> Iterator[bytes]:
+        while True:
+            chunk = self.read(self.chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+    @property
+    def sent_bytes(self) -> int:
+        return self._sent
+
+    @property
+    def closed(self) -> bool:
+        return self._file.closed
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0 or size > self.chunk_size:
+            size = self.chunk_size
+        with self._lock:
+            # 送信途中でファイルが伸びても宣言済みの Content-Length を超えて送らない
+            size = min(size, self._length - self._sent)
+            if size <= 0:
+                return b""
+            chunk = self._file.read(size)
+            self._sent += len(chunk)
+            sent = self._sent
+            report = bool(chunk) and (sent >= self._next_report or sent >= self._length)
+            if report:
+                self._next_report = sent + self.progress_interval
+        if report:
+            self._report(sent)
+        return chunk
+
+    def rewind(self) -> None:
+        """先頭に戻す（再送前に呼ぶ）"""
+        with self._lock:
+            self._file.seek(0)
+            self._sent = 0
+            self._next_report = 0
+        self._report(0)
+
+    def close(self) -> None:
+        self._file.close()
+
+    def _report(self, sent: int) -> None:
+        if self._progress_callback is None:
+            return
+        try:
+            self._progress_callback(sent, self._length)
+        except Exception:
+            logger.debug("アップロード進捗コールバックでエラー: %s", self.path, exc_info=True)
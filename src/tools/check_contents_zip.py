@@ -0,0 +1,123 @@
+"""contents_zip_auto.build_zip の往復確認
+
+build_zip で作成した ZIP を zipfile で読み戻し、testzip() と内容の一致を確認する。
+並列圧縮の対象になる大きなメンバーと、ZIP64 が必要な 4 GiB 超のメンバー（スパースファイル）を含む。
+
+    python -m tools.check_contents_zip            （src から実行）
+    python -m tools.check_contents_zip --skip-zip64
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import zipfile
+
+from classes.data_portal.core.contents_zip_auto import (
+    PARALLEL_COMPRESS_MIN_BYTES,
+    SelectedFile,
+    build_zip,
+)
+
+# ローカルヘッダ・セントラルディレクトリの 32 ビットのサイズ欄に収まる上限
+_ZIP32_MAX_SIZE = 0xFFFFFFFF
+
+
+def _write(path: str, data: bytes) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def _write_sparse(path: str, size: int) -> None:
+    """内容がすべて 0 の size バイトのファイルを作る（対応するファイルシステムではディスクを消費しない）"""
+    with open(path, "wb") as f:
+        f.truncate(size)
+
+
+def _selected(base_dir: str, rel_paths) -> list:
+    files = []
+    for rel in rel_paths:
+        path = os.path.join(base_dir, rel)
+        files.append(SelectedFile(rel, os.path.basename(rel), "MAIN_IMAGE", os.path.getsize(path), path))
+    return files
+
+
+def _verify(zip_path: str, base_dir: str, files, compare_limit: int) -> None:
+    with zipfile.ZipFile(zip_path) as zf:
+        bad = zf.testzip()
+        if bad is not None:
+            raise AssertionError(f"CRC 不一致: {bad}")
+        infos = {info.filename: info for info in zf.infolist()}
+        for f in files:
+            arcname = os.path.relpath(f.local_path, base_dir).replace(os.sep, "/")
+            info = infos.get(arcname)
+            if info is None:
+                raise AssertionError(f"メンバーがありません: {arcname}")
+            if info.file_size != f.file_size:
+                raise AssertionError(f"サイズ不一致: {arcname} {info.file_size} != {f.file_size}")
+            if f.file_size <= compare_limit:
+                with open(f.local_path, "rb") as src:
+                    if zf.read(arcname) != src.read():
+                        raise AssertionError(f"内容不一致: {arcname}")
+            print(f"  ok {arcname} ({info.file_size} bytes, compress_type={info.compress_type})")
+
+
+def check_mixed(work_dir: str) -> None:
+    """小さなメンバー・格納のみのメンバー・並列圧縮されるメンバーの混在"""
+    base = os.path.join(work_dir, "mixed")
+    big = PARALLEL_COMPRESS_MIN_BYTES + 12345
+    _write(os.path.join(base, "a.txt"), b"hello zip\n" * 1000)
+    _write(os.path.join(base, "img", "photo.png"), os.urandom(300_000))
+    _write(os.path.join(base, "img", "raw.bin"), os.urandom(200_000))
+    _write(os.path.join(base, "日本語名.csv"), "列1,列2\n".encode("utf-8") * 500)
+    for i in range(4):
+        block = (f"row {i} ".encode() * 8)[:56] + os.urandom(8)
+        _write(os.path.join(base, "large", f"large_{i}.dat"), block * (big // len(block) + 1))
+    rels = [
+        os.path.relpath(os.path.join(root, name), base)
+        for root, _dirs, names in os.walk(base)
+        for name in names
+    ]
+    files = _selected(base, sorted(rels))
+    zip_path = os.path.join(work_dir, "mixed.zip")
+    build_zip(zip_path, base, files, max_workers=4)
+    _verify(zip_path, base, files, compare_limit=1 << 62)
+    print("mixed: OK")
+
+
+def check_zip64(work_dir: str) -> None:
+    """ZIP64 拡張が必要な 4 GiB 超のメンバー（並列圧縮の対象）を含む"""
+    base = os.path.join(work_dir, "zip64")
+    os.makedirs(base, exist_ok=True)
+    _write_sparse(os.path.join(base, "huge.dat"), _ZIP32_MAX_SIZE + 1024 * 1024)
+    _write(os.path.join(base, "second.dat"), b"0123456789abcdef" * (PARALLEL_COMPRESS_MIN_BYTES // 16 + 1))
+    _write(os.path.join(base, "tail.txt"), b"after zip64 member\n")
+    files = _selected(base, ["huge.dat", "second.dat", "tail.txt"])
+    zip_path = os.path.join(work_dir, "zip64.zip")
+    build_zip(zip_path, base, files, max_workers=2)
+    _verify(zip_path, base, files, compare_limit=64 * 1024 * 1024)
+    print("zip64: OK")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="build_zip の往復確認")
+    parser.add_argument("--skip-zip64", action="store_true", help="4 GiB 超のメンバーの確認を省略する")
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix="check_contents_zip_")
+    try:
+        check_mixed(work_dir)
+        if not args.skip_zip64:
+            check_zip64(work_dir)
+    except AssertionError as e:
+        print(f"NG: {e}")
+        return 1
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())